@@ -0,0 +1,35 @@
+"""add job leases
+
+Revision ID: 3f9a1c7d2b64
+Revises: fa04677b7122
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7d2b64'
+down_revision: Union[str, None] = 'fa04677b7122'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 스케줄러 작업별 lease (replica 간 중복 실행 방지)
+    op.create_table(
+        'job_leases',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('owner', sa.String(length=128), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.Column('last_slot', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_leases')
@@ -0,0 +1,57 @@
+"""activity_stats unique (pet_id, date)
+
+Revision ID: 5b8e2d41a7c9
+Revises: 3f9a1c7d2b64
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2d41a7c9'
+down_revision: Union[str, None] = '3f9a1c7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1) 동시 산책 종료로 생긴 (pet_id, date) 중복 행을 가장 오래된 행으로 합침
+    op.execute(
+        """
+        UPDATE activity_stats a
+        JOIN (
+            SELECT pet_id, date,
+                   MIN(stats_id) AS keep_id,
+                   SUM(COALESCE(total_walks, 0)) AS walks,
+                   SUM(COALESCE(total_distance_km, 0)) AS distance,
+                   SUM(COALESCE(total_duration_min, 0)) AS duration,
+                   SUM(calories_burned) AS calories
+            FROM activity_stats
+            GROUP BY pet_id, date
+            HAVING COUNT(*) > 1
+        ) g ON a.stats_id = g.keep_id
+        SET a.total_walks = g.walks,
+            a.total_distance_km = g.distance,
+            a.total_duration_min = g.duration,
+            a.calories_burned = g.calories,
+            a.avg_speed_kmh = CASE WHEN g.duration > 0 THEN g.distance / (g.duration / 60) ELSE a.avg_speed_kmh END
+        """
+    )
+    op.execute(
+        """
+        DELETE a FROM activity_stats a
+        JOIN activity_stats b
+          ON a.pet_id = b.pet_id AND a.date = b.date AND a.stats_id > b.stats_id
+        """
+    )
+
+    # 2) 펫별 하루 1행 보장 (INSERT ... ON DUPLICATE KEY UPDATE 의 기준 키)
+    op.create_unique_constraint('uq_activity_stats_pet_date', 'activity_stats', ['pet_id', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_activity_stats_pet_date', 'activity_stats', type_='unique')
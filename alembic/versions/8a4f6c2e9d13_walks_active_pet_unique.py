@@ -0,0 +1,53 @@
+"""walks active_pet_id generated column + unique index
+
+Revision ID: 8a4f6c2e9d13
+Revises: 5b8e2d41a7c9
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4f6c2e9d13'
+down_revision: Union[str, None] = '5b8e2d41a7c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1) 동시 시작으로 생긴 "펫당 진행 중 산책 여러 개"는 가장 최근 것만 남기고 시작 시각으로 종료 처리
+    op.execute(
+        """
+        UPDATE walks w
+        JOIN (
+            SELECT pet_id, MAX(walk_id) AS keep_id
+            FROM walks
+            WHERE end_time IS NULL
+            GROUP BY pet_id
+            HAVING COUNT(*) > 1
+        ) g ON w.pet_id = g.pet_id
+        SET w.end_time = w.start_time
+        WHERE w.end_time IS NULL AND w.walk_id <> g.keep_id
+        """
+    )
+
+    # 2) 진행 중일 때만 pet_id 를 갖는 생성 컬럼 + unique index (NULL 은 중복 허용)
+    op.add_column(
+        'walks',
+        sa.Column(
+            'active_pet_id',
+            sa.Integer(),
+            sa.Computed('CASE WHEN end_time IS NULL THEN pet_id END', persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('uq_walks_active_pet', 'walks', ['active_pet_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_walks_active_pet', table_name='walks')
+    op.drop_column('walks', 'active_pet_id')
@@ -0,0 +1,105 @@
+"""walks range indexes + monthly partitions for walk_tracking_points
+
+Revision ID: a9d2e6f1c874
+Revises: f3c8a1d6b472
+Create Date: 2026-10-19 19:00:00.000000
+
+walks 는 파티션하지 않음: MySQL 파티션 테이블은 FK 를 갖거나 참조될 수 없고
+(photos / walk_tracking_points / walk_route_archives 가 walks 를 참조),
+모든 unique 키에 파티션 컬럼이 들어가야 함 (uq_walks_user_client_key, uq_walks_active_pet).
+대신 기간 조회용 (pet_id, start_time) / (user_id, start_time) / (start_time) 인덱스를 추가한다.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d2e6f1c874'
+down_revision: Union[str, None] = 'f3c8a1d6b472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 처음 만들 파티션 범위: 데이터가 있는 가장 오래된 달(최대 12개월 전까지) ~ 이번 달 + 3개월
+MAX_PAST_MONTHS = 12
+MONTHS_AHEAD = 3
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.create_index('ix_walks_pet_start', 'walks', ['pet_id', 'start_time'])
+    op.create_index('ix_walks_user_start', 'walks', ['user_id', 'start_time'])
+    op.create_index('ix_walks_start', 'walks', ['start_time'])
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        op.create_index('ix_walk_tracking_points_walk_ts', 'walk_tracking_points', ['walk_id', 'timestamp'])
+        return
+
+    # 1) 파티션 테이블은 FK 불가 → walks 참조 제거 (이름은 자동 생성이라 조회)
+    fk_names = [
+        r[0] for r in bind.execute(sa.text(
+            "SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS "
+            "WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'walk_tracking_points'"
+        ))
+    ]
+    for name in fk_names:
+        op.drop_constraint(name, 'walk_tracking_points', type_='foreignkey')
+
+    # 2) 산책별 경로 조회 인덱스 (FK 용 walk_id 단일 인덱스 대체)
+    op.create_index('ix_walk_tracking_points_walk_ts', 'walk_tracking_points', ['walk_id', 'timestamp'])
+    has_fk_index = bind.execute(sa.text(
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'walk_tracking_points' AND INDEX_NAME = 'walk_id' LIMIT 1"
+    )).first()
+    if has_fk_index:
+        op.drop_index('walk_id', table_name='walk_tracking_points')
+
+    # 3) 파티션 키는 모든 unique 키에 포함되어야 함
+    op.execute("ALTER TABLE walk_tracking_points DROP PRIMARY KEY, ADD PRIMARY KEY (point_id, `timestamp`)")
+
+    # 4) 월 단위 RANGE 파티션 (가장 앞 파티션은 그보다 오래된 행도 담음)
+    this_month = date.today().replace(day=1)
+    oldest = bind.execute(sa.text("SELECT MIN(`timestamp`) FROM walk_tracking_points")).scalar()
+    first_month = max(
+        oldest.date().replace(day=1) if oldest else this_month,
+        _add_months(this_month, -MAX_PAST_MONTHS),
+    )
+
+    clauses = []
+    month = first_month
+    while month <= _add_months(this_month, MONTHS_AHEAD):
+        clauses.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    clauses.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+
+    op.execute(
+        "ALTER TABLE walk_tracking_points PARTITION BY RANGE COLUMNS(`timestamp`) ("
+        + ", ".join(clauses)
+        + ")"
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute("ALTER TABLE walk_tracking_points REMOVE PARTITIONING")
+        op.execute("ALTER TABLE walk_tracking_points DROP PRIMARY KEY, ADD PRIMARY KEY (point_id)")
+        # FK 가 쓸 인덱스는 MySQL 이 다시 만듦
+        op.drop_index('ix_walk_tracking_points_walk_ts', table_name='walk_tracking_points')
+        op.create_foreign_key(None, 'walk_tracking_points', 'walks', ['walk_id'], ['walk_id'])
+    else:
+        op.drop_index('ix_walk_tracking_points_walk_ts', table_name='walk_tracking_points')
+
+    op.drop_index('ix_walks_start', table_name='walks')
+    op.drop_index('ix_walks_user_start', table_name='walks')
+    op.drop_index('ix_walks_pet_start', table_name='walks')
@@ -0,0 +1,53 @@
+"""broadcast_jobs
+
+Revision ID: b4e7d2a9c815
+Revises: a9d2e6f1c874
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7d2a9c815'
+down_revision: Union[str, None] = 'a9d2e6f1c874'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 전체 기기 푸시 발송 작업 (백그라운드, 재시작 가능)
+    op.create_table(
+        'broadcast_jobs',
+        sa.Column('job_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('dedup_key', sa.String(length=64), nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('body', sa.String(length=500), nullable=False),
+        sa.Column('data', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('device_cursor', sa.Integer(), nullable=False),
+        sa.Column('legacy_cursor', sa.Integer(), nullable=False),
+        sa.Column('pages', sa.Integer(), nullable=False),
+        sa.Column('tokens', sa.Integer(), nullable=False),
+        sa.Column('success', sa.Integer(), nullable=False),
+        sa.Column('failure', sa.Integer(), nullable=False),
+        sa.Column('invalid', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.String(length=255), nullable=True),
+        sa.Column('lease_owner', sa.String(length=128), nullable=True),
+        sa.Column('lease_until', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('job_id'),
+        sa.UniqueConstraint('dedup_key'),
+    )
+    op.create_index('ix_broadcast_jobs_status_job', 'broadcast_jobs', ['status', 'job_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_broadcast_jobs_status_job', table_name='broadcast_jobs')
+    op.drop_table('broadcast_jobs')
@@ -0,0 +1,43 @@
+"""add change_log for delta sync
+
+Revision ID: c41d7e9a2b58
+Revises: 8a4f6c2e9d13
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2b58'
+down_revision: Union[str, None] = '8a4f6c2e9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 동기화 cursor 용 변경 기록 (pets / walks / photos / notifications / family_members / pet_share_requests)
+    op.create_table(
+        'change_log',
+        sa.Column('change_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('entity', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('op', sa.String(length=1), nullable=False),
+        sa.Column('family_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('change_id'),
+    )
+    op.create_index('ix_change_log_family_change', 'change_log', ['family_id', 'change_id'])
+    op.create_index('ix_change_log_user_change', 'change_log', ['user_id', 'change_id'])
+    op.create_index('ix_change_log_created_at', 'change_log', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_change_log_created_at', table_name='change_log')
+    op.drop_index('ix_change_log_user_change', table_name='change_log')
+    op.drop_index('ix_change_log_family_change', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,29 @@
+"""walks client_key (idempotent offline upload)
+
+Revision ID: d7a3c5e1f046
+Revises: c41d7e9a2b58
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c5e1f046'
+down_revision: Union[str, None] = 'c41d7e9a2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 클라이언트 생성 키: 같은 사용자의 같은 키는 1건만 (NULL 은 기존 기록)
+    op.add_column('walks', sa.Column('client_key', sa.String(length=64), nullable=True))
+    op.create_index('uq_walks_user_client_key', 'walks', ['user_id', 'client_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_walks_user_client_key', table_name='walks')
+    op.drop_column('walks', 'client_key')
@@ -0,0 +1,53 @@
+"""soft delete columns + purge_jobs
+
+Revision ID: e2b9f4a7c315
+Revises: d7a3c5e1f046
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9f4a7c315'
+down_revision: Union[str, None] = 'd7a3c5e1f046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 삭제 요청 시각 (tombstone)
+    op.add_column('users', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('families', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('pets', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    # 연관 데이터 정리 작업 (백그라운드, 재시작 가능)
+    op.create_table(
+        'purge_jobs',
+        sa.Column('job_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('target_id', sa.Integer(), nullable=False),
+        sa.Column('firebase_uid', sa.String(length=128), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('step', sa.String(length=40), nullable=True),
+        sa.Column('step_cursor', sa.Integer(), nullable=False),
+        sa.Column('deleted_rows', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('job_id'),
+    )
+    op.create_index('ix_purge_jobs_status_job', 'purge_jobs', ['status', 'job_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_purge_jobs_status_job', table_name='purge_jobs')
+    op.drop_table('purge_jobs')
+    op.drop_column('pets', 'deleted_at')
+    op.drop_column('families', 'deleted_at')
+    op.drop_column('users', 'deleted_at')
@@ -0,0 +1,40 @@
+"""walk_route_archives
+
+Revision ID: f3c8a1d6b472
+Revises: e2b9f4a7c315
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8a1d6b472'
+down_revision: Union[str, None] = 'e2b9f4a7c315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 오래된 산책 경로 압축 보관본 (산책 1건당 1행)
+    op.create_table(
+        'walk_route_archives',
+        sa.Column('walk_id', sa.Integer(), nullable=False),
+        sa.Column('point_count', sa.Integer(), nullable=False),
+        sa.Column('codec', sa.String(length=20), nullable=False),
+        sa.Column('storage', sa.String(length=10), nullable=False),
+        sa.Column('data', mysql.MEDIUMBLOB(), nullable=True),
+        sa.Column('object_key', sa.String(length=255), nullable=True),
+        sa.Column('compressed_bytes', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['walk_id'], ['walks.walk_id'], ),
+        sa.PrimaryKeyConstraint('walk_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('walk_route_archives')
@@ -0,0 +1,156 @@
+"""
+진행 중인 산책 레지스트리
+
+track / end 요청마다 Walk → Pet → FamilyMember 를 다시 읽던 것을
+walk_id → (pet_id, family_id, user_id, 마지막 위치) 메모리 조회로 대체한다.
+
+- 기동 시 진행 중인 산책(active_pet_id IS NOT NULL)을 한 번에 적재
+- 미스면 walk_id 로 1쿼리 적재 (다른 replica 에서 시작된 산책)
+- 진행 여부의 기준은 DB: 위치 저장은 "진행 중일 때만 INSERT" 조건문으로 하고,
+  0행이면(다른 replica 에서 종료/삭제) 여기서도 제거
+- 오래 접근되지 않은 항목은 idle TTL 후 다시 적재 (다른 replica 에서 끝난 산책 정리)
+- 펫당 진행 중 산책 1개는 walks.uq_walks_active_pet unique index 가 보장
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.pet import Pet
+from app.models.walk import Walk
+
+
+ACTIVE_WALK_LOOKUPS = metrics.counter(
+    "active_walk_lookups_total", "진행 중 산책 레지스트리 조회 (hit/miss)", ["result"]
+)
+ACTIVE_WALKS = metrics.gauge("active_walks_tracked", "레지스트리에 적재된 진행 중 산책 수")
+
+_HIT = ACTIVE_WALK_LOOKUPS.labels("hit")
+_MISS = ACTIVE_WALK_LOOKUPS.labels("miss")
+
+
+@dataclass
+class ActiveWalk:
+    walk_id: int
+    pet_id: int
+    family_id: int
+    user_id: Optional[int]
+    start_time: datetime
+    last_lat: Optional[float] = None
+    last_lng: Optional[float] = None
+    last_at: Optional[datetime] = None
+    touched_at: float = 0.0
+
+
+class ActiveWalkRegistry:
+    def __init__(self, idle_ttl_sec: float = 900.0, max_walks: int = 50000, clock=time.monotonic):
+        self.idle_ttl_sec = idle_ttl_sec
+        self.max_walks = max_walks
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._walks: "OrderedDict[int, ActiveWalk]" = OrderedDict()
+        self._by_pet: Dict[int, int] = {}
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+    def get(self, db: Session, walk_id: int) -> Optional[ActiveWalk]:
+        """진행 중인 산책 정보. 없거나 이미 종료된 산책이면 None"""
+        now = self.clock()
+        with self._lock:
+            walk = self._walks.get(walk_id)
+            if walk is not None and now - walk.touched_at < self.idle_ttl_sec:
+                walk.touched_at = now
+                self._walks.move_to_end(walk_id)
+                _HIT.inc()
+                return walk
+
+        _MISS.inc()
+        loaded = self._load(db, walk_id)
+        if loaded is None:
+            self.remove(walk_id)
+            return None
+        self.put(loaded)
+        return loaded
+
+    def get_by_pet(self, pet_id: int) -> Optional[ActiveWalk]:
+        with self._lock:
+            walk_id = self._by_pet.get(pet_id)
+            return self._walks.get(walk_id) if walk_id is not None else None
+
+    @staticmethod
+    def _load(db: Session, walk_id: int) -> Optional[ActiveWalk]:
+        row = (
+            db.query(Walk.walk_id, Walk.pet_id, Pet.family_id, Walk.user_id, Walk.start_time)
+            .join(Pet, Pet.pet_id == Walk.pet_id)
+            .filter(Walk.walk_id == walk_id, Walk.end_time.is_(None))
+            .first()
+        )
+        return ActiveWalk(*row) if row else None
+
+    # -------------------------------------------------
+    # 갱신
+    # -------------------------------------------------
+    def put(self, walk: ActiveWalk) -> None:
+        with self._lock:
+            walk.touched_at = self.clock()
+            self._drop(walk.walk_id)
+            # 같은 펫의 이전 산책 항목은 (다른 replica 에서 종료됐으므로) 정리
+            previous = self._by_pet.get(walk.pet_id)
+            if previous is not None:
+                self._drop(previous)
+            self._walks[walk.walk_id] = walk
+            self._by_pet[walk.pet_id] = walk.walk_id
+
+            while len(self._walks) > self.max_walks:
+                self._drop(next(iter(self._walks)))
+            ACTIVE_WALKS.set(len(self._walks))
+
+    def record_point(self, walk_id: int, latitude: float, longitude: float, timestamp: datetime) -> None:
+        with self._lock:
+            walk = self._walks.get(walk_id)
+            if walk is not None:
+                walk.last_lat = latitude
+                walk.last_lng = longitude
+                walk.last_at = timestamp
+
+    def remove(self, walk_id: int) -> Optional[ActiveWalk]:
+        with self._lock:
+            walk = self._drop(walk_id)
+            ACTIVE_WALKS.set(len(self._walks))
+            return walk
+
+    def _drop(self, walk_id: int) -> Optional[ActiveWalk]:
+        walk = self._walks.pop(walk_id, None)
+        if walk is not None and self._by_pet.get(walk.pet_id) == walk_id:
+            del self._by_pet[walk.pet_id]
+        return walk
+
+    def warm(self, db: Session) -> int:
+        """기동 시 진행 중인 산책 전체 적재 (active_pet_id unique index 사용)"""
+        rows = (
+            db.query(Walk.walk_id, Walk.pet_id, Pet.family_id, Walk.user_id, Walk.start_time)
+            .join(Pet, Pet.pet_id == Walk.pet_id)
+            .filter(Walk.active_pet_id.isnot(None))
+            .order_by(Walk.walk_id.desc())
+            .limit(self.max_walks)
+            .all()
+        )
+        for row in reversed(rows):
+            self.put(ActiveWalk(*row))
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._walks.clear()
+            self._by_pet.clear()
+            ACTIVE_WALKS.set(0)
+
+
+registry = ActiveWalkRegistry(idle_ttl_sec=settings.ACTIVE_WALK_IDLE_TTL_SEC)
@@ -0,0 +1,92 @@
+"""
+캐시 저장소 (교체 가능한 backend)
+
+프로세스 안 캐시(push_targets / today_counters)는 각자 dict 를 들고 있었다.
+여러 워커가 같은 값을 공유해야 하는 캐시는 CacheBackend 인터페이스로 저장소를 분리해
+설정(PET_PROFILE_CACHE_BACKEND 등)만 바꿔 외부 저장소로 옮길 수 있게 한다.
+
+- MemoryCache: 프로세스 안 LRU + TTL (기본값, 워커마다 따로)
+- 외부 저장소: "패키지.모듈:팩토리" 로 지정. 팩토리는 인자 없이 CacheBackend 를 반환
+  (접속 정보는 구현 쪽에서 읽음). 값은 pickle 가능한 객체 (frozen dataclass 등)
+- 키는 문자열 ("pet_profile:12" 처럼 캐시별 접두어)
+"""
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+
+class CacheBackend:
+    """저장소 인터페이스. 없는 키 / 만료된 키는 get_many 결과에서 빠짐"""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def set_many(self, items: Dict[str, Any], ttl_sec: float) -> None:
+        raise NotImplementedError
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class MemoryCache(CacheBackend):
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key → (만료 시각, 값). 조회/저장 시 끝으로 옮겨 앞쪽이 가장 오래 안 쓴 항목
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        now = self.clock()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry[1]
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl_sec: float) -> None:
+        expires_at = self.clock() + ttl_sec
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def load_backend(spec: str, max_entries: int) -> CacheBackend:
+    """'memory' 또는 '패키지.모듈:팩토리'"""
+    if spec == "memory":
+        return MemoryCache(max_entries=max_entries)
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"cache backend must be 'memory' or 'module:factory': {spec}")
+    factory = getattr(importlib.import_module(module_name), attr)
+    return factory()
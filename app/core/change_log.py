@@ -0,0 +1,220 @@
+"""
+동기화용 변경 기록 (change_log)
+
+앱이 화면을 열 때마다 목록 전체를 다시 받던 것을 "cursor 이후 변경분"만 받도록
+pets / walks / photos / notifications / family_members / pet_share_requests 변경을
+같은 트랜잭션 안에서 INSERT ... SELECT 로 남긴다. (commit 되지 않으면 기록도 사라짐)
+
+- ORM flush: 삭제는 flush 전(행이 아직 있을 때), 생성/수정은 flush 후(PK 확정) 기록
+- ORM bulk update/delete (query.update / query.delete): 실행 직전에 같은 WHERE 로 대상 행을 기록
+- Core 문장(executemany UPDATE, bulk INSERT)은 record_ids / record_where 로 직접 기록
+- 보이는 범위(family_id / user_id)는 엔티티별 SELECT 로 계산 (walk / photo / 공유 요청은 pets 조인)
+- 가장 최근 change_id 는 조건부 GET(ETag)의 버전 값으로도 사용 (family_head / user_version)
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import (
+    DateTime, String, case, event, func, insert, inspect as sa_inspect, literal, null, select, true, union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.change_log import ChangeLog
+from app.models.family_member import FamilyMember
+from app.models.notification import Notification
+from app.models.pet import Pet
+from app.models.pet_share_request import PetShareRequest
+from app.models.photo import Photo
+from app.models.walk import Walk
+
+
+CHANGE_LOG_WRITES = metrics.counter(
+    "change_log_writes_total", "변경 기록 INSERT ... SELECT 실행 수", ["entity", "op"]
+)
+
+OP_UPSERT = "U"
+OP_DELETE = "D"
+
+# 모델 → 동기화 응답의 entity 이름
+TRACKED: Dict[type, str] = {
+    Pet: "pet",
+    Walk: "walk",
+    Photo: "photo",
+    Notification: "notification",
+    FamilyMember: "family_member",
+    PetShareRequest: "share_request",
+}
+
+
+def _scope(model):
+    """(pk, family_id, user_id, joins)"""
+    if model is Pet:
+        return Pet.pet_id, Pet.family_id, null(), []
+    if model is Walk:
+        return Walk.walk_id, Pet.family_id, null(), [(Pet, Pet.pet_id == Walk.pet_id)]
+    if model is Photo:
+        return Photo.photo_id, Pet.family_id, null(), [
+            (Walk, Walk.walk_id == Photo.walk_id),
+            (Pet, Pet.pet_id == Walk.pet_id),
+        ]
+    if model is Notification:
+        # 개인 알림은 대상자에게만, 가족 알림은 가족 전체에게
+        family_id = case((Notification.target_user_id.is_(None), Notification.family_id), else_=None)
+        return Notification.notification_id, family_id, Notification.target_user_id, []
+    if model is FamilyMember:
+        return FamilyMember.member_id, FamilyMember.family_id, FamilyMember.user_id, []
+    if model is PetShareRequest:
+        # 펫 가족(승인하는 쪽) + 요청자
+        return PetShareRequest.request_id, Pet.family_id, PetShareRequest.requester_id, [
+            (Pet, Pet.pet_id == PetShareRequest.pet_id),
+        ]
+    raise ValueError(f"untracked model: {model}")
+
+
+def _insert_from(model, op: str, where):
+    entity = TRACKED[model]
+    pk, family_id, user_id, joins = _scope(model)
+
+    sel = select(
+        literal(entity, String),
+        pk,
+        literal(op, String),
+        family_id,
+        user_id,
+        literal(datetime.utcnow(), DateTime),
+    ).select_from(model)
+    for target, onclause in joins:
+        sel = sel.join(target, onclause)
+    sel = sel.where(where)
+
+    return insert(ChangeLog.__table__).from_select(
+        ["entity", "entity_id", "op", "family_id", "user_id", "created_at"], sel
+    )
+
+
+def record_where(db: Session, model, where, op: str = OP_UPSERT) -> None:
+    """where 에 해당하는 model 행들의 변경을 기록 (flush 를 거치지 않는 변경용)"""
+    if not settings.SYNC_CHANGE_LOG_ENABLED:
+        return
+    db.connection().execute(_insert_from(model, op, where))
+    CHANGE_LOG_WRITES.labels(TRACKED[model], op).inc()
+
+
+def record_ids(db: Session, model, ids: Iterable[int], op: str = OP_UPSERT) -> None:
+    ids = sorted(set(ids))
+    if not ids:
+        return
+    pk = _scope(model)[0]
+    record_where(db, model, pk.in_(ids), op)
+
+
+# ============================================================
+# 조건부 GET(ETag) 용 버전 값
+# ============================================================
+def family_head(family_id):
+    """
+    family_id(값 또는 컬럼) 범위의 가장 최근 (change_id, created_at) 스칼라 서브쿼리
+    권한 확인 조회에 컬럼으로 붙여 왕복 없이 (family_id, change_id) 인덱스 끝 1건만 읽음
+    """
+    def latest(column):
+        return (
+            select(column)
+            .where(ChangeLog.family_id == family_id)
+            .order_by(ChangeLog.change_id.desc())
+            .limit(1)
+            .correlate_except(ChangeLog)
+            .scalar_subquery()
+        )
+
+    return latest(ChangeLog.change_id), latest(ChangeLog.created_at)
+
+
+def _settled(created_at: Optional[datetime]) -> bool:
+    # settle 시간 안의 기록이 있으면 늦게 commit 되는 더 작은 change_id 가 아직 안 보일 수 있음
+    return created_at is None or created_at <= datetime.utcnow() - timedelta(seconds=settings.SYNC_SETTLE_SEC)
+
+
+def settled_version(change_id: Optional[int], created_at: Optional[datetime]) -> Optional[int]:
+    """family_head 결과 → 버전 값 (기록 없음 0). 변경 기록을 안 쓰거나 settle 전이면 None"""
+    if not settings.SYNC_CHANGE_LOG_ENABLED or not _settled(created_at):
+        return None
+    return int(change_id or 0)
+
+
+def user_version(db: Session, user_id: int) -> Optional[Tuple[int, ...]]:
+    """
+    사용자가 속한 가족별 + 개인 범위의 가장 최근 change_id 들 (여러 가족에 걸친 목록용, 1쿼리)
+    개인 범위도 보므로 가족 탈퇴처럼 내 가족 목록이 바뀐 경우에도 버전이 바뀜
+    """
+    if not settings.SYNC_CHANGE_LOG_ENABLED:
+        return None
+    family_ids = select(FamilyMember.family_id).where(FamilyMember.user_id == user_id)
+    heads = union_all(
+        select(func.max(ChangeLog.change_id))
+        .where(ChangeLog.family_id.in_(family_ids))
+        .group_by(ChangeLog.family_id),
+        select(func.max(ChangeLog.change_id)).where(ChangeLog.user_id == user_id),
+    )
+    rows = db.execute(
+        select(ChangeLog.change_id, ChangeLog.created_at).where(ChangeLog.change_id.in_(heads))
+    ).all()
+    if not _settled(max((r.created_at for r in rows), default=None)):
+        return None
+    return tuple(sorted(r.change_id for r in rows))
+
+
+# ============================================================
+# 세션 이벤트
+# ============================================================
+def _group(objects) -> Dict[type, Set[int]]:
+    grouped: Dict[type, Set[int]] = {}
+    for obj in objects:
+        model = type(obj)
+        if model not in TRACKED:
+            continue
+        # after_flush 시점엔 identity key 가 아직 없으므로 PK 속성값으로
+        pk = sa_inspect(obj).mapper.primary_key_from_instance(obj)[0]
+        if pk is not None:
+            grouped.setdefault(model, set()).add(pk)
+    return grouped
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    # 삭제 대상은 행이 남아 있을 때 범위를 계산
+    for model, ids in _group(session.deleted).items():
+        record_ids(session, model, ids, OP_DELETE)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # new / dirty 는 after_flush 에서도 flush 전 상태를 보여줌
+    changed: List[object] = list(session.new)
+    changed += [
+        obj for obj in session.dirty
+        if type(obj) in TRACKED and session.is_modified(obj, include_collections=False)
+    ]
+    for model, ids in _group(changed).items():
+        record_ids(session, model, ids, OP_UPSERT)
+
+
+def _do_orm_execute(state) -> None:
+    # query.update() / query.delete() : 같은 WHERE 로 대상 행을 먼저 기록
+    if not (state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model not in TRACKED or isinstance(state.parameters, (list, tuple)):
+        return
+    where = state.statement.whereclause
+    record_where(
+        state.session,
+        model,
+        where if where is not None else true(),
+        OP_DELETE if state.is_delete else OP_UPSERT,
+    )
+
+
+event.listen(Session, "before_flush", _before_flush)
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "do_orm_execute", _do_orm_execute)
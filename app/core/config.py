@@ -10,12 +10,114 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     OPENWEATHER_API_KEY: str
 
+    # 산책 추천 로컬 엔진 모드: primary(엔진만) / fallback(LLM 실패 시 엔진) / shadow(LLM 결과 사용 + 엔진 비교 로그)
+    WALK_REC_ENGINE_MODE: str = "fallback"
+
+    # 날씨/건강 배치 알림: LLM 1회 요청당 pet 수, 동시 요청 수, 지역 클러스터 격자 크기(도)
+    BATCH_ADVICE_PETS_PER_REQUEST: int = 20
+    BATCH_ADVICE_MAX_CONCURRENCY: int = 4
+    BATCH_ADVICE_GRID_DEG: float = 0.1
+
+    # 프로세스 내 스케줄러: 사용 여부, replica 간 리더 선출 방식(table: job_leases / mysql_lock: GET_LOCK)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_LEASE_BACKEND: str = "table"
+
+    # 운영용 엔드포인트(/metrics, /scheduler/jobs) Bearer 토큰. 비우면 해당 엔드포인트는 404
+    OPS_API_TOKEN: str = ""
+
+    # /metrics 멀티프로세스 집계: 워커별 스냅샷 파일 디렉토리(비우면 단일 프로세스), 기록 주기(초)
+    # STALE_SEC: 이 시간 동안 갱신되지 않은 다른 워커 파일은 합산에서 빼고 삭제 (기록 주기보다 충분히 길게)
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_FLUSH_INTERVAL_SEC: float = 5.0
+    METRICS_SNAPSHOT_STALE_SEC: float = 60.0
+
+    # 디버그: 요청별 SQL 수/시간 헤더(X-DB-Query-Count, X-DB-Time-ms) + 반복 문장(N+1 의심) 로그
+    DB_QUERY_DEBUG: bool = False
+    DB_REPEATED_QUERY_THRESHOLD: int = 5
+
+    # 가족 푸시 대상(기기 토큰) 캐시 유지 시간(초). 다른 워커의 토큰/구성원 변경은 이 시간 안에 반영
+    PUSH_TARGET_CACHE_TTL_SEC: float = 300.0
+
+    # 진행 중 산책 레지스트리: 이 시간(초) 동안 접근 없던 항목은 DB 에서 다시 확인
+    ACTIVE_WALK_IDLE_TTL_SEC: float = 900.0
+    # 홈 화면 집계 API: 날씨 조회 대기 최대 시간(초). 넘으면 weather 없이 응답
+    HOME_WEATHER_TIMEOUT_SEC: float = 3.0
+
+    # 반려동물별 오늘 산책 카운터 캐시 유지 시간(초). 다른 워커의 산책 변경은 이 시간 안에 반영
+    TODAY_COUNTER_TTL_SEC: float = 60.0
+
+    # 반려동물 프로필 묶음(펫 + 목표 + 추천) 캐시: 저장소(memory 또는 "모듈:팩토리"), 유지 시간(초), 최대 항목 수
+    # memory 는 워커마다 따로라 다른 워커의 변경은 TTL 안에 반영. 공유 저장소를 쓰면 무효화가 바로 공유됨
+    PET_PROFILE_CACHE_BACKEND: str = "memory"
+    PET_PROFILE_CACHE_TTL_SEC: float = 300.0
+    PET_PROFILE_CACHE_MAX_PETS: int = 50000
+
+    # 방치 산책 자동 종료: 마지막 위치 이후 경과 시간(분), 배치 크기, 검사 주기(초)
+    STALE_WALK_IDLE_MIN: int = 120
+    STALE_WALK_BATCH_SIZE: int = 200
+    STALE_WALK_CHECK_INTERVAL_SEC: int = 600
+
+    # 동기화(변경분 조회): 변경 기록 사용 여부, 페이지 크기, 보관 기간(일), 정리 주기(초)
+    # SETTLE_SEC: 이보다 최근 기록은 응답에서 제외 (늦게 commit 되는 작은 change_id 를 건너뛰지 않도록)
+    SYNC_CHANGE_LOG_ENABLED: bool = True
+    SYNC_PAGE_SIZE: int = 500
+    SYNC_CHANGE_LOG_RETENTION_DAYS: int = 30
+    SYNC_CHANGE_LOG_PURGE_INTERVAL_SEC: int = 3600
+    SYNC_SETTLE_SEC: float = 2.0
+
+    # 계정/가족/반려동물 삭제 후 데이터 정리: 묶음 크기(행), 산책 묶음 크기, 실행 주기(초), 1회 실행 시간 예산(초), 최대 재시도
+    PURGE_BATCH_SIZE: int = 500
+    PURGE_WALK_CHUNK: int = 50
+    PURGE_INTERVAL_SEC: int = 60
+    PURGE_TIME_BUDGET_SEC: float = 45.0
+    PURGE_MAX_ATTEMPTS: int = 5
+
+    # 오래된 산책 경로 보관: 사용 여부, 기준(종료 후 일수), 1회 묶음(산책 수), hot 행 삭제 묶음(행), 실행 주기(초), 1회 시간 예산(초)
+    # BACKEND: db (walk_route_archives.data) / file (ROUTE_ARCHIVE_DIR 아래, 객체 저장소 대용)
+    ROUTE_ARCHIVE_ENABLED: bool = True
+    ROUTE_ARCHIVE_AFTER_DAYS: int = 30
+    ROUTE_ARCHIVE_BATCH_WALKS: int = 100
+    ROUTE_ARCHIVE_DELETE_CHUNK: int = 2000
+    ROUTE_ARCHIVE_INTERVAL_SEC: int = 3600
+    ROUTE_ARCHIVE_TIME_BUDGET_SEC: float = 300.0
+    ROUTE_ARCHIVE_BACKEND: str = "db"
+    ROUTE_ARCHIVE_DIR: str = "./data/route_archive"
+
+    # walk_tracking_points 월 단위 파티션 (MySQL): 미리 만들 개월 수, hot 행 보관 개월 수, 점검 주기(초)
+    # RETENTION 은 ROUTE_ARCHIVE_AFTER_DAYS 보다 길어야 파티션 삭제 전에 보관이 끝남
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_RETENTION_MONTHS: int = 3
+    PARTITION_MAINTENANCE_INTERVAL_SEC: int = 86400
+
+    # 가족 푸시 병합: 사용 여부, debounce(초), 첫 입력 후 최대 지연(초), 같은 행위 중복 제거 시간(초)
+    PUSH_COALESCE_ENABLED: bool = True
+    PUSH_DEBOUNCE_SEC: float = 5.0
+    PUSH_MAX_DELAY_SEC: float = 20.0
+    PUSH_DEDUP_SEC: float = 120.0
+    # 가족별 푸시 token bucket: 순간 최대 건수, 분당 리필 건수
+    PUSH_FAMILY_BURST: float = 6.0
+    PUSH_FAMILY_PER_MIN: float = 2.0
+
+    # FCM 대량 발송: 동시 전송 청크 수, 일시 오류 재시도 횟수, 전체 브로드캐스트 토큰 페이지 크기
+    FCM_FANOUT_MAX_WORKERS: int = 8
+    FCM_FANOUT_MAX_RETRIES: int = 3
+    FCM_BROADCAST_PAGE_SIZE: int = 5000
+    # 전체 브로드캐스트 작업: 워커 실행 주기(초), 작업 lease(초, 페이지마다 연장), 최대 재시도
+    BROADCAST_WORKER_INTERVAL_SEC: int = 30
+    BROADCAST_LEASE_SEC: int = 300
+    BROADCAST_MAX_ATTEMPTS: int = 5
+
+    # 벤치마크/테스트용 DB URL 직접 지정 (예: sqlite:///bench.db). 비우면 DB_* 값으로 MySQL URL 생성
+    DATABASE_URL_OVERRIDE: str = ""
+
     class Config:
         env_file = ".env"     # 프로젝트 루트에 있는 .env 자동 로딩
 
     @property
     def DATABASE_URL(self) -> str:
         """SQLAlchemy에서 사용할 MySQL 연결 URL 생성"""
+        if self.DATABASE_URL_OVERRIDE:
+            return self.DATABASE_URL_OVERRIDE
         return (
             f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -1,8 +1,8 @@
-from fastapi.responses import JSONResponse
 from datetime import datetime
+from app.core.responses import FastJSONResponse
 from app.schemas.error_schema import ErrorResponse
 
-def error_response(status: int, code: str, reason: str, path: str) -> JSONResponse:
+def error_response(status: int, code: str, reason: str, path: str) -> FastJSONResponse:
 
     error = ErrorResponse(
         success=False,
@@ -13,7 +13,7 @@ def error_response(status: int, code: str, reason: str, path: str) -> JSONRespon
         path=path
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status,
         content=error.model_dump()
     )
@@ -0,0 +1,84 @@
+"""
+조건부 GET (ETag / If-None-Match → 304)
+
+읽기 위주 화면(내 반려동물 / 산책 상세 / 추천 / 가족 구성원 / 통계)은 바뀌지 않은 데이터를 반복해서 다시 받는다.
+서비스가 권한 확인과 함께 본문 대신 싼 버전 값(change_log 최근 change_id / 작은 행의 값)만 읽어 ETag 를 정하고,
+요청의 If-None-Match 와 같으면 본문 조회 / 직렬화 없이 304 를 돌려준다.
+
+- strong ETag: (경로 + 쿼리, 보는 사람, 버전 값) 해시. timeStamp 처럼 매번 바뀌는 값은 포함하지 않음
+- 버전 값을 확정할 수 없으면(None) ETag 없이 평소처럼 200
+- Cache-Control: private, no-cache → 공유 캐시에 저장하지 않고, 클라이언트는 매번 재검증
+"""
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Header, Request
+from starlette.responses import Response
+
+from app.core import metrics
+
+
+ETAG_REQUESTS = metrics.counter(
+    "etag_requests_total", "조건부 GET 결과 (not_modified / full / untagged)", ["resource", "result"]
+)
+
+# 응답 모양이 바뀌는 배포에서 올리면 이전 ETag 가 모두 무효화됨
+ETAG_FORMAT = 1
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 는 weak 비교 (W/ 접두어 무시), * 는 모두 일치"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ConditionalGet:
+    def __init__(self, request: Request, if_none_match: Optional[str]):
+        query = request.url.query
+        self.target = request.url.path + ("?" + query if query else "")
+        self.if_none_match = if_none_match
+        self.etag: Optional[str] = None
+
+    def evaluate(self, resource: str, viewer_id: int, version: Any) -> Optional[Response]:
+        """
+        version 으로 ETag 를 정하고, If-None-Match 와 같으면 304 응답 (아니면 None → 200 을 만들어 headers() 첨부)
+        version 이 None 이면 ETag 없이 진행
+        """
+        if version is None:
+            self.etag = None
+            ETAG_REQUESTS.labels(resource, "untagged").inc()
+            return None
+
+        key = repr((ETAG_FORMAT, resource, self.target, viewer_id, version)).encode()
+        self.etag = f'"{hashlib.blake2b(key, digest_size=16).hexdigest()}"'
+
+        if _matches(self.if_none_match, self.etag):
+            ETAG_REQUESTS.labels(resource, "not_modified").inc()
+            return Response(status_code=304, headers=self.headers())
+
+        ETAG_REQUESTS.labels(resource, "full").inc()
+        return None
+
+    def headers(self) -> Optional[Dict[str, str]]:
+        if self.etag is None:
+            return None
+        return {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+
+
+def conditional_get(
+    request: Request,
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (바뀌지 않았으면 304)"),
+) -> ConditionalGet:
+    """라우트 dependency"""
+    return ConditionalGet(request, if_none_match)
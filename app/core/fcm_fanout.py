@@ -0,0 +1,226 @@
+"""
+FCM 대량 발송(fan-out) 엔진
+
+- 수신 토큰을 FCM multicast 한도(500) 이하 청크로 나눠 bounded executor 에서 동시 전송
+- 청크 결과를 success / invalid(앱 삭제 등 영구 실패) / failed 로 합산
+- 일시적 오류(UNAVAILABLE, INTERNAL, QUOTA_EXCEEDED 등)는 실패한 토큰만 jitter backoff 로 재시도
+- 청크별 전송 시간/재시도 수를 지표로 남김
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from firebase_admin import exceptions as firebase_exceptions
+from firebase_admin import messaging
+
+from app.core import metrics
+from app.core.config import settings
+
+FCM_MULTICAST_LIMIT = 500
+
+FCM_CHUNK_LATENCY = metrics.histogram(
+    "fcm_chunk_duration_seconds", "FCM multicast 청크 1개 전송 시간(초, 재시도 포함)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+FCM_CHUNKS = metrics.counter("fcm_chunks_total", "FCM multicast 청크 전송 결과", ("result",))
+FCM_RETRIES = metrics.counter("fcm_retries_total", "FCM 일시 오류 재시도 수")
+
+# 토큰 문제로 다시 보내도 소용없는 오류
+_INVALID_CODES = {"registration-token-not-registered", "invalid-argument", "NOT_FOUND", "INVALID_ARGUMENT"}
+# 잠시 후 다시 보내면 성공할 수 있는 오류
+_TRANSIENT_ERRORS = (
+    firebase_exceptions.UnavailableError,
+    firebase_exceptions.InternalError,
+    firebase_exceptions.DeadlineExceededError,
+    firebase_exceptions.ResourceExhaustedError,
+    messaging.QuotaExceededError,
+)
+_TRANSIENT_CODES = {"unavailable", "internal", "message-rate-exceeded", "quota-exceeded",
+                    "UNAVAILABLE", "INTERNAL", "QUOTA_EXCEEDED", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED"}
+
+
+@dataclass
+class FanoutResult:
+    success_count: int = 0
+    failure_count: int = 0
+    failed_tokens: List[str] = field(default_factory=list)
+    invalid_tokens: List[str] = field(default_factory=list)
+    failure_details: List[dict] = field(default_factory=list)
+    chunks: int = 0
+    retries: int = 0
+
+    def add(self, other: "FanoutResult") -> None:
+        self.success_count += other.success_count
+        self.failure_count += other.failure_count
+        self.failed_tokens.extend(other.failed_tokens)
+        self.invalid_tokens.extend(other.invalid_tokens)
+        self.failure_details.extend(other.failure_details)
+        self.chunks += other.chunks
+        self.retries += other.retries
+
+    def as_dict(self) -> dict:
+        """send_push_notification_to_multiple 의 기존 반환 형식"""
+        return {
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "failed_tokens": self.failed_tokens,
+            "invalid_tokens": self.invalid_tokens,
+            "failure_details": self.failure_details,
+        }
+
+
+def _is_invalid(error) -> bool:
+    return isinstance(error, messaging.UnregisteredError) or getattr(error, "code", None) in _INVALID_CODES
+
+
+def _is_transient(error) -> bool:
+    return isinstance(error, _TRANSIENT_ERRORS) or getattr(error, "code", None) in _TRANSIENT_CODES
+
+
+def chunked(tokens: List[str], size: int = FCM_MULTICAST_LIMIT) -> List[List[str]]:
+    return [tokens[i:i + size] for i in range(0, len(tokens), size)]
+
+
+class FcmFanout:
+    def __init__(
+        self,
+        max_workers: int = 8,
+        chunk_size: int = FCM_MULTICAST_LIMIT,
+        max_retries: int = 3,
+        base_delay_sec: float = 0.5,
+        max_delay_sec: float = 8.0,
+        send: Optional[Callable] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_workers = max_workers
+        self.chunk_size = min(chunk_size, FCM_MULTICAST_LIMIT)
+        self.max_retries = max_retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        # 테스트/벤치마크에서 messaging.send_each_for_multicast 교체가 반영되도록 호출 시점에 조회
+        self._send = send
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor_(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="fcm-fanout"
+                    )
+        return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return self.rng.uniform(0, min(self.max_delay_sec, self.base_delay_sec * (2 ** attempt)))
+
+    # -------------------------------------------------
+    # 청크 1개 전송 (재시도 포함)
+    # -------------------------------------------------
+    def send_chunk(self, tokens: List[str], build_message: Callable[[List[str]], "messaging.MulticastMessage"]) -> FanoutResult:
+        send = self._send or messaging.send_each_for_multicast
+        result = FanoutResult(chunks=1)
+        pending = list(tokens)
+        started = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            retry: List[str] = []
+            last_errors = {}
+            try:
+                response = send(build_message(pending))
+            except Exception as e:
+                if _is_transient(e) and attempt < self.max_retries:
+                    retry = pending
+                else:
+                    result.failure_count += len(pending)
+                    result.failed_tokens.extend(pending)
+                    result.failure_details.extend(
+                        {"token": t, "code": "exception", "exception": type(e).__name__} for t in pending
+                    )
+                    print(f"[FCM] Chunk send error ({len(pending)} tokens): {e}")
+            else:
+                for token, send_response in zip(pending, response.responses):
+                    if send_response.success:
+                        result.success_count += 1
+                        continue
+                    error = getattr(send_response, "exception", None)
+                    if _is_invalid(error):
+                        result.invalid_tokens.append(token)
+                    elif _is_transient(error) and attempt < self.max_retries:
+                        retry.append(token)
+                        last_errors[token] = error
+                        continue
+                    result.failure_count += 1
+                    result.failed_tokens.append(token)
+                    result.failure_details.append({
+                        "token": token,
+                        "code": getattr(error, "code", None),
+                        "exception": type(error).__name__ if error else "UnknownError",
+                    })
+
+            if not retry:
+                break
+            result.retries += 1
+            FCM_RETRIES.inc()
+            self.sleep(self._backoff(attempt))
+            pending = retry
+
+        # 무효 토큰도 실패 건수에 포함 (기존 반환 형식과 동일)
+        result.failure_count += len(result.invalid_tokens)
+        FCM_CHUNK_LATENCY.observe(time.perf_counter() - started)
+        FCM_CHUNKS.labels("ok" if result.failure_count == 0 else "partial" if result.success_count else "failed").inc()
+        return result
+
+    # -------------------------------------------------
+    # 전체 fan-out
+    # -------------------------------------------------
+    def send_multicast(self, tokens: List[str], build_message: Callable[[List[str]], "messaging.MulticastMessage"]) -> FanoutResult:
+        unique = list(dict.fromkeys(t for t in tokens if t))
+        chunks = chunked(unique, self.chunk_size)
+        total = FanoutResult()
+        if not chunks:
+            return total
+
+        # 청크 1개면 executor 를 거치지 않고 호출 스레드에서 바로 전송
+        if len(chunks) == 1:
+            total.add(self.send_chunk(chunks[0], build_message))
+            return total
+
+        futures = [self._executor_().submit(self.send_chunk, chunk, build_message) for chunk in chunks]
+        for future in futures:
+            total.add(future.result())
+        return total
+
+
+_fanout: Optional[FcmFanout] = None
+_fanout_lock = threading.Lock()
+
+
+def get_fanout() -> FcmFanout:
+    global _fanout
+    if _fanout is None:
+        with _fanout_lock:
+            if _fanout is None:
+                _fanout = FcmFanout(
+                    max_workers=settings.FCM_FANOUT_MAX_WORKERS,
+                    max_retries=settings.FCM_FANOUT_MAX_RETRIES,
+                )
+    return _fanout
+
+
+def shutdown_fanout() -> None:
+    if _fanout is not None:
+        _fanout.shutdown()
@@ -8,6 +8,15 @@ import firebase_admin
 from firebase_admin import auth, credentials, messaging, storage
 
 from app.core.config import settings
+from app.core import metrics
+from app.core.fcm_fanout import get_fanout
+
+FCM_MESSAGES = metrics.counter(
+    "fcm_messages_total", "FCM 전송 메시지 수 (토큰 단위)", ("kind", "result")
+)
+FCM_DISPATCH_LATENCY = metrics.histogram(
+    "fcm_dispatch_duration_seconds", "FCM 전송 호출 시간(초)", ("kind",)
+)
 
 
 def _load_firebase_credentials(raw_cred: str):
@@ -66,7 +75,20 @@ else:
     print(f"[INFO] Firebase Admin SDK already initialized")
 
 
+# 토큰 검증 함수 교체 지점 (벤치마크/테스트에서 로컬 서명 토큰 검증기로 교체)
+_token_verifier = None
+
+
+def set_token_verifier(verifier) -> None:
+    """verifier(id_token) -> decoded dict 또는 None. None을 넘기면 Firebase 검증으로 복귀"""
+    global _token_verifier
+    _token_verifier = verifier
+
+
 def verify_firebase_token(id_token: str):
+    if _token_verifier is not None:
+        return _token_verifier(id_token)
+
     try:
         # check_revoked=False로 설정하여 성능 향상
         # clock_skew_seconds=60으로 시계 오차 60초까지 허용
@@ -156,16 +178,20 @@ def send_push_notification(
         )
         
         # 메시지 전송
-        response = messaging.send(message)
+        with FCM_DISPATCH_LATENCY.labels("single").time():
+            response = messaging.send(message)
+        FCM_MESSAGES.labels("single", "success").inc()
         print(f"[FCM] Successfully sent message: {response}")
         return True
         
     except messaging.UnregisteredError:
         # 토큰이 더 이상 유효하지 않음 (앱 삭제 등)
+        FCM_MESSAGES.labels("single", "invalid").inc()
         print(f"[FCM] Token is no longer valid: {fcm_token[:20]}...")
         return False
         
     except Exception as e:
+        FCM_MESSAGES.labels("single", "failure").inc()
         print(f"[FCM] Error sending message: {e}")
         return False
 
@@ -175,6 +201,7 @@ def send_push_notification_to_multiple(
     title: str,
     body: str,
     data: Optional[Dict[str, Any]] = None,
+    collapse_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     여러 사용자에게 FCM 푸시 알림을 전송합니다.
@@ -184,6 +211,7 @@ def send_push_notification_to_multiple(
         title: 알림 제목
         body: 알림 본문
         data: 추가 데이터 (선택사항)
+        collapse_key: 같은 키의 이전 알림을 기기에서 대체 (선택사항)
     
     Returns:
         Dict: 전송 결과 (success_count, failure_count, failed_tokens)
@@ -196,70 +224,46 @@ def send_push_notification_to_multiple(
     if not valid_tokens:
         return {"success_count": 0, "failure_count": 0, "failed_tokens": []}
     
-    try:
-        payload_data = {k: str(v) for k, v in (data or {}).items()}
-        if "type" not in payload_data:
-            payload_data["type"] = payload_data.get("type", "GENERIC")
+    payload_data = {k: str(v) for k, v in (data or {}).items()}
+    if "type" not in payload_data:
+        payload_data["type"] = payload_data.get("type", "GENERIC")
 
-        # MulticastMessage 구성
-        message = messaging.MulticastMessage(
+    def build_message(tokens: list) -> messaging.MulticastMessage:
+        return messaging.MulticastMessage(
             notification=messaging.Notification(
                 title=title,
                 body=body,
             ),
             data=payload_data,
-            tokens=valid_tokens,
+            tokens=tokens,
             android=messaging.AndroidConfig(
                 priority="high",
+                collapse_key=collapse_key,
                 notification=messaging.AndroidNotification(
                     icon="ic_notification",
                     color="#FF6B6B",
                     sound="default",
                     click_action="OPEN_NOTIFICATION",
+                    # 같은 tag 알림은 알림창에서 새 알림으로 교체됨
+                    tag=collapse_key,
                 ),
             ),
+            apns=(
+                messaging.APNSConfig(headers={"apns-collapse-id": collapse_key})
+                if collapse_key
+                else None
+            ),
         )
-        
-        # 메시지 전송
-        response = messaging.send_each_for_multicast(message)
-        
-        # 실패한 토큰 수집
-        failed_tokens = []
-        invalid_tokens = []
-        failure_details = []
-        for idx, send_response in enumerate(response.responses):
-            if not send_response.success:
-                failed_tokens.append(valid_tokens[idx])
-                error_obj = getattr(send_response, "exception", None)
-                error_code = getattr(error_obj, "code", None)
-                failure_details.append({
-                    "token": valid_tokens[idx],
-                    "code": error_code,
-                    "exception": type(error_obj).__name__ if error_obj else "UnknownError",
-                })
-                if isinstance(error_obj, messaging.UnregisteredError) or error_code in (
-                    "registration-token-not-registered",
-                    "invalid-argument",
-                ):
-                    invalid_tokens.append(valid_tokens[idx])
-        
-        print(f"[FCM] Multicast result: {response.success_count} success, {response.failure_count} failures")
-        
-        return {
-            "success_count": response.success_count,
-            "failure_count": response.failure_count,
-            "failed_tokens": failed_tokens,
-            "invalid_tokens": invalid_tokens,
-            "failure_details": failure_details,
-        }
-        
-    except Exception as e:
-        print(f"[FCM] Error sending multicast: {e}")
-        return {
-            "success_count": 0,
-            "failure_count": len(valid_tokens),
-            "failed_tokens": valid_tokens,
-            # Do NOT mark all tokens invalid on generic errors; keep them for retry.
-            "invalid_tokens": [],
-            "failure_details": [{"token": t, "code": "exception", "exception": type(e).__name__} for t in valid_tokens],
-        }
+
+    # 500개 단위 청크로 나눠 동시 전송 + 일시 오류 재시도 (app/core/fcm_fanout.py)
+    with FCM_DISPATCH_LATENCY.labels("multicast").time():
+        result = get_fanout().send_multicast(valid_tokens, build_message)
+
+    FCM_MESSAGES.labels("multicast", "success").inc(result.success_count)
+    FCM_MESSAGES.labels("multicast", "failure").inc(result.failure_count - len(result.invalid_tokens))
+    FCM_MESSAGES.labels("multicast", "invalid").inc(len(result.invalid_tokens))
+    print(
+        f"[FCM] Multicast result: {result.success_count} success, {result.failure_count} failures "
+        f"({result.chunks} chunks, {result.retries} retries)"
+    )
+    return result.as_dict()
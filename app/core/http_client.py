@@ -0,0 +1,130 @@
+# app/core/http_client.py
+
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+from app.core import metrics
+
+
+HTTP_CLIENT_REQUESTS = metrics.counter(
+    "http_client_requests_total", "외부 HTTP 호출 수", ("host", "status")
+)
+HTTP_CLIENT_LATENCY = metrics.histogram(
+    "http_client_request_duration_seconds", "외부 HTTP 호출 시간(초)", ("host",)
+)
+
+DEFAULT_TIMEOUT = httpx.Timeout(5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+def _record(request: httpx.Request, status, start: float) -> None:
+    host = request.url.host
+    HTTP_CLIENT_LATENCY.labels(host).observe(time.perf_counter() - start)
+    HTTP_CLIENT_REQUESTS.labels(host, status).inc()
+
+
+class MetricsTransport(httpx.BaseTransport):
+    """요청 단위로 호스트별 지연/상태코드를 기록하는 transport 래퍼"""
+
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None):
+        self._transport = transport or httpx.HTTPTransport(limits=DEFAULT_LIMITS)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TimeoutException:
+            _record(request, "timeout", start)
+            raise
+        except httpx.TransportError:
+            _record(request, "error", start)
+            raise
+        _record(request, response.status_code, start)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncMetricsTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._transport = transport or httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            _record(request, "timeout", start)
+            raise
+        except httpx.TransportError:
+            _record(request, "error", start)
+            raise
+        _record(request, response.status_code, start)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# ============================================================
+# 프로세스 공유 클라이언트 (커넥션 재사용)
+# ============================================================
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(transport=MetricsTransport(), timeout=DEFAULT_TIMEOUT)
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None:
+        with _lock:
+            if _async_client is None:
+                _async_client = httpx.AsyncClient(
+                    transport=AsyncMetricsTransport(), timeout=DEFAULT_TIMEOUT
+                )
+    return _async_client
+
+
+def set_http_transport(
+    transport: Optional[httpx.BaseTransport] = None,
+    async_transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> None:
+    """테스트/벤치마크에서 MockTransport 등으로 교체할 때 사용 (지표 기록은 유지)"""
+    global _client, _async_client
+    with _lock:
+        if transport is not None:
+            _client = httpx.Client(transport=MetricsTransport(transport), timeout=DEFAULT_TIMEOUT)
+        if async_transport is not None:
+            _async_client = httpx.AsyncClient(
+                transport=AsyncMetricsTransport(async_transport), timeout=DEFAULT_TIMEOUT
+            )
+
+
+def close_http_clients() -> None:
+    global _client, _async_client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+async def aclose_http_clients() -> None:
+    global _async_client
+    close_http_clients()
+    with _lock:
+        client, _async_client = _async_client, None
+    if client is not None:
+        await client.aclose()
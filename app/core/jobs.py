@@ -0,0 +1,137 @@
+# app/core/jobs.py
+
+from app.core.config import settings
+from app.core.scheduler import MySQLNamedLock, Scheduler, TableLease
+from app.db import SessionLocal, engine
+
+
+# ============================================================
+# 작업 본문 (각 작업은 자체 세션을 열고 닫음)
+# ============================================================
+def refresh_walk_recommendations() -> dict:
+    from app.domains.pets.service.recommendation_refresh_service import RecommendationRefreshService
+
+    db = SessionLocal()
+    try:
+        return RecommendationRefreshService(db).refresh_all()
+    finally:
+        db.close()
+
+
+def send_weather_advice() -> dict:
+    from app.domains.notifications.service.batch_advice_service import run_weather_advice_job
+
+    return run_weather_advice_job()
+
+
+def send_health_advice() -> dict:
+    from app.domains.notifications.service.batch_advice_service import run_health_advice_job
+
+    return run_health_advice_job()
+
+
+def close_stale_walks() -> dict:
+    from app.domains.walk.service.stale_walk_service import StaleWalkService
+
+    db = SessionLocal()
+    try:
+        return StaleWalkService(db).close_stale_walks()
+    finally:
+        db.close()
+
+
+def purge_change_log() -> dict:
+    from app.domains.sync.service.sync_service import SyncService
+
+    db = SessionLocal()
+    try:
+        return SyncService(db).purge_change_log()
+    finally:
+        db.close()
+
+
+def archive_walk_routes() -> dict:
+    from app.domains.walk.service.route_archive_service import RouteArchiveService
+
+    db = SessionLocal()
+    try:
+        return RouteArchiveService(db).archive_old_routes()
+    finally:
+        db.close()
+
+
+def maintain_partitions() -> dict:
+    from app.domains.walk.service.partition_service import PartitionMaintenanceService
+
+    db = SessionLocal()
+    try:
+        return PartitionMaintenanceService(db).maintain()
+    finally:
+        db.close()
+
+
+def run_purge_jobs() -> dict:
+    from app.domains.users.service.purge_service import PurgeService
+
+    db = SessionLocal()
+    try:
+        return PurgeService(db).run()
+    finally:
+        db.close()
+
+
+def run_broadcast_jobs() -> dict:
+    from app.domains.notifications.service.broadcast_service import BroadcastService
+
+    db = SessionLocal()
+    try:
+        return BroadcastService(db).run_pending()
+    finally:
+        db.close()
+
+
+# ============================================================
+# 스케줄러 구성
+# ============================================================
+def build_lease():
+    if (settings.SCHEDULER_LEASE_BACKEND or "").lower() == "mysql_lock":
+        return MySQLNamedLock(engine)
+    return TableLease(SessionLocal)
+
+
+def register_jobs(scheduler: Scheduler) -> Scheduler:
+    # 매일 06:00 KST 날씨 기반 산책 추천
+    scheduler.add_cron_job("weather_advice", send_weather_advice, "0 6 * * *", jitter_sec=60, lease_ttl_sec=3600)
+    # 매주 월요일 09:00 KST 건강 요약
+    scheduler.add_cron_job("health_advice", send_health_advice, "0 9 * * 1", jitter_sec=60, lease_ttl_sec=3600)
+    # 매일 03:30 KST 로컬 엔진 추천값 재계산
+    scheduler.add_cron_job("walk_rec_refresh", refresh_walk_recommendations, "30 3 * * *", lease_ttl_sec=3600)
+    # 방치된 진행 중 산책 자동 종료
+    scheduler.add_interval_job(
+        "stale_walk_closer", close_stale_walks, settings.STALE_WALK_CHECK_INTERVAL_SEC, lease_ttl_sec=600
+    )
+    # 보관 기간 지난 동기화 변경 기록 정리
+    scheduler.add_interval_job(
+        "change_log_purge", purge_change_log, settings.SYNC_CHANGE_LOG_PURGE_INTERVAL_SEC, lease_ttl_sec=600
+    )
+    # 계정/가족/반려동물 삭제 후 연관 데이터 묶음 단위 정리
+    scheduler.add_interval_job(
+        "purge_worker", run_purge_jobs, settings.PURGE_INTERVAL_SEC, lease_ttl_sec=120
+    )
+    # 운영자 전체 푸시 작업 (요청 직후 실행이 중단된 작업을 저장된 cursor 부터 이어서)
+    scheduler.add_interval_job(
+        "broadcast_worker", run_broadcast_jobs, settings.BROADCAST_WORKER_INTERVAL_SEC, lease_ttl_sec=120
+    )
+    # 오래된 산책 경로 압축 보관 + hot 행 정리
+    scheduler.add_interval_job(
+        "route_archiver", archive_walk_routes, settings.ROUTE_ARCHIVE_INTERVAL_SEC, lease_ttl_sec=600
+    )
+    # walk_tracking_points 미래 파티션 생성 + 보관 끝난 오래된 파티션 삭제
+    scheduler.add_interval_job(
+        "partition_maintenance", maintain_partitions, settings.PARTITION_MAINTENANCE_INTERVAL_SEC, lease_ttl_sec=1800
+    )
+    return scheduler
+
+
+def create_scheduler() -> Scheduler:
+    return register_jobs(Scheduler(lease=build_lease()))
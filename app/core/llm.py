@@ -0,0 +1,41 @@
+import json
+import threading
+from typing import Optional
+
+from openai import OpenAI
+
+from app.core.config import settings
+
+
+# 프로세스 전체에서 공유하는 OpenAI 클라이언트 (서비스 인스턴스마다 새로 만들지 않음)
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
+def get_openai_client() -> OpenAI:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    return _client
+
+
+def set_openai_client(client) -> None:
+    """테스트/벤치마크에서 가짜 클라이언트로 교체할 때 사용"""
+    global _client
+    with _client_lock:
+        _client = client
+
+
+def parse_json_content(content: str) -> dict:
+    """LLM 응답에서 코드펜스를 제거하고 JSON 객체로 파싱"""
+    cleaned = (
+        (content or "")
+        .replace("```json", "")
+        .replace("```", "")
+        .strip()
+    )
+    return json.loads(cleaned)
@@ -0,0 +1,572 @@
+# app/core/metrics.py
+
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)
+DEFAULT_SIZE_BUCKETS = (
+    100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000,
+)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ============================================================
+# Metric 타입 (Prometheus 텍스트 포맷 호환, 외부 의존성 없음)
+# ============================================================
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: expected labels {self.labelnames}")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _default(self):
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def items(self):
+        with self._lock:
+            return list(self._children.items())
+
+
+class _ValueChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class Gauge(_Metric):
+    """
+    multiprocess_mode: 여러 워커 값을 합칠 때 sum(기본) / max / min
+    (죽은 워커의 gauge 값은 합산에서 제외)
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), multiprocess_mode: str = "sum"):
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)   # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[idx] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        return _Timer(self)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+
+class _Timer:
+    __slots__ = ("child", "start")
+
+    def __init__(self, child):
+        self.child = child
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.child.observe(time.perf_counter() - self.start)
+        return False
+
+
+# ============================================================
+# Registry
+# ============================================================
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # 모듈 재import 시 같은 metric을 재사용
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=(), multiprocess_mode="sum") -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, multiprocess_mode))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, func: Callable[[], None]) -> None:
+        """scrape 직전에 호출되어 gauge 등을 갱신하는 콜백 (DB pool, 스케줄러 등)"""
+        with self._lock:
+            self._collectors.append(func)
+
+    def collect(self) -> None:
+        for func in list(self._collectors):
+            try:
+                func()
+            except Exception as e:
+                print("METRICS COLLECTOR ERROR:", e)
+
+    # -----------------------
+    # 스냅샷 (멀티프로세스 집계용)
+    # -----------------------
+    def snapshot(self) -> dict:
+        self.collect()
+        metrics = {}
+        for name, m in list(self._metrics.items()):
+            entry = {
+                "type": m.kind,
+                "help": m.documentation,
+                "labelnames": list(m.labelnames),
+            }
+            if isinstance(m, Histogram):
+                entry["buckets"] = list(m.buckets)
+                entry["samples"] = [
+                    [list(k), list(c.counts), c.sum, c.count] for k, c in m.items()
+                ]
+            else:
+                entry["samples"] = [[list(k), c.value] for k, c in m.items()]
+                if isinstance(m, Gauge):
+                    entry["mode"] = m.multiprocess_mode
+            metrics[name] = entry
+        return {"pid": os.getpid(), "metrics": metrics}
+
+
+REGISTRY = Registry()
+
+
+def counter(name, documentation, labelnames=()) -> Counter:
+    return REGISTRY.counter(name, documentation, labelnames)
+
+
+def gauge(name, documentation, labelnames=(), multiprocess_mode="sum") -> Gauge:
+    return REGISTRY.gauge(name, documentation, labelnames, multiprocess_mode)
+
+
+def histogram(name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS) -> Histogram:
+    return REGISTRY.histogram(name, documentation, labelnames, buckets)
+
+
+def register_collector(func: Callable[[], None]) -> None:
+    REGISTRY.register_collector(func)
+
+
+# ============================================================
+# 멀티프로세스 워커 집계
+# - 각 워커가 METRICS_MULTIPROC_DIR/<pid>.json 으로 스냅샷을 주기적으로 기록
+# - /metrics 를 받은 워커가 자기 최신 스냅샷 + 다른 워커 파일을 합산
+# - 죽은 워커 파일은 시작 시 정리, 오래 갱신되지 않은 파일(METRICS_SNAPSHOT_STALE_SEC)은 읽을 때 정리
+# ============================================================
+def _multiproc_dir() -> Optional[str]:
+    return settings.METRICS_MULTIPROC_DIR or None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+def _snapshot_pid(path: str) -> Optional[int]:
+    try:
+        return int(os.path.basename(path).split(".")[0])
+    except ValueError:
+        return None
+
+
+def _remove_snapshot(path: str, reason: str) -> None:
+    try:
+        os.remove(path)
+        print(f"[METRICS] removed {reason} snapshot: {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print("METRICS SNAPSHOT REMOVE ERROR:", path, e)
+
+
+def cleanup_snapshots() -> None:
+    """워커 시작 시: 이 호스트에서 살아있지 않은 pid 의 스냅샷 / 남은 임시 파일 삭제"""
+    directory = _multiproc_dir()
+    if not directory or not os.path.isdir(directory):
+        return
+
+    for path in glob.glob(os.path.join(directory, "*.json.tmp")):
+        pid = _snapshot_pid(path)
+        if pid is None or not _pid_alive(pid):
+            _remove_snapshot(path, "leftover")
+
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        pid = _snapshot_pid(path)
+        if pid is not None and pid != os.getpid() and not _pid_alive(pid):
+            _remove_snapshot(path, "dead worker")
+
+
+def write_snapshot(registry: Registry = REGISTRY) -> None:
+    directory = _multiproc_dir()
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(registry.snapshot(), f)
+    os.replace(tmp, path)
+
+
+def _load_snapshots(registry: Registry) -> List[Tuple[dict, bool]]:
+    """(스냅샷, 살아있는 워커 여부) 목록"""
+    own = registry.snapshot()
+    snapshots = [(own, True)]
+
+    directory = _multiproc_dir()
+    if not directory:
+        return snapshots
+
+    stale_before = time.time() - settings.METRICS_SNAPSHOT_STALE_SEC
+
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        pid = _snapshot_pid(path)
+        if pid is None or pid == own["pid"]:
+            continue
+        try:
+            # 재시작/종료된 워커 (다른 호스트 포함) 는 더 이상 갱신하지 않음 → 합산에서 제외하고 정리
+            if os.path.getmtime(path) < stale_before:
+                _remove_snapshot(path, "stale")
+                continue
+            with open(path) as f:
+                snapshots.append((json.load(f), _pid_alive(pid)))
+        except (OSError, ValueError) as e:
+            print("METRICS SNAPSHOT READ ERROR:", path, e)
+    return snapshots
+
+
+def _merge(snapshots: List[Tuple[dict, bool]]) -> Dict[str, dict]:
+    merged: Dict[str, dict] = {}
+
+    for snap, alive in snapshots:
+        for name, entry in snap.get("metrics", {}).items():
+            kind = entry["type"]
+            if kind == "gauge" and not alive:
+                continue
+
+            target = merged.setdefault(name, {
+                "type": kind,
+                "help": entry["help"],
+                "labelnames": entry["labelnames"],
+                "buckets": entry.get("buckets"),
+                "mode": entry.get("mode", "sum"),
+                "samples": {},
+            })
+            samples = target["samples"]
+
+            for sample in entry["samples"]:
+                key = tuple(sample[0])
+                if kind == "histogram":
+                    counts, total, count = sample[1], sample[2], sample[3]
+                    prev = samples.get(key)
+                    if prev is None:
+                        samples[key] = [list(counts), total, count]
+                    else:
+                        prev[0] = [a + b for a, b in zip(prev[0], counts)]
+                        prev[1] += total
+                        prev[2] += count
+                else:
+                    value = sample[1]
+                    if key not in samples:
+                        samples[key] = value
+                    elif kind == "gauge" and target["mode"] == "max":
+                        samples[key] = max(samples[key], value)
+                    elif kind == "gauge" and target["mode"] == "min":
+                        samples[key] = min(samples[key], value)
+                    else:
+                        samples[key] += value
+    return merged
+
+
+# ============================================================
+# 텍스트 포맷 출력
+# ============================================================
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names, values, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def generate_latest(registry: Registry = REGISTRY) -> str:
+    merged = _merge(_load_snapshots(registry))
+    lines = []
+
+    for name in sorted(merged):
+        m = merged[name]
+        lines.append(f"# HELP {name} {m['help']}")
+        lines.append(f"# TYPE {name} {m['type']}")
+        names = m["labelnames"]
+
+        for key in sorted(m["samples"]):
+            sample = m["samples"][key]
+            if m["type"] == "histogram":
+                counts, total, count = sample
+                cumulative = 0
+                for bound, c in zip(list(m["buckets"]) + [float("inf")], counts):
+                    cumulative += c
+                    lines.append(
+                        f"{name}_bucket{_labels_text(names, key, ('le', _fmt(bound)))} {cumulative}"
+                    )
+                lines.append(f"{name}_sum{_labels_text(names, key)} {_fmt(total)}")
+                lines.append(f"{name}_count{_labels_text(names, key)} {count}")
+            else:
+                lines.append(f"{name}{_labels_text(names, key)} {_fmt(sample)}")
+
+    return "\n".join(lines) + "\n"
+
+
+# ============================================================
+# 스냅샷 주기 기록 (멀티프로세스 모드에서만)
+# ============================================================
+_flusher: Optional[threading.Thread] = None
+_flusher_stop = threading.Event()
+
+
+def start_snapshot_flusher(interval_sec: Optional[float] = None) -> None:
+    global _flusher
+    if not _multiproc_dir() or (_flusher and _flusher.is_alive()):
+        return
+
+    interval = interval_sec or settings.METRICS_FLUSH_INTERVAL_SEC
+    cleanup_snapshots()
+
+    def loop():
+        while not _flusher_stop.wait(interval):
+            try:
+                write_snapshot()
+            except Exception as e:
+                print("METRICS SNAPSHOT WRITE ERROR:", e)
+
+    _flusher_stop.clear()
+    _flusher = threading.Thread(target=loop, name="metrics-flusher", daemon=True)
+    _flusher.start()
+    atexit.register(stop_snapshot_flusher)
+
+
+def stop_snapshot_flusher() -> None:
+    global _flusher
+    _flusher_stop.set()
+    if _flusher:
+        _flusher.join(timeout=1)
+        _flusher = None
+    try:
+        write_snapshot()
+    except Exception as e:
+        print("METRICS SNAPSHOT WRITE ERROR:", e)
+
+
+# ============================================================
+# HTTP 지표 (미들웨어에서 사용)
+# ============================================================
+HTTP_REQUESTS = counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_LATENCY = histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route")
+)
+HTTP_RESPONSE_SIZE = histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기(byte)", ("method", "route"),
+    buckets=DEFAULT_SIZE_BUCKETS,
+)
+HTTP_IN_FLIGHT = gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware 미사용: 응답 스트림 복사 없음)
+    - route 라벨은 raw path가 아닌 라우트 템플릿 (/api/v1/record/walks/{walk_id})
+    - 라우팅 후 scope["endpoint"]로 템플릿을 찾고, 매칭 안 된 요청은 하나의 라벨로 묶음
+    """
+
+    def __init__(self, app, skip_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths)
+        self._templates: Optional[Dict[object, str]] = None
+        # (method, route, status) → 라벨 child 캐시 (요청마다 labels() 조회 생략)
+        self._children: Dict[tuple, tuple] = {}
+        self._in_flight = HTTP_IN_FLIGHT._default()
+
+    def _route_template(self, scope) -> str:
+        route = scope.get("route")
+        if route is not None and getattr(route, "path_format", None):
+            return route.path_format
+
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        if self._templates is None:
+            templates = {}
+            app = scope.get("app")
+            for r in getattr(getattr(app, "router", None), "routes", []):
+                ep = getattr(r, "endpoint", None)
+                if ep is not None:
+                    templates.setdefault(ep, getattr(r, "path_format", r.path))
+            self._templates = templates
+        return self._templates.get(endpoint, UNMATCHED_ROUTE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = self._in_flight
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+
+            key = (scope["method"], scope.get("endpoint"), status_code)
+            children = self._children.get(key)
+            if children is None:
+                children = self._children_for(scope, status_code)
+                self._children[key] = children
+            requests, latency, response_size = children
+            requests.inc()
+            latency.observe(elapsed)
+            response_size.observe(size)
+
+    def _children_for(self, scope, status_code) -> tuple:
+        method = scope["method"]
+        route = self._route_template(scope)
+        return (
+            HTTP_REQUESTS.labels(method, route, status_code),
+            HTTP_LATENCY.labels(method, route),
+            HTTP_RESPONSE_SIZE.labels(method, route),
+        )
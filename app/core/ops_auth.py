@@ -0,0 +1,32 @@
+"""
+운영용 엔드포인트 인증 (/metrics, /scheduler/jobs)
+
+앱 사용자(Firebase) 인증과 별개로, 설정의 OPS_API_TOKEN 을 Bearer 토큰으로 받은 요청만 허용한다.
+- OPS_API_TOKEN 이 비어 있으면 엔드포인트 자체를 숨김 (404)
+- 토큰이 없거나 다르면 401
+"""
+import hmac
+from typing import Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.error_handler import error_response
+from app.core.responses import FastJSONResponse
+
+
+def ops_auth_error(request: Request, authorization: Optional[str]) -> Optional[FastJSONResponse]:
+    """허용된 요청이면 None, 아니면 바로 돌려줄 에러 응답"""
+    path = request.url.path
+    token = settings.OPS_API_TOKEN
+
+    if not token:
+        return error_response(404, "OPS_404_1", "사용할 수 없는 엔드포인트입니다.", path)
+
+    if not authorization or not authorization.startswith("Bearer "):
+        return error_response(401, "OPS_401_1", "Authorization 헤더가 필요합니다.", path)
+
+    if not hmac.compare_digest(authorization[len("Bearer "):].encode(), token.encode()):
+        return error_response(401, "OPS_401_2", "유효하지 않은 운영 토큰입니다.", path)
+
+    return None
@@ -0,0 +1,111 @@
+"""
+MySQL 월 단위 RANGE COLUMNS 파티션 관리
+
+파티션 pYYYYMM = 그 달의 행 (VALUES LESS THAN 다음 달 1일), 마지막은 pmax (MAXVALUE).
+- ensure_future: pmax 를 REORGANIZE 해서 앞으로 months_ahead 개월 파티션을 미리 만들어 둠 (pmax 에 행이 쌓이지 않도록)
+- drop_before: 상한이 cutoff 이하인 파티션을 DROP (can_drop 이 허락한 것만). DELETE 와 달리 행 단위 잠금/undo 없이 즉시
+MySQL 이 아니거나 파티션이 없는 테이블이면 아무것도 하지 않음
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+MAXVALUE_PARTITION = "pmax"
+
+
+@dataclass
+class Partition:
+    name: str
+    upper: Optional[date]  # None = MAXVALUE
+    rows: int  # information_schema 추정치
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_clause(month: date) -> str:
+    return f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{add_months(month, 1).isoformat()}')"
+
+
+def _parse_upper(description: Optional[str]) -> Optional[date]:
+    if description is None or description.upper() == "MAXVALUE":
+        return None
+    return datetime.fromisoformat(description.strip("'").split(" ")[0]).date()
+
+
+class MonthlyPartitions:
+    def __init__(self, conn: Connection, table: str):
+        self.conn = conn
+        self.table = table
+
+    def is_supported(self) -> bool:
+        return self.conn.dialect.name == "mysql" and bool(self.list())
+
+    def list(self) -> List[Partition]:
+        if self.conn.dialect.name != "mysql":
+            return []
+        rows = self.conn.execute(
+            text(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS "
+                "FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"table": self.table},
+        ).all()
+        return [Partition(name, _parse_upper(description), int(table_rows or 0)) for name, description, table_rows in rows]
+
+    # =====================================================
+    # 앞으로 쓸 파티션 미리 만들기
+    # =====================================================
+    def ensure_future(self, today: date, months_ahead: int) -> List[str]:
+        partitions = self.list()
+        bounded = [p.upper for p in partitions if p.upper is not None]
+        if not bounded:
+            return []
+
+        # 마지막 월 파티션 다음 달부터 (오늘 + months_ahead) 달까지
+        month = max(bounded)
+        last_month = add_months(month_start(today), months_ahead)
+        clauses = []
+        created = []
+        while month <= last_month:
+            clauses.append(partition_clause(month))
+            created.append(f"p{month:%Y%m}")
+            month = add_months(month, 1)
+        if not clauses:
+            return []
+
+        if any(p.name == MAXVALUE_PARTITION for p in partitions):
+            clauses.append(f"PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+            self.conn.execute(text(
+                f"ALTER TABLE {self.table} REORGANIZE PARTITION {MAXVALUE_PARTITION} INTO ({', '.join(clauses)})"
+            ))
+        else:
+            self.conn.execute(text(f"ALTER TABLE {self.table} ADD PARTITION ({', '.join(clauses)})"))
+        return created
+
+    # =====================================================
+    # 보관 기간 지난 파티션 삭제
+    # =====================================================
+    def drop_before(self, cutoff: date, can_drop: Callable[[str], bool]) -> List[str]:
+        dropped = []
+        for partition in self.list():
+            if partition.upper is None or partition.upper > cutoff:
+                continue
+            if not can_drop(partition.name):
+                print(f"[PARTITIONS] {self.table}.{partition.name} 유지 (정리되지 않은 행 있음)")
+                continue
+            self.conn.execute(text(f"ALTER TABLE {self.table} DROP PARTITION {partition.name}"))
+            dropped.append(partition.name)
+        return dropped
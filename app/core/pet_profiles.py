@@ -0,0 +1,229 @@
+"""
+반려동물 프로필 묶음 캐시 (펫 + 산책 목표 + 추천 산책)
+
+추천 조회 / 산책 추천 멘트 / 건강·날씨 알림 / 홈 화면이 요청마다 pets, pet_walk_goals,
+pet_walk_recommendations 를 따로 다시 읽던 것을 pet_id → PetProfile 캐시로 대체한다.
+
+- 미스난 펫만 1쿼리(outer join)로 한 번에 적재. 없는(삭제된) 펫은 캐시하지 않음
+- 무효화: ORM flush 에서 Pet / PetWalkGoal / PetWalkRecommendation 변경을 감지해
+  flush 시점 + commit(또는 rollback) 직후 두 번 비움 (commit 전 다른 요청이 옛 값을 다시 적재하는 경우 방지)
+- Core bulk insert/update 처럼 flush 를 거치지 않는 변경은 mark_pets_changed 로 직접 알림
+- 저장소는 app.core.cache backend (PET_PROFILE_CACHE_BACKEND). 가족 구성원 권한은 캐시하지 않음
+"""
+import threading
+from dataclasses import dataclass, fields
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.cache import CacheBackend, load_backend
+from app.core.config import settings
+from app.models.pet import Pet, PetGender
+from app.models.pet_walk_goal import PetWalkGoal
+from app.models.pet_walk_recommendation import PetWalkRecommendation
+
+
+PET_PROFILE_LOOKUPS = metrics.counter(
+    "pet_profile_lookups_total", "반려동물 프로필 캐시 조회 (hit/miss)", ["result"]
+)
+PET_PROFILE_ENTRIES = metrics.gauge("pet_profile_cached_entries", "반려동물 프로필 캐시 항목 수")
+
+_HIT = PET_PROFILE_LOOKUPS.labels("hit")
+_MISS = PET_PROFILE_LOOKUPS.labels("miss")
+
+_SESSION_KEY = "pet_profiles_dirty"
+
+
+@dataclass(frozen=True, slots=True)
+class PetInfo:
+    pet_id: int
+    family_id: int
+    owner_id: int
+    name: str
+    breed: Optional[str]
+    age: Optional[int]
+    weight: Optional[float]
+    gender: Optional[PetGender]
+    disease: Optional[str]
+    image_url: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class GoalInfo:
+    goal_id: int
+    target_walks: int
+    target_minutes: int
+    target_distance_km: Decimal
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class RecommendationInfo:
+    """PetWalkRecommendation 과 같은 속성 이름 (recommendation_to_dict 에 그대로 사용)"""
+    rec_id: int
+    pet_id: int
+    min_walks: int
+    min_minutes: int
+    min_distance_km: Decimal
+    recommended_walks: int
+    recommended_minutes: int
+    recommended_distance_km: Decimal
+    max_walks: int
+    max_minutes: int
+    max_distance_km: Decimal
+    generated_by: Optional[str]
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class PetProfile:
+    pet: PetInfo
+    goal: Optional[GoalInfo]
+    recommendation: Optional[RecommendationInfo]
+
+
+def _columns(model, dto) -> List:
+    return [getattr(model, f.name) for f in fields(dto)]
+
+
+_PET_COLUMNS = _columns(Pet, PetInfo)
+_GOAL_COLUMNS = _columns(PetWalkGoal, GoalInfo)
+_REC_COLUMNS = _columns(PetWalkRecommendation, RecommendationInfo)
+
+
+def _key(pet_id: int) -> str:
+    return f"pet_profile:{pet_id}"
+
+
+def _load(db: Session, pet_ids: List[int]) -> Dict[int, PetProfile]:
+    """펫 + 목표 + 추천 (1쿼리, 펫당 목표 / 추천은 최대 1행)"""
+    rows = (
+        db.query(*_PET_COLUMNS, *_GOAL_COLUMNS, *_REC_COLUMNS)
+        .outerjoin(PetWalkGoal, PetWalkGoal.pet_id == Pet.pet_id)
+        .outerjoin(PetWalkRecommendation, PetWalkRecommendation.pet_id == Pet.pet_id)
+        .filter(Pet.pet_id.in_(pet_ids))
+        .all()
+    )
+
+    goal_start = len(_PET_COLUMNS)
+    rec_start = goal_start + len(_GOAL_COLUMNS)
+    profiles: Dict[int, PetProfile] = {}
+    for row in rows:
+        pet = PetInfo(*row[:goal_start])
+        goal = row[goal_start:rec_start]
+        rec = row[rec_start:]
+        profiles[pet.pet_id] = PetProfile(
+            pet=pet,
+            goal=GoalInfo(*goal) if goal[0] is not None else None,
+            recommendation=RecommendationInfo(*rec) if rec[0] is not None else None,
+        )
+    return profiles
+
+
+class PetProfileCache:
+    def __init__(self, backend: CacheBackend, ttl_sec: float = 300.0):
+        self.backend = backend
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        # 적재 중에 무효화가 끼어들면 그 결과는 캐시에 넣지 않음
+        self._version = 0
+
+    def get_many(self, db: Session, pet_ids: Iterable[int]) -> Dict[int, PetProfile]:
+        """pet_id → PetProfile (없는 펫은 결과에서 빠짐)"""
+        ids = list(dict.fromkeys(pet_ids))
+        if not ids:
+            return {}
+
+        found = self.backend.get_many([_key(pet_id) for pet_id in ids])
+        profiles = {pet_id: found[_key(pet_id)] for pet_id in ids if _key(pet_id) in found}
+        misses = [pet_id for pet_id in ids if pet_id not in profiles]
+        if profiles:
+            _HIT.inc(len(profiles))
+        if not misses:
+            return profiles
+
+        _MISS.inc(len(misses))
+        with self._lock:
+            version = self._version
+        loaded = _load(db, misses)
+
+        with self._lock:
+            if version == self._version and loaded:
+                self.backend.set_many({_key(pet_id): p for pet_id, p in loaded.items()}, self.ttl_sec)
+        profiles.update(loaded)
+        return profiles
+
+    def get(self, db: Session, pet_id: int) -> Optional[PetProfile]:
+        return self.get_many(db, [pet_id]).get(pet_id)
+
+    def invalidate(self, pet_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._version += 1
+            self.backend.delete_many([_key(pet_id) for pet_id in pet_ids])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self.backend.clear()
+
+
+cache = PetProfileCache(
+    load_backend(settings.PET_PROFILE_CACHE_BACKEND, settings.PET_PROFILE_CACHE_MAX_PETS),
+    ttl_sec=settings.PET_PROFILE_CACHE_TTL_SEC,
+)
+metrics.register_collector(lambda: PET_PROFILE_ENTRIES.set(len(cache.backend)))
+
+
+def get_pet_profile(db: Session, pet_id: int) -> Optional[PetProfile]:
+    return cache.get(db, pet_id)
+
+
+def get_pet_profiles(db: Session, pet_ids: Iterable[int]) -> Dict[int, PetProfile]:
+    return cache.get_many(db, pet_ids)
+
+
+# ============================================================
+# 변경 감지 (세션 이벤트)
+# ============================================================
+def _pending(db: Session) -> Set[int]:
+    return db.info.setdefault(_SESSION_KEY, set())
+
+
+def mark_pets_changed(db: Session, pet_ids: Iterable[int]) -> None:
+    """flush 를 거치지 않는 펫 / 목표 / 추천 변경(Core bulk insert/update 등) 후 호출"""
+    pet_ids = {pet_id for pet_id in pet_ids if pet_id is not None}
+    if not pet_ids:
+        return
+    _pending(db).update(pet_ids)
+    cache.invalidate(pet_ids)
+
+
+def _history_values(obj, attr: str) -> Set[int]:
+    history = sa_inspect(obj).attrs[attr].history
+    return {v for v in (*history.added, *history.deleted, *history.unchanged) if v is not None}
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pet_ids: Set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Pet):
+            pet_ids.add(obj.pet_id)
+        elif isinstance(obj, (PetWalkGoal, PetWalkRecommendation)):
+            pet_ids |= _history_values(obj, "pet_id")
+    mark_pets_changed(session, pet_ids)
+
+
+def _after_end(session: Session) -> None:
+    # rollback 도 비움: 같은 트랜잭션 안에서 commit 안 된 값이 적재됐을 수 있음
+    pending = session.info.pop(_SESSION_KEY, None)
+    if pending:
+        cache.invalidate(pending)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "after_commit", _after_end)
+event.listen(Session, "after_rollback", _after_end)
@@ -0,0 +1,378 @@
+"""
+가족 푸시 병합(coalescing) + 가족별 전송량 제한
+
+- collapse key = (family_id, pet_id, kind). 같은 키의 푸시는 debounce 시간 동안 모았다가 1건으로 전송
+  예) 짧은 산책의 WALK_START → WALK_END 는 "산책 종료" 1건, 연속된 펫 정보 수정은 "... (외 N건)" 1건
+- 기기 쪽에서도 같은 키 알림은 교체되도록 FCM collapse_key / Android tag / apns-collapse-id 로 전달
+- dedup: 같은 (가족, 펫, 타입, 보낸 사람) 푸시는 dedup 시간 안에 한 번만 (start_walk + notify_walk_start 중복 방지)
+- 가족별 token bucket: 버킷이 비면 버리지 않고 리필 시점까지 미뤄 그 사이 푸시를 계속 병합
+- 전송은 백그라운드 스레드에서 수행. 수신 토큰은 전송 시점에 push_targets 캐시로 조회
+
+워커 프로세스마다 독립적으로 동작하므로 서로 다른 워커로 들어온 요청끼리는 병합되지 않음.
+"""
+import heapq
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core import metrics
+from app.core.config import settings
+
+PUSH_EVENTS = metrics.counter(
+    "push_coalescer_events_total", "푸시 병합기 입력 처리 결과", ("kind", "result")
+)
+PUSH_PENDING = metrics.gauge("push_coalescer_pending", "전송 대기 중인 병합 푸시 수")
+
+
+@dataclass(frozen=True)
+class CollapseKey:
+    family_id: int
+    pet_id: Optional[int]
+    kind: str
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.family_id}:{self.pet_id or 0}"
+
+
+@dataclass
+class PendingPush:
+    key: CollapseKey
+    title: str
+    body: str
+    data: Dict[str, str]
+    exclude_user_ids: Set[int]
+    types: List[str] = field(default_factory=list)
+    first_at: float = 0.0
+    due_at: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.types)
+
+    def merge(self, title: str, body: str, data: Dict[str, str], exclude_user_ids: Set[int], push_type: str):
+        # 최신 내용 우선, 이전 data 는 남겨둠 (예: START 의 walk_id)
+        self.title = title
+        self.body = body
+        self.data = {**self.data, **data}
+        # 각각의 행위자는 자기 행동 알림을 받을 필요가 없지만, 다른 사람의 행동은 받아야 함
+        self.exclude_user_ids &= exclude_user_ids
+        self.types.append(push_type)
+
+    def payload(self) -> Tuple[str, str, Dict[str, str]]:
+        body = self.body
+        data = dict(self.data)
+        if self.count > 1:
+            data["coalesced_count"] = str(self.count)
+            data["coalesced_types"] = ",".join(dict.fromkeys(self.types))
+            # 같은 종류가 여러 번 쌓였으면 건수 표시 (START+END 처럼 종류가 다르면 마지막 내용만)
+            if len(set(self.types)) == 1:
+                body = f"{body} (외 {self.count - 1}건)"
+        return self.title, body, data
+
+
+class TokenBucket:
+    # 부동소수 누적 오차로 0.99999.. 에서 멈추지 않도록 허용 오차
+    EPSILON = 1e-6
+
+    def __init__(self, capacity: float, refill_per_sec: float, now: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.updated_at = now
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_sec)
+            self.updated_at = now
+
+    def try_take(self, now: float) -> bool:
+        self._refill(now)
+        if self.tokens >= 1 - self.EPSILON:
+            self.tokens = max(0.0, self.tokens - 1)
+            return True
+        return False
+
+    def next_available(self, now: float) -> float:
+        self._refill(now)
+        if self.tokens >= 1 - self.EPSILON or self.refill_per_sec <= 0:
+            return now
+        return now + max((1 - self.tokens) / self.refill_per_sec, 0.01)
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+def _send(push: PendingPush) -> None:
+    """병합된 푸시 1건 전송 (별도 DB 세션에서 수신자 조회/무효 토큰 정리)"""
+    from app.core import push_targets
+    from app.core.firebase import send_push_notification_to_multiple
+    from app.db import SessionLocal
+    from app.domains.users.repository.user_repository import UserRepository
+
+    title, body, data = push.payload()
+    db = SessionLocal()
+    try:
+        tokens = push_targets.get_family_push_tokens(db, push.key.family_id, push.exclude_user_ids)
+        if not tokens:
+            print(f"[PUSH] No tokens for {push.key}")
+            return
+        result = send_push_notification_to_multiple(
+            fcm_tokens=tokens,
+            title=title,
+            body=body,
+            data=data,
+            collapse_key=str(push.key),
+        )
+        print(
+            f"[PUSH] {push.key} sent (merged={push.count}): "
+            f"success={result['success_count']}, failure={result['failure_count']}"
+        )
+        if result.get("invalid_tokens"):
+            UserRepository(db).remove_fcm_tokens(result["invalid_tokens"])
+    finally:
+        db.close()
+
+
+class PushCoalescer:
+    def __init__(
+        self,
+        debounce_sec: float = 5.0,
+        max_delay_sec: float = 20.0,
+        dedup_sec: float = 120.0,
+        bucket_capacity: float = 6.0,
+        refill_per_sec: float = 2.0 / 60.0,
+        clock=time.monotonic,
+        sender=_send,
+        background: bool = True,
+    ):
+        self.debounce_sec = debounce_sec
+        self.max_delay_sec = max_delay_sec
+        self.dedup_sec = dedup_sec
+        self.bucket_capacity = bucket_capacity
+        self.refill_per_sec = refill_per_sec
+        self.clock = clock
+        self.sender = sender
+        self.background = background
+
+        self._cond = threading.Condition()
+        self._pending: Dict[CollapseKey, PendingPush] = {}
+        self._heap: List[Tuple[float, int, CollapseKey]] = []
+        self._seq = 0
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._recent: Dict[tuple, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # -------------------------------------------------
+    # 입력
+    # -------------------------------------------------
+    def submit(
+        self,
+        family_id: int,
+        pet_id: Optional[int],
+        kind: str,
+        push_type: str,
+        title: str,
+        body: str,
+        data: Optional[dict] = None,
+        exclude_user_ids: Iterable[int] = (),
+        dedup_actor_id: Optional[int] = None,
+    ) -> str:
+        """
+        푸시를 병합 대기열에 넣음. 반환값: queued / merged / duplicate
+        - kind: collapse 그룹 (예: WALK 는 START/END 를 같은 키로 묶음)
+        - dedup_actor_id: 주면 같은 (가족, 펫, push_type, actor) 는 dedup 시간 안에 1회만
+        """
+        key = CollapseKey(family_id, pet_id, kind)
+        str_data = {k: str(v) for k, v in (data or {}).items()}
+        str_data.setdefault("type", push_type)
+        excluded = set(exclude_user_ids)
+        now = self.clock()
+
+        with self._cond:
+            if dedup_actor_id is not None:
+                dedup_key = (family_id, pet_id, push_type, dedup_actor_id)
+                seen_at = self._recent.get(dedup_key)
+                if seen_at is not None and now - seen_at < self.dedup_sec:
+                    PUSH_EVENTS.labels(kind, "duplicate").inc()
+                    return "duplicate"
+                self._recent[dedup_key] = now
+
+            existing = self._pending.get(key)
+            if existing is not None:
+                existing.merge(title, body, str_data, excluded, push_type)
+                # trailing debounce, 단 첫 입력 후 max_delay 를 넘기지 않음
+                existing.due_at = max(
+                    existing.due_at,
+                    min(now + self.debounce_sec, existing.first_at + self.max_delay_sec),
+                )
+                self._schedule(key, existing.due_at)
+                PUSH_EVENTS.labels(kind, "merged").inc()
+                return "merged"
+
+            push = PendingPush(
+                key=key,
+                title=title,
+                body=body,
+                data=str_data,
+                exclude_user_ids=excluded,
+                types=[push_type],
+                first_at=now,
+                due_at=now + self.debounce_sec,
+            )
+            self._pending[key] = push
+            self._schedule(key, push.due_at)
+            PUSH_PENDING.set(len(self._pending))
+            PUSH_EVENTS.labels(kind, "queued").inc()
+
+        if self.background:
+            self._ensure_thread()
+        return "queued"
+
+    def _schedule(self, key: CollapseKey, due_at: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (due_at, self._seq, key))
+        self._cond.notify()
+
+    # -------------------------------------------------
+    # 전송
+    # -------------------------------------------------
+    def _bucket(self, family_id: int, now: float) -> TokenBucket:
+        bucket = self._buckets.get(family_id)
+        if bucket is None:
+            bucket = TokenBucket(self.bucket_capacity, self.refill_per_sec, now)
+            self._buckets[family_id] = bucket
+        return bucket
+
+    def _pop_due(self, now: float) -> List[PendingPush]:
+        """기한이 된 푸시를 꺼냄. 가족 버킷이 비어 있으면 리필 시점으로 미룸 (호출 측에서 lock 보유)"""
+        ready: List[PendingPush] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, _, key = heapq.heappop(self._heap)
+            push = self._pending.get(key)
+            # 병합으로 기한이 늦춰진 예전 heap 항목은 무시
+            if push is None or push.due_at > due_at:
+                continue
+
+            bucket = self._bucket(key.family_id, now)
+            if not bucket.try_take(now):
+                push.due_at = bucket.next_available(now)
+                self._schedule(key, push.due_at)
+                PUSH_EVENTS.labels(key.kind, "rate_limited").inc()
+                continue
+
+            del self._pending[key]
+            ready.append(push)
+
+        PUSH_PENDING.set(len(self._pending))
+        return ready
+
+    def _gc(self, now: float) -> None:
+        self._recent = {k: t for k, t in self._recent.items() if now - t < self.dedup_sec}
+        self._buckets = {
+            fid: b for fid, b in self._buckets.items()
+            if fid in {k.family_id for k in self._pending} or not b.is_full(now)
+        }
+
+    def _dispatch(self, pushes: List[PendingPush]) -> None:
+        for push in pushes:
+            try:
+                self.sender(push)
+                PUSH_EVENTS.labels(push.key.kind, "sent").inc()
+            except Exception as e:
+                PUSH_EVENTS.labels(push.key.kind, "error").inc()
+                print(f"[PUSH] Send error for {push.key}: {e}")
+
+    def run_pending(self) -> int:
+        """기한이 된 푸시를 현재 스레드에서 전송 (테스트/동기 모드용)"""
+        with self._cond:
+            pushes = self._pop_due(self.clock())
+        self._dispatch(pushes)
+        return len(pushes)
+
+    def flush_all(self) -> int:
+        """종료 시 대기 중인 푸시를 버킷 제한 없이 모두 전송"""
+        with self._cond:
+            pushes = list(self._pending.values())
+            self._pending.clear()
+            self._heap.clear()
+            PUSH_PENDING.set(0)
+        self._dispatch(pushes)
+        return len(pushes)
+
+    def _loop(self) -> None:
+        last_gc = self.clock()
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = self.clock()
+                pushes = self._pop_due(now)
+                if not pushes:
+                    timeout = (self._heap[0][0] - now) if self._heap else 60.0
+                    self._cond.wait(timeout=max(0.01, timeout))
+                    continue
+                if now - last_gc > 60.0:
+                    self._gc(now)
+                    last_gc = now
+            self._dispatch(pushes)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._loop, name="push-coalescer", daemon=True)
+            self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if flush:
+            self.flush_all()
+
+
+coalescer = PushCoalescer(
+    debounce_sec=settings.PUSH_DEBOUNCE_SEC,
+    max_delay_sec=settings.PUSH_MAX_DELAY_SEC,
+    dedup_sec=settings.PUSH_DEDUP_SEC,
+    bucket_capacity=settings.PUSH_FAMILY_BURST,
+    refill_per_sec=settings.PUSH_FAMILY_PER_MIN / 60.0,
+)
+
+
+def submit_family_push(
+    family_id: int,
+    pet_id: Optional[int],
+    kind: str,
+    push_type: str,
+    title: str,
+    body: str,
+    data: Optional[dict] = None,
+    exclude_user_ids: Iterable[int] = (),
+    dedup_actor_id: Optional[int] = None,
+) -> str:
+    """PUSH_COALESCE_ENABLED=false 면 병합 없이 즉시 전송"""
+    if not settings.PUSH_COALESCE_ENABLED:
+        push = PendingPush(
+            key=CollapseKey(family_id, pet_id, kind),
+            title=title,
+            body=body,
+            data={k: str(v) for k, v in (data or {}).items()},
+            exclude_user_ids=set(exclude_user_ids),
+            types=[push_type],
+        )
+        push.data.setdefault("type", push_type)
+        _send(push)
+        return "sent"
+    return coalescer.submit(
+        family_id, pet_id, kind, push_type, title, body, data, exclude_user_ids, dedup_actor_id
+    )
@@ -0,0 +1,272 @@
+"""
+가족 푸시 대상(기기 토큰) 레지스트리
+
+푸시마다 FamilyMember → users.fcm_token → user_fcm_tokens 를 따로 조회하던 것을
+family_id → {user_id: 활성 토큰들} 캐시로 대체한다.
+
+- 캐시 미스일 때만 1쿼리로 가족 전체 토큰을 적재, 이후 같은 가족 푸시는 0쿼리
+- 무효화: ORM flush 에서 FamilyMember / UserFcmToken / User.fcm_token 변경을 감지해
+  flush 시점 + commit 직후 두 번 비움 (commit 전 다른 요청이 옛 값을 다시 적재하는 경우 방지)
+- bulk delete/update 처럼 flush 를 거치지 않는 변경은 mark_family_changed / mark_user_changed 로 직접 알림
+- 워커 프로세스마다 캐시가 따로이므로 다른 워커의 변경은 TTL 안에 반영됨
+  → 푸시 대상 선택에만 사용하고, 권한(가족 구성원) 확인에는 쓰지 않음 (DB 에서 확인)
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.family_member import FamilyMember
+from app.models.user import User
+from app.models.user_fcm_token import UserFcmToken
+
+
+PUSH_TARGET_LOOKUPS = metrics.counter(
+    "push_target_lookups_total", "가족 푸시 대상 조회 (hit/miss)", ["result"]
+)
+PUSH_TARGET_FAMILIES = metrics.gauge("push_target_cached_families", "푸시 대상 캐시에 적재된 가족 수")
+
+_HIT = PUSH_TARGET_LOOKUPS.labels("hit")
+_MISS = PUSH_TARGET_LOOKUPS.labels("miss")
+
+_SESSION_KEY = "push_targets_dirty"
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    tokens_by_user: Dict[int, Tuple[str, ...]]
+
+
+class PushTargetRegistry:
+    def __init__(self, ttl_sec: float = 300.0, max_families: int = 10000, clock=time.monotonic):
+        self.ttl_sec = ttl_sec
+        self.max_families = max_families
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._families_by_user: Dict[int, Set[int]] = {}
+        # 적재 중에 무효화가 끼어들면 그 결과는 캐시에 넣지 않음
+        self._version = 0
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+    def get_family_tokens(
+        self,
+        db: Session,
+        family_id: int,
+        exclude_user_ids: Iterable[int] = (),
+    ) -> List[str]:
+        """가족 구성원(제외 대상 빼고)의 활성 토큰을 중복 없이 반환"""
+        tokens_by_user = self._get(db, family_id)
+        excluded = set(exclude_user_ids)
+
+        tokens: List[str] = []
+        seen: Set[str] = set()
+        for user_id, user_tokens in tokens_by_user.items():
+            if user_id in excluded:
+                continue
+            for token in user_tokens:
+                if token not in seen:
+                    seen.add(token)
+                    tokens.append(token)
+        return tokens
+
+    def _get(self, db: Session, family_id: int) -> Dict[int, Tuple[str, ...]]:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(family_id)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(family_id)
+                _HIT.inc()
+                return entry.tokens_by_user
+            version = self._version
+
+        _MISS.inc()
+        tokens_by_user = self._load(db, family_id)
+
+        with self._lock:
+            if version == self._version:
+                self._store(family_id, _Entry(now + self.ttl_sec, tokens_by_user))
+        return tokens_by_user
+
+    @staticmethod
+    def _load(db: Session, family_id: int) -> Dict[int, Tuple[str, ...]]:
+        """가족 구성원 + legacy 토큰 + 기기별 활성 토큰을 한 번에 조회"""
+        rows = (
+            db.query(FamilyMember.user_id, User.fcm_token, UserFcmToken.fcm_token)
+            .join(User, User.user_id == FamilyMember.user_id)
+            .outerjoin(
+                UserFcmToken,
+                and_(
+                    UserFcmToken.user_id == FamilyMember.user_id,
+                    UserFcmToken.is_active.is_(True),
+                ),
+            )
+            .filter(FamilyMember.family_id == family_id)
+            .all()
+        )
+
+        collected: Dict[int, List[str]] = {}
+        for user_id, legacy_token, device_token in rows:
+            user_tokens = collected.setdefault(user_id, [])
+            for token in (legacy_token, device_token):
+                if token and token not in user_tokens:
+                    user_tokens.append(token)
+        return {user_id: tuple(tokens) for user_id, tokens in collected.items()}
+
+    def _store(self, family_id: int, entry: _Entry) -> None:
+        self._drop(family_id)
+        self._entries[family_id] = entry
+        for user_id in entry.tokens_by_user:
+            self._families_by_user.setdefault(user_id, set()).add(family_id)
+
+        while len(self._entries) > self.max_families:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+        PUSH_TARGET_FAMILIES.set(len(self._entries))
+
+    def _drop(self, family_id: int) -> None:
+        entry = self._entries.pop(family_id, None)
+        if entry is None:
+            return
+        for user_id in entry.tokens_by_user:
+            families = self._families_by_user.get(user_id)
+            if families is not None:
+                families.discard(family_id)
+                if not families:
+                    del self._families_by_user[user_id]
+
+    # -------------------------------------------------
+    # 무효화
+    # -------------------------------------------------
+    def invalidate(self, family_ids: Iterable[int] = (), user_ids: Iterable[int] = ()) -> None:
+        with self._lock:
+            self._version += 1
+            targets = set(family_ids)
+            for user_id in user_ids:
+                targets.update(self._families_by_user.get(user_id, ()))
+            for family_id in targets:
+                self._drop(family_id)
+            PUSH_TARGET_FAMILIES.set(len(self._entries))
+
+    def invalidate_token(self, token: str) -> None:
+        """토큰이 다른 사용자로 옮겨간 경우: 그 토큰을 가진 가족 캐시를 찾아 제거 (드문 경로라 전체 순회)"""
+        with self._lock:
+            families = [
+                family_id for family_id, entry in self._entries.items()
+                if any(token in tokens for tokens in entry.tokens_by_user.values())
+            ]
+        if families:
+            self.invalidate(family_ids=families)
+
+    def invalidate_family(self, family_id: int) -> None:
+        self.invalidate(family_ids=[family_id])
+
+    def invalidate_user(self, user_id: int) -> None:
+        self.invalidate(user_ids=[user_id])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._families_by_user.clear()
+            PUSH_TARGET_FAMILIES.set(0)
+
+
+registry = PushTargetRegistry(ttl_sec=settings.PUSH_TARGET_CACHE_TTL_SEC)
+
+
+def get_family_push_tokens(db: Session, family_id: int, exclude_user_ids: Iterable[int] = ()) -> List[str]:
+    return registry.get_family_tokens(db, family_id, exclude_user_ids)
+
+
+# ============================================================
+# 변경 감지 (세션 이벤트)
+# ============================================================
+def _pending(db: Session) -> Tuple[Set[int], Set[int]]:
+    return db.info.setdefault(_SESSION_KEY, (set(), set()))
+
+
+def mark_family_changed(db: Session, family_id: Optional[int]) -> None:
+    """flush 를 거치지 않는 구성원 변경(bulk delete 등) 후 호출"""
+    if family_id is None:
+        return
+    family_ids, _ = _pending(db)
+    family_ids.add(family_id)
+    registry.invalidate_family(family_id)
+
+
+def mark_user_changed(db: Session, user_id: Optional[int]) -> None:
+    """flush 를 거치지 않는 토큰 변경 후 호출"""
+    if user_id is None:
+        return
+    _, user_ids = _pending(db)
+    user_ids.add(user_id)
+    registry.invalidate_user(user_id)
+
+
+def mark_token_changed(db: Session, token: Optional[str]) -> None:
+    """Core upsert 로 토큰 소유자가 바뀌었을 수 있을 때 호출"""
+    if not token:
+        return
+    registry.invalidate_token(token)
+
+
+def _history_values(obj, attr: str) -> Set[int]:
+    history = sa_inspect(obj).attrs[attr].history
+    return {v for v in (*history.added, *history.deleted, *history.unchanged) if v is not None}
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    family_ids: Set[int] = set()
+    user_ids: Set[int] = set()
+
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, FamilyMember):
+            family_ids.add(obj.family_id)
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, UserFcmToken):
+            user_ids.add(obj.user_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, FamilyMember):
+            family_ids |= _history_values(obj, "family_id")
+            user_ids |= _history_values(obj, "user_id")
+        elif isinstance(obj, UserFcmToken):
+            # 토큰이 다른 사용자로 옮겨간 경우 이전/새 사용자 모두
+            user_ids |= _history_values(obj, "user_id")
+        elif isinstance(obj, User) and sa_inspect(obj).attrs["fcm_token"].history.has_changes():
+            user_ids.add(obj.user_id)
+
+    family_ids.discard(None)
+    user_ids.discard(None)
+    if not family_ids and not user_ids:
+        return
+
+    pending_families, pending_users = _pending(session)
+    pending_families |= family_ids
+    pending_users |= user_ids
+    registry.invalidate(family_ids, user_ids)
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_SESSION_KEY, None)
+    if pending:
+        registry.invalidate(*pending)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,174 @@
+# app/core/query_counter.py
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+
+# ============================================================
+# 요청(또는 with 블록) 단위 SQL 통계
+# ============================================================
+class QueryStats:
+    __slots__ = ("count", "total_time", "shapes", "_lock")
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        shape = normalize_statement(statement)
+        with self._lock:
+            self.count += 1
+            self.total_time += elapsed
+            self.shapes[shape] += 1
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time * 1000.0
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """같은 모양의 문장이 threshold 회 이상 실행된 목록 (N+1 의심)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+# 컨텍스트와 무관하게 프로세스 전체 SQL을 모으는 수집기 (테스트: TestClient는 별도 스레드에서 앱 실행)
+_global_collectors: List[QueryStats] = []
+
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """바인드 값/IN 목록 길이/리터럴 차이를 지운 문장 모양"""
+    shape = _STRING.sub("?", statement)
+    shape = _NUMBER.sub("?", shape)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries():
+    """
+    with track_queries() as stats:
+        ...
+    블록 안에서 (스레드풀로 넘어간 작업 포함) 실행된 SQL 수와 시간을 stats에 누적
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def track_all_queries():
+    """프로세스 전체(모든 스레드/요청)의 SQL을 블록 동안 누적"""
+    install()
+    stats = QueryStats()
+    _global_collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        _global_collectors.remove(stats)
+
+
+# ============================================================
+# SQLAlchemy 이벤트 훅 (모든 Engine 대상, 1회 설치)
+# ============================================================
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None or _global_collectors:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start_time")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    for collector in list(_global_collectors):
+        collector.record(statement, elapsed)
+
+
+def install() -> None:
+    global _installed
+    if _installed:
+        return
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+# ============================================================
+# 디버그 미들웨어 (DB_QUERY_DEBUG=true 일 때만 등록)
+# ============================================================
+class QueryCounterMiddleware:
+    """
+    요청마다 SQL 수/시간을 세어 응답 헤더로 노출하고,
+    같은 모양의 문장이 임계치 이상 반복되면 N+1 의심 로그를 남김
+    - X-DB-Query-Count, X-DB-Time-ms
+    """
+
+    def __init__(self, app, threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = threshold or settings.DB_REPEATED_QUERY_THRESHOLD
+        install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-query-count", str(stats.count).encode()))
+                    headers.append((b"x-db-time-ms", f"{stats.total_time_ms:.2f}".encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._report(scope, stats)
+
+    def _report(self, scope, stats: QueryStats) -> None:
+        path = scope.get("path")
+        print(
+            f"[DB] {scope.get('method')} {path} "
+            f"queries={stats.count} time={stats.total_time_ms:.1f}ms"
+        )
+        for shape, n in stats.repeated(self.threshold):
+            print(f"[DB][N+1?] {path} x{n}: {shape[:200]}")
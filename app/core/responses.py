@@ -0,0 +1,71 @@
+"""
+JSON 응답 (orjson)
+
+서비스는 dict 를 만들고 jsonable_encoder(재귀 변환 1번) → JSONResponse(stdlib json 으로 직렬화 1번)를 거쳤다.
+FastJSONResponse 는 datetime / date / Enum / UUID 를 orjson 이 직접 쓰고, 나머지(Decimal / pydantic 모델 등)만
+default 로 jsonable_encoder 와 같은 값으로 바꿔 dict 를 한 번만 훑는다.
+
+- json_response(content): 서비스가 만든 dict 를 그대로 응답 (jsonable_encoder 불필요)
+- model_response(model): 이미 검증된 pydantic 응답 모델을 model_dump_json 으로 바로 (다시 검증/변환하지 않음)
+- create_app 의 default_response_class 라서 dict 를 반환하는 라우트도 orjson 으로 렌더링
+"""
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+# dict 키가 int 인 응답(통계 등)도 jsonable_encoder 처럼 문자열 키로
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """orjson 이 직접 못 쓰는 타입 → jsonable_encoder 와 같은 값"""
+    if isinstance(obj, Decimal):
+        # 소수부가 없으면 int, 있으면 float (fastapi decimal_encoder 와 동일)
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FastJSONResponse:
+    return FastJSONResponse(content=content, status_code=status_code, headers=headers)
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
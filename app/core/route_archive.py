@@ -0,0 +1,151 @@
+"""
+산책 경로 압축 보관 (walk_route_archives)
+
+- encode_points / decode_points: (point_id, 위도, 경도, 시각) 목록 ↔ 압축 blob
+  각 값을 정수로 바꿔(좌표 ×1e7 = DECIMAL(10, 7) 그대로, 시각은 epoch 마이크로초) 직전 포인트와의 차이를
+  zigzag varint 로 쓰고 zlib 압축. 연속된 GPS 포인트는 차이가 작아서 행 저장 대비 수십 배 작아짐
+- RouteArchiveStore: 보관 위치. db(행의 data 컬럼) / file(로컬 디렉터리, 객체 저장소 대용)
+"""
+import os
+import zlib
+from datetime import datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+
+CODEC = "delta-zlib-v1"
+
+_COORD_SCALE = 10_000_000
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class RoutePoint(NamedTuple):
+    """경로 포인트 1개. hot 행 / 보관본 공통 (WalkTrackingPoint 와 같은 속성 이름이라 조회 코드가 tier 를 구분하지 않음)"""
+    point_id: int
+    latitude: float
+    longitude: float
+    timestamp: datetime
+
+
+# ============================================================
+# varint 직렬화
+# ============================================================
+def _write_varint(buf: bytearray, value: int) -> None:
+    # zigzag: 음수 차이도 작은 양수로
+    value = (value << 1) if value >= 0 else ((-value << 1) - 1)
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    value = (value >> 1) if not value & 1 else -((value + 1) >> 1)
+    return value, pos
+
+
+def encode_points(points: Iterable[tuple]) -> Tuple[bytes, int]:
+    """points: (point_id, latitude, longitude, timestamp) 시간순 → (blob, point 수)"""
+    buf = bytearray()
+    prev = (0, 0, 0, 0)
+    count = 0
+    for point_id, lat, lng, ts in points:
+        current = (
+            int(point_id),
+            int(round(lat * _COORD_SCALE)),
+            int(round(lng * _COORD_SCALE)),
+            (ts - _EPOCH) // _MICROSECOND,
+        )
+        for value, before in zip(current, prev):
+            _write_varint(buf, value - before)
+        prev = current
+        count += 1
+    return zlib.compress(bytes(buf), 6), count
+
+
+def decode_points(blob: bytes) -> List[RoutePoint]:
+    data = zlib.decompress(blob)
+    points: List[RoutePoint] = []
+    values = [0, 0, 0, 0]
+    pos = 0
+    while pos < len(data):
+        for i in range(4):
+            delta, pos = _read_varint(data, pos)
+            values[i] += delta
+        points.append(RoutePoint(
+            point_id=values[0],
+            latitude=values[1] / _COORD_SCALE,
+            longitude=values[2] / _COORD_SCALE,
+            timestamp=_EPOCH + values[3] * _MICROSECOND,
+        ))
+    return points
+
+
+# ============================================================
+# 보관 위치
+# ============================================================
+class RouteArchiveStore:
+    """
+    backend=db: blob 을 walk_route_archives.data 에 그대로
+    backend=file: ROUTE_ARCHIVE_DIR/<walk_id // 1000>/<walk_id>.route 에 쓰고 object_key 만 행에
+    """
+
+    def __init__(self, backend: Optional[str] = None, root: Optional[str] = None):
+        self._backend = backend
+        self._root = root
+
+    @property
+    def backend(self) -> str:
+        return (self._backend or settings.ROUTE_ARCHIVE_BACKEND or "db").lower()
+
+    @property
+    def root(self) -> str:
+        return self._root or settings.ROUTE_ARCHIVE_DIR
+
+    def put(self, walk_id: int, blob: bytes) -> dict:
+        """walk_route_archives 행에 들어갈 storage / data / object_key"""
+        if self.backend != "file":
+            return {"storage": "db", "data": blob, "object_key": None}
+
+        object_key = f"{walk_id // 1000}/{walk_id}.route"
+        path = os.path.join(self.root, object_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 같은 산책을 다시 보관해도 반쯤 쓴 파일이 보이지 않도록 임시 파일 → rename
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        return {"storage": "file", "data": None, "object_key": object_key}
+
+    def get(self, storage: str, data: Optional[bytes], object_key: Optional[str]) -> bytes:
+        if storage == "file":
+            with open(os.path.join(self.root, object_key), "rb") as f:
+                return f.read()
+        return data
+
+    def delete(self, storage: str, object_key: Optional[str]) -> None:
+        if storage != "file" or not object_key:
+            return
+        try:
+            os.remove(os.path.join(self.root, object_key))
+        except FileNotFoundError:
+            pass
+
+
+store = RouteArchiveStore()
+
+
+def load_points(archive) -> List[RoutePoint]:
+    """WalkRouteArchive 행 → 포인트 목록 (시간순)"""
+    return decode_points(store.get(archive.storage, archive.data, archive.object_key))
@@ -0,0 +1,536 @@
+# app/core/scheduler.py
+
+import os
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import pytz
+from sqlalchemy import and_, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core import metrics
+from app.models.job_lease import JobLease
+
+KST = pytz.timezone("Asia/Seoul")
+
+JOB_RUNS = metrics.counter(
+    "scheduler_job_runs_total", "스케줄러 작업 실행 수", ("job", "result")
+)
+JOB_SKIPS = metrics.counter(
+    "scheduler_job_skipped_total", "스케줄러 작업 건너뜀 수", ("job", "reason")
+)
+JOB_DURATION = metrics.histogram(
+    "scheduler_job_duration_seconds", "스케줄러 작업 실행 시간(초)", ("job",),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+JOB_LAG = metrics.gauge(
+    "scheduler_job_lag_seconds", "예정 시각 대비 마지막 실행 시작 지연(초)", ("job",),
+    multiprocess_mode="max",
+)
+
+
+# ============================================================
+# Clock (테스트에서는 FakeClock으로 교체)
+# ============================================================
+class SystemClock:
+    def now(self) -> datetime:
+        """timezone-aware UTC"""
+        return datetime.now(timezone.utc)
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+
+class FakeClock:
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self._mono = 0.0
+
+    def now(self) -> datetime:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._mono
+
+    def advance(self, seconds: float) -> None:
+        self._now += timedelta(seconds=seconds)
+        self._mono += seconds
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# ============================================================
+# Schedule
+# ============================================================
+class IntervalSchedule:
+    """
+    epoch 기준으로 정렬된 고정 간격 슬롯
+    - replica마다 시작 시각이 달라도 같은 슬롯 시각을 계산하므로 lease로 중복 제거 가능
+    """
+
+    def __init__(self, seconds: int):
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        self.seconds = int(seconds)
+
+    def next_after(self, dt: datetime) -> datetime:
+        ts = int(dt.timestamp()) // self.seconds * self.seconds + self.seconds
+        return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+    def __repr__(self):
+        return f"every {self.seconds}s"
+
+
+class CronSchedule:
+    """
+    5필드 cron ("분 시 일 월 요일"), 필드마다 *, a-b, a,b, */n, a-b/n 지원
+    요일은 0=일요일 ~ 6=토요일 (7도 일요일)
+    """
+
+    _BOUNDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expr: str, tz=KST):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"invalid cron expression: {expr}")
+        self.expr = expr
+        self.tz = tz
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse(p, lo, hi) for p, (lo, hi) in zip(parts, self._BOUNDS)
+        ]
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field_expr: str, lo: int, hi: int) -> frozenset:
+        values = set()
+        for part in field_expr.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+            if part in ("*", ""):
+                start, end = lo, hi
+            elif "-" in part:
+                a, b = part.split("-", 1)
+                start, end = int(a), int(b)
+            else:
+                start = int(part)
+                end = hi if step > 1 else start
+            for v in range(start, end + 1, step):
+                values.add(0 if (hi == 6 and v == 7) else v)
+        bad = [v for v in values if v < lo or v > hi]
+        if bad:
+            raise ValueError(f"cron value out of range: {bad}")
+        return frozenset(values)
+
+    def _day_matches(self, local: datetime) -> bool:
+        # cron 표준: 일/요일이 둘 다 지정되면 OR
+        weekday = (local.weekday() + 1) % 7
+        day_ok = local.day in self.days
+        weekday_ok = weekday in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, dt: datetime) -> datetime:
+        local = dt.astimezone(self.tz).replace(second=0, microsecond=0, tzinfo=None)
+        local += timedelta(minutes=1)
+        limit = local + timedelta(days=366 * 5)
+
+        while local < limit:
+            if local.month not in self.months:
+                local = (local.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(local):
+                local = local.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if local.hour not in self.hours:
+                local = local.replace(minute=0) + timedelta(hours=1)
+                continue
+            if local.minute not in self.minutes:
+                local += timedelta(minutes=1)
+                continue
+            return self.tz.localize(local).astimezone(timezone.utc)
+
+        raise ValueError(f"cron expression never fires: {self.expr}")
+
+    def __repr__(self):
+        return f"cron '{self.expr}'"
+
+
+# ============================================================
+# Lease (replica 간 리더 선출)
+# ============================================================
+class LocalLease:
+    """단일 프로세스용: 항상 획득"""
+
+    def acquire(self, name: str, slot: datetime, ttl_sec: int) -> bool:
+        return True
+
+    def release(self, name: str) -> None:
+        pass
+
+
+class TableLease:
+    """
+    job_leases 테이블 조건부 UPDATE로 슬롯 단위 lease 획득
+    - 이미 같은(혹은 이후) 슬롯을 누가 가져갔거나, 다른 owner의 lease가 아직 유효하면 실패
+    - 행이 없으면 INSERT, 동시 INSERT 경합은 PK 충돌로 판정
+    """
+
+    def __init__(self, session_factory, owner: Optional[str] = None, clock=None):
+        self.session_factory = session_factory
+        self.owner = owner or default_owner_id()
+        self.clock = clock or SystemClock()
+
+    def acquire(self, name: str, slot: datetime, ttl_sec: int) -> bool:
+        now = _naive_utc(self.clock.now())
+        slot = _naive_utc(slot)
+        expires_at = now + timedelta(seconds=ttl_sec)
+        table = JobLease.__table__
+
+        db = self.session_factory()
+        try:
+            result = db.execute(
+                update(table)
+                .where(
+                    table.c.name == name,
+                    or_(table.c.last_slot.is_(None), table.c.last_slot < slot),
+                    or_(
+                        table.c.expires_at.is_(None),
+                        table.c.expires_at < now,
+                        table.c.owner == self.owner,
+                    ),
+                )
+                .values(owner=self.owner, expires_at=expires_at, last_slot=slot)
+            )
+            if result.rowcount == 1:
+                db.commit()
+                return True
+
+            exists = db.execute(
+                select(table.c.name).where(table.c.name == name)
+            ).first()
+            if exists:
+                db.rollback()
+                return False
+
+            try:
+                db.execute(
+                    insert(table).values(
+                        name=name,
+                        owner=self.owner,
+                        expires_at=expires_at,
+                        last_slot=slot,
+                    )
+                )
+                db.commit()
+                return True
+            except IntegrityError:
+                db.rollback()
+                return False
+        except Exception as e:
+            print("JOB LEASE ERROR:", e)
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def release(self, name: str) -> None:
+        # 슬롯은 last_slot으로 이미 소비됐으므로 만료만 앞당김
+        table = JobLease.__table__
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(table)
+                .where(and_(table.c.name == name, table.c.owner == self.owner))
+                .values(expires_at=_naive_utc(self.clock.now()))
+            )
+            db.commit()
+        except Exception as e:
+            print("JOB LEASE RELEASE ERROR:", e)
+            db.rollback()
+        finally:
+            db.close()
+
+
+class MySQLNamedLock:
+    """
+    MySQL GET_LOCK 기반 상호배제
+    - 실행 중에는 한 replica만 작업을 돌리지만, 슬롯 중복 제거는 하지 않음
+      (작업 자체가 멱등이거나 짧은 interval 작업에 적합)
+    """
+
+    def __init__(self, engine, prefix: str = "takeapaw:job:"):
+        self.engine = engine
+        self.prefix = prefix
+        self._conns: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, name: str, slot: datetime, ttl_sec: int) -> bool:
+        conn = self.engine.connect()
+        try:
+            got = conn.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": self.prefix + name}
+            ).scalar()
+        except Exception as e:
+            print("GET_LOCK ERROR:", e)
+            conn.close()
+            return False
+
+        if got != 1:
+            conn.close()
+            return False
+
+        with self._lock:
+            self._conns[name] = conn
+        return True
+
+    def release(self, name: str) -> None:
+        with self._lock:
+            conn = self._conns.pop(name, None)
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.prefix + name})
+        except Exception as e:
+            print("RELEASE_LOCK ERROR:", e)
+        finally:
+            conn.close()
+
+
+def default_owner_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# ============================================================
+# Job
+# ============================================================
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    skipped_concurrency: int = 0
+    skipped_lease: int = 0
+    last_duration_sec: Optional[float] = None
+    last_lag_sec: Optional[float] = None
+    total_duration_sec: float = 0.0
+    last_error: Optional[str] = None
+    last_finished_at: Optional[datetime] = None
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], object]
+    schedule: object
+    max_concurrency: int = 1
+    jitter_sec: float = 0.0
+    lease_ttl_sec: int = 600
+    next_slot: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+    running: int = 0
+    stats: JobStats = field(default_factory=JobStats)
+
+
+# ============================================================
+# Scheduler
+# ============================================================
+class Scheduler:
+    """
+    프로세스 내 경량 스케줄러
+
+    - run_pending(): 만기된 작업을 한 번 훑어 실행 (테스트에서는 FakeClock과 함께 직접 호출)
+    - start()/stop(): 백그라운드 스레드에서 tick_sec 마다 run_pending()
+    - synchronous=True 면 작업을 호출 스레드에서 바로 실행 (테스트용)
+    """
+
+    def __init__(
+        self,
+        clock=None,
+        lease=None,
+        max_workers: int = 4,
+        tick_sec: float = 1.0,
+        synchronous: bool = False,
+        rng: Optional[random.Random] = None,
+    ):
+        self.clock = clock or SystemClock()
+        self.lease = lease or LocalLease()
+        self.tick_sec = tick_sec
+        self.synchronous = synchronous
+        self.rng = rng or random.Random()
+
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = None if synchronous else ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scheduler"
+        )
+
+    # -----------------------
+    # 작업 등록
+    # -----------------------
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], object],
+        schedule,
+        max_concurrency: int = 1,
+        jitter_sec: float = 0.0,
+        lease_ttl_sec: int = 600,
+    ) -> Job:
+        job = Job(
+            name=name,
+            func=func,
+            schedule=schedule,
+            max_concurrency=max(1, max_concurrency),
+            jitter_sec=max(0.0, jitter_sec),
+            lease_ttl_sec=lease_ttl_sec,
+        )
+        self._plan_next(job, self.clock.now())
+        with self._lock:
+            self._jobs[name] = job
+        return job
+
+    def add_interval_job(self, name: str, func, seconds: int, **kwargs) -> Job:
+        return self.add_job(name, func, IntervalSchedule(seconds), **kwargs)
+
+    def add_cron_job(self, name: str, func, expr: str, tz=KST, **kwargs) -> Job:
+        return self.add_job(name, func, CronSchedule(expr, tz=tz), **kwargs)
+
+    def get_job(self, name: str) -> Optional[Job]:
+        return self._jobs.get(name)
+
+    def _plan_next(self, job: Job, after: datetime) -> None:
+        job.next_slot = job.schedule.next_after(after)
+        jitter = self.rng.uniform(0, job.jitter_sec) if job.jitter_sec else 0.0
+        job.next_run_at = job.next_slot + timedelta(seconds=jitter)
+
+    # -----------------------
+    # 실행
+    # -----------------------
+    def run_pending(self) -> int:
+        """만기된 작업 수만큼 실행을 시작하고, 시작한 수를 반환"""
+        now = self.clock.now()
+        started = 0
+
+        with self._lock:
+            due = [j for j in self._jobs.values() if j.next_run_at and j.next_run_at <= now]
+
+        for job in due:
+            slot = job.next_slot
+            # 밀린 슬롯은 하나로 합치고 다음 슬롯은 현재 시각 이후로
+            self._plan_next(job, max(now, slot))
+
+            with self._lock:
+                if job.running >= job.max_concurrency:
+                    job.stats.skipped_concurrency += 1
+                    JOB_SKIPS.labels(job.name, "concurrency").inc()
+                    continue
+                job.running += 1
+
+            if not self.lease.acquire(job.name, slot, job.lease_ttl_sec):
+                with self._lock:
+                    job.running -= 1
+                    job.stats.skipped_lease += 1
+                JOB_SKIPS.labels(job.name, "lease").inc()
+                continue
+
+            lag = (now - slot).total_seconds()
+            started += 1
+            if self._executor is None:
+                self._execute(job, lag)
+            else:
+                self._executor.submit(self._execute, job, lag)
+
+        return started
+
+    def _execute(self, job: Job, lag_sec: float) -> None:
+        begin = self.clock.monotonic()
+        error = None
+        try:
+            job.func()
+        except Exception as e:
+            error = e
+            print(f"[SCHEDULER] job={job.name} failed: {e}")
+        finally:
+            duration = self.clock.monotonic() - begin
+            self.lease.release(job.name)
+            with self._lock:
+                job.running -= 1
+                s = job.stats
+                s.runs += 1
+                s.last_lag_sec = lag_sec
+                s.last_duration_sec = duration
+                s.total_duration_sec += duration
+                s.last_finished_at = self.clock.now()
+                if error is not None:
+                    s.failures += 1
+                    s.last_error = str(error)
+
+            JOB_RUNS.labels(job.name, "failure" if error is not None else "success").inc()
+            JOB_DURATION.labels(job.name).observe(duration)
+            JOB_LAG.labels(job.name).set(lag_sec)
+
+        print(f"[SCHEDULER] job={job.name} lag={lag_sec:.1f}s duration={duration:.2f}s")
+
+    # -----------------------
+    # 백그라운드 스레드
+    # -----------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="scheduler-tick", daemon=True)
+        self._thread.start()
+        print(f"[SCHEDULER] started with jobs={list(self._jobs)}")
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.tick_sec):
+            try:
+                self.run_pending()
+            except Exception as e:
+                print("[SCHEDULER] tick error:", e)
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.tick_sec * 2)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    # -----------------------
+    # 작업별 지표
+    # -----------------------
+    def stats(self) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "name": j.name,
+                    "schedule": repr(j.schedule),
+                    "running": j.running,
+                    "next_run_at": j.next_run_at.isoformat() if j.next_run_at else None,
+                    "runs": j.stats.runs,
+                    "failures": j.stats.failures,
+                    "skipped_concurrency": j.stats.skipped_concurrency,
+                    "skipped_lease": j.stats.skipped_lease,
+                    "last_duration_sec": j.stats.last_duration_sec,
+                    "last_lag_sec": j.stats.last_lag_sec,
+                    "total_duration_sec": j.stats.total_duration_sec,
+                    "last_error": j.stats.last_error,
+                }
+                for j in self._jobs.values()
+            ]
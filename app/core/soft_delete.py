@@ -0,0 +1,36 @@
+"""
+소프트 삭제(tombstone) 조회 필터
+
+users / families / pets 의 deleted_at 이 채워진 행은 모든 ORM SELECT(조인/서브쿼리 포함)에서 자동으로 빠진다.
+삭제 요청은 tombstone 만 남기고 바로 응답하고, 연관 데이터는 purge 작업이 나중에 정리한다.
+
+- 정리 작업처럼 삭제된 행을 봐야 하는 조회는 execution_options(include_deleted=True)
+- Core 문장(connection.execute)과 UPDATE / DELETE 에는 적용되지 않음
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from app.models.family import Family
+from app.models.pet import Pet
+from app.models.user import User
+
+
+SOFT_DELETE_MODELS = (User, Family, Pet)
+
+_CRITERIA = tuple(
+    with_loader_criteria(model, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+    for model in SOFT_DELETE_MODELS
+)
+
+
+def _do_orm_execute(state) -> None:
+    if (
+        state.is_select
+        and not state.is_column_load
+        and not state.is_relationship_load
+        and not state.execution_options.get("include_deleted", False)
+    ):
+        state.statement = state.statement.options(*_CRITERIA)
+
+
+event.listen(Session, "do_orm_execute", _do_orm_execute)
@@ -0,0 +1,72 @@
+"""
+DB 방언별 단일 문장 upsert / insert-ignore
+
+- MySQL : INSERT ... ON DUPLICATE KEY UPDATE / INSERT IGNORE
+- SQLite: INSERT ... ON CONFLICT (...) DO UPDATE / DO NOTHING (벤치마크/테스트용)
+
+SELECT 후 INSERT/UPDATE 하는 get-or-create 패턴 대신 사용해
+동시 요청에서의 lost update / 중복 INSERT 오류와 추가 왕복을 없앤다.
+"""
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+
+# inserted(col_name) → "이번에 넣으려던 값" 컬럼 표현식 (MySQL VALUES(col) / SQLite excluded.col)
+UpdateSpec = Callable[[Callable[[str], object]], List[Tuple[str, object]]]
+
+
+def _table(model_or_table) -> Table:
+    return getattr(model_or_table, "__table__", model_or_table)
+
+
+def upsert(
+    db: Session,
+    model_or_table,
+    values: Union[Dict, List[Dict]],
+    conflict_columns: Sequence[str],
+    update: UpdateSpec,
+):
+    """
+    values 를 INSERT 하고, unique 키(conflict_columns) 충돌 시 update(inserted) 의 SET 목록을 적용
+
+    update 는 (컬럼명, 표현식) 리스트를 돌려줘야 하며 순서대로 적용된다.
+    MySQL 은 SET 이 왼쪽부터 평가되어 뒤 항목이 앞에서 바뀐 값을 보므로,
+    기존 값을 참조해야 하는 항목(예: 평균)을 먼저 둔다. SQLite 는 모두 기존 값을 참조.
+    """
+    table = _table(model_or_table)
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql.insert(table).values(values)
+        assignments = update(lambda name: stmt.inserted[name])
+        stmt = stmt.on_duplicate_key_update(assignments)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(table).values(values)
+        assignments = update(lambda name: stmt.excluded[name])
+        stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=dict(assignments))
+    else:
+        raise NotImplementedError(f"upsert is not supported for dialect: {dialect}")
+
+    return db.execute(stmt)
+
+
+def insert_ignore(
+    db: Session,
+    model_or_table,
+    values: Union[Dict, List[Dict]],
+    conflict_columns: Sequence[str],
+) -> int:
+    """unique 키 충돌 행은 건너뛰고 INSERT. 실제로 들어간 행 수를 반환"""
+    table = _table(model_or_table)
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql.insert(table).values(values).prefix_with("IGNORE")
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(table).values(values).on_conflict_do_nothing(index_elements=list(conflict_columns))
+    else:
+        raise NotImplementedError(f"insert_ignore is not supported for dialect: {dialect}")
+
+    return db.execute(stmt).rowcount
@@ -1,14 +1,23 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core import metrics
 
 # DB URL (env에서 불러오기)
 DATABASE_URL = settings.DATABASE_URL
 
+# SQLite(벤치마크/테스트)는 스레드풀에서 같은 커넥션을 쓸 수 있도록 설정
+connect_args = (
+    {"check_same_thread": False, "timeout": 30}
+    if DATABASE_URL.startswith("sqlite")
+    else {}
+)
+
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    echo=False
+    echo=False,
+    connect_args=connect_args,
 )
 
 SessionLocal = sessionmaker(
@@ -17,6 +26,26 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 동기화(변경분 조회)용 변경 기록 / 소프트 삭제 조회 필터 세션 이벤트 등록
+from app.core import change_log, soft_delete  # noqa: E402,F401
+
+# DB 커넥션 풀 지표 (scrape 시점에 갱신)
+DB_POOL_SIZE = metrics.gauge("db_pool_size", "DB 커넥션 풀 크기")
+DB_POOL_CHECKED_OUT = metrics.gauge("db_pool_checked_out", "사용 중인 DB 커넥션 수")
+DB_POOL_OVERFLOW = metrics.gauge("db_pool_overflow", "풀 크기를 넘어 생성된 DB 커넥션 수")
+
+
+def _collect_pool_metrics():
+    pool = engine.pool
+    if hasattr(pool, "checkedout"):
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+
+metrics.register_collector(_collect_pool_metrics)
+
+
 # DB dependency
 def get_db():
     db = SessionLocal()
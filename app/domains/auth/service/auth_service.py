@@ -1,26 +1,18 @@
 from fastapi import Request
 from sqlalchemy.orm import Session
 from typing import Optional
+from datetime import datetime
 from firebase_admin import auth as firebase_auth
 
+from app.core import pet_profiles, push_targets
 from app.core.firebase import verify_firebase_token, send_push_notification, send_push_notification_to_multiple
 from app.domains.auth.exception import auth_error
 from app.domains.auth.repository.auth_repository import AuthRepository
-from app.domains.notifications.repository.notification_repository import NotificationRepository
+from app.domains.users.repository.purge_repository import PurgeRepository
 from app.models.family_member import FamilyMember, MemberRole
 from app.models.family import Family
 from app.models.pet import Pet
-from app.models.walk import Walk
-from app.models.walk_tracking_point import WalkTrackingPoint
-from app.models.photo import Photo
-from app.models.activity_stat import ActivityStat
-from app.models.pet_walk_goal import PetWalkGoal
-from app.models.pet_walk_recommendation import PetWalkRecommendation
-from app.models.pet_share_request import PetShareRequest
-from app.models.notification import Notification, NotificationType
-from app.models.notification_reads import NotificationRead
-from app.models.user import User
-from app.domains.users.repository.user_repository import UserRepository
+from app.models.user_fcm_token import UserFcmToken
 
 
 class AuthService:
@@ -147,8 +139,9 @@ class AuthService:
         user_id = user.user_id
 
         try:
-            notif_repo = NotificationRepository(db)
-            user_repo = UserRepository(db)
+            purge_repo = PurgeRepository(db)
+            now = datetime.utcnow()
+
             # 사용자가 속한 모든 family_member 조회
             memberships = (
                 db.query(FamilyMember)
@@ -156,171 +149,73 @@ class AuthService:
                 .all()
             )
 
-            if not memberships:
-                # 가족이 없더라도 사용자만 삭제하고 종료
-                db.query(User).filter(User.user_id == user_id).delete(synchronize_session=False)
-                try:
-                    firebase_auth.delete_user(firebase_uid)
-                except firebase_auth.UserNotFoundError:
-                    # 이미 Firebase에 없으면 무시하고 진행
-                    print(f"AUTH_FIREBASE_DELETE_SKIP: user {firebase_uid} not found in Firebase")
-                except Exception as fe:
-                    print("AUTH_FIREBASE_DELETE_ERROR:", fe)
-                    db.rollback()
-                    return error_response(500, "AUTH_500_2", "Firebase 계정 삭제 중 오류가 발생했습니다.", path)
-                db.commit()
-                return {
-                    "success": True,
-                    "message": "회원탈퇴가 정상적으로 처리되었습니다."
-                }
-
             for membership in memberships:
                 family_id = membership.family_id
 
-                # 가족 멤버 전체 조회 (joined_at 오름차순)
-                members = (
-                    db.query(FamilyMember)
+                member_count = (
+                    db.query(FamilyMember.member_id)
                     .filter(FamilyMember.family_id == family_id)
-                    .order_by(FamilyMember.joined_at.asc())
-                    .all()
+                    .count()
                 )
-
-                if not members:
-                    # 가족이 없으면 스킵
-                    continue
-
-                member_count = len(members)
                 is_owner = membership.role == MemberRole.OWNER
 
-                if member_count == 1:
-                    # Case 2: 본인만 존재 → 가족/펫/연관 데이터 삭제
-                    AuthService._delete_family_and_pets(db, family_id)
+                if member_count == 1 or is_owner:
+                    # Case 1 (2명 이상, 내가 OWNER) / Case 2 (본인만 존재) → 가족/펫 전부 삭제
+                    AuthService._soft_delete_family(db, purge_repo, family_id, now)
                 else:
-                    if is_owner:
-                        # Case 1 (2명 이상, 내가 OWNER) → 가족/펫 전부 삭제 (Case 2와 동일 처리)
-                        AuthService._delete_family_and_pets(db, family_id)
-                    else:
-                        # Case 3: 단순 멤버 → 멤버십만 제거
-                        db.query(FamilyMember).filter(
-                            FamilyMember.family_id == family_id,
-                            FamilyMember.user_id == user_id
-                        ).delete(synchronize_session=False)
-
-            # 사용자 개인이 생성한 펫 공유 요청/연관 알림 제거 (requester FK 제약 해소)
-            share_req_ids = [
-                rid for (rid,) in db.query(PetShareRequest.request_id)
-                .filter(PetShareRequest.requester_id == user_id)
-                .all()
-            ]
-            if share_req_ids:
-                notif_ids = [
-                    n for (n,) in db.query(Notification.notification_id)
-                    .filter(Notification.related_request_id.in_(share_req_ids))
-                    .all()
-                ]
-                if notif_ids:
-                    db.query(NotificationRead).filter(
-                        NotificationRead.notification_id.in_(notif_ids)
+                    # Case 3: 단순 멤버 → 멤버십만 제거
+                    db.query(FamilyMember).filter(
+                        FamilyMember.family_id == family_id,
+                        FamilyMember.user_id == user_id
                     ).delete(synchronize_session=False)
-                    db.query(Notification).filter(
-                        Notification.notification_id.in_(notif_ids)
-                    ).delete(synchronize_session=False)
-                db.query(PetShareRequest).filter(
-                    PetShareRequest.request_id.in_(share_req_ids)
-                ).delete(synchronize_session=False)
-
-            # 모든 가족 처리 후 사용자 삭제
-            db.query(User).filter(User.user_id == user_id).delete(synchronize_session=False)
-
-            # Firebase 계정 삭제 (Admin SDK)
-            try:
-                firebase_auth.delete_user(firebase_uid)
-            except firebase_auth.UserNotFoundError:
-                # 이미 Firebase에 없으면 무시하고 진행
-                print(f"AUTH_FIREBASE_DELETE_SKIP: user {firebase_uid} not found in Firebase")
-            except Exception as fe:
-                print("AUTH_FIREBASE_DELETE_ERROR:", fe)
-                db.rollback()
-                return auth_error("AUTH_500_2", path)
+                    push_targets.mark_family_changed(db, family_id)
 
-            db.commit()
+            # 사용자 tombstone: 조회에서 바로 빠지고, 같은 Firebase uid 로 재가입할 수 있도록 uid 비움
+            user.deleted_at = now
+            user.firebase_uid = f"deleted:{user_id}"
+            user.fcm_token = None
+            db.query(UserFcmToken).filter(UserFcmToken.user_id == user_id).delete(synchronize_session=False)
+            push_targets.mark_user_changed(db, user_id)
 
-            return {
-                "success": True,
-                "message": "회원탈퇴가 정상적으로 처리되었습니다."
-            }
+            # 공유 요청 / 읽음 기록 / Firebase 계정 / 사용자 행은 purge 작업이 정리 (가족 작업보다 뒤에 등록)
+            purge_repo.enqueue("user", user_id, firebase_uid=firebase_uid)
+
+            db.commit()
 
         except Exception as e:
             print("AUTH_DELETE_ERROR:", e)
             db.rollback()
             return auth_error("AUTH_500_1", path)
 
+        # Firebase 계정 삭제 (Admin SDK) — commit 이후 시도, 실패해도 purge 작업이 재시도
+        try:
+            firebase_auth.delete_user(firebase_uid)
+        except firebase_auth.UserNotFoundError:
+            # 이미 Firebase에 없으면 무시하고 진행
+            print(f"AUTH_FIREBASE_DELETE_SKIP: user {firebase_uid} not found in Firebase")
+        except Exception as fe:
+            print("AUTH_FIREBASE_DELETE_ERROR:", fe)
+
+        return {
+            "success": True,
+            "message": "회원탈퇴가 정상적으로 처리되었습니다."
+        }
+
     @staticmethod
-    def _delete_family_and_pets(db: Session, family_id: int):
+    def _soft_delete_family(db: Session, purge_repo: PurgeRepository, family_id: int, now: datetime):
         """
-        가족 단위 삭제 (펫 및 연관 데이터 모두 제거)
+        가족 단위 삭제: 가족/펫 tombstone + 구성원 제거 후 연관 데이터는 purge 작업이 정리
         """
-        # 가족 전체 알림/읽음 삭제 (family_id FK 때문에 마지막에 막히는 문제 방지)
-        family_notif_ids = [
-            n for (n,) in db.query(Notification.notification_id)
-            .filter(Notification.family_id == family_id)
-            .all()
-        ]
-        if family_notif_ids:
-            db.query(NotificationRead).filter(
-                NotificationRead.notification_id.in_(family_notif_ids)
-            ).delete(synchronize_session=False)
-            db.query(Notification).filter(
-                Notification.notification_id.in_(family_notif_ids)
-            ).delete(synchronize_session=False)
-
-        # 가족의 모든 pet_id만 먼저 모은 뒤, 참조 순서대로 일괄 삭제
-        pet_ids = [pid for (pid,) in db.query(Pet.pet_id).filter(Pet.family_id == family_id).all()]
-        if pet_ids:
-            # Walk -> TrackingPoint/Photo -> Walk -> ActivityStat -> Goals -> Recommendations -> ShareRequest/Notifications
-            walk_ids = [w for (w,) in db.query(Walk.walk_id).filter(Walk.pet_id.in_(pet_ids)).all()]
-            if walk_ids:
-                db.query(WalkTrackingPoint).filter(WalkTrackingPoint.walk_id.in_(walk_ids)).delete(synchronize_session=False)
-                db.query(Photo).filter(Photo.walk_id.in_(walk_ids)).delete(synchronize_session=False)
-            db.query(Walk).filter(Walk.pet_id.in_(pet_ids)).delete(synchronize_session=False)
-
-            db.query(ActivityStat).filter(ActivityStat.pet_id.in_(pet_ids)).delete(synchronize_session=False)
-            db.query(PetWalkGoal).filter(PetWalkGoal.pet_id.in_(pet_ids)).delete(synchronize_session=False)
-            db.query(PetWalkRecommendation).filter(PetWalkRecommendation.pet_id.in_(pet_ids)).delete(synchronize_session=False)
-
-            share_ids = [sid for (sid,) in db.query(PetShareRequest.request_id).filter(PetShareRequest.pet_id.in_(pet_ids)).all()]
-            if share_ids:
-                notif_ids = [
-                    n for (n,) in db.query(Notification.notification_id)
-                    .filter(Notification.related_request_id.in_(share_ids))
-                    .all()
-                ]
-                if notif_ids:
-                    db.query(NotificationRead).filter(
-                        NotificationRead.notification_id.in_(notif_ids)
-                    ).delete(synchronize_session=False)
-                db.query(Notification).filter(
-                    Notification.related_request_id.in_(share_ids)
-                ).delete(synchronize_session=False)
-
-            db.query(PetShareRequest).filter(PetShareRequest.pet_id.in_(pet_ids)).delete(synchronize_session=False)
+        db.query(Family).filter(Family.family_id == family_id).update(
+            {Family.deleted_at: now}, synchronize_session=False
+        )
+        pet_ids = [pet_id for (pet_id,) in db.query(Pet.pet_id).filter(Pet.family_id == family_id).all()]
+        db.query(Pet).filter(Pet.family_id == family_id).update(
+            {Pet.deleted_at: now}, synchronize_session=False
+        )
+        pet_profiles.mark_pets_changed(db, pet_ids)
 
-            notif_ids = [
-                n for (n,) in db.query(Notification.notification_id)
-                .filter(Notification.related_pet_id.in_(pet_ids))
-                .all()
-            ]
-            if notif_ids:
-                db.query(NotificationRead).filter(
-                    NotificationRead.notification_id.in_(notif_ids)
-                ).delete(synchronize_session=False)
-                db.query(Notification).filter(
-                    Notification.notification_id.in_(notif_ids)
-                ).delete(synchronize_session=False)
-
-            # 마지막으로 모든 펫 삭제 (bulk)
-            db.query(Pet).filter(Pet.pet_id.in_(pet_ids)).delete(synchronize_session=False)
-
-        # 가족 멤버 삭제 및 가족 삭제
         db.query(FamilyMember).filter(FamilyMember.family_id == family_id).delete(synchronize_session=False)
-        db.query(Family).filter(Family.family_id == family_id).delete(synchronize_session=False)
+        push_targets.mark_family_changed(db, family_id)
+
+        purge_repo.enqueue("family", family_id)
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from app.core.error_handler import error_response
+from app.schemas.error_schema import ErrorResponse
+
+
+@dataclass(frozen=True)
+class HomeError:
+    status: int
+    code: str
+    reason: str
+
+    def to_dict(self, path: str) -> Dict:
+        return {
+            "success": False,
+            "status": self.status,
+            "code": self.code,
+            "reason": self.reason,
+            "timeStamp": "...",
+            "path": path,
+        }
+
+
+HOME_ERRORS: Dict[str, HomeError] = {
+    "HOME_401_1": HomeError(401, "HOME_401_1", "Authorization 헤더가 필요합니다."),
+    "HOME_401_2": HomeError(401, "HOME_401_2", "Authorization 헤더 형식이 잘못되었거나 토큰이 유효하지 않습니다."),
+    "HOME_400_1": HomeError(400, "HOME_400_1", "lat과 lng는 함께 전달해야 하며 올바른 범위여야 합니다."),
+    "HOME_404_1": HomeError(404, "HOME_404_1", "해당 사용자를 찾을 수 없습니다."),
+    "HOME_500_1": HomeError(500, "HOME_500_1", "홈 화면 정보를 조회하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."),
+}
+
+# 부분 실패(섹션별) 코드: 응답은 200 이고 errors 목록에 담김
+HOME_SECTION_ERRORS: Dict[str, HomeError] = {
+    "HOME_TODAY_500": HomeError(500, "HOME_TODAY_500", "오늘 산책 현황을 불러오지 못했습니다."),
+    "HOME_RECENT_500": HomeError(500, "HOME_RECENT_500", "최근 활동을 불러오지 못했습니다."),
+    "HOME_REC_500": HomeError(500, "HOME_REC_500", "추천 산책 정보를 불러오지 못했습니다."),
+    "HOME_NOTIF_500": HomeError(500, "HOME_NOTIF_500", "알림 정보를 불러오지 못했습니다."),
+    "HOME_WEATHER_502": HomeError(502, "HOME_WEATHER_502", "외부 날씨 서비스 응답 오류입니다."),
+    "HOME_WEATHER_503": HomeError(503, "HOME_WEATHER_503", "날씨 정보를 가져오지 못했습니다."),
+}
+
+
+def home_error(code: str, path: str):
+    err = HOME_ERRORS.get(code)
+    if not err:
+        return error_response(500, "HOME_500_1", "서버 내부 오류가 발생했습니다.", path)
+    return error_response(err.status, err.code, err.reason, path)
+
+
+def home_section_error(section: str, code: str) -> Dict:
+    err = HOME_SECTION_ERRORS[code]
+    return {"section": section, "status": err.status, "code": err.code, "reason": err.reason}
+
+
+def _examples(path: str, mapping: Dict[str, HomeError]) -> Dict:
+    return {
+        code: {"value": err.to_dict(path)}
+        for code, err in mapping.items()
+    }
+
+
+def _responses(path: str, status: int, description: str) -> Dict:
+    return {
+        "model": ErrorResponse,
+        "description": description,
+        "content": {
+            "application/json": {
+                "examples": _examples(path, {
+                    code: err for code, err in HOME_ERRORS.items() if err.status == status
+                })
+            }
+        },
+    }
+
+
+HOME_RESPONSES = {
+    400: _responses("/api/v1/home", 400, "잘못된 요청"),
+    401: _responses("/api/v1/home", 401, "인증 실패"),
+    404: _responses("/api/v1/home", 404, "리소스 없음"),
+    500: _responses("/api/v1/home", 500, "서버 내부 오류"),
+}
@@ -0,0 +1,101 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, exists, func, or_
+from typing import Dict, List
+
+from app.core.pet_profiles import RecommendationInfo, get_pet_profiles
+from app.models.walk import Walk
+from app.models.photo import Photo
+from app.models.user import User
+from app.models.family_member import FamilyMember
+from app.models.notification import Notification
+from app.models.notification_reads import NotificationRead
+
+
+class HomeRepository:
+    """홈 화면 집계용: 사용자 반려동물 전체를 대상으로 섹션별 1쿼리씩"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # =====================================================
+    # 최근 활동 (반려동물별 상위 N개, window 함수)
+    # =====================================================
+    def list_recent_activities(self, pet_ids: List[int], limit: int) -> List[tuple]:
+        """(Walk, User) 목록. 반려동물별 start_time 내림차순 상위 limit 개"""
+        if not pet_ids:
+            return []
+        ranked = (
+            self.db.query(
+                Walk.walk_id.label("walk_id"),
+                func.row_number().over(
+                    partition_by=Walk.pet_id,
+                    order_by=(Walk.start_time.desc(), Walk.walk_id.desc()),
+                ).label("rn"),
+            )
+            .filter(Walk.pet_id.in_(pet_ids))
+            .subquery()
+        )
+        return (
+            self.db.query(Walk, User)
+            .join(ranked, ranked.c.walk_id == Walk.walk_id)
+            .join(User, Walk.user_id == User.user_id)
+            .filter(ranked.c.rn <= limit)
+            .order_by(Walk.pet_id, Walk.start_time.desc())
+            .all()
+        )
+
+    def get_thumbnail_urls(self, walk_ids: List[int]) -> Dict[int, str]:
+        """walk_id → 가장 먼저 올린 사진 URL"""
+        if not walk_ids:
+            return {}
+        rows = (
+            self.db.query(Photo.walk_id, Photo.image_url)
+            .filter(Photo.walk_id.in_(walk_ids))
+            .order_by(Photo.walk_id, Photo.created_at.asc())
+            .all()
+        )
+        urls: Dict[int, str] = {}
+        for walk_id, image_url in rows:
+            urls.setdefault(walk_id, image_url)
+        return urls
+
+    # =====================================================
+    # 추천 산책 정보 (프로필 캐시, 미스난 펫만 1쿼리)
+    # =====================================================
+    def get_recommendations(self, pet_ids: List[int]) -> Dict[int, RecommendationInfo]:
+        profiles = get_pet_profiles(self.db, pet_ids)
+        return {
+            pet_id: profile.recommendation
+            for pet_id, profile in profiles.items()
+            if profile.recommendation is not None
+        }
+
+    # =====================================================
+    # 안 읽은 알림 수 (알림 목록과 같은 노출 조건)
+    # =====================================================
+    def count_unread_notifications(self, user_id: int) -> int:
+        family_ids = (
+            self.db.query(FamilyMember.family_id)
+            .filter(FamilyMember.user_id == user_id)
+            .subquery()
+        )
+        already_read = exists().where(
+            and_(
+                NotificationRead.notification_id == Notification.notification_id,
+                NotificationRead.user_id == user_id,
+            )
+        )
+        return (
+            self.db.query(func.count(Notification.notification_id))
+            .filter(
+                or_(
+                    Notification.target_user_id == user_id,
+                    and_(
+                        Notification.target_user_id.is_(None),
+                        Notification.family_id.in_(family_ids.select()),
+                    ),
+                ),
+                ~already_read,
+            )
+            .scalar()
+        ) or 0
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Header, Request, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.db import get_db
+from app.domains.home.service.home_service import HomeService
+from app.schemas.home.home_schema import HomeResponse
+from app.domains.home.exception import HOME_RESPONSES
+
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["Home"]
+)
+
+
+@router.get(
+    "/home",
+    summary="홈 화면 정보 한 번에 조회",
+    description="내 반려동물, 반려동물별 오늘 산책/최근 활동/추천, 날씨, 안 읽은 알림 수를 한 번에 조회합니다.",
+    status_code=200,
+    response_model=HomeResponse,
+    responses=HOME_RESPONSES,
+)
+def get_home(
+    request: Request,
+    lat: Optional[float] = Query(None, description="위도 (날씨 조회용, lng와 함께 전달)"),
+    lng: Optional[float] = Query(None, description="경도 (날씨 조회용, lat와 함께 전달)"),
+    recent_limit: int = Query(3, ge=1, le=20, description="반려동물별 최근 활동 개수"),
+    authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    db: Session = Depends(get_db),
+):
+    """
+    앱 실행 시 호출하던 여러 API(내 반려동물, 오늘 산책, 최근 활동, 추천, 날씨, 알림)를 한 번에 조회합니다.
+
+    - 각 섹션은 실패해도 나머지 결과와 함께 200으로 반환되며, 실패 섹션은 errors에 담깁니다.
+    - 알림은 안 읽은 개수만 반환하며 읽음 처리는 하지 않습니다.
+    - lat/lng를 전달하지 않으면 weather는 null입니다.
+    """
+    service = HomeService(db)
+    return service.get_home(
+        request=request,
+        authorization=authorization,
+        lat=lat,
+        lng=lng,
+        recent_limit=recent_limit,
+    )
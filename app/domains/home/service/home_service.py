@@ -0,0 +1,206 @@
+from fastapi import Request
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
+from app.domains.home.exception import home_error, home_section_error
+from app.domains.home.repository.home_repository import HomeRepository
+from app.domains.pets.repository.pet_repository import PetRepository
+from app.domains.pets.service.my_pets_service import pet_to_dict
+from app.domains.record.service.recent_service import recent_activity_to_dict
+from app.domains.walk.repository.today_repository import TodayRepository
+from app.domains.walk.service.recommendation_service import recommendation_to_dict
+from app.domains.walk.service.today_service import kst_today_range
+from app.domains.walk.service.weather_service import WeatherService
+from app.models.user import User
+
+
+# 날씨(외부 API)는 DB 조회와 겹쳐서 실행 (Session 은 스레드 간 공유하지 않음)
+_weather_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="home-weather")
+
+
+class HomeService:
+    """
+    앱 첫 화면에 필요한 정보를 한 번에 조회
+
+    - 토큰 검증/사용자 조회 1회
+    - 오늘 산책은 카운터 캐시, 최근 활동/추천/안 읽은 알림은 사용자 반려동물 전체에 대해 섹션별 1쿼리
+    - 날씨는 별도 스레드에서 동시에 조회
+    - 섹션 하나가 실패해도 나머지는 200 으로 반환하고 errors 에 실패 섹션을 담음
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.home_repo = HomeRepository(db)
+        self.pet_repo = PetRepository(db)
+        self.today_repo = TodayRepository(db)
+
+    def get_home(
+        self,
+        request: Request,
+        authorization: Optional[str],
+        lat: Optional[float],
+        lng: Optional[float],
+        recent_limit: int = 3,
+    ):
+        path = request.url.path
+
+        # ============================================
+        # 1) Authorization 검증
+        # ============================================
+        if authorization is None:
+            return home_error("HOME_401_1", path)
+
+        if not authorization.startswith("Bearer "):
+            return home_error("HOME_401_2", path)
+
+        parts = authorization.split(" ")
+        if len(parts) != 2:
+            return home_error("HOME_401_2", path)
+
+        decoded = verify_firebase_token(parts[1])
+        if decoded is None:
+            return home_error("HOME_401_2", path)
+
+        firebase_uid = decoded.get("uid")
+
+        # ============================================
+        # 2) Query Parameter 검사 + 날씨 조회 시작
+        # ============================================
+        if (lat is None) != (lng is None):
+            return home_error("HOME_400_1", path)
+        if lat is not None and (not (-90 <= lat <= 90) or not (-180 <= lng <= 180)):
+            return home_error("HOME_400_1", path)
+
+        weather_future = None
+        if lat is not None:
+            weather_future = _weather_executor.submit(WeatherService().get_weather_data, lat, lng)
+
+        # ============================================
+        # 3) 사용자 / 반려동물 조회
+        # ============================================
+        user: User = (
+            self.db.query(User)
+            .filter(User.firebase_uid == firebase_uid)
+            .first()
+        )
+
+        if not user:
+            return home_error("HOME_404_1", path)
+
+        try:
+            rows = self.pet_repo.get_pets_for_user(user.user_id)
+        except Exception as e:
+            print("HOME_PETS_QUERY_ERROR:", e)
+            return home_error("HOME_500_1", path)
+
+        pets = [pet_to_dict(pet, user.user_id) for pet in rows]
+        pet_ids = [p["pet_id"] for p in pets]
+        errors: List[dict] = []
+
+        # ============================================
+        # 4) 오늘 산책 현황 (카운터 캐시 → 미스난 반려동물만 집계 쿼리 1번)
+        # ============================================
+        try:
+            today_date_str, today_start_utc, today_end_utc = kst_today_range()
+            today_stats = self.today_repo.get_today_walks_stats_cached(
+                pet_ids, today_date_str, today_start_utc, today_end_utc
+            )
+            for pet in pets:
+                total_walks, total_duration_min, total_distance_km, current_walk_order, has_ongoing_walk = (
+                    today_stats[pet["pet_id"]]
+                )
+                pet["today"] = {
+                    "pet_id": pet["pet_id"],
+                    "date": today_date_str,
+                    "total_walks": total_walks,
+                    "total_duration_min": total_duration_min,
+                    "total_distance_km": round(total_distance_km, 2),
+                    "current_walk_order": current_walk_order,
+                    "has_ongoing_walk": has_ongoing_walk,
+                }
+        except Exception as e:
+            print("HOME_TODAY_QUERY_ERROR:", e)
+            self.db.rollback()
+            errors.append(home_section_error("today", "HOME_TODAY_500"))
+
+        # ============================================
+        # 5) 최근 활동 (반려동물별 상위 N개 1쿼리 + 썸네일 1쿼리)
+        # ============================================
+        for pet in pets:
+            pet["recent_activities"] = []
+        try:
+            recent_rows = self.home_repo.list_recent_activities(pet_ids, recent_limit)
+            thumbnails = self.home_repo.get_thumbnail_urls([walk.walk_id for walk, _ in recent_rows])
+            by_pet = {pet["pet_id"]: pet for pet in pets}
+            for walk, walker in recent_rows:
+                by_pet[walk.pet_id]["recent_activities"].append(
+                    recent_activity_to_dict(walk, walker, thumbnails.get(walk.walk_id))
+                )
+        except Exception as e:
+            print("HOME_RECENT_QUERY_ERROR:", e)
+            self.db.rollback()
+            errors.append(home_section_error("recent_activities", "HOME_RECENT_500"))
+
+        # ============================================
+        # 6) 추천 산책 정보 (프로필 캐시)
+        # ============================================
+        try:
+            recommendations = self.home_repo.get_recommendations(pet_ids)
+            for pet in pets:
+                rec = recommendations.get(pet["pet_id"])
+                pet["recommendation"] = recommendation_to_dict(rec) if rec else None
+        except Exception as e:
+            print("HOME_RECOMMENDATION_QUERY_ERROR:", e)
+            self.db.rollback()
+            errors.append(home_section_error("recommendation", "HOME_REC_500"))
+
+        # ============================================
+        # 7) 안 읽은 알림 수 (1쿼리, 읽음 처리는 하지 않음)
+        # ============================================
+        notifications = None
+        try:
+            notifications = {"unread_count": self.home_repo.count_unread_notifications(user.user_id)}
+        except Exception as e:
+            print("HOME_NOTIFICATION_QUERY_ERROR:", e)
+            self.db.rollback()
+            errors.append(home_section_error("notifications", "HOME_NOTIF_500"))
+
+        # ============================================
+        # 8) 날씨 결과 대기
+        # ============================================
+        weather = None
+        if weather_future is not None:
+            try:
+                weather = weather_future.result(timeout=settings.HOME_WEATHER_TIMEOUT_SEC)
+            except FutureTimeoutError:
+                errors.append(home_section_error("weather", "HOME_WEATHER_503"))
+            except Exception as e:
+                print("HOME_WEATHER_ERROR:", e)
+                code = "HOME_WEATHER_502" if str(e) == "WEATHER_502_1" else "HOME_WEATHER_503"
+                errors.append(home_section_error("weather", code))
+
+        # ============================================
+        # 9) 응답 생성
+        # ============================================
+        response_content = {
+            "success": True,
+            "status": 200,
+            "user": {
+                "user_id": user.user_id,
+                "nickname": user.nickname,
+                "profile_img_url": user.profile_img_url,
+            },
+            "pets": pets,
+            "weather": weather,
+            "notifications": notifications,
+            "errors": errors,
+            "timeStamp": datetime.utcnow().isoformat(),
+            "path": path
+        }
+
+        return json_response(response_content, status_code=200)
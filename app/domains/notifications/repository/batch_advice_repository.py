@@ -0,0 +1,172 @@
+# app/domains/notifications/repository/batch_advice_repository.py
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+
+from app.models.pet import Pet
+from app.models.walk import Walk
+from app.models.family_member import FamilyMember
+from app.models.notification import Notification, NotificationType
+from app.models.pet_walk_recommendation import PetWalkRecommendation
+
+
+class BatchAdviceRepository:
+    """
+    스케줄 배치(날씨/건강 알림)용 조회/저장
+    - pet 단위 반복 쿼리 대신 페이지 단위 집합 쿼리만 사용
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # -----------------------
+    # pet 프로필 (pet_id keyset 페이지)
+    # -----------------------
+    def list_pets_page(self, after_pet_id: int, limit: int):
+        return (
+            self.db.query(
+                Pet.pet_id,
+                Pet.family_id,
+                Pet.name,
+                Pet.breed,
+                Pet.age,
+                Pet.weight,
+                Pet.disease,
+            )
+            .filter(Pet.pet_id > after_pet_id)
+            .order_by(Pet.pet_id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    # -----------------------
+    # 마지막 산책 위치 — pet 묶음 (현재 페이지 pet 만 집계)
+    # -----------------------
+    def get_last_location_map(self, pet_ids: List[int]) -> Dict[int, Tuple[float, float]]:
+        if not pet_ids:
+            return {}
+
+        # pet별 위치가 기록된 마지막 산책
+        last_walk = (
+            self.db.query(
+                Walk.pet_id.label("pet_id"),
+                func.max(Walk.walk_id).label("walk_id"),
+            )
+            .filter(
+                Walk.pet_id.in_(pet_ids),
+                Walk.last_lat.isnot(None),
+                Walk.last_lng.isnot(None),
+            )
+            .group_by(Walk.pet_id)
+            .subquery()
+        )
+
+        rows = (
+            self.db.query(Walk.pet_id, Walk.last_lat, Walk.last_lng)
+            .join(last_walk, last_walk.c.walk_id == Walk.walk_id)
+            .all()
+        )
+        return {r.pet_id: (r.last_lat, r.last_lng) for r in rows}
+
+    # -----------------------
+    # 최근 7일 산책 시간(분) 총합 — pet 묶음
+    # -----------------------
+    def get_weekly_walk_minutes_map(self, pet_ids: List[int]) -> Dict[int, int]:
+        if not pet_ids:
+            return {}
+
+        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+
+        rows = (
+            self.db.query(Walk.pet_id, func.sum(Walk.duration_min))
+            .filter(
+                Walk.pet_id.in_(pet_ids),
+                Walk.start_time >= seven_days_ago,
+            )
+            .group_by(Walk.pet_id)
+            .all()
+        )
+        return {pet_id: int(total or 0) for pet_id, total in rows}
+
+    # -----------------------
+    # 추천 산책 정보 — pet 묶음
+    # -----------------------
+    def get_recommendation_map(self, pet_ids: List[int]) -> Dict[int, dict]:
+        if not pet_ids:
+            return {}
+
+        rows = (
+            self.db.query(
+                PetWalkRecommendation.pet_id,
+                PetWalkRecommendation.min_minutes,
+                PetWalkRecommendation.recommended_minutes,
+                PetWalkRecommendation.max_minutes,
+            )
+            .filter(PetWalkRecommendation.pet_id.in_(pet_ids))
+            .all()
+        )
+        return {
+            r.pet_id: {
+                "min_minutes": r.min_minutes,
+                "recommended_minutes": r.recommended_minutes,
+                "max_minutes": r.max_minutes,
+            }
+            for r in rows
+        }
+
+    # -----------------------
+    # family별 구성원 user_id 목록
+    # -----------------------
+    def get_family_member_map(self, family_ids: Iterable[int]) -> Dict[int, List[int]]:
+        family_ids = list(set(family_ids))
+        if not family_ids:
+            return {}
+
+        rows = (
+            self.db.query(FamilyMember.family_id, FamilyMember.user_id)
+            .filter(FamilyMember.family_id.in_(family_ids))
+            .all()
+        )
+        result: Dict[int, List[int]] = {}
+        for family_id, user_id in rows:
+            result.setdefault(family_id, []).append(user_id)
+        return result
+
+    # -----------------------
+    # 이미 알림을 받은 pet (같은 배치 재실행 시 중복 방지)
+    # -----------------------
+    def get_notified_pet_ids(
+        self,
+        pet_ids: List[int],
+        notif_type: NotificationType,
+        since: datetime,
+    ) -> set:
+        if not pet_ids:
+            return set()
+
+        rows = (
+            self.db.query(Notification.related_pet_id)
+            .filter(
+                Notification.related_pet_id.in_(pet_ids),
+                Notification.type == notif_type,
+                Notification.created_at >= since,
+            )
+            .distinct()
+            .all()
+        )
+        return {r[0] for r in rows}
+
+    # -----------------------
+    # 개인 알림 일괄 INSERT (읽음 레코드 생성 없음)
+    # -----------------------
+    def bulk_insert_notifications(self, rows: List[dict]) -> int:
+        if not rows:
+            return 0
+        # ORM flush 로 INSERT: 생성된 ID 를 돌려받아 change_log 가 after_flush 에서 정확히 그 행들만 기록
+        # (RETURNING 지원 DB 는 묶음 INSERT, MySQL 은 행별 INSERT + lastrowid)
+        self.db.add_all([Notification(**row) for row in rows])
+        self.db.flush()
+        return len(rows)
@@ -0,0 +1,116 @@
+# app/domains/notifications/repository/broadcast_repository.py
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, exists, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.upsert import insert_ignore
+from app.models.broadcast_job import BroadcastJob
+from app.models.user import User
+from app.models.user_fcm_token import UserFcmToken
+
+
+class BroadcastRepository:
+    """전체 기기 브로드캐스트 작업 큐 + 토큰 keyset 페이지 조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # =====================================================
+    # 작업 큐
+    # =====================================================
+    def enqueue(self, dedup_key: str, title: str, body: str, data: Optional[str]) -> bool:
+        """dedup_key 로 1건만 등록. 새로 들어갔으면 True"""
+        return insert_ignore(
+            self.db,
+            BroadcastJob,
+            {
+                "dedup_key": dedup_key,
+                "title": title,
+                "body": body,
+                "data": data,
+                "status": "PENDING",
+                "device_cursor": 0,
+                "legacy_cursor": 0,
+                "pages": 0,
+                "tokens": 0,
+                "success": 0,
+                "failure": 0,
+                "invalid": 0,
+                "attempts": 0,
+            },
+            conflict_columns=("dedup_key",),
+        ) == 1
+
+    def get_job(self, job_id: int) -> Optional[BroadcastJob]:
+        return self.db.query(BroadcastJob).filter(BroadcastJob.job_id == job_id).first()
+
+    def get_job_by_dedup_key(self, dedup_key: str) -> Optional[BroadcastJob]:
+        return self.db.query(BroadcastJob).filter(BroadcastJob.dedup_key == dedup_key).first()
+
+    def list_pending_job_ids(self, limit: int) -> List[int]:
+        rows = (
+            self.db.query(BroadcastJob.job_id)
+            .filter(BroadcastJob.status == "PENDING")
+            .order_by(BroadcastJob.job_id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [r[0] for r in rows]
+
+    def claim(self, job_id: int, owner: str, now: datetime, lease_until: datetime) -> bool:
+        """
+        조건부 UPDATE 로 작업 lease 획득
+        - 다른 워커의 lease 가 아직 유효하면 실패 (만료됐으면 이어받음)
+        """
+        table = BroadcastJob.__table__
+        result = self.db.execute(
+            update(table)
+            .where(
+                and_(
+                    table.c.job_id == job_id,
+                    table.c.status == "PENDING",
+                    or_(
+                        table.c.lease_until.is_(None),
+                        table.c.lease_until < now,
+                        table.c.lease_owner == owner,
+                    ),
+                )
+            )
+            .values(lease_owner=owner, lease_until=lease_until)
+        )
+        return result.rowcount == 1
+
+    # -----------------------
+    # 기기별 활성 토큰 (user_fcm_tokens)
+    # -----------------------
+    def get_device_token_page(self, after_token_id: int, limit: int) -> List[Tuple[int, str]]:
+        return (
+            self.db.query(UserFcmToken.token_id, UserFcmToken.fcm_token)
+            .filter(
+                UserFcmToken.token_id > after_token_id,
+                UserFcmToken.is_active.is_(True),
+            )
+            .order_by(UserFcmToken.token_id)
+            .limit(limit)
+            .all()
+        )
+
+    # -----------------------
+    # legacy users.fcm_token (user_fcm_tokens 에 없는 것만)
+    # -----------------------
+    def get_legacy_token_page(self, after_user_id: int, limit: int) -> List[Tuple[int, str]]:
+        return (
+            self.db.query(User.user_id, User.fcm_token)
+            .filter(
+                User.user_id > after_user_id,
+                User.fcm_token.isnot(None),
+                User.fcm_token != "",
+                ~exists().where(UserFcmToken.fcm_token == User.fcm_token),
+            )
+            .order_by(User.user_id)
+            .limit(limit)
+            .all()
+        )
@@ -4,10 +4,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
 
-from app.models.pet import Pet
+from app.core.pet_profiles import get_pet_profile
 from app.models.family_member import FamilyMember
 from app.models.walk import Walk
-from app.models.pet_walk_recommendation import PetWalkRecommendation
 
 
 class HealthRepository:
@@ -15,14 +14,11 @@ class HealthRepository:
         self.db = db
 
     # -----------------------
-    # PET 조회
+    # PET 조회 (프로필 캐시)
     # -----------------------
     def get_pet(self, pet_id: int):
-        return (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == pet_id)
-            .first()
-        )
+        profile = get_pet_profile(self.db, pet_id)
+        return profile.pet if profile else None
 
     # -----------------------
     # user가 family 소속인지 체크
@@ -59,8 +55,5 @@ class HealthRepository:
     # 추천 산책 정보
     # -----------------------
     def get_recommendation(self, pet_id: int):
-        return (
-            self.db.query(PetWalkRecommendation)
-            .filter(PetWalkRecommendation.pet_id == pet_id)
-            .first()
-        )
+        profile = get_pet_profile(self.db, pet_id)
+        return profile.recommendation if profile else None
@@ -1,10 +1,40 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from dataclasses import dataclass
+from decimal import Decimal
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, select
 from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from app.core.upsert import insert_ignore
 from app.models.notification import Notification, NotificationType
 from app.models.notification_reads import NotificationRead
 from app.models.family_member import FamilyMember
+from app.models.pet import Pet
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationRow:
+    """알림 목록 1행 (ORM 엔티티 대신 필요한 컬럼만, identity map / 변경 추적 없음)"""
+    notification_id: int
+    type: NotificationType
+    title: str
+    message: str
+    family_id: int
+    target_user_id: Optional[int]
+    related_request_id: Optional[int]
+    related_lat: Optional[Decimal]
+    related_lng: Optional[Decimal]
+    created_at: datetime
+    # 관련 반려동물 / 보낸 사람 (없거나 삭제됐으면 None)
+    related_user_id: Optional[int]
+    pet_id: Optional[int]
+    pet_name: Optional[str]
+    pet_image_url: Optional[str]
+    sender_id: Optional[int]
+    sender_nickname: Optional[str]
+    sender_profile_img_url: Optional[str]
+    is_read_by_me: bool
 
 
 class NotificationRepository:
@@ -20,38 +50,89 @@ class NotificationRepository:
         pet_id: int | None,
         page: int,
         size: int
-    ):
+    ) -> Tuple[List[NotificationRow], int]:
+        """관련 반려동물 / 보낸 사람 / 내 읽음 여부까지 쿼리 1번 (+ 총 개수 1번)"""
         # 사용자가 속한 family_id
-        family_ids = (
-            self.db.query(FamilyMember.family_id)
-            .filter(FamilyMember.user_id == user_id)
-            .subquery()
+        family_ids = select(FamilyMember.family_id).where(FamilyMember.user_id == user_id)
+        condition = (
+            (Notification.target_user_id == user_id)
+            |
+            ((Notification.target_user_id.is_(None)) &
+             (Notification.family_id.in_(family_ids)))
         )
+        if pet_id is not None:
+            condition = condition & (Notification.related_pet_id == pet_id)
+
+        sender = aliased(User)
+        my_read = aliased(NotificationRead)
 
         query = (
-            self.db.query(Notification)
-            .options(
-                joinedload(Notification.related_user),
-                joinedload(Notification.related_pet),
-                joinedload(Notification.related_request),    # ⭐ 추가
-            )
-            .filter(
-                (Notification.target_user_id == user_id)
-                |
-                ((Notification.target_user_id.is_(None)) &
-                 (Notification.family_id.in_(family_ids)))
+            self.db.query(
+                Notification.notification_id,
+                Notification.type,
+                Notification.title,
+                Notification.message,
+                Notification.family_id,
+                Notification.target_user_id,
+                Notification.related_request_id,
+                Notification.related_lat,
+                Notification.related_lng,
+                Notification.created_at,
+                Notification.related_user_id,
+                Pet.pet_id,
+                Pet.name,
+                Pet.image_url,
+                sender.user_id,
+                sender.nickname,
+                sender.profile_img_url,
+                my_read.user_id.isnot(None),
             )
+            .outerjoin(Pet, Pet.pet_id == Notification.related_pet_id)
+            .outerjoin(sender, sender.user_id == Notification.related_user_id)
+            .outerjoin(my_read, and_(
+                my_read.notification_id == Notification.notification_id,
+                my_read.user_id == user_id,
+            ))
+            .filter(condition)
         )
 
-        if pet_id is not None:
-            query = query.filter(Notification.related_pet_id == pet_id)
+        # 총 개수는 조인 없이 같은 조건으로
+        total = self.db.query(func.count(Notification.notification_id)).filter(condition).scalar()
 
-        query = query.order_by(Notification.created_at.asc())
+        rows = (
+            query.order_by(Notification.created_at.asc(), Notification.notification_id.asc())
+            .offset(page * size)
+            .limit(size)
+            .all()
+        )
+        return [NotificationRow(*r) for r in rows], total
 
-        total = query.count()
-        items = query.offset(page * size).limit(size).all()
+    # ============================
+    # 📌 여러 알림 읽은 사람 수 / 가족 인원수 (목록용 일괄 조회)
+    # ============================
+    def get_read_counts(self, notification_ids: Iterable[int]) -> Dict[int, int]:
+        ids = list(notification_ids)
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(NotificationRead.notification_id, func.count(func.distinct(NotificationRead.user_id)))
+            .filter(NotificationRead.notification_id.in_(ids))
+            .group_by(NotificationRead.notification_id)
+            .all()
+        )
+        return {notification_id: count for notification_id, count in rows}
 
-        return items, total
+    def get_family_member_counts(self, family_ids: Iterable[int]) -> Dict[int, int]:
+        ids = list(family_ids)
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(FamilyMember.family_id, func.count(FamilyMember.user_id))
+            .filter(FamilyMember.family_id.in_(ids))
+            .group_by(FamilyMember.family_id)
+            .all()
+        )
+        return {family_id: count for family_id, count in rows}
 
     # ============================
     # 📌 가족 인원수
@@ -78,24 +159,33 @@ class NotificationRepository:
     # 📌 읽음 처리
     # ============================
     def mark_as_read(self, notification_id: int, user_id: int):
-        exists = (
-            self.db.query(NotificationRead)
-            .filter(
-                NotificationRead.notification_id == notification_id,
-                NotificationRead.user_id == user_id
-            )
-            .first()
+        # (notification_id, user_id) unique 키 기준 INSERT IGNORE 1회 (조회 후 INSERT 경쟁 없음)
+        inserted = insert_ignore(
+            self.db,
+            NotificationRead,
+            {
+                "notification_id": notification_id,
+                "user_id": user_id,
+                "read_at": datetime.utcnow(),
+            },
+            conflict_columns=("notification_id", "user_id"),
         )
+        return "OK" if inserted else "ALREADY_READ"
 
-        if exists:
-            return "ALREADY_READ"
-
-        new_row = NotificationRead(
-            notification_id=notification_id,
-            user_id=user_id
+    def mark_many_as_read(self, notification_ids: List[int], user_id: int) -> int:
+        """목록 조회 시 안 읽은 알림들을 INSERT IGNORE 1문장으로 읽음 처리"""
+        if not notification_ids:
+            return 0
+        now = datetime.utcnow()
+        return insert_ignore(
+            self.db,
+            NotificationRead,
+            [
+                {"notification_id": notification_id, "user_id": user_id, "read_at": now}
+                for notification_id in notification_ids
+            ],
+            conflict_columns=("notification_id", "user_id"),
         )
-        self.db.add(new_row)
-        return "OK"
 
     # ============================
     # 📌 단일 조회
@@ -4,9 +4,8 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.models.pet import Pet
+from app.core.pet_profiles import get_pet_profile
 from app.models.family_member import FamilyMember
-from app.models.pet_walk_recommendation import PetWalkRecommendation
 from app.models.walk import Walk
 
 
@@ -15,14 +14,11 @@ class WeatherRepository:
         self.db = db
 
     # -----------------------
-    # PET 조회
+    # PET 조회 (프로필 캐시)
     # -----------------------
     def get_pet(self, pet_id: int):
-        return (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == pet_id)
-            .first()
-        )
+        profile = get_pet_profile(self.db, pet_id)
+        return profile.pet if profile else None
 
     # -----------------------
     # user가 pet family에 속하는지 체크
@@ -59,11 +55,8 @@ class WeatherRepository:
     # 추천 산책 정보 조회
     # -----------------------
     def get_recommendation(self, pet_id: int):
-        return (
-            self.db.query(PetWalkRecommendation)
-            .filter(PetWalkRecommendation.pet_id == pet_id)
-            .first()
-        )
+        profile = get_pet_profile(self.db, pet_id)
+        return profile.recommendation if profile else None
 
     # -----------------------
     # 최근 산책 1건 조회
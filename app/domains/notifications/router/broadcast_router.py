@@ -0,0 +1,87 @@
+# app/domains/notifications/router/broadcast_router.py
+
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Request
+from sqlalchemy.orm import Session
+
+from app.core.error_handler import error_response
+from app.core.jobs import run_broadcast_jobs
+from app.core.ops_auth import ops_auth_error
+from app.db import get_db
+from app.domains.notifications.repository.broadcast_repository import BroadcastRepository
+from app.domains.notifications.service.broadcast_service import BroadcastService
+from app.models.broadcast_job import BroadcastJob
+from app.schemas.notifications.broadcast_schema import BroadcastJobResponse, BroadcastRequest
+
+router = APIRouter(
+    prefix="/api/v1/notifications/broadcast",
+    tags=["Broadcast Notification"]
+)
+
+
+def _job_response(job: BroadcastJob, created: bool = False) -> dict:
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "created": created,
+        "pages": job.pages,
+        "tokens": job.tokens,
+        "success": job.success,
+        "failure": job.failure,
+        "invalid": job.invalid,
+        "attempts": job.attempts,
+        "last_error": job.last_error,
+    }
+
+
+@router.post(
+    "",
+    status_code=202,
+    response_model=BroadcastJobResponse,
+    summary="전체 기기 푸시 발송 등록 (운영자 전용)",
+    include_in_schema=False,
+)
+def broadcast(
+    request: Request,
+    body: BroadcastRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    authorization: Optional[str] = Header(None),
+):
+    """
+    점검 공지 / 기상 특보 등을 등록된 모든 기기로 발송하는 작업을 등록.
+    - 앱 사용자 토큰이 아닌 OPS_API_TOKEN(Bearer) 필요
+    - 발송은 응답 후 백그라운드에서 진행 (중단되면 broadcast_worker 가 이어서)
+    - 같은 dedup_key 재요청은 기존 작업을 그대로 돌려줌 (created=false)
+    """
+    denied = ops_auth_error(request, authorization)
+    if denied is not None:
+        return denied
+
+    job, created = BroadcastService(db).enqueue(body.title, body.body, body.data, body.dedup_key)
+    if job.status == "PENDING":
+        background_tasks.add_task(run_broadcast_jobs)
+    return _job_response(job, created)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=BroadcastJobResponse,
+    summary="전체 기기 푸시 발송 진행 상황 (운영자 전용)",
+    include_in_schema=False,
+)
+def get_broadcast(
+    request: Request,
+    job_id: int,
+    db: Session = Depends(get_db),
+    authorization: Optional[str] = Header(None),
+):
+    denied = ops_auth_error(request, authorization)
+    if denied is not None:
+        return denied
+
+    job = BroadcastRepository(db).get_job(job_id)
+    if job is None:
+        return error_response(404, "BROADCAST_404_1", "브로드캐스트 작업을 찾을 수 없습니다.", request.url.path)
+    return _job_response(job)
@@ -0,0 +1,428 @@
+# app/domains/notifications/service/batch_advice_service.py
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.llm import DEFAULT_MODEL, get_openai_client, parse_json_content
+from app.models.notification import NotificationType
+from app.domains.notifications.repository.batch_advice_repository import BatchAdviceRepository
+from app.domains.notifications.service.weather_service import WeatherService
+from app.domains.pets.service.recommendation_engine import (
+    classify_age_band,
+    classify_size,
+    disease_flags,
+)
+
+KST = pytz.timezone("Asia/Seoul")
+
+TITLE_MAX_LEN = 100     # notifications.title
+MESSAGE_MAX_LEN = 255   # notifications.message
+INSERT_CHUNK_SIZE = 1000
+
+
+class BatchAdviceService:
+    """
+    스케줄 배치용 날씨/건강 알림 생성 파이프라인
+
+    1) pet_id keyset 페이지로 pet 프로필/마지막 산책 위치/주간 산책량/추천값을 집합 조회
+       (전체 대상을 메모리에 모으지 않고 페이지마다 2)~5)를 수행)
+    2) 날씨: 마지막 산책 위치를 격자(BATCH_ADVICE_GRID_DEG)로 묶어 클러스터당 1회만 날씨 조회
+       (조회한 날씨는 다음 페이지에서도 재사용)
+    3) 같은 클러스터 안에서 프로필(체급/연령대/질환)로 다시 묶고,
+       LLM 1회 요청에 여러 pet을 담아 JSON(items 배열)으로 응답받음
+    4) LLM 요청은 BATCH_ADVICE_MAX_CONCURRENCY 만큼만 동시에 실행
+    5) 결과를 가족 구성원별 개인 알림으로 펼쳐 bulk INSERT (읽음 레코드 생성 없음)
+
+    DB 세션은 메인 스레드에서만 사용하고, 워커 스레드는 외부 HTTP/LLM 호출만 수행한다.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        pets_per_request: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        grid_deg: Optional[float] = None,
+    ):
+        self.db = db
+        self.repo = BatchAdviceRepository(db)
+        self.client = get_openai_client()
+        self.pets_per_request = max(1, pets_per_request or settings.BATCH_ADVICE_PETS_PER_REQUEST)
+        self.max_concurrency = max(1, max_concurrency or settings.BATCH_ADVICE_MAX_CONCURRENCY)
+        self.grid_deg = grid_deg or settings.BATCH_ADVICE_GRID_DEG
+
+    # ============================================================
+    # 🔥 날씨 배치 (매일 아침)
+    # ============================================================
+    def run_weather_batch(self, page_size: int = 1000) -> dict:
+        since = self._kst_today_start_utc()
+        summary = {"pets": 0, "clusters": 0, "llm_requests": 0, "skipped_weather": 0, "notifications": 0}
+
+        # 클러스터별 날씨는 배치 전체에서 1회만 조회 (페이지를 넘어 재사용)
+        weather_by_cluster: Dict[Tuple[int, int], Optional[dict]] = {}
+
+        for candidates in self._iter_candidate_pages(
+            NotificationType.SYSTEM_WEATHER,
+            since,
+            page_size,
+            require_location=True,
+        ):
+            summary["pets"] += len(candidates)
+
+            # 1) 지역 격자 클러스터 → 클러스터 대표 좌표로 날씨 1회 조회
+            clusters: Dict[Tuple[int, int], List[dict]] = {}
+            for c in candidates:
+                clusters.setdefault(self._grid_key(c["lat"], c["lng"]), []).append(c)
+
+            new_keys = [key for key in clusters if key not in weather_by_cluster]
+            if new_keys:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                    weathers = list(pool.map(
+                        lambda key: WeatherService.fetch_weather(*self._grid_center(key)),
+                        new_keys,
+                    ))
+                weather_by_cluster.update(zip(new_keys, weathers))
+
+            # 2) 클러스터 × 프로필 그룹 → LLM 요청 단위로 분할
+            jobs = []
+            for key, pets in clusters.items():
+                weather = weather_by_cluster.get(key)
+                if not weather:
+                    summary["skipped_weather"] += len(pets)
+                    continue
+                for chunk in self._profile_chunks(pets):
+                    jobs.append((weather, chunk))
+
+            advices = self._run_llm_jobs(
+                jobs,
+                lambda job: self._request_weather_advice(*job),
+            )
+            summary["llm_requests"] += len(jobs)
+
+            # 3) 개인 알림 펼치기 → 페이지마다 저장
+            rows = []
+            for (weather, chunk), result in zip(jobs, advices):
+                for pet in chunk:
+                    advice = result.get(pet["pet_id"])
+                    if not advice:
+                        continue
+                    rows.extend(self._fan_out(
+                        pet,
+                        NotificationType.SYSTEM_WEATHER,
+                        advice["title"],
+                        WeatherService.build_message(weather, advice),
+                    ))
+
+            summary["notifications"] += self._insert_notifications(rows)
+
+        summary["clusters"] = len(weather_by_cluster)
+        print(f"[BATCH_WEATHER] {summary}")
+        return summary
+
+    # ============================================================
+    # 🔥 건강 배치 (주간)
+    # ============================================================
+    def run_health_batch(self, page_size: int = 1000) -> dict:
+        since = datetime.utcnow() - timedelta(days=6)
+        summary = {"pets": 0, "llm_requests": 0, "notifications": 0}
+
+        for candidates in self._iter_candidate_pages(
+            NotificationType.SYSTEM_HEALTH,
+            since,
+            page_size,
+            require_location=False,
+        ):
+            summary["pets"] += len(candidates)
+
+            jobs = list(self._profile_chunks(candidates))
+            advices = self._run_llm_jobs(jobs, self._request_health_advice)
+            summary["llm_requests"] += len(jobs)
+
+            rows = []
+            for chunk, result in zip(jobs, advices):
+                for pet in chunk:
+                    advice = result.get(pet["pet_id"])
+                    if not advice:
+                        continue
+                    rows.extend(self._fan_out(
+                        pet,
+                        NotificationType.SYSTEM_HEALTH,
+                        advice["title"],
+                        advice["message"],
+                    ))
+
+            summary["notifications"] += self._insert_notifications(rows)
+
+        print(f"[BATCH_HEALTH] {summary}")
+        return summary
+
+    # ============================================================
+    # 대상 pet 수집 (페이지 단위 집합 조회 → 페이지마다 바로 처리)
+    # ============================================================
+    def _iter_candidate_pages(self, notif_type, since, page_size, require_location):
+        last_pet_id = 0
+
+        while True:
+            rows = self.repo.list_pets_page(last_pet_id, page_size)
+            if not rows:
+                break
+            last_pet_id = rows[-1].pet_id
+
+            locations = {}
+            if require_location:
+                locations = self.repo.get_last_location_map([r.pet_id for r in rows])
+                rows = [r for r in rows if r.pet_id in locations]
+            if not rows:
+                continue
+
+            pet_ids = [r.pet_id for r in rows]
+            notified = self.repo.get_notified_pet_ids(pet_ids, notif_type, since)
+            rows = [r for r in rows if r.pet_id not in notified]
+            if not rows:
+                continue
+
+            pet_ids = [r.pet_id for r in rows]
+            weekly = self.repo.get_weekly_walk_minutes_map(pet_ids)
+            recs = self.repo.get_recommendation_map(pet_ids)
+            members = self.repo.get_family_member_map(r.family_id for r in rows)
+
+            candidates = []
+            for r in rows:
+                member_ids = members.get(r.family_id)
+                if not member_ids:
+                    continue
+
+                lat, lng = locations.get(r.pet_id, (None, None))
+                size = classify_size(r.breed, r.weight)
+                candidates.append({
+                    "pet_id": r.pet_id,
+                    "family_id": r.family_id,
+                    "name": r.name,
+                    "breed": r.breed,
+                    "age": r.age,
+                    "weight": r.weight,
+                    "disease": r.disease,
+                    "lat": lat,
+                    "lng": lng,
+                    "weekly_minutes": weekly.get(r.pet_id, 0),
+                    "rec": recs.get(r.pet_id),
+                    "member_ids": member_ids,
+                    "profile_key": (
+                        size,
+                        classify_age_band(size, r.age),
+                        disease_flags(r.disease),
+                    ),
+                })
+
+            if candidates:
+                yield candidates
+
+    def _profile_chunks(self, pets: List[dict]):
+        groups: Dict[tuple, List[dict]] = {}
+        for p in pets:
+            groups.setdefault(p["profile_key"], []).append(p)
+
+        for group in groups.values():
+            for i in range(0, len(group), self.pets_per_request):
+                yield group[i:i + self.pets_per_request]
+
+    # ============================================================
+    # 지역 격자
+    # ============================================================
+    def _grid_key(self, lat, lng) -> Tuple[int, int]:
+        return (int(float(lat) // self.grid_deg), int(float(lng) // self.grid_deg))
+
+    def _grid_center(self, key: Tuple[int, int]) -> Tuple[float, float]:
+        return (
+            round((key[0] + 0.5) * self.grid_deg, 4),
+            round((key[1] + 0.5) * self.grid_deg, 4),
+        )
+
+    @staticmethod
+    def _kst_today_start_utc() -> datetime:
+        start = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+        return start.astimezone(pytz.utc).replace(tzinfo=None)
+
+    # ============================================================
+    # LLM (여러 pet을 한 요청에)
+    # ============================================================
+    def _run_llm_jobs(self, jobs, func) -> List[Dict[int, dict]]:
+        if not jobs:
+            return []
+
+        def safe(job):
+            try:
+                return func(job)
+            except Exception as e:
+                print("BATCH LLM ERROR:", e)
+                return {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(pool.map(safe, jobs))
+
+    @staticmethod
+    def _pet_payload(pets: List[dict]) -> str:
+        return json.dumps(
+            [
+                {
+                    "pet_id": p["pet_id"],
+                    "name": p["name"],
+                    "breed": p["breed"],
+                    "age": p["age"],
+                    "weight": p["weight"],
+                    "disease": p["disease"],
+                    "weekly_walk_minutes": p["weekly_minutes"],
+                    "recommendation": p["rec"],
+                }
+                for p in pets
+            ],
+            ensure_ascii=False,
+        )
+
+    def _chat_items(self, prompt: str, temperature: float) -> Dict[int, dict]:
+        res = self.client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            temperature=temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": "Output JSON only."},
+                {"role": "user", "content": prompt},
+            ],
+        )
+        data = parse_json_content(res.choices[0].message.content)
+
+        result = {}
+        for item in data.get("items") or []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                pet_id = int(item.get("pet_id"))
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(item.get("title"), str) or not isinstance(item.get("message"), str):
+                continue
+            result[pet_id] = item
+        return result
+
+    def _request_weather_advice(self, weather: dict, pets: List[dict]) -> Dict[int, dict]:
+        prompt = f"""
+        너는 반려동물 산책 전문가야.
+        아래 날씨와 반려동물 목록을 분석해 각 반려동물의 오늘 산책 추천을 JSON으로 출력해줘.
+        반드시 입력된 모든 pet_id에 대해 items 항목을 하나씩 만들어줘.
+
+        JSON:
+        {{
+            "items": [
+                {{
+                    "pet_id": 1,
+                    "title": "string",
+                    "message": "string",
+                    "suggested_time_slots": [
+                        {{
+                            "label": "string",
+                            "start_time": "HH:MM",
+                            "end_time": "HH:MM"
+                        }}
+                    ],
+                    "suggested_duration_min": 20,
+                    "notes": ["주의1", "주의2"]
+                }}
+            ]
+        }}
+
+        --- 날씨 ---
+        상태: {weather["condition_ko"]}
+        기온: {weather["temperature_c"]}℃
+        습도: {weather["humidity"]}%
+
+        --- 반려동물 목록 ---
+        {self._pet_payload(pets)}
+
+        message는 1~2문장, title은 한 문장.
+        """
+        return self._chat_items(prompt, temperature=0.4)
+
+    def _request_health_advice(self, pets: List[dict]) -> Dict[int, dict]:
+        prompt = f"""
+        너는 전문 수의사이자 반려동물 건강 코치야.
+        아래 반려동물 목록 각각에 대해 **전반적인 건강 요약**을 JSON으로 출력해줘.
+        반드시 입력된 모든 pet_id에 대해 items 항목을 하나씩 만들어줘.
+
+        JSON:
+        {{
+            "items": [
+                {{
+                    "pet_id": 1,
+                    "title": "string",
+                    "message": "string",
+                    "tags": ["a", "b"]
+                }}
+            ]
+        }}
+
+        --- 반려동물 목록 (weekly_walk_minutes: 최근 7일 산책 시간, recommendation: 하루 추천 산책 분) ---
+        {self._pet_payload(pets)}
+
+        message는 2~3문장, title은 한 문장.
+        """
+        return self._chat_items(prompt, temperature=0.5)
+
+    # ============================================================
+    # 개인 알림 펼치기 + bulk INSERT
+    # ============================================================
+    @staticmethod
+    def _fan_out(pet: dict, notif_type: NotificationType, title: str, message: str) -> List[dict]:
+        title = title[:TITLE_MAX_LEN]
+        message = message[:MESSAGE_MAX_LEN]
+        return [
+            {
+                "family_id": pet["family_id"],
+                "target_user_id": user_id,
+                "related_pet_id": pet["pet_id"],
+                "related_user_id": user_id,
+                "type": notif_type,
+                "title": title,
+                "message": message,
+            }
+            for user_id in pet["member_ids"]
+        ]
+
+    def _insert_notifications(self, rows: List[dict]) -> int:
+        inserted = 0
+        for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+            try:
+                inserted += self.repo.bulk_insert_notifications(rows[i:i + INSERT_CHUNK_SIZE])
+                self.db.commit()
+            except Exception as e:
+                print("BATCH NOTIFICATION INSERT ERROR:", e)
+                self.db.rollback()
+                raise
+        return inserted
+
+
+# ============================================================
+# 스케줄러 진입점 (자체 세션 사용)
+# ============================================================
+def run_weather_advice_job() -> dict:
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return BatchAdviceService(db).run_weather_batch()
+    finally:
+        db.close()
+
+
+def run_health_advice_job() -> dict:
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return BatchAdviceService(db).run_health_batch()
+    finally:
+        db.close()
@@ -0,0 +1,142 @@
+# app/domains/notifications/service/broadcast_service.py
+
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.firebase import send_push_notification_to_multiple
+from app.core.scheduler import default_owner_id
+from app.domains.notifications.repository.broadcast_repository import BroadcastRepository
+from app.domains.users.repository.user_repository import UserRepository
+from app.models.broadcast_job import BroadcastJob
+
+
+def _dedup_key(title: str, body: str, data: Optional[dict]) -> str:
+    raw = json.dumps([title, body, data or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class BroadcastService:
+    """
+    등록된 모든 기기로 푸시 발송 (점검 공지, 기상 특보 등)
+
+    - 요청 시에는 broadcast_jobs 에 작업만 등록 (dedup_key 로 재시도해도 1건)
+    - 워커가 토큰을 keyset 페이지(FCM_BROADCAST_PAGE_SIZE)로 읽고,
+      페이지마다 fcm_fanout 이 500개 청크로 나눠 동시 전송
+    - 페이지마다 출처별 cursor + 집계 + lease 연장을 commit → 중단돼도 다음 페이지부터 이어서 진행
+      (commit 전에 죽은 페이지 1개만 다시 보낼 수 있음)
+    - 페이지별로 무효 토큰을 바로 정리
+    """
+
+    def __init__(self, db: Session, page_size: Optional[int] = None, owner: Optional[str] = None):
+        self.db = db
+        self.repo = BroadcastRepository(db)
+        self.user_repo = UserRepository(db)
+        self.page_size = max(1, page_size or settings.FCM_BROADCAST_PAGE_SIZE)
+        # 같은 프로세스의 요청 스레드 / 스케줄러 스레드도 서로 다른 워커로 취급
+        self.owner = owner or f"{default_owner_id()}:{threading.get_ident()}"
+
+    # =====================================================
+    # 작업 등록
+    # =====================================================
+    def enqueue(
+        self,
+        title: str,
+        body: str,
+        data: Optional[dict] = None,
+        dedup_key: Optional[str] = None,
+    ) -> Tuple[BroadcastJob, bool]:
+        """(작업, 새로 등록됐는지). dedup_key 가 없으면 제목/본문/data 로 만든 키 사용"""
+        key = dedup_key or _dedup_key(title, body, data)
+        created = self.repo.enqueue(key, title, body, json.dumps(data) if data else None)
+        self.db.commit()
+        return self.repo.get_job_by_dedup_key(key), created
+
+    # =====================================================
+    # 워커: 대기 중인 작업 실행
+    # =====================================================
+    def run_pending(self) -> dict:
+        counts = {"done": 0, "retry": 0, "failed": 0, "busy": 0}
+        for job_id in self.repo.list_pending_job_ids(limit=20):
+            if not self._renew_lease(job_id):
+                counts["busy"] += 1
+                continue
+            counts[self._run_job(self.repo.get_job(job_id))] += 1
+
+        print(f"[BROADCAST] {counts}")
+        return counts
+
+    def _renew_lease(self, job_id: int) -> bool:
+        now = datetime.utcnow()
+        claimed = self.repo.claim(job_id, self.owner, now, now + timedelta(seconds=settings.BROADCAST_LEASE_SEC))
+        self.db.commit()
+        return claimed
+
+    def _run_job(self, job: BroadcastJob) -> str:
+        job_id = job.job_id
+        started = time.perf_counter()
+        payload = {"type": "BROADCAST", **json.loads(job.data or "{}")}
+        sources = (
+            ("device_cursor", self.repo.get_device_token_page),
+            ("legacy_cursor", self.repo.get_legacy_token_page),
+        )
+
+        try:
+            for cursor_attr, fetch_page in sources:
+                while True:
+                    rows = fetch_page(getattr(job, cursor_attr), self.page_size)
+                    if not rows:
+                        break
+
+                    result = send_push_notification_to_multiple(
+                        fcm_tokens=[token for _, token in rows],
+                        title=job.title,
+                        body=job.body,
+                        data=payload,
+                    )
+                    invalid = result.get("invalid_tokens") or []
+                    if invalid:
+                        self.user_repo.remove_fcm_tokens(invalid)
+
+                    setattr(job, cursor_attr, rows[-1][0])
+                    job.pages += 1
+                    job.tokens += len(rows)
+                    job.success += result["success_count"]
+                    job.failure += result["failure_count"]
+                    job.invalid += len(invalid)
+                    self.db.commit()
+
+                    # lease 가 만료돼 다른 워커가 이어받았으면 중단 (그 워커가 저장된 cursor 부터 계속)
+                    if not self._renew_lease(job_id):
+                        print(f"[BROADCAST] job {job_id} taken over, stopping")
+                        return "retry"
+                    if len(rows) < self.page_size:
+                        break
+
+            job.status = "DONE"
+            job.finished_at = datetime.utcnow()
+            job.lease_owner = None
+            job.lease_until = None
+            self.db.commit()
+            elapsed = round(time.perf_counter() - started, 2)
+            print(f"[BROADCAST] job {job_id} {job.title}: {job.tokens} tokens, {job.success} ok ({elapsed}s)")
+            return "done"
+
+        except Exception as e:
+            print(f"BROADCAST_JOB_ERROR: job {job_id}:", e)
+            self.db.rollback()
+            job.attempts += 1
+            job.last_error = str(e)[:255]
+            # 다음 워커 실행에서 바로 이어받도록 lease 해제
+            job.lease_owner = None
+            job.lease_until = None
+            if job.attempts >= settings.BROADCAST_MAX_ATTEMPTS:
+                job.status = "FAILED"
+            self.db.commit()
+            return "failed" if job.status == "FAILED" else "retry"
@@ -1,7 +1,7 @@
 import json
 from datetime import datetime
 from fastapi.responses import JSONResponse
-from openai import OpenAI
+from app.core.llm import get_openai_client
 
 from app.core.config import settings
 from app.core.firebase import verify_firebase_token
@@ -21,7 +21,7 @@ from app.schemas.notifications.common_action_schema import (
 class HealthService:
     def __init__(self, db):
         self.db = db
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
         self.health_repo = HealthRepository(db)
         self.notif_repo = NotificationRepository(db)
 
@@ -4,10 +4,9 @@ from sqlalchemy.orm import Session
 
 from app.core.firebase import verify_firebase_token
 from app.core.error_handler import error_response
-from sqlalchemy.exc import IntegrityError
+from app.core.responses import model_response
 
 from app.models.user import User
-from app.models.notification_reads import NotificationRead
 from app.domains.notifications.repository.notification_repository import NotificationRepository
 from app.schemas.notifications.notification_schema import NotificationListResponse
 
@@ -45,6 +44,26 @@ class NotificationService:
         if items is None and total == "INVALID_TYPE":
             return error_response(400, "NOTIF_400", "알림 타입 오류", request.url.path)
 
+        # --------------------------------------
+        # 안 읽은 알림 일괄 읽음 처리 (이미 다른 요청에서 읽음 처리된 경우는 INSERT IGNORE 로 건너뜀)
+        # --------------------------------------
+        read_ids = {row.notification_id for row in items if row.is_read_by_me}
+        unread_ids = [row.notification_id for row in items if not row.is_read_by_me]
+        if unread_ids:
+            try:
+                self.repo.mark_many_as_read(unread_ids, user.user_id)
+                self.db.commit()
+                read_ids.update(unread_ids)
+            except Exception as e:
+                self.db.rollback()
+                print(f"[NOTIF] mark read commit error: {e}")
+
+        # 읽음 여부를 반영한 최신 카운트 (목록 전체 1번씩)
+        read_counts = self.repo.get_read_counts(row.notification_id for row in items)
+        family_counts = self.repo.get_family_member_counts(
+            {row.family_id for row in items if row.target_user_id is None}
+        )
+
         results = []
 
         for notif in items:
@@ -52,27 +71,15 @@ class NotificationService:
             is_me = (notif.related_user_id == user.user_id)
 
             # ❗ 내가 읽었는지
-            is_read = (
-                self.db.query(NotificationRead)
-                .filter(
-                    NotificationRead.notification_id == notif.notification_id,
-                    NotificationRead.user_id == user.user_id
-                )
-                .first() is not None
-            )
+            is_read = notif.notification_id in read_ids
 
-            
+            read_count = read_counts.get(notif.notification_id, 0)
             if notif.target_user_id is not None:
                 # 개인 알림: 총 인원수는 1로 가정하고 실제 읽음 수를 기반으로 계산
-                base_count = 1
-                read_count = self.repo.get_read_count(notif.notification_id)
-                unread_count = max(0, base_count - read_count)
+                unread_count = max(0, 1 - read_count)
             else:
-                # ❗ family 전체 인원수
-                family_count = self.repo.get_family_member_count(notif.family_id)
-                # ❗ 이 알림을 읽은 사람 수
-                read_count = self.repo.get_read_count(notif.notification_id)
-                unread_count = family_count - read_count
+                # ❗ family 전체 인원수 - 이 알림을 읽은 사람 수
+                unread_count = family_counts.get(notif.family_id, 0) - read_count
 
             # ❗ display_time (오전/오후)
             display_time = (
@@ -81,49 +88,6 @@ class NotificationService:
                 .replace("PM", "오후")
             )
 
-            # ❗ 알림 타입 라벨
-            display_type_label = f"[{notif.type.value}]"
-
-            # ❗ 읽음 텍스트
-            display_read_text = f"{read_count}명 읽음"
-
-            # ❗ sender info
-            sender_profile_img_url = notif.related_user.profile_img_url if notif.related_user else None
-            sender_nickname = notif.related_user.nickname if notif.related_user else None
-
-            # --------------------------------------
-            # 읽음처리 (안읽었으면 기록)
-            # --------------------------------------
-            if not is_read:
-                try:
-                    read_obj = NotificationRead(
-                        notification_id=notif.notification_id,
-                        user_id=user.user_id,
-                        read_at=datetime.utcnow()
-                    )
-                    self.db.add(read_obj)
-                    self.db.commit()
-                    is_read = True
-                except IntegrityError:
-                    # 이미 다른 요청에서 읽음 처리된 경우: 롤백 후 그대로 계속
-                    self.db.rollback()
-                    is_read = True
-                except Exception as e:
-                    self.db.rollback()
-                    print(f"[NOTIF] mark read commit error: {e}")
-
-                # 읽음 여부를 반영해 최신 카운트를 DB 기준으로 다시 계산
-                if notif.target_user_id is not None:
-                    base_count = 1
-                    read_count = self.repo.get_read_count(notif.notification_id)
-                    unread_count = max(0, base_count - read_count)
-                else:
-                    family_count = self.repo.get_family_member_count(notif.family_id)
-                    read_count = self.repo.get_read_count(notif.notification_id)
-                    unread_count = family_count - read_count
-
-                display_read_text = f"{read_count}명 읽음"
-
             # --------------------------------------
             # 응답에 넣기 — 전 필드 포함
             # --------------------------------------
@@ -137,8 +101,18 @@ class NotificationService:
                 "target_user_id": notif.target_user_id,
 
                 # 관계
-                "related_pet": notif.related_pet,
-                "related_user": notif.related_user,
+                "related_pet": (
+                    {"pet_id": notif.pet_id, "name": notif.pet_name, "image_url": notif.pet_image_url}
+                    if notif.pet_id is not None else None
+                ),
+                "related_user": (
+                    {
+                        "user_id": notif.sender_id,
+                        "nickname": notif.sender_nickname,
+                        "profile_img_url": notif.sender_profile_img_url,
+                    }
+                    if notif.sender_id is not None else None
+                ),
                 "related_request_id": notif.related_request_id,
                 "related_lat": float(notif.related_lat) if notif.related_lat else None,
                 "related_lng": float(notif.related_lng) if notif.related_lng else None,
@@ -151,15 +125,16 @@ class NotificationService:
 
                 # 프론트 UI
                 "display_time": display_time,
-                "display_type_label": display_type_label,
-                "display_read_text": display_read_text,
-                "sender_profile_img_url": sender_profile_img_url,
-                "sender_nickname": sender_nickname,
+                "display_type_label": f"[{notif.type.value}]",
+                "display_read_text": f"{read_count}명 읽음",
+                "sender_profile_img_url": notif.sender_profile_img_url,
+                "sender_nickname": notif.sender_nickname,
 
                 "created_at": notif.created_at,
             })
 
-        return NotificationListResponse(
+        # 응답 모델 검증은 여기서 1번, 직렬화는 model_dump_json 으로 바로 (FastAPI 가 다시 검증/변환하지 않음)
+        return model_response(NotificationListResponse(
             success=True,
             status=200,
             notifications=results,
@@ -168,7 +143,7 @@ class NotificationService:
             total_count=total,
             timeStamp=datetime.utcnow().isoformat(),
             path=request.url.path,
-        )
+        ))
 
 
     # ============================
@@ -197,16 +172,10 @@ class NotificationService:
         if not notif:
             return error_response(404, "NOTIF_READ_404_2", "알림 없음", path)
 
-        existing = (
-            self.db.query(NotificationRead)
-            .filter(
-                NotificationRead.notification_id == notification_id,
-                NotificationRead.user_id == user.user_id
-            )
-            .first()
-        )
+        result = self.repo.mark_as_read(notification_id, user.user_id)
+        self.db.commit()
 
-        if existing:
+        if result == "ALREADY_READ":
             return {
                 "success": True,
                 "status": 200,
@@ -216,14 +185,6 @@ class NotificationService:
                 "path": path
             }
 
-        new_read = NotificationRead(
-            notification_id=notification_id,
-            user_id=user.user_id,
-            read_at=datetime.utcnow()
-        )
-        self.db.add(new_read)
-        self.db.commit()
-
         return {
             "success": True,
             "status": 200,
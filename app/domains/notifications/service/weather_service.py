@@ -1,10 +1,10 @@
 import json
-import requests
 from datetime import datetime
 import pytz
 
 from fastapi.responses import JSONResponse
-from openai import OpenAI
+from app.core.llm import get_openai_client
+from app.core.http_client import get_http_client
 
 from app.core.config import settings
 from app.core.firebase import verify_firebase_token
@@ -30,19 +30,20 @@ class WeatherService:
         self.db = db
         self.weather_repo = WeatherRepository(db)
         self.notif_repo = NotificationRepository(db)
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     # ------------------------------------------------------------
     # 1) 외부 날씨 API
     # ------------------------------------------------------------
-    def fetch_weather(self, lat, lng):
+    @staticmethod
+    def fetch_weather(lat, lng):
         try:
             url = (
                 f"https://api.openweathermap.org/data/2.5/weather?"
                 f"lat={lat}&lon={lng}&appid={settings.OPENWEATHER_API_KEY}"
                 f"&units=metric&lang=kr"
             )
-            res = requests.get(url, timeout=5)
+            res = get_http_client().get(url)
             if res.status_code != 200:
                 print("WEATHER API ERROR:", res.text)
                 return None
@@ -121,7 +122,8 @@ class WeatherService:
     # ------------------------------------------------------------
     # 3) 디테일 포함 message 생성
     # ------------------------------------------------------------
-    def build_message(self, weather, advice):
+    @staticmethod
+    def build_message(weather, advice):
         weather_text = f"오늘 날씨는 {weather['condition_ko']}({weather['temperature_c']}℃)입니다."
         slots = advice.get("suggested_time_slots", [])
         if slots:
@@ -1,13 +1,36 @@
+from dataclasses import dataclass
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, insert, update, bindparam
 from typing import Optional, List
 
+from app.core import pet_profiles
 from app.models.pet import Pet, PetGender
 from app.models.pet_walk_recommendation import PetWalkRecommendation
 from app.models.family import Family
 from app.models.family_member import FamilyMember, MemberRole
 
 
+@dataclass(frozen=True, slots=True)
+class MyPetRow:
+    """내 반려동물 목록 1행 (반려동물 컬럼 + 가족 이름, ORM 엔티티 없이)"""
+    pet_id: int
+    family_id: int
+    family_name: Optional[str]
+    owner_id: int
+    pet_search_id: str
+    name: str
+    breed: Optional[str]
+    age: Optional[int]
+    weight: Optional[float]
+    gender: Optional[PetGender]
+    image_url: Optional[str]
+    disease: Optional[str]
+    voice_url: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
 class PetRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -71,9 +94,25 @@ class PetRepository:
     # -------------------------------
     # MY PETS 목록 조회
     # -------------------------------
-    def get_pets_for_user(self, user_id: int):
-        return (
-            self.db.query(Pet, Family)
+    def get_pets_for_user(self, user_id: int) -> List[MyPetRow]:
+        rows = (
+            self.db.query(
+                Pet.pet_id,
+                Pet.family_id,
+                Family.family_name,
+                Pet.owner_id,
+                Pet.pet_search_id,
+                Pet.name,
+                Pet.breed,
+                Pet.age,
+                Pet.weight,
+                Pet.gender,
+                Pet.image_url,
+                Pet.disease,
+                Pet.voice_url,
+                Pet.created_at,
+                Pet.updated_at,
+            )
             .join(Family, Family.family_id == Pet.family_id)
             .join(FamilyMember, FamilyMember.family_id == Pet.family_id)
             .filter(FamilyMember.user_id == user_id)
@@ -83,6 +122,7 @@ class PetRepository:
             )
             .all()
         )
+        return [MyPetRow(*r) for r in rows]
 
     # -------------------------------
     # RECOMMENDATION
@@ -106,3 +146,50 @@ class PetRepository:
             setattr(rec, k, v)
         self.db.flush()
         return rec
+
+    # -------------------------------
+    # RECOMMENDATION: 배치 재계산용
+    # -------------------------------
+    def list_pet_profiles_for_recommendation(self, after_pet_id: int, limit: int):
+        """
+        pet_id 기준 keyset 페이지로 추천 계산에 필요한 컬럼만 조회
+        (pet_id, breed, age, weight, disease, rec_id, generated_by)
+        """
+        return (
+            self.db.query(
+                Pet.pet_id,
+                Pet.breed,
+                Pet.age,
+                Pet.weight,
+                Pet.disease,
+                PetWalkRecommendation.rec_id,
+                PetWalkRecommendation.generated_by,
+            )
+            .outerjoin(PetWalkRecommendation, PetWalkRecommendation.pet_id == Pet.pet_id)
+            .filter(Pet.pet_id > after_pet_id)
+            .order_by(Pet.pet_id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def bulk_insert_recommendations(self, rows: List[dict]) -> int:
+        if not rows:
+            return 0
+        self.db.execute(insert(PetWalkRecommendation), rows)
+        pet_profiles.mark_pets_changed(self.db, [r["pet_id"] for r in rows])
+        return len(rows)
+
+    def bulk_update_recommendations(self, rows: List[dict]) -> int:
+        """rows: pet_id + 추천 필드 + generated_by (executemany 한 번으로 갱신)"""
+        if not rows:
+            return 0
+        fields = [k for k in rows[0].keys() if k != "pet_id"]
+        stmt = (
+            update(PetWalkRecommendation.__table__)
+            .where(PetWalkRecommendation.__table__.c.pet_id == bindparam("b_pet_id"))
+            .values({f: bindparam(f) for f in fields})
+        )
+        params = [{**{f: r[f] for f in fields}, "b_pet_id": r["pet_id"]} for r in rows]
+        self.db.execute(stmt, params)
+        pet_profiles.mark_pets_changed(self.db, [r["pet_id"] for r in rows])
+        return len(rows)
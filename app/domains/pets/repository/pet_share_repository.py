@@ -4,6 +4,7 @@ from typing import Optional, List
 from app.models.pet_share_request import PetShareRequest, RequestStatus
 from app.models.family_member import FamilyMember
 from app.models.pet import Pet
+from app.models.user import User
 
 
 class PetShareRepository:
@@ -96,8 +97,18 @@ class PetShareRepository:
         page: int,
         size: int
     ):
+        """요청 + 반려동물 이름/이미지를 한 번의 JOIN 으로 (목록 행마다 pet 조회하지 않음)"""
         query = (
-            self.db.query(PetShareRequest)
+            self.db.query(
+                PetShareRequest.request_id,
+                PetShareRequest.pet_id,
+                PetShareRequest.status,
+                PetShareRequest.created_at,
+                PetShareRequest.responded_at,
+                Pet.name.label("pet_name"),
+                Pet.image_url.label("pet_image_url"),
+            )
+            .join(Pet, PetShareRequest.pet_id == Pet.pet_id)
             .filter(PetShareRequest.requester_id == requester_id)
         )
 
@@ -150,10 +161,22 @@ class PetShareRepository:
     ):
         """
         owner_id가 소유한 pet들에 대해 받은 공유 요청 목록 조회
+        - 반려동물 이름/이미지, 요청자 닉네임까지 한 번의 JOIN 으로
         """
         query = (
-            self.db.query(PetShareRequest)
+            self.db.query(
+                PetShareRequest.request_id,
+                PetShareRequest.pet_id,
+                PetShareRequest.requester_id,
+                PetShareRequest.status,
+                PetShareRequest.created_at,
+                PetShareRequest.responded_at,
+                Pet.name.label("pet_name"),
+                Pet.image_url.label("pet_image_url"),
+                User.nickname.label("requester_nickname"),
+            )
             .join(Pet, PetShareRequest.pet_id == Pet.pet_id)
+            .join(User, PetShareRequest.requester_id == User.user_id)
             .filter(Pet.owner_id == owner_id)
         )
 
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Header, Request, Depends
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.etag import ConditionalGet, conditional_get
 from app.db import get_db
 from app.schemas.pets.my_pets_schema import MyPetsResponse
 from app.schemas.pets.pet_update_schema import PetUpdateRequest
@@ -31,6 +32,7 @@ router = APIRouter(
 def list_my_pets(
     request: Request,
     authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    conditional: ConditionalGet = Depends(conditional_get),
     db: Session = Depends(get_db),
 ):
     """
@@ -39,9 +41,11 @@ def list_my_pets(
     - 현재 사용자가 owner이거나 member로 속한 모든 반려동물 반환
     - 각 반려동물의 소유자 여부(is_owner) 정보 포함
     - 가족 그룹별로 구분되어 반환
+    - ETag / If-None-Match 지원 (변경 없으면 304)
     """
     service = MyPetsService(db)
     return service.list_my_pets(
         request=request,
         authorization=authorization,
+        conditional=conditional,
     )
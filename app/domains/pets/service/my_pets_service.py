@@ -1,19 +1,42 @@
 # app/domains/pets/service/my_pets_service.py
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
+from app.core import change_log
+from app.core.etag import ConditionalGet
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.pets.exception import pet_error
 from app.models.user import User
-from app.domains.pets.repository.pet_repository import PetRepository
+from app.domains.pets.repository.pet_repository import MyPetRow, PetRepository
 from app.domains.auth.repository.auth_repository import AuthRepository
 
 
+def pet_to_dict(pet: MyPetRow, user_id: int) -> dict:
+    """내 반려동물 목록 항목 (홈 화면 집계 응답에서도 사용)"""
+    return {
+        "pet_id": pet.pet_id,
+        "family_id": pet.family_id,
+        "family_name": pet.family_name,
+        "owner_id": pet.owner_id,
+        "is_owner": (pet.owner_id == user_id),
+        "pet_search_id": pet.pet_search_id,
+        "name": pet.name,
+        "breed": pet.breed,
+        "age": pet.age,
+        "weight": pet.weight,
+        "gender": pet.gender.value if pet.gender else None,
+        "image_url": pet.image_url,
+        "disease": pet.disease,
+        "voice_url": pet.voice_url,
+        "created_at": pet.created_at.isoformat() if pet.created_at else None,
+        "updated_at": pet.updated_at.isoformat() if pet.updated_at else None,
+    }
+
+
 class MyPetsService:
     def __init__(self, db: Session):
         self.db = db
@@ -23,6 +46,7 @@ class MyPetsService:
         self,
         request: Request,
         authorization: Optional[str],
+        conditional: ConditionalGet,
     ):
         path = request.url.path
 
@@ -83,7 +107,20 @@ class MyPetsService:
                 return pet_error("MY_PETS_500_2", path)
 
         # ------------------------
-        # 3) Pet 조회
+        # 3) 조건부 GET: 내 가족들 / 개인 범위 변경이 없으면 304
+        # ------------------------
+        try:
+            not_modified = conditional.evaluate(
+                "pets.my", user.user_id, change_log.user_version(self.db, user.user_id)
+            )
+        except Exception as e:
+            print("MY_PETS_VERSION_ERROR:", e)
+            return pet_error("MY_PETS_500_1", path)
+        if not_modified is not None:
+            return not_modified
+
+        # ------------------------
+        # 4) Pet 조회
         # ------------------------
         try:
             rows = self.pet_repo.get_pets_for_user(user.user_id)
@@ -92,31 +129,12 @@ class MyPetsService:
             return pet_error("MY_PETS_500_1", path)
 
         # ------------------------
-        # 4) 데이터 변환
+        # 5) 데이터 변환
         # ------------------------
-        pets = []
-        for pet, family in rows:
-            pets.append({
-                "pet_id": pet.pet_id,
-                "family_id": pet.family_id,
-                "family_name": family.family_name if family else None,
-                "owner_id": pet.owner_id,
-                "is_owner": (pet.owner_id == user.user_id),
-                "pet_search_id": pet.pet_search_id,
-                "name": pet.name,
-                "breed": pet.breed,
-                "age": pet.age,
-                "weight": pet.weight,
-                "gender": pet.gender.value if pet.gender else None,
-                "image_url": pet.image_url,
-                "disease": getattr(pet, 'disease', None),
-                "voice_url": getattr(pet, 'voice_url', None),
-                "created_at": pet.created_at.isoformat() if pet.created_at else None,
-                "updated_at": pet.updated_at.isoformat() if pet.updated_at else None,
-            })
+        pets = [pet_to_dict(pet, user.user_id) for pet in rows]
 
         # ------------------------
-        # 5) 성공 응답
+        # 6) 성공 응답
         # ------------------------
         resp = {
             "success": True,
@@ -125,4 +143,4 @@ class MyPetsService:
             "timeStamp": datetime.utcnow().isoformat(),
             "path": path,
         }
-        return JSONResponse(status_code=200, content=jsonable_encoder(resp))
+        return json_response(resp, status_code=200, headers=conditional.headers())
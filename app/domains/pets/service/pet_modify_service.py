@@ -3,32 +3,27 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
-from openai import OpenAI
+from app.core.llm import get_openai_client
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.firebase import verify_firebase_token, send_push_notification_to_multiple
 from app.core.error_handler import error_response
+from app.core import push_targets
+from app.core.push_coalescer import submit_family_push
+from app.core.responses import json_response
 
 from app.models.user import User
 from app.models.pet import Pet, PetGender
 from app.models.family import Family
 from app.models.family_member import FamilyMember, MemberRole
-from app.models.walk import Walk
-from app.models.photo import Photo
-from app.models.pet_walk_goal import PetWalkGoal
-from app.models.pet_walk_recommendation import PetWalkRecommendation
-from app.models.pet_share_request import PetShareRequest
-from app.models.notification import Notification, NotificationType
-from app.models.notification_reads import NotificationRead
-from app.models.walk_tracking_point import WalkTrackingPoint
-from app.models.activity_stat import ActivityStat
+from app.models.notification import NotificationType
 
 from app.domains.pets.repository.pet_repository import PetRepository
 from app.domains.notifications.repository.notification_repository import NotificationRepository
 from app.domains.users.repository.user_repository import UserRepository
+from app.domains.users.repository.purge_repository import PurgeRepository
+from app.domains.pets.service.recommendation_engine import resolve_recommendation
 from app.schemas.pets.pet_update_schema import PetUpdateRequest
 
 
@@ -38,7 +33,7 @@ class PetModifyService:
         self.repo = PetRepository(db)
         self.notif_repo = NotificationRepository(db)
         self.user_repo = UserRepository(db)
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     # --------------------------------------------------
     # 🔥 LLM 추천 산책 정보 생성 (수정 시 호출)
@@ -190,17 +185,17 @@ class PetModifyService:
         rec_dict = None
 
         if need_llm:
-            rec_json = self._generate_recommendation(updated_pet)
+            rec_json, generated_by = resolve_recommendation(updated_pet, self._generate_recommendation)
             if rec_json is None:
                 return error_response(500, "PET_EDIT_500_2", "추천 산책 정보 생성 실패", path)
 
             rec_obj = self.repo.get_recommendation(pet_id)
             if rec_obj:
-                rec_obj = self.repo.update_recommendation(rec_obj, **rec_json)
+                rec_obj = self.repo.update_recommendation(rec_obj, **rec_json, generated_by=generated_by)
             else:
-                rec_obj = self.repo.create_recommendation(pet_id, **rec_json)
+                rec_obj = self.repo.create_recommendation(pet_id, **rec_json, generated_by=generated_by)
 
-            rec_dict = {**rec_json, "rec_id": rec_obj.rec_id}
+            rec_dict = {**rec_json, "rec_id": rec_obj.rec_id, "generated_by": generated_by}
 
         self.db.commit()
         self.db.refresh(updated_pet)
@@ -243,7 +238,7 @@ class PetModifyService:
             "path": path,
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(resp))
+        return json_response(resp, status_code=200)
 
     # --------------------------------------------------
     # OWNER 체크
@@ -322,17 +317,15 @@ class PetModifyService:
             print(f"[NOTIF] PET_UPDATE image notify error: {e}")
             self.db.rollback()
 
-        return JSONResponse(
+        return json_response(
+            {
+                "success": True,
+                "status": 200,
+                "image_url": image_url,
+                "timeStamp": datetime.utcnow().isoformat(),
+                "path": path,
+            },
             status_code=200,
-            content=jsonable_encoder(
-                {
-                    "success": True,
-                    "status": 200,
-                    "image_url": image_url,
-                    "timeStamp": datetime.utcnow().isoformat(),
-                    "path": path,
-                }
-            ),
         )
 
     # --------------------------------------------------
@@ -393,6 +386,7 @@ class PetModifyService:
                 )
                 .delete(synchronize_session=False)
             )
+            push_targets.mark_family_changed(self.db, family_id)
 
             if deleted == 0:
                 return error_response(404, "PET_DELETE_404_3", "가족 구성원 정보를 찾을 수 없습니다.", path)
@@ -434,111 +428,28 @@ class PetModifyService:
 
             self.db.commit()
 
-            return JSONResponse(
+            return json_response(
+                {
+                    "success": True,
+                    "status": 200,
+                    "message": "가족에서 탈퇴되었습니다.",
+                    "pet_id": pet_id,
+                    "timeStamp": datetime.utcnow().isoformat(),
+                    "path": path,
+                },
                 status_code=200,
-                content=jsonable_encoder(
-                    {
-                        "success": True,
-                        "status": 200,
-                        "message": "가족에서 탈퇴되었습니다.",
-                        "pet_id": pet_id,
-                        "timeStamp": datetime.utcnow().isoformat(),
-                        "path": path,
-                    }
-                ),
             )
 
         # ---------------------------------------------------
-        # 🔥 연관 데이터 전체 삭제 (FK 순서 완벽 보장)
+        # 🔥 tombstone 후 연관 데이터는 purge 작업이 묶음 단위로 정리
+        #    (산책/경로/사진/알림이 많아도 요청 트랜잭션은 짧게 유지)
         # ---------------------------------------------------
         try:
-            # 삭제 전에 가족 멤버 및 FCM 토큰 수집 (OWNER는 제외)
-            family_members = (
-                self.db.query(FamilyMember)
-                .filter(FamilyMember.family_id == family_id)
-                .all()
-            )
-            member_user_ids = [m.user_id for m in family_members if m.user_id != user.user_id]
-            fcm_tokens = self.user_repo.get_active_fcm_tokens_for_users(member_user_ids)
-
-            # 1️⃣ WalkTrackingPoint 삭제
-            walk_ids = self.db.query(Walk.walk_id).filter(Walk.pet_id == pet_id).all()
-            walk_ids = [w[0] for w in walk_ids]
-
-            if walk_ids:
-                self.db.query(WalkTrackingPoint).filter(
-                    WalkTrackingPoint.walk_id.in_(walk_ids)
-                ).delete(synchronize_session=False)
-
-            # 2️⃣ Photo 삭제
-            if walk_ids:
-                self.db.query(Photo).filter(
-                    Photo.walk_id.in_(walk_ids)
-                ).delete(synchronize_session=False)
-
-            # 3️⃣ Walk 삭제
-            self.db.query(Walk).filter(Walk.pet_id == pet_id).delete(synchronize_session=False)
-
-            # 4️⃣ ActivityStat 삭제
-            self.db.query(ActivityStat).filter(
-                ActivityStat.pet_id == pet_id
-            ).delete(synchronize_session=False)
-
-            # 5️⃣ PetWalkGoal 삭제
-            self.db.query(PetWalkGoal).filter(
-                PetWalkGoal.pet_id == pet_id
-            ).delete(synchronize_session=False)
-
-            # 6️⃣ PetWalkRecommendation 삭제
-            self.db.query(PetWalkRecommendation).filter(
-                PetWalkRecommendation.pet_id == pet_id
-            ).delete(synchronize_session=False)
-
-            # 7️⃣ PetShareRequest 삭제  
-            #     (⚠️ 먼저 해당 요청을 참조하는 Notifications/Reads 제거 필요)
-            share_ids = self.db.query(PetShareRequest.request_id).filter(
-                PetShareRequest.pet_id == pet_id
-            ).all()
-            share_ids = [sid[0] for sid in share_ids]
-
-            if share_ids:
-                # 관련 알림의 읽음 기록 제거
-                notif_ids = [
-                    n[0]
-                    for n in self.db.query(Notification.notification_id)
-                    .filter(Notification.related_request_id.in_(share_ids))
-                    .all()
-                ]
-                if notif_ids:
-                    self.db.query(NotificationRead).filter(
-                        NotificationRead.notification_id.in_(notif_ids)
-                    ).delete(synchronize_session=False)
-
-                self.db.query(Notification).filter(
-                    Notification.related_request_id.in_(share_ids)
-                ).delete(synchronize_session=False)
-
-            self.db.query(PetShareRequest).filter(
-                PetShareRequest.pet_id == pet_id
-            ).delete(synchronize_session=False)
-
-            # 8️⃣ Notifications (산책/일반 알림) + 읽음 기록
-            notif_ids = [
-                n[0]
-                for n in self.db.query(Notification.notification_id)
-                .filter(Notification.related_pet_id == pet_id)
-                .all()
-            ]
-            if notif_ids:
-                self.db.query(NotificationRead).filter(
-                    NotificationRead.notification_id.in_(notif_ids)
-                ).delete(synchronize_session=False)
-                self.db.query(Notification).filter(
-                    Notification.notification_id.in_(notif_ids)
-                ).delete(synchronize_session=False)
+            # 가족 멤버 FCM 토큰 수집 (OWNER는 제외)
+            fcm_tokens = self.user_repo.get_family_push_tokens(family_id, exclude_user_ids=[user.user_id])
 
-            # 9️⃣ 마지막으로 Pet 삭제
-            self.db.delete(pet)
+            pet.deleted_at = datetime.utcnow()
+            PurgeRepository(self.db).enqueue("pet", pet_id)
 
             # Commit
             self.db.commit()
@@ -567,18 +478,16 @@ class PetModifyService:
             return error_response(500, "PET_DELETE_500_1", "반려동물 삭제 중 오류 발생", path)
 
         # 성공 응답
-        return JSONResponse(
+        return json_response(
+            {
+                "success": True,
+                "status": 200,
+                "message": "반려동물이 성공적으로 삭제되었습니다.",
+                "pet_id": pet_id,
+                "timeStamp": datetime.utcnow().isoformat(),
+                "path": path,
+            },
             status_code=200,
-            content=jsonable_encoder(
-                {
-                    "success": True,
-                    "status": 200,
-                    "message": "반려동물이 성공적으로 삭제되었습니다.",
-                    "pet_id": pet_id,
-                    "timeStamp": datetime.utcnow().isoformat(),
-                    "path": path,
-                }
-            ),
         )
 
     # --------------------------------------------------
@@ -610,23 +519,19 @@ class PetModifyService:
         )
         self.db.flush()
 
-        target_ids = [
-            m.user_id for m in family_members
-            if exclude_user_id is None or m.user_id != exclude_user_id
-        ]
-        tokens = self.user_repo.get_active_fcm_tokens_for_users(target_ids)
-        if tokens:
-            result = send_push_notification_to_multiple(
-                fcm_tokens=tokens,
-                title="반려동물 정보 업데이트",
-                body=message,
-                data={
-                    "type": "PET_UPDATE",
-                    "family_id": str(pet.family_id),
-                    "pet_id": str(pet.pet_id),
-                    "actor_user_id": str(actor.user_id),
-                    "notification_id": str(notif.notification_id),
-                },
-            )
-            if result.get("invalid_tokens"):
-                self.user_repo.remove_fcm_tokens(result["invalid_tokens"])
\ No newline at end of file
+        # 연속 수정은 collapse key (가족, 펫, PET_UPDATE) 로 병합되어 1건만 발송
+        submit_family_push(
+            family_id=pet.family_id,
+            pet_id=pet.pet_id,
+            kind="PET_UPDATE",
+            push_type="PET_UPDATE",
+            title="반려동물 정보 업데이트",
+            body=message,
+            data={
+                "family_id": str(pet.family_id),
+                "pet_id": str(pet.pet_id),
+                "actor_user_id": str(actor.user_id),
+                "notification_id": str(notif.notification_id),
+            },
+            exclude_user_ids=[exclude_user_id] if exclude_user_id is not None else [],
+        )
\ No newline at end of file
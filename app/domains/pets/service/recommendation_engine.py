@@ -0,0 +1,369 @@
+# app/domains/pets/service/recommendation_engine.py
+"""
+로컬 규칙/테이블 기반 산책 추천 엔진.
+
+견종 크기 등급 × 나이 구간 × 체중 × 질환 플래그 → 최소/적정/최대 (횟수, 분, km)
+LLM 없이 결정적으로 계산되므로 등록/수정 시 폴백 또는 기본 경로로 사용하고,
+전체 펫 테이블을 한 번에 재계산하는 야간 배치에서도 같은 규칙을 사용한다.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+
+GENERATED_BY_RULE = "RULE"
+GENERATED_BY_LLM = "LLM"
+
+ENGINE_MODES = ("primary", "fallback", "shadow")
+
+REQUIRED_FIELDS = (
+    "min_walks", "min_minutes", "min_distance_km",
+    "recommended_walks", "recommended_minutes", "recommended_distance_km",
+    "max_walks", "max_minutes", "max_distance_km",
+)
+
+
+# ============================================================
+# 규칙 테이블
+# ============================================================
+
+# 견종 → 크기 등급 (소문자/공백 제거 후 부분 일치)
+BREED_SIZE: Dict[str, str] = {
+    # TOY
+    "치와와": "TOY", "chihuahua": "TOY",
+    "요크셔테리어": "TOY", "요크셔": "TOY", "yorkshire": "TOY", "yorkie": "TOY",
+    "포메라니안": "TOY", "pomeranian": "TOY",
+    "말티즈": "TOY", "maltese": "TOY",
+    "토이푸들": "TOY", "toypoodle": "TOY",
+    "파피용": "TOY", "papillon": "TOY",
+    # SMALL
+    "시츄": "SMALL", "shihtzu": "SMALL",
+    "비숑": "SMALL", "bichon": "SMALL",
+    "푸들": "SMALL", "poodle": "SMALL",
+    "닥스훈트": "SMALL", "dachshund": "SMALL",
+    "미니어처슈나우저": "SMALL", "슈나우저": "SMALL", "schnauzer": "SMALL",
+    "퍼그": "SMALL", "pug": "SMALL",
+    "페키니즈": "SMALL", "pekingese": "SMALL",
+    "잭러셀": "SMALL", "jackrussell": "SMALL",
+    "프렌치불독": "SMALL", "frenchbulldog": "SMALL",
+    "boston": "SMALL", "보스턴테리어": "SMALL",
+    "코카푸": "SMALL", "cockapoo": "SMALL",
+    # MEDIUM
+    "웰시코기": "MEDIUM", "코기": "MEDIUM", "corgi": "MEDIUM",
+    "비글": "MEDIUM", "beagle": "MEDIUM",
+    "시바": "MEDIUM", "shiba": "MEDIUM",
+    "진돗개": "MEDIUM", "진도": "MEDIUM", "jindo": "MEDIUM",
+    "코카스파니엘": "MEDIUM", "cocker": "MEDIUM",
+    "보더콜리": "MEDIUM", "bordercollie": "MEDIUM",
+    "불독": "MEDIUM", "bulldog": "MEDIUM",
+    "스피츠": "MEDIUM", "spitz": "MEDIUM",
+    "믹스": "MEDIUM", "mix": "MEDIUM",
+    # LARGE
+    "골든리트리버": "LARGE", "리트리버": "LARGE", "retriever": "LARGE",
+    "래브라도": "LARGE", "labrador": "LARGE",
+    "허스키": "LARGE", "husky": "LARGE",
+    "사모예드": "LARGE", "samoyed": "LARGE",
+    "셰퍼드": "LARGE", "shepherd": "LARGE",
+    "말라뮤트": "LARGE", "malamute": "LARGE",
+    "도베르만": "LARGE", "doberman": "LARGE",
+    "스탠다드푸들": "LARGE", "standardpoodle": "LARGE",
+    # GIANT
+    "그레이트데인": "GIANT", "greatdane": "GIANT",
+    "버니즈": "GIANT", "bernese": "GIANT",
+    "세인트버나드": "GIANT", "saintbernard": "GIANT",
+    "뉴펀들랜드": "GIANT", "newfoundland": "GIANT",
+    "그레이트피레니즈": "GIANT", "pyrenees": "GIANT",
+    "마스티프": "GIANT", "mastiff": "GIANT",
+}
+
+# 긴 이름부터 비교 ("스탠다드푸들"이 "푸들"보다 먼저 매칭되도록)
+_BREED_KEYS_BY_LENGTH = sorted(BREED_SIZE.items(), key=lambda kv: len(kv[0]), reverse=True)
+
+# 단두종 (호흡기 부담 → 강도 완화)
+BRACHYCEPHALIC_BREEDS: Tuple[str, ...] = (
+    "퍼그", "pug", "시츄", "shihtzu", "페키니즈", "pekingese",
+    "불독", "bulldog", "보스턴테리어", "boston",
+)
+
+# 체중 기반 크기 등급 (견종을 모를 때): (상한 kg, 등급)
+WEIGHT_SIZE_BOUNDS: Tuple[Tuple[float, str], ...] = (
+    (4.0, "TOY"),
+    (10.0, "SMALL"),
+    (25.0, "MEDIUM"),
+    (45.0, "LARGE"),
+)
+
+# 등급별 정상 체중 상한 (이 값의 1.2배 초과 시 과체중으로 판단)
+SIZE_WEIGHT_UPPER: Dict[str, float] = {
+    "TOY": 4.0, "SMALL": 10.0, "MEDIUM": 25.0, "LARGE": 45.0, "GIANT": 90.0,
+}
+
+# 성견 기준 하루 적정값: (횟수, 분, km)
+BASE_TABLE: Dict[str, Tuple[int, int, float]] = {
+    "TOY": (2, 30, 1.5),
+    "SMALL": (2, 45, 2.5),
+    "MEDIUM": (2, 60, 4.0),
+    "LARGE": (2, 80, 5.5),
+    "GIANT": (2, 60, 4.0),
+}
+
+# 등급별 노령 시작 나이 (대형견일수록 빨리 노화)
+SENIOR_AGE: Dict[str, int] = {
+    "TOY": 10, "SMALL": 10, "MEDIUM": 8, "LARGE": 7, "GIANT": 6,
+}
+
+# 나이 구간 → (횟수 가산, 분 배수, km 배수)
+AGE_BAND_FACTORS: Dict[str, Tuple[int, float, float]] = {
+    "PUPPY": (1, 0.5, 0.4),      # 짧고 자주
+    "ADULT": (0, 1.0, 1.0),
+    "SENIOR": (0, 0.75, 0.6),
+    "GERIATRIC": (0, 0.55, 0.4),
+}
+
+# 질환 플래그 → (키워드, 분 배수, km 배수, 최대치 배율 상한)
+DISEASE_RULES: Dict[str, Tuple[Tuple[str, ...], float, float, float]] = {
+    "CARDIAC": (("심장", "이첨판", "heart", "cardiac", "mvd"), 0.6, 0.5, 1.15),
+    "RESPIRATORY": (("기관지", "기관허탈", "호흡", "trachea", "respiratory", "asthma"), 0.7, 0.6, 1.2),
+    "JOINT": (("관절", "슬개골", "디스크", "고관절", "patella", "luxation", "arthritis", "hip", "ivdd", "disc"), 0.75, 0.6, 1.2),
+    "KIDNEY": (("신장", "신부전", "kidney", "renal"), 0.8, 0.8, 1.3),
+    "DIABETES": (("당뇨", "diabet"), 0.9, 0.9, 1.3),
+    "OBESITY": (("비만", "obese", "obesity"), 1.1, 0.9, 1.4),
+}
+
+BRACHYCEPHALIC_FACTORS = (0.85, 0.8, 1.3)
+OVERWEIGHT_FACTORS = (1.1, 0.9)
+
+DEFAULT_MAX_RATIO = 1.5
+MIN_RATIO = 0.6
+FACTOR_FLOOR = 0.35
+
+
+@dataclass(frozen=True)
+class PetProfile:
+    pet_id: Optional[int]
+    breed: Optional[str]
+    age: Optional[int]
+    weight: Optional[float]
+    disease: Optional[str]
+
+
+# ============================================================
+# 분류 함수
+# ============================================================
+def _normalize(text: Optional[str]) -> str:
+    return "".join((text or "").lower().split())
+
+
+def classify_size(breed: Optional[str], weight: Optional[float]) -> str:
+    key = _normalize(breed)
+    if key:
+        for name, size in _BREED_KEYS_BY_LENGTH:
+            if name in key:
+                return size
+
+    if weight is not None and weight > 0:
+        for upper, size in WEIGHT_SIZE_BOUNDS:
+            if weight < upper:
+                return size
+        return "GIANT"
+
+    return "SMALL"
+
+
+def classify_age_band(size: str, age: Optional[int]) -> str:
+    if age is None:
+        return "ADULT"
+    if age < 1:
+        return "PUPPY"
+    senior = SENIOR_AGE[size]
+    if age >= senior + 3:
+        return "GERIATRIC"
+    if age >= senior:
+        return "SENIOR"
+    return "ADULT"
+
+
+def disease_flags(disease: Optional[str]) -> Tuple[str, ...]:
+    text = _normalize(disease)
+    if not text or text in ("없음", "none", "null", "-"):
+        return ()
+    return tuple(
+        flag for flag, (keywords, *_rest) in DISEASE_RULES.items()
+        if any(k in text for k in keywords)
+    )
+
+
+def is_brachycephalic(breed: Optional[str]) -> bool:
+    key = _normalize(breed)
+    return bool(key) and any(b in key for b in BRACHYCEPHALIC_BREEDS)
+
+
+def is_overweight(size: str, weight: Optional[float]) -> bool:
+    return weight is not None and weight > SIZE_WEIGHT_UPPER[size] * 1.2
+
+
+# ============================================================
+# 계산
+# ============================================================
+def _round_minutes(value: float) -> int:
+    return max(5, int(round(value / 5.0)) * 5)
+
+
+def _round_km(value: float) -> float:
+    return max(0.3, round(value, 1))
+
+
+def _compute(size: str, band: str, flags: Tuple[str, ...], brachy: bool, overweight: bool) -> dict:
+    walks, minutes, km = BASE_TABLE[size]
+    add_walks, f_min, f_km = AGE_BAND_FACTORS[band]
+    max_ratio = DEFAULT_MAX_RATIO
+
+    for flag in flags:
+        _keywords, d_min, d_km, d_max = DISEASE_RULES[flag]
+        f_min *= d_min
+        f_km *= d_km
+        max_ratio = min(max_ratio, d_max)
+
+    if brachy:
+        f_min *= BRACHYCEPHALIC_FACTORS[0]
+        f_km *= BRACHYCEPHALIC_FACTORS[1]
+        max_ratio = min(max_ratio, BRACHYCEPHALIC_FACTORS[2])
+
+    if overweight and "OBESITY" not in flags:
+        f_min *= OVERWEIGHT_FACTORS[0]
+        f_km *= OVERWEIGHT_FACTORS[1]
+
+    f_min = max(f_min, FACTOR_FLOOR)
+    f_km = max(f_km, FACTOR_FLOOR)
+
+    rec_walks = walks + add_walks
+    rec_minutes = _round_minutes(minutes * f_min)
+    rec_km = _round_km(km * f_km)
+
+    return {
+        "min_walks": max(1, rec_walks - 1),
+        "min_minutes": _round_minutes(rec_minutes * MIN_RATIO),
+        "min_distance_km": _round_km(rec_km * MIN_RATIO),
+        "recommended_walks": rec_walks,
+        "recommended_minutes": rec_minutes,
+        "recommended_distance_km": rec_km,
+        "max_walks": rec_walks + 1,
+        "max_minutes": _round_minutes(rec_minutes * max_ratio),
+        "max_distance_km": _round_km(rec_km * max_ratio),
+    }
+
+
+def recommend(profile: PetProfile) -> dict:
+    """단일 펫 추천값 계산"""
+    return recommend_many([profile])[0]
+
+
+def recommend_many(profiles: Sequence[PetProfile]) -> List[dict]:
+    """
+    여러 펫의 추천값을 한 번에 계산.
+
+    입력을 열 단위(크기 등급/나이 구간/질환 플래그)로 먼저 분류한 뒤,
+    서로 다른 규칙 키마다 한 번만 계산하고 결과를 펫별로 펼친다.
+    대부분의 펫이 소수의 규칙 키를 공유하므로 전체 테이블 재계산도 빠르다.
+    """
+    sizes = [classify_size(p.breed, p.weight) for p in profiles]
+    bands = [classify_age_band(s, p.age) for s, p in zip(sizes, profiles)]
+    flags = [disease_flags(p.disease) for p in profiles]
+    brachy = [is_brachycephalic(p.breed) for p in profiles]
+    overweight = [is_overweight(s, p.weight) for s, p in zip(sizes, profiles)]
+
+    keys = list(zip(sizes, bands, flags, brachy, overweight))
+    computed: Dict[tuple, dict] = {key: _compute(*key) for key in set(keys)}
+
+    return [dict(computed[key]) for key in keys]
+
+
+def profile_from_pet(pet) -> PetProfile:
+    return PetProfile(
+        pet_id=getattr(pet, "pet_id", None),
+        breed=getattr(pet, "breed", None),
+        age=getattr(pet, "age", None),
+        weight=getattr(pet, "weight", None),
+        disease=getattr(pet, "disease", None),
+    )
+
+
+# ============================================================
+# LLM 과의 관계 (primary / fallback / shadow)
+# ============================================================
+def get_engine_mode() -> str:
+    mode = (settings.WALK_REC_ENGINE_MODE or "fallback").lower()
+    return mode if mode in ENGINE_MODES else "fallback"
+
+
+def _coerce_field(key: str, value) -> Optional[float]:
+    """LLM 응답 값 하나를 숫자로 검증/변환 (숫자가 아니거나 음수/무한대면 None)"""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(number) or number < 0:
+        return None
+    if key.endswith("_distance_km"):
+        return number
+    return int(round(number))
+
+
+def _valid_llm_fields(data) -> Dict[str, float]:
+    """LLM 응답에서 검증을 통과한 필드만 추린다 (shadow/fallback 공용)"""
+    if not isinstance(data, dict):
+        return {}
+    valid = {}
+    for k in REQUIRED_FIELDS:
+        value = _coerce_field(k, data.get(k))
+        if value is not None:
+            valid[k] = value
+    return valid
+
+
+def resolve_recommendation(
+    pet,
+    llm_generate: Callable[[object], Optional[dict]],
+    mode: Optional[str] = None,
+) -> Tuple[Optional[dict], str]:
+    """
+    설정된 모드에 따라 추천값과 generated_by를 결정한다.
+
+    - primary : 로컬 엔진만 사용 (LLM 호출 없음)
+    - fallback: LLM 우선, 누락/잘못된 필드는 로컬 엔진 값으로 보정 (전부 실패 시 로컬 엔진)
+    - shadow  : fallback 과 같은 값을 쓰고 로컬 엔진 결과와의 차이를 로그로 남김
+    """
+    mode = mode or get_engine_mode()
+    local = recommend(profile_from_pet(pet))
+
+    if mode == "primary":
+        return local, GENERATED_BY_RULE
+
+    llm = llm_generate(pet)
+    if isinstance(llm, dict) and "rec_data" in llm:
+        llm = llm["rec_data"]
+
+    valid = _valid_llm_fields(llm)
+    missing = [k for k in REQUIRED_FIELDS if k not in valid]
+    pet_id = getattr(pet, "pet_id", None)
+
+    if not valid:
+        tag = "REC_SHADOW" if mode == "shadow" else "REC_FALLBACK"
+        print(f"[{tag}] pet_id={pet_id} LLM 실패 → 로컬 엔진 사용")
+        return local, GENERATED_BY_RULE
+
+    # 누락/잘못된 필드만 로컬 엔진 값으로 보정하고 유효한 LLM 값은 유지
+    if missing:
+        print(f"[REC_LLM] pet_id={pet_id} 누락/잘못된 필드 → 로컬 엔진 값으로 보정: {missing}")
+    merged = {k: valid.get(k, local[k]) for k in REQUIRED_FIELDS}
+
+    if mode == "shadow":
+        diff = {k: (valid[k], local[k]) for k in valid if float(valid[k]) != float(local[k])}
+        print(f"[REC_SHADOW] pet_id={pet_id} diff(llm, rule)={diff}")
+
+    return merged, GENERATED_BY_LLM
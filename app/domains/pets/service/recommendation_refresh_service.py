@@ -0,0 +1,84 @@
+# app/domains/pets/service/recommendation_refresh_service.py
+
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.domains.pets.repository.pet_repository import PetRepository
+from app.domains.pets.service.recommendation_engine import (
+    GENERATED_BY_RULE,
+    PetProfile,
+    recommend_many,
+)
+
+
+class RecommendationRefreshService:
+    """
+    로컬 추천 엔진으로 pets 테이블 전체의 추천값을 일괄 재계산 (야간 배치용)
+
+    - pet_id keyset 페이지 단위로 필요한 컬럼만 조회
+    - 페이지 전체를 recommend_many로 한 번에 계산
+    - 신규 추천은 executemany INSERT, 기존 추천은 executemany UPDATE
+    - 기본적으로 RULE로 생성된 추천만 덮어쓰고 LLM 추천은 보존
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.pet_repo = PetRepository(db)
+
+    def refresh_all(
+        self,
+        chunk_size: int = 1000,
+        overwrite_generated_by: Optional[Iterable[str]] = (GENERATED_BY_RULE,),
+    ) -> dict:
+        """
+        overwrite_generated_by=None 이면 LLM 추천까지 모두 엔진 결과로 덮어쓴다.
+        """
+        overwrite = None if overwrite_generated_by is None else set(overwrite_generated_by)
+
+        last_pet_id = 0
+        inserted = 0
+        updated = 0
+        skipped = 0
+
+        while True:
+            rows = self.pet_repo.list_pet_profiles_for_recommendation(last_pet_id, chunk_size)
+            if not rows:
+                break
+            last_pet_id = rows[-1].pet_id
+
+            profiles = [
+                PetProfile(
+                    pet_id=r.pet_id,
+                    breed=r.breed,
+                    age=r.age,
+                    weight=r.weight,
+                    disease=r.disease,
+                )
+                for r in rows
+            ]
+            results = recommend_many(profiles)
+
+            to_insert = []
+            to_update = []
+            for row, rec in zip(rows, results):
+                values = {**rec, "pet_id": row.pet_id, "generated_by": GENERATED_BY_RULE}
+                if row.rec_id is None:
+                    to_insert.append(values)
+                elif overwrite is None or row.generated_by in overwrite:
+                    to_update.append(values)
+                else:
+                    skipped += 1
+
+            try:
+                inserted += self.pet_repo.bulk_insert_recommendations(to_insert)
+                updated += self.pet_repo.bulk_update_recommendations(to_update)
+                self.db.commit()
+            except Exception as e:
+                print("RECOMMENDATION_REFRESH_ERROR:", e)
+                self.db.rollback()
+                raise
+
+        result = {"inserted": inserted, "updated": updated, "skipped": skipped}
+        print(f"[REC_REFRESH] {result}")
+        return result
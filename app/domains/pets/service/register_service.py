@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
-from openai import OpenAI
+from app.core.llm import get_openai_client
 
 from app.core.config import settings
 from app.core.firebase import verify_firebase_token
@@ -18,6 +18,7 @@ from app.models.user import User
 from app.domains.pets.repository.pet_repository import PetRepository
 from app.domains.pets.repository.family_repository import FamilyRepository
 from app.domains.auth.repository.auth_repository import AuthRepository
+from app.domains.pets.service.recommendation_engine import resolve_recommendation
 
 from app.schemas.pets.pet_register_schema import PetRegisterRequest, PetRegisterResponse
 
@@ -27,7 +28,7 @@ class PetRegisterService:
         self.pet_repo = PetRepository(db)
         self.family_repo = FamilyRepository(db)
 
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     # ============================================================
     # LLM 추천 생성
@@ -197,37 +198,16 @@ class PetRegisterService:
             )
 
 
-            # 추천 생성
-            rec_data = self._generate_walk_recommendation(pet)
+            # 추천 생성 (LLM / 로컬 엔진 — WALK_REC_ENGINE_MODE 설정 기준)
+            rec_data, generated_by = resolve_recommendation(pet, self._generate_walk_recommendation)
             if rec_data is None:
                 raise Exception("RECOMMENDATION_ERROR")
 
-            # rec_data 안에 rec_data 키가 있으면 평탄화
-            if "rec_data" in rec_data:
-                rec_data = rec_data["rec_data"]
-
-            # 필수 필드가 누락되면 기본값 보정
-            defaults = {
-                "min_walks": 1,
-                "min_minutes": 20,
-                "min_distance_km": 1.0,
-                "recommended_walks": 2,
-                "recommended_minutes": 40,
-                "recommended_distance_km": 2.0,
-                "max_walks": 3,
-                "max_minutes": 60,
-                "max_distance_km": 3.0,
-            }
-
-            for key, val in defaults.items():
-                if key not in rec_data or rec_data[key] is None:
-                    rec_data[key] = val
-
             # 정상 삽입
             recommendation = self.pet_repo.create_recommendation(
                 pet_id=pet.pet_id,
                 **rec_data,
-                generated_by="LLM"
+                generated_by=generated_by
             )
 
 
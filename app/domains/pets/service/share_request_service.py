@@ -1,14 +1,13 @@
 # app/domains/pets/service/share_request_service.py
 
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
 from app.core.firebase import verify_firebase_token, send_push_notification_to_multiple
 from app.core.error_handler import error_response
+from app.core.responses import json_response
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.notification import Notification, NotificationType
@@ -164,7 +163,7 @@ class PetShareRequestService:
             "path": path,
         }
 
-        return JSONResponse(status_code=201, content=jsonable_encoder(response))
+        return json_response(response, status_code=201)
 
     # ---------------------------------------------------------
     # 2) 공유 요청 승인 / 거절
@@ -332,7 +331,7 @@ class PetShareRequestService:
             "path": path,
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response))
+        return json_response(response, status_code=200)
 
     # ---------------------------------------------------------
     # 3) 알림 생성 함수
@@ -435,13 +434,11 @@ class PetShareRequestService:
         # 5) 응답 조립
         results = []
         for req in items:
-            pet = self.db.get(Pet, req.pet_id)
-
             results.append({
                 "request_id": req.request_id,
-                "pet_id": pet.pet_id,
-                "pet_name": pet.name,
-                "pet_image_url": pet.image_url,
+                "pet_id": req.pet_id,
+                "pet_name": req.pet_name,
+                "pet_image_url": req.pet_image_url,
                 "status": req.status.value,
                 "created_at": req.created_at.isoformat() if req.created_at else None,
                 "responded_at": req.responded_at.isoformat() if req.responded_at else None,
@@ -534,16 +531,13 @@ class PetShareRequestService:
         # 5) 응답 조립
         results = []
         for req in items:
-            pet = self.db.get(Pet, req.pet_id)
-            requester = self.db.get(User, req.requester_id)
-
             results.append({
                 "request_id": req.request_id,
-                "pet_id": pet.pet_id,
-                "pet_name": pet.name,
-                "pet_image_url": pet.image_url,
-                "requester_id": requester.user_id,
-                "requester_nickname": requester.nickname,
+                "pet_id": req.pet_id,
+                "pet_name": req.pet_name,
+                "pet_image_url": req.pet_image_url,
+                "requester_id": req.requester_id,
+                "requester_nickname": req.requester_nickname,
                 "status": req.status.value,
                 "created_at": req.created_at.isoformat() if req.created_at else None,
                 "responded_at": req.responded_at.isoformat() if req.responded_at else None,
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 from typing import List, Optional, Tuple
@@ -8,6 +9,19 @@ from app.models.walk import Walk
 from app.models.user import User
 
 
+@dataclass(frozen=True, slots=True)
+class PhotoListRow:
+    """사진 목록 1행 (사진 + 산책 시작 시각 + 올린 사람, 필요한 컬럼만)"""
+    photo_id: int
+    walk_id: int
+    image_url: str
+    caption: Optional[str]
+    created_at: Optional[datetime]
+    walk_start_time: datetime
+    uploader_id: int
+    uploader_nickname: str
+
+
 class RecordPhotoRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -19,30 +33,42 @@ class RecordPhotoRepository:
         end_dt: Optional[datetime],
         page: int,
         size: int,
-    ) -> Tuple[List[tuple], int]:
+    ) -> Tuple[List[PhotoListRow], int]:
         """
-        Returns a list of tuples (Photo, Walk, User) and total_count
+        Returns a list of PhotoListRow and total_count
         """
-        query = (
-            self.db.query(Photo, Walk, User)
-            .join(Walk, Photo.walk_id == Walk.walk_id)
-            .join(User, Photo.uploaded_by == User.user_id)
-            .filter(Walk.pet_id == pet_id)
-        )
-
+        conditions = [Walk.pet_id == pet_id]
         if start_dt is not None:
-            query = query.filter(Walk.start_time >= start_dt)
+            conditions.append(Walk.start_time >= start_dt)
         if end_dt is not None:
-            query = query.filter(Walk.start_time <= end_dt)
+            conditions.append(Walk.start_time <= end_dt)
 
-        total_count = query.count()
+        total_count = (
+            self.db.query(func.count(Photo.photo_id))
+            .join(Walk, Photo.walk_id == Walk.walk_id)
+            .join(User, Photo.uploaded_by == User.user_id)
+            .filter(*conditions)
+            .scalar()
+        )
 
         rows = (
-            query
-            .order_by(Photo.created_at.desc())
+            self.db.query(
+                Photo.photo_id,
+                Walk.walk_id,
+                Photo.image_url,
+                Photo.caption,
+                Photo.created_at,
+                Walk.start_time,
+                User.user_id,
+                User.nickname,
+            )
+            .join(Walk, Photo.walk_id == Walk.walk_id)
+            .join(User, Photo.uploaded_by == User.user_id)
+            .filter(*conditions)
+            .order_by(Photo.created_at.desc(), Photo.photo_id.asc())
             .offset(page * size)
             .limit(size)
             .all()
         )
 
-        return rows, total_count
+        return [PhotoListRow(*r) for r in rows], total_count
@@ -1,13 +1,38 @@
+from dataclasses import dataclass
+from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+from app.core import change_log
 from app.models.walk import Walk
+from app.models.pet import Pet
+from app.models.family_member import FamilyMember
 from app.models.pet_walk_goal import PetWalkGoal
 from app.models.pet_walk_recommendation import PetWalkRecommendation
 
 
+@dataclass(frozen=True, slots=True)
+class StatsAccess:
+    """
+    반려동물 존재 + 권한(member_id) + 가족 최근 변경 기록(head_*) + 목표 / 추천 값
+    goal_id / rec_id 가 None 이면 목표 / 추천 없음
+    """
+    pet_id: int
+    member_id: Optional[int]
+    head_change_id: Optional[int]
+    head_created_at: Optional[datetime]
+    goal_id: Optional[int]
+    target_walks: Optional[int]
+    target_minutes: Optional[int]
+    target_distance_km: Optional[Decimal]
+    rec_id: Optional[int]
+    recommended_walks: Optional[int]
+    recommended_minutes: Optional[int]
+    recommended_distance_km: Optional[Decimal]
+
+
 class StatsRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -43,16 +68,34 @@ class StatsRepository:
             })
         return result
 
-    def get_goal(self, pet_id: int) -> PetWalkGoal | None:
-        return (
-            self.db.query(PetWalkGoal)
-            .filter(PetWalkGoal.pet_id == pet_id)
-            .first()
-        )
-
-    def get_recommendation(self, pet_id: int) -> PetWalkRecommendation | None:
-        return (
-            self.db.query(PetWalkRecommendation)
-            .filter(PetWalkRecommendation.pet_id == pet_id)
+    def get_pet_access(self, pet_id: int, user_id: int) -> Optional[StatsAccess]:
+        """반려동물 / 권한 / 버전 / 목표 / 추천을 쿼리 1번으로 (반려동물이 없으면 None)"""
+        head_change_id, head_created_at = change_log.family_head(Pet.family_id)
+        row = (
+            self.db.query(
+                Pet.pet_id,
+                FamilyMember.member_id,
+                head_change_id,
+                head_created_at,
+                PetWalkGoal.goal_id,
+                PetWalkGoal.target_walks,
+                PetWalkGoal.target_minutes,
+                PetWalkGoal.target_distance_km,
+                PetWalkRecommendation.rec_id,
+                PetWalkRecommendation.recommended_walks,
+                PetWalkRecommendation.recommended_minutes,
+                PetWalkRecommendation.recommended_distance_km,
+            )
+            .outerjoin(
+                FamilyMember,
+                and_(
+                    FamilyMember.family_id == Pet.family_id,
+                    FamilyMember.user_id == user_id,
+                ),
+            )
+            .outerjoin(PetWalkGoal, PetWalkGoal.pet_id == Pet.pet_id)
+            .outerjoin(PetWalkRecommendation, PetWalkRecommendation.pet_id == Pet.pet_id)
+            .filter(Pet.pet_id == pet_id)
             .first()
         )
+        return StatsAccess(*row) if row else None
@@ -1,16 +1,37 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from dataclasses import dataclass
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, exists, func, literal_column, null, select, type_coerce, union_all
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from app.core import change_log, route_archive
+from app.core.route_archive import RoutePoint
 from app.models.walk import Walk
 from app.models.walk_tracking_point import WalkTrackingPoint
+from app.models.walk_route_archive import WalkRouteArchive
 from app.models.photo import Photo
 from app.models.pet import Pet
 from app.models.family import Family
+from app.models.family_member import FamilyMember
 from app.models.user import User
 
 
+@dataclass(frozen=True, slots=True)
+class WalkListRow:
+    """산책 목록 1행 (필요한 컬럼 + 첫 사진 썸네일만, ORM 엔티티 없이)"""
+    walk_id: int
+    pet_id: int
+    user_id: Optional[int]
+    start_time: datetime
+    end_time: Optional[datetime]
+    duration_min: Optional[int]
+    distance_km: Optional[float]
+    calories: Optional[float]
+    weather_status: Optional[str]
+    weather_temp_c: Optional[float]
+    thumbnail_image_url: Optional[str]
+
+
 class RecordWalkRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -20,61 +41,151 @@ class RecordWalkRepository:
         pet_id: int,
         start_dt: Optional[datetime] = None,
         end_dt: Optional[datetime] = None,
-    ) -> List[Walk]:
-        query = self.db.query(Walk).filter(Walk.pet_id == pet_id)
+    ) -> List[WalkListRow]:
+        # 산책별 첫 사진 (산책마다 따로 조회하지 않고 상관 서브쿼리로)
+        thumbnail = (
+            select(Photo.image_url)
+            .where(Photo.walk_id == Walk.walk_id)
+            .order_by(Photo.created_at.asc(), Photo.photo_id.asc())
+            .limit(1)
+            .correlate(Walk)
+            .scalar_subquery()
+        )
+        query = self.db.query(
+            Walk.walk_id,
+            Walk.pet_id,
+            Walk.user_id,
+            Walk.start_time,
+            Walk.end_time,
+            Walk.duration_min,
+            Walk.distance_km,
+            Walk.calories,
+            Walk.weather_status,
+            Walk.weather_temp_c,
+            thumbnail,
+        ).filter(Walk.pet_id == pet_id)
 
         if start_dt is not None:
             query = query.filter(Walk.start_time >= start_dt)
         if end_dt is not None:
             query = query.filter(Walk.start_time <= end_dt)
 
-        return (
-            query
-            .order_by(Walk.start_time.desc())
-            .all()
-        )
+        rows = query.order_by(Walk.start_time.desc()).all()
+        return [WalkListRow(*r) for r in rows]
 
-    def get_walk(self, walk_id: int) -> Optional[Walk]:
+    # =====================================================
+    # 산책 상세: 산책 + 반려동물 + 가족 + 산책한 사람 + 조회자 구성원 여부 (1쿼리)
+    # =====================================================
+    def get_walk_detail(self, walk_id: int, user_id: int):
+        """
+        Row(Walk, pet_id, pet_name, pet_image_url, family_id, family_name, walker_*, member_id,
+            head_change_id, head_created_at) 또는 None — head_*: 가족의 최근 변경 기록 (ETag 버전)
+        """
+        walker = aliased(User)
+        head_change_id, head_created_at = change_log.family_head(Pet.family_id)
         return (
-            self.db.query(Walk)
+            self.db.query(
+                Walk,
+                Pet.pet_id,
+                Pet.name.label("pet_name"),
+                Pet.image_url.label("pet_image_url"),
+                Pet.family_id,
+                Family.family_name,
+                walker.user_id.label("walker_id"),
+                walker.nickname.label("walker_nickname"),
+                walker.profile_img_url.label("walker_profile_img_url"),
+                FamilyMember.member_id,
+                head_change_id.label("head_change_id"),
+                head_created_at.label("head_created_at"),
+            )
+            .join(Pet, Pet.pet_id == Walk.pet_id)
+            .outerjoin(Family, Family.family_id == Pet.family_id)
+            .outerjoin(walker, walker.user_id == Walk.user_id)
+            .outerjoin(
+                FamilyMember,
+                and_(
+                    FamilyMember.family_id == Pet.family_id,
+                    FamilyMember.user_id == user_id,
+                ),
+            )
             .filter(Walk.walk_id == walk_id)
             .first()
         )
 
-    def get_pet_and_family(self, pet_id: int) -> tuple[Optional[Pet], Optional[Family]]:
-        pet = self.db.query(Pet).filter(Pet.pet_id == pet_id).first()
-        family = None
-        if pet:
-            family = self.db.query(Family).filter(Family.family_id == pet.family_id).first()
-        return pet, family
+    # =====================================================
+    # 사진 + 경로 포인트 (UNION ALL 1쿼리, ORM 객체 없이 튜플로)
+    # =====================================================
+    def get_photos_and_points(self, walk_id: int, include_points: bool) -> Tuple[List[tuple], List[RoutePoint]]:
+        """
+        photos: Row(id, image_url, caption, uploaded_by, ts) — created_at 순
+        points: RoutePoint — 시간순. 압축 보관본이 있으면 보관본에서
+        (보관 배치가 hot 행을 묶음 단위로 지우므로, 삭제 도중의 남은 hot 행은 읽지 않음)
+        """
+        photo_rows = select(
+            literal_column("0").label("kind"),
+            Photo.photo_id.label("id"),
+            Photo.image_url,
+            Photo.caption,
+            Photo.uploaded_by,
+            type_coerce(null(), WalkTrackingPoint.latitude.type).label("latitude"),
+            type_coerce(null(), WalkTrackingPoint.longitude.type).label("longitude"),
+            Photo.created_at.label("ts"),
+        ).where(Photo.walk_id == walk_id)
 
-    def get_user(self, user_id: int) -> Optional[User]:
-        return self.db.query(User).filter(User.user_id == user_id).first()
+        stmt = photo_rows
+        if include_points:
+            stmt = union_all(
+                photo_rows,
+                select(
+                    literal_column("1"),
+                    WalkTrackingPoint.point_id,
+                    null(),
+                    null(),
+                    null(),
+                    WalkTrackingPoint.latitude,
+                    WalkTrackingPoint.longitude,
+                    WalkTrackingPoint.timestamp,
+                ).where(
+                    WalkTrackingPoint.walk_id == walk_id,
+                    ~exists().where(WalkRouteArchive.walk_id == walk_id),
+                ),
+            )
+        stmt = stmt.order_by(literal_column("kind"), literal_column("ts"), literal_column("id"))
 
-    def get_points(self, walk_id: int) -> List[WalkTrackingPoint]:
-        return (
-            self.db.query(WalkTrackingPoint)
-            .filter(WalkTrackingPoint.walk_id == walk_id)
-            .order_by(WalkTrackingPoint.timestamp.asc())
-            .all()
-        )
+        photos: List[tuple] = []
+        points: List[RoutePoint] = []
+        for row in self.db.execute(stmt):
+            if row.kind == 0:
+                photos.append(row)
+            else:
+                points.append(RoutePoint(row.id, row.latitude, row.longitude, row.ts))
 
-    def get_photos(self, walk_id: int) -> List[Photo]:
-        return (
-            self.db.query(Photo)
-            .filter(Photo.walk_id == walk_id)
-            .order_by(Photo.created_at.asc())
-            .all()
-        )
+        if include_points and not points:
+            # 보관된 산책은 hot 행을 건너뛰었으므로 압축 보관본에서
+            archive = (
+                self.db.query(WalkRouteArchive)
+                .filter(WalkRouteArchive.walk_id == walk_id)
+                .first()
+            )
+            if archive:
+                points = route_archive.load_points(archive)
 
-    def get_thumbnail_url(self, walk_id: int) -> Optional[str]:
-        photo = (
-            self.db.query(Photo)
-            .filter(Photo.walk_id == walk_id)
-            .order_by(Photo.created_at.asc())
-            .first()
+        return photos, points
+
+    def get_thumbnail_urls(self, walk_ids: List[int]) -> Dict[int, str]:
+        """walk_id → 가장 먼저 올린 사진 URL (산책 묶음 1쿼리)"""
+        if not walk_ids:
+            return {}
+        rows = (
+            self.db.query(Photo.walk_id, Photo.image_url)
+            .filter(Photo.walk_id.in_(walk_ids))
+            .order_by(Photo.walk_id, Photo.created_at.asc())
+            .all()
         )
-        return photo.image_url if photo else None
+        urls: Dict[int, str] = {}
+        for walk_id, image_url in rows:
+            urls.setdefault(walk_id, image_url)
+        return urls
 
     def list_recent_activities(self, pet_id: int, limit: int = 3) -> List[tuple]:
         return (
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Header, Request, Depends, Query, Path
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.etag import ConditionalGet, conditional_get
 from app.db import get_db
 from app.domains.record.service.walk_service import RecordWalkService
 from app.domains.record.service.walk_detail_service import RecordWalkDetailService
@@ -67,6 +68,7 @@ def get_walk_detail(
     walk_id: int = Path(..., description="산책 ID"),
     include_points: Optional[str] = Query(None, description="위치 포인트 포함 여부 (true/false)"),
     authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    conditional: ConditionalGet = Depends(conditional_get),
     db: Session = Depends(get_db),
 ):
     service = RecordWalkDetailService(db)
@@ -74,6 +76,7 @@ def get_walk_detail(
         request=request,
         authorization=authorization,
         walk_id=walk_id,
+        conditional=conditional,
         include_points=include_points,
     )
 
@@ -124,6 +127,7 @@ def get_activity_stats(
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD 형식, monthly용)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD 형식, monthly용)"),
     authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    conditional: ConditionalGet = Depends(conditional_get),
     db: Session = Depends(get_db),
 ):
     # period 변환: daily -> day, weekly -> week, monthly -> month, all -> all
@@ -144,6 +148,7 @@ def get_activity_stats(
         date=date,
         start_date=start_date,
         end_date=end_date,
+        conditional=conditional,
     )
 
 
@@ -1,12 +1,11 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 import pytz
 
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.record.exception import record_error
 from app.models.user import User
 from app.models.pet import Pet
@@ -111,18 +110,18 @@ class RecordPhotoService:
 
         # 6) 응답 변환
         items = []
-        for photo, walk, uploader in rows:
+        for photo in rows:
             items.append({
                 "photo_id": photo.photo_id,
-                "walk_id": walk.walk_id,
+                "walk_id": photo.walk_id,
                 "image_url": photo.image_url,
                 "uploaded_by": {
-                    "user_id": uploader.user_id,
-                    "nickname": uploader.nickname,
+                    "user_id": photo.uploader_id,
+                    "nickname": photo.uploader_nickname,
                 },
                 "caption": photo.caption,
-                "walk_date": walk.start_time.date().isoformat() if walk.start_time else None,
-                "walk_start_time": walk.start_time.isoformat() if walk.start_time else None,
+                "walk_date": photo.walk_start_time.date().isoformat() if photo.walk_start_time else None,
+                "walk_start_time": photo.walk_start_time.isoformat() if photo.walk_start_time else None,
                 "created_at": photo.created_at.isoformat() if photo.created_at else None,
             })
 
@@ -138,4 +137,4 @@ class RecordPhotoService:
             "path": path
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response_content))
+        return json_response(response_content, status_code=200)
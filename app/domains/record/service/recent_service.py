@@ -1,11 +1,10 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.record.exception import record_error
 from app.models.user import User
 from app.models.pet import Pet
@@ -13,6 +12,25 @@ from app.models.family_member import FamilyMember
 from app.domains.record.repository.walk_repository import RecordWalkRepository
 
 
+def recent_activity_to_dict(walk, walker, thumbnail_url: Optional[str]) -> dict:
+    """최근 활동 항목 (홈 화면 집계 응답에서도 사용)"""
+    return {
+        "walk_id": walk.walk_id,
+        "date": walk.start_time.date().isoformat() if walk.start_time else None,
+        "start_time": walk.start_time.isoformat() if walk.start_time else None,
+        "end_time": walk.end_time.isoformat() if walk.end_time else None,
+        "duration_min": walk.duration_min,
+        "distance_km": float(walk.distance_km) if walk.distance_km is not None else None,
+        "walker": {
+            "user_id": walker.user_id,
+            "nickname": walker.nickname,
+        },
+        "weather_status": walk.weather_status,
+        "weather_temp_c": float(walk.weather_temp_c) if walk.weather_temp_c is not None else None,
+        "thumbnail_image_url": thumbnail_url,
+    }
+
+
 class RecentActivityService:
     def __init__(self, db: Session):
         self.db = db
@@ -76,24 +94,11 @@ class RecentActivityService:
             print("RECENT_QUERY_ERROR:", e)
             return record_error("RECENT_ACT_500_1", path)
 
-        activities = []
-        for walk, walker in rows:
-            thumbnail_url = self.repo.get_thumbnail_url(walk.walk_id)
-            activities.append({
-                "walk_id": walk.walk_id,
-                "date": walk.start_time.date().isoformat() if walk.start_time else None,
-                "start_time": walk.start_time.isoformat() if walk.start_time else None,
-                "end_time": walk.end_time.isoformat() if walk.end_time else None,
-                "duration_min": walk.duration_min,
-                "distance_km": float(walk.distance_km) if walk.distance_km is not None else None,
-                "walker": {
-                    "user_id": walker.user_id,
-                    "nickname": walker.nickname,
-                },
-                "weather_status": walk.weather_status,
-                "weather_temp_c": float(walk.weather_temp_c) if walk.weather_temp_c is not None else None,
-                "thumbnail_image_url": thumbnail_url,
-            })
+        thumbnails = self.repo.get_thumbnail_urls([walk.walk_id for walk, _ in rows])
+        activities = [
+            recent_activity_to_dict(walk, walker, thumbnails.get(walk.walk_id))
+            for walk, walker in rows
+        ]
 
         response_content = {
             "success": True,
@@ -104,4 +109,4 @@ class RecentActivityService:
             "path": path
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response_content))
+        return json_response(response_content, status_code=200)
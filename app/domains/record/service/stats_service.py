@@ -1,16 +1,15 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 import pytz
 
+from app.core import change_log
+from app.core.etag import ConditionalGet
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.record.exception import record_error
 from app.models.user import User
-from app.models.pet import Pet
-from app.models.family_member import FamilyMember
 from app.domains.record.repository.stats_repository import StatsRepository
 
 
@@ -88,6 +87,7 @@ class ActivityStatsService:
         date: Optional[str],
         start_date: Optional[str],
         end_date: Optional[str],
+        conditional: ConditionalGet,
     ):
         path = request.url.path
 
@@ -119,20 +119,11 @@ class ActivityStatsService:
         if not user:
             return record_error("ACTIVITY_404_1", path)
 
-        pet: Pet = (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == pet_id)
-            .first()
-        )
-        if not pet:
+        # 반려동물 + 권한 + 버전 + 목표 / 추천 (1쿼리)
+        access = self.repo.get_pet_access(pet_id, user.user_id)
+        if not access:
             return record_error("ACTIVITY_404_2", path)
-
-        fm: FamilyMember = (
-            self.db.query(FamilyMember)
-            .filter(FamilyMember.family_id == pet.family_id, FamilyMember.user_id == user.user_id)
-            .first()
-        )
-        if not fm:
+        if access.member_id is None:
             return record_error("ACTIVITY_403_1", path)
 
         # 4) Date range
@@ -149,7 +140,20 @@ class ActivityStatsService:
         except Exception:
             return record_error("ACTIVITY_400_3", path)
 
-        # 5) Aggregate
+        # 5) 조건부 GET: 산책 변경은 가족 변경 기록으로, 목표 / 추천은 값 그대로 + 계산된 기간
+        version = None
+        family_version = change_log.settled_version(access.head_change_id, access.head_created_at)
+        if family_version is not None:
+            version = (
+                family_version, start_str, end_str,
+                access.goal_id, access.target_walks, access.target_minutes, access.target_distance_km,
+                access.rec_id, access.recommended_walks, access.recommended_minutes, access.recommended_distance_km,
+            )
+        not_modified = conditional.evaluate("record.stats", user.user_id, version)
+        if not_modified is not None:
+            return not_modified
+
+        # 6) Aggregate
         try:
             daily = self.repo.aggregate_daily(pet_id, start_utc, end_utc)
         except Exception as e:
@@ -184,13 +188,13 @@ class ActivityStatsService:
         avg_distance_km_per_day = round(total_distance_km / total_days, 2) if total_days > 0 else 0.0
         avg_duration_min_per_day = round(total_duration_min / total_days, 2) if total_days > 0 else 0.0
 
-        # Goal / Recommendation
-        goal = self.repo.get_goal(pet_id)
-        rec = self.repo.get_recommendation(pet_id)
+        # Goal / Recommendation (access 조회에서 함께 가져옴)
+        goal = access.goal_id is not None
+        rec = access.rec_id is not None
 
-        goal_walks = goal.target_walks if goal else None
-        goal_minutes = goal.target_minutes if goal else None
-        goal_distance = float(goal.target_distance_km) if goal else None
+        goal_walks = access.target_walks if goal else None
+        goal_minutes = access.target_minutes if goal else None
+        goal_distance = float(access.target_distance_km) if goal else None
 
         # distribute daily goals as given values (they are per-day targets)
         for p in points:
@@ -216,9 +220,9 @@ class ActivityStatsService:
 
         summary_rec = {
             "has_recommendation": True if rec else False,
-            "recommended_walks_per_day": rec.recommended_walks if rec else None,
-            "recommended_minutes_per_day": rec.recommended_minutes if rec else None,
-            "recommended_distance_km_per_day": float(rec.recommended_distance_km) if rec else None,
+            "recommended_walks_per_day": access.recommended_walks if rec else None,
+            "recommended_minutes_per_day": access.recommended_minutes if rec else None,
+            "recommended_distance_km_per_day": float(access.recommended_distance_km) if rec else None,
         }
 
         response_content = {
@@ -247,4 +251,4 @@ class ActivityStatsService:
             "path": path,
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response_content))
+        return json_response(response_content, status_code=200, headers=conditional.headers())
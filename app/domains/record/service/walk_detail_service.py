@@ -1,14 +1,14 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
+from app.core import change_log
+from app.core.etag import ConditionalGet
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.record.exception import record_error
 from app.models.user import User
-from app.models.family_member import FamilyMember
 from app.domains.record.repository.walk_repository import RecordWalkRepository
 
 
@@ -22,6 +22,7 @@ class RecordWalkDetailService:
         request: Request,
         authorization: Optional[str],
         walk_id: int,
+        conditional: ConditionalGet,
         include_points: Optional[str] = None,
     ):
         path = request.url.path
@@ -63,57 +64,56 @@ class RecordWalkDetailService:
         if not user:
             return record_error("WALK_DETAIL_404_1", path)
 
-        # 4) 산책 조회
+        # 4) 산책 + 반려동물 + 가족 + 산책한 사람 + 권한(family_members) 1쿼리
         try:
-            walk = self.repo.get_walk(walk_id)
-            if not walk:
-                return record_error("WALK_DETAIL_404_2", path)
+            detail = self.repo.get_walk_detail(walk_id, user.user_id)
         except Exception as e:
             print("WALK_DETAIL_QUERY_ERROR:", e)
             return record_error("WALK_DETAIL_500_1", path)
 
-        # 5) 권한 체크 (family_members)
-        pet, family = self.repo.get_pet_and_family(walk.pet_id)
-        if not pet:
+        if not detail:
             return record_error("WALK_DETAIL_404_2", path)
 
-        family_member: FamilyMember = (
-            self.db.query(FamilyMember)
-            .filter(
-                FamilyMember.family_id == pet.family_id,
-                FamilyMember.user_id == user.user_id
-            )
-            .first()
-        )
-        if not family_member:
+        # 5) 권한 체크
+        if detail.member_id is None:
             return record_error("WALK_DETAIL_403_1", path)
 
-        # 6) 연관 데이터 조회
-        walker = self.repo.get_user(walk.user_id)
-        photos = self.repo.get_photos(walk.walk_id)
-        points = self.repo.get_points(walk.walk_id) if include_pts else []
+        walk = detail.Walk
+
+        # 6) 조건부 GET: 산책 / 사진 / 반려동물 변경은 가족 변경 기록으로, 산책한 사람 정보는 값 그대로
+        #    진행 중인 산책은 경로 포인트가 변경 기록에 남지 않으므로 ETag 없이
+        version = None
+        family_version = change_log.settled_version(detail.head_change_id, detail.head_created_at)
+        if walk.end_time is not None and family_version is not None:
+            version = (family_version, detail.walker_id, detail.walker_nickname, detail.walker_profile_img_url)
+        not_modified = conditional.evaluate("record.walk_detail", user.user_id, version)
+        if not_modified is not None:
+            return not_modified
+
+        # 7) 사진 + 경로 포인트 (1쿼리)
+        photos, points = self.repo.get_photos_and_points(walk.walk_id, include_pts)
 
         # route_data는 현재 Walk 모델에 별도 저장소가 없으므로 None 처리 또는 확장 여지
         route_data = None
         thumbnail_url = photos[0].image_url if photos else None
 
-        # 7) 응답 구성
+        # 8) 응답 구성
         response_content = {
             "success": True,
             "status": 200,
             "walk": {
                 "walk_id": walk.walk_id,
                 "pet": {
-                    "pet_id": pet.pet_id,
-                    "name": pet.name,
-                    "image_url": pet.image_url,
-                    "family_id": pet.family_id,
-                    "family_name": family.family_name if family else None,
+                    "pet_id": detail.pet_id,
+                    "name": detail.pet_name,
+                    "image_url": detail.pet_image_url,
+                    "family_id": detail.family_id,
+                    "family_name": detail.family_name,
                 },
                 "walker": {
-                    "user_id": walker.user_id if walker else None,
-                    "nickname": walker.nickname if walker else None,
-                    "profile_img_url": walker.profile_img_url if walker else None,
+                    "user_id": detail.walker_id,
+                    "nickname": detail.walker_nickname,
+                    "profile_img_url": detail.walker_profile_img_url,
                 },
                 "start_time": walk.start_time.isoformat() if walk.start_time else None,
                 "end_time": walk.end_time.isoformat() if walk.end_time else None,
@@ -134,11 +134,11 @@ class RecordWalkDetailService:
                 ] if include_pts else None,
                 "photos": [
                     {
-                        "photo_id": ph.photo_id,
+                        "photo_id": ph.id,
                         "image_url": ph.image_url,
                         "uploaded_by": ph.uploaded_by,
                         "caption": ph.caption,
-                        "created_at": ph.created_at.isoformat() if ph.created_at else None,
+                        "created_at": ph.ts.isoformat() if ph.ts else None,
                     } for ph in photos
                 ],
             },
@@ -146,4 +146,4 @@ class RecordWalkDetailService:
             "path": path
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response_content))
+        return json_response(response_content, status_code=200, headers=conditional.headers())
@@ -1,12 +1,11 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 import pytz
 
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.record.exception import record_error
 from app.models.user import User
 from app.models.pet import Pet
@@ -107,7 +106,6 @@ class RecordWalkService:
         # 8) 응답
         items = []
         for w in walks:
-            thumbnail_url = self.repo.get_thumbnail_url(w.walk_id)
             items.append({
                 "walk_id": w.walk_id,
                 "pet_id": w.pet_id,
@@ -119,7 +117,7 @@ class RecordWalkService:
                 "calories": float(w.calories) if w.calories is not None else None,
                 "weather_status": w.weather_status,
                 "weather_temp_c": float(w.weather_temp_c) if w.weather_temp_c is not None else None,
-                "thumbnail_image_url": thumbnail_url,
+                "thumbnail_image_url": w.thumbnail_image_url,
             })
 
         response_content = {
@@ -129,4 +127,4 @@ class RecordWalkService:
             "timeStamp": datetime.utcnow().isoformat(),
             "path": path
         }
-        return JSONResponse(status_code=200, content=jsonable_encoder(response_content))
+        return json_response(response_content, status_code=200)
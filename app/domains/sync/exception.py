@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from app.core.error_handler import error_response
+from app.schemas.error_schema import ErrorResponse
+
+
+@dataclass(frozen=True)
+class SyncError:
+    status: int
+    code: str
+    reason: str
+
+    def to_dict(self, path: str) -> Dict:
+        return {
+            "success": False,
+            "status": self.status,
+            "code": self.code,
+            "reason": self.reason,
+            "timeStamp": "...",
+            "path": path,
+        }
+
+
+SYNC_ERRORS: Dict[str, SyncError] = {
+    "SYNC_401_1": SyncError(401, "SYNC_401_1", "Authorization 헤더가 필요합니다."),
+    "SYNC_401_2": SyncError(401, "SYNC_401_2", "Authorization 헤더 형식이 잘못되었거나 토큰이 유효하지 않습니다."),
+    "SYNC_400_1": SyncError(400, "SYNC_400_1", "cursor 형식이 올바르지 않습니다."),
+    "SYNC_404_1": SyncError(404, "SYNC_404_1", "해당 사용자를 찾을 수 없습니다."),
+    "SYNC_500_1": SyncError(500, "SYNC_500_1", "변경 내역을 조회하는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."),
+}
+
+
+def sync_error(code: str, path: str):
+    err = SYNC_ERRORS.get(code)
+    if not err:
+        return error_response(500, "SYNC_500_1", "서버 내부 오류가 발생했습니다.", path)
+    return error_response(err.status, err.code, err.reason, path)
+
+
+def _examples(path: str, mapping: Dict[str, SyncError]) -> Dict:
+    return {
+        code: {"value": err.to_dict(path)}
+        for code, err in mapping.items()
+    }
+
+
+def _responses(path: str, status: int, description: str) -> Dict:
+    return {
+        "model": ErrorResponse,
+        "description": description,
+        "content": {
+            "application/json": {
+                "examples": _examples(path, {
+                    code: err for code, err in SYNC_ERRORS.items() if err.status == status
+                })
+            }
+        },
+    }
+
+
+SYNC_RESPONSES = {
+    400: _responses("/api/v1/sync/changes", 400, "잘못된 요청"),
+    401: _responses("/api/v1/sync/changes", 401, "인증 실패"),
+    404: _responses("/api/v1/sync/changes", 404, "리소스 없음"),
+    500: _responses("/api/v1/sync/changes", 500, "서버 내부 오류"),
+}
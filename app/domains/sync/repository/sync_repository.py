@@ -0,0 +1,132 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.models.change_log import ChangeLog
+from app.models.family_member import FamilyMember
+from app.models.notification import Notification
+from app.models.pet import Pet
+from app.models.pet_share_request import PetShareRequest
+from app.models.photo import Photo
+from app.models.walk import Walk
+
+
+# entity → (pk, 응답에 담을 컬럼들). 목록 화면에 필요한 값만 담아 응답을 작게 유지
+SNAPSHOT_COLUMNS = {
+    "pet": (Pet.pet_id, [
+        Pet.pet_id, Pet.family_id, Pet.owner_id, Pet.pet_search_id, Pet.name, Pet.breed, Pet.age,
+        Pet.weight, Pet.gender, Pet.disease, Pet.image_url, Pet.voice_url, Pet.updated_at,
+    ]),
+    "walk": (Walk.walk_id, [
+        Walk.walk_id, Walk.pet_id, Walk.user_id, Walk.start_time, Walk.end_time,
+        Walk.duration_min, Walk.distance_km, Walk.calories,
+    ]),
+    "photo": (Photo.photo_id, [
+        Photo.photo_id, Photo.walk_id, Photo.image_url, Photo.caption, Photo.uploaded_by, Photo.created_at,
+    ]),
+    "notification": (Notification.notification_id, [
+        Notification.notification_id, Notification.family_id, Notification.target_user_id, Notification.type,
+        Notification.title, Notification.message, Notification.related_pet_id, Notification.related_user_id,
+        Notification.related_request_id, Notification.created_at,
+    ]),
+    "family_member": (FamilyMember.member_id, [
+        FamilyMember.member_id, FamilyMember.family_id, FamilyMember.user_id, FamilyMember.role,
+        FamilyMember.joined_at,
+    ]),
+    "share_request": (PetShareRequest.request_id, [
+        PetShareRequest.request_id, PetShareRequest.pet_id, PetShareRequest.requester_id,
+        PetShareRequest.status, PetShareRequest.created_at, PetShareRequest.responded_at,
+    ]),
+}
+
+
+class SyncRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_family_ids(self, user_id: int) -> List[int]:
+        rows = (
+            self.db.query(FamilyMember.family_id)
+            .filter(FamilyMember.user_id == user_id)
+            .all()
+        )
+        return [r[0] for r in rows]
+
+    # =====================================================
+    # cursor 기준점
+    # =====================================================
+    def get_head_change_id(self, settled_before: datetime) -> int:
+        """settle 시간이 지난 기록 중 가장 큰 change_id (없으면 0)"""
+        head = (
+            self.db.query(func.max(ChangeLog.change_id))
+            .filter(ChangeLog.created_at <= settled_before)
+            .scalar()
+        )
+        return int(head or 0)
+
+    def get_oldest_change_id(self) -> Optional[int]:
+        oldest = self.db.query(func.min(ChangeLog.change_id)).scalar()
+        return int(oldest) if oldest is not None else None
+
+    # =====================================================
+    # 변경 목록 (가족 범위 / 개인 범위 각각 인덱스 range scan 후 병합)
+    # =====================================================
+    def list_changes(
+        self,
+        family_ids: List[int],
+        user_id: int,
+        after_change_id: int,
+        settled_before: datetime,
+        limit: int,
+    ) -> List[tuple]:
+        columns = (
+            ChangeLog.change_id, ChangeLog.entity, ChangeLog.entity_id, ChangeLog.op, ChangeLog.user_id,
+        )
+
+        def branch(condition):
+            return (
+                self.db.query(*columns)
+                .filter(
+                    condition,
+                    ChangeLog.change_id > after_change_id,
+                    ChangeLog.created_at <= settled_before,
+                )
+                .order_by(ChangeLog.change_id.asc())
+                .limit(limit)
+                .all()
+            )
+
+        rows = {r.change_id: r for r in branch(ChangeLog.user_id == user_id)}
+        if family_ids:
+            for r in branch(ChangeLog.family_id.in_(family_ids)):
+                rows[r.change_id] = r
+        return [rows[k] for k in sorted(rows)[:limit]]
+
+    # =====================================================
+    # 현재 값 (entity 별 1쿼리)
+    # =====================================================
+    def get_snapshots(self, entity: str, ids: List[int]) -> Dict[int, dict]:
+        if not ids:
+            return {}
+        pk, columns = SNAPSHOT_COLUMNS[entity]
+        rows = self.db.query(*columns).filter(pk.in_(ids)).all()
+        return {getattr(r, pk.key): r._asdict() for r in rows}
+
+    # =====================================================
+    # 보관 기간 지난 기록 삭제 (change_id 묶음 단위)
+    # =====================================================
+    def purge_before(self, cutoff: datetime, batch_size: int) -> int:
+        ids = [
+            r[0] for r in (
+                self.db.query(ChangeLog.change_id)
+                .filter(ChangeLog.created_at < cutoff)
+                .order_by(ChangeLog.change_id.asc())
+                .limit(batch_size)
+                .all()
+            )
+        ]
+        if not ids:
+            return 0
+        self.db.query(ChangeLog).filter(ChangeLog.change_id.in_(ids)).delete(synchronize_session=False)
+        return len(ids)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Header, Request, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.db import get_db
+from app.domains.sync.service.sync_service import SyncService
+from app.schemas.sync.sync_schema import SyncChangesResponse
+from app.domains.sync.exception import SYNC_RESPONSES
+
+
+router = APIRouter(
+    prefix="/api/v1/sync",
+    tags=["Sync"]
+)
+
+
+@router.get(
+    "/changes",
+    summary="cursor 이후 변경분 조회",
+    description="반려동물, 산책, 사진, 알림, 가족 구성원, 공유 요청의 생성/수정/삭제 중 cursor 이후 것만 조회합니다.",
+    status_code=200,
+    response_model=SyncChangesResponse,
+    responses=SYNC_RESPONSES,
+)
+def get_changes(
+    request: Request,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 동기화면 생략)"),
+    limit: int = Query(500, ge=1, le=1000, description="한 번에 받을 최대 변경 수"),
+    authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    db: Session = Depends(get_db),
+):
+    """
+    앱 재개/화면 진입 시 목록 전체 대신 변경분만 받아 로컬 데이터에 반영합니다.
+
+    - cursor 없이 호출하면 현재 cursor 와 full_resync=true 를 반환합니다. 이후 목록 API 로 전체를 받은 뒤 이 cursor 로 이어서 호출합니다.
+    - full_resync=true 이면 목록 전체를 다시 받고, next_cursor 부터 이어갑니다.
+    - has_more=true 이면 next_cursor 로 바로 다시 호출합니다.
+    - upsert 는 현재 값(data)을, delete 는 ID 만 담습니다. 같은 항목이 여러 번 와도 덮어쓰면 됩니다.
+    """
+    service = SyncService(db)
+    return service.get_changes(
+        request=request,
+        authorization=authorization,
+        cursor=cursor,
+        limit=limit,
+    )
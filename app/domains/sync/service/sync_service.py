@@ -0,0 +1,190 @@
+from fastapi import Request
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+
+from app.core.change_log import OP_DELETE
+from app.core.config import settings
+from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
+from app.domains.sync.exception import sync_error
+from app.domains.sync.repository.sync_repository import SyncRepository
+from app.models.user import User
+
+
+class SyncService:
+    """
+    cursor 이후 변경분 조회 (오프라인 우선 앱의 재개/화면 진입용)
+
+    - 변경 기록(change_log)을 가족 범위 + 개인 범위로 읽어 cursor 이후 것만 반환
+    - 같은 엔티티는 페이지 안에서 마지막 변경 1건으로 합치고, upsert 는 현재 값을 entity 별 1쿼리로 채움
+    - cursor 가 없거나 보관 기간을 넘었거나 내 가족 구성이 바뀌면 full_resync=true
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = SyncRepository(db)
+
+    def get_changes(
+        self,
+        request: Request,
+        authorization: Optional[str],
+        cursor: Optional[str],
+        limit: int,
+    ):
+        path = request.url.path
+
+        # ============================================
+        # 1) Authorization 검증
+        # ============================================
+        if authorization is None:
+            return sync_error("SYNC_401_1", path)
+
+        if not authorization.startswith("Bearer "):
+            return sync_error("SYNC_401_2", path)
+
+        parts = authorization.split(" ")
+        if len(parts) != 2:
+            return sync_error("SYNC_401_2", path)
+
+        decoded = verify_firebase_token(parts[1])
+        if decoded is None:
+            return sync_error("SYNC_401_2", path)
+
+        firebase_uid = decoded.get("uid")
+
+        # ============================================
+        # 2) cursor 검사
+        # ============================================
+        after_change_id = None
+        if cursor is not None:
+            if not cursor.isdigit():
+                return sync_error("SYNC_400_1", path)
+            after_change_id = int(cursor)
+
+        # ============================================
+        # 3) 사용자 조회
+        # ============================================
+        user: User = (
+            self.db.query(User)
+            .filter(User.firebase_uid == firebase_uid)
+            .first()
+        )
+
+        if not user:
+            return sync_error("SYNC_404_1", path)
+
+        # 최근 settle 시간 안의 기록은 제외 (먼저 발급된 change_id 가 늦게 commit 되는 경우 건너뛰지 않도록)
+        settled_before = datetime.utcnow() - timedelta(seconds=settings.SYNC_SETTLE_SEC)
+
+        try:
+            # ============================================
+            # 4) 첫 동기화 / 보관 기간 지난 cursor → 현재 위치만 알려주고 전체 재조회
+            # ============================================
+            if after_change_id is None or self._is_expired(after_change_id):
+                head = self.repo.get_head_change_id(settled_before)
+                return self._response(path, [], str(head), has_more=False, full_resync=True)
+
+            # ============================================
+            # 5) 변경 목록 조회 (limit + 1 로 has_more 판단)
+            # ============================================
+            family_ids = self.repo.get_family_ids(user.user_id)
+            rows = self.repo.list_changes(
+                family_ids, user.user_id, after_change_id, settled_before, limit + 1
+            )
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            next_cursor = str(rows[-1].change_id) if rows else str(after_change_id)
+
+            # 내 가족 가입/탈퇴는 그 가족의 과거 데이터까지 바뀌므로 전체 재조회
+            full_resync = any(
+                r.entity == "family_member" and r.user_id == user.user_id
+                for r in rows
+            )
+
+            # ============================================
+            # 6) 엔티티별 마지막 변경으로 합치고 현재 값 채우기
+            # ============================================
+            changes = self._build_changes(self._collapse(rows))
+
+        except Exception as e:
+            print("SYNC_CHANGES_QUERY_ERROR:", e)
+            return sync_error("SYNC_500_1", path)
+
+        return self._response(path, changes, next_cursor, has_more=has_more, full_resync=full_resync)
+
+    def _is_expired(self, after_change_id: int) -> bool:
+        oldest = self.repo.get_oldest_change_id()
+        return oldest is not None and after_change_id + 1 < oldest
+
+    @staticmethod
+    def _collapse(rows) -> List[Tuple[str, int, str]]:
+        """(entity, entity_id) 별 마지막 op 만, 마지막 변경 순서대로"""
+        latest: Dict[Tuple[str, int], str] = {}
+        for r in rows:
+            key = (r.entity, r.entity_id)
+            latest.pop(key, None)
+            latest[key] = r.op
+        return [(entity, entity_id, op) for (entity, entity_id), op in latest.items()]
+
+    def _build_changes(self, collapsed: List[Tuple[str, int, str]]) -> List[dict]:
+        upsert_ids: Dict[str, List[int]] = {}
+        for entity, entity_id, op in collapsed:
+            if op != OP_DELETE:
+                upsert_ids.setdefault(entity, []).append(entity_id)
+
+        snapshots = {
+            entity: self.repo.get_snapshots(entity, ids)
+            for entity, ids in upsert_ids.items()
+        }
+
+        changes = []
+        for entity, entity_id, op in collapsed:
+            data = snapshots.get(entity, {}).get(entity_id) if op != OP_DELETE else None
+            # 기록 후 삭제된 행(삭제 기록은 다음 페이지에 있을 수 있음)도 delete 로
+            changes.append({
+                "entity": entity,
+                "id": entity_id,
+                "op": "upsert" if data is not None else "delete",
+                "data": data,
+            })
+        return changes
+
+    @staticmethod
+    def _response(path: str, changes: List[dict], next_cursor: str, has_more: bool, full_resync: bool):
+        response_content = {
+            "success": True,
+            "status": 200,
+            "changes": changes,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "full_resync": full_resync,
+            "timeStamp": datetime.utcnow().isoformat(),
+            "path": path
+        }
+
+        return json_response(response_content, status_code=200)
+
+    # ============================================
+    # 보관 기간 지난 변경 기록 정리 (주기 배치용)
+    # ============================================
+    def purge_change_log(self, retention_days: Optional[int] = None, batch_size: int = 5000) -> dict:
+        retention_days = retention_days if retention_days is not None else settings.SYNC_CHANGE_LOG_RETENTION_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+
+        deleted = 0
+        while True:
+            try:
+                count = self.repo.purge_before(cutoff, batch_size)
+                self.db.commit()
+            except Exception as e:
+                print("CHANGE_LOG_PURGE_ERROR:", e)
+                self.db.rollback()
+                break
+            deleted += count
+            if count < batch_size:
+                break
+
+        result = {"deleted": deleted}
+        print(f"[CHANGE_LOG_PURGE] {result}")
+        return result
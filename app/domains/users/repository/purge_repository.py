@@ -0,0 +1,152 @@
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional
+
+from app.core import route_archive
+from app.models.notification import Notification
+from app.models.notification_reads import NotificationRead
+from app.models.pet import Pet
+from app.models.photo import Photo
+from app.models.purge_job import PurgeJob
+from app.models.walk import Walk
+from app.models.walk_route_archive import WalkRouteArchive
+from app.models.walk_tracking_point import WalkTrackingPoint
+
+
+class PurgeRepository:
+    """
+    삭제 요청(tombstone) 이후 연관 데이터 정리용
+    - 모든 조회는 include_deleted (소프트 삭제된 pets / families / users 도 대상)
+    - 삭제는 항상 "PK keyset 으로 고른 최대 limit 개 → PK IN 삭제" 라서 한 문장이 잡는 잠금/패킷 크기가 제한됨
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _query(self, *entities):
+        return self.db.query(*entities).execution_options(include_deleted=True)
+
+    # =====================================================
+    # 작업 큐
+    # =====================================================
+    def enqueue(self, kind: str, target_id: int, firebase_uid: Optional[str] = None) -> PurgeJob:
+        job = PurgeJob(
+            kind=kind,
+            target_id=target_id,
+            firebase_uid=firebase_uid,
+            status="PENDING",
+            step_cursor=0,
+            deleted_rows=0,
+            attempts=0,
+        )
+        self.db.add(job)
+        return job
+
+    def list_pending_jobs(self, limit: int) -> List[PurgeJob]:
+        # 먼저 들어온 작업부터 (계정 작업은 같은 요청의 가족 작업보다 뒤에 등록됨)
+        return (
+            self.db.query(PurgeJob)
+            .filter(PurgeJob.status == "PENDING")
+            .order_by(PurgeJob.job_id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    # =====================================================
+    # 대상 반려동물
+    # =====================================================
+    def get_family_pet_ids(self, family_id: int) -> List[int]:
+        return [r[0] for r in self._query(Pet.pet_id).filter(Pet.family_id == family_id).all()]
+
+    # =====================================================
+    # 공통: keyset 으로 다음 PK 묶음
+    # =====================================================
+    def next_ids(self, pk, condition, after_id: int, limit: int) -> List[int]:
+        rows = (
+            self._query(pk)
+            .filter(condition, pk > after_id)
+            .order_by(pk.asc())
+            .limit(limit)
+            .all()
+        )
+        return [r[0] for r in rows]
+
+    def delete_ids(self, model, pk, ids: List[int]) -> int:
+        if not ids:
+            return 0
+        return (
+            self.db.query(model)
+            .filter(pk.in_(ids))
+            .delete(synchronize_session=False)
+        )
+
+    # =====================================================
+    # 산책 (경로 포인트 → 경로 보관본 → 사진 → 산책)
+    # =====================================================
+    def delete_walk_points(self, walk_ids: List[int], limit: int) -> int:
+        """walk_ids 의 경로 포인트를 최대 limit 개 삭제 (0 이 될 때까지 반복 호출)"""
+        point_ids = [
+            r[0] for r in (
+                self._query(WalkTrackingPoint.point_id)
+                .filter(WalkTrackingPoint.walk_id.in_(walk_ids))
+                .limit(limit)
+                .all()
+            )
+        ]
+        return self.delete_ids(WalkTrackingPoint, WalkTrackingPoint.point_id, point_ids)
+
+    def delete_walk_photos(self, walk_ids: List[int]) -> int:
+        return (
+            self.db.query(Photo)
+            .filter(Photo.walk_id.in_(walk_ids))
+            .delete(synchronize_session=False)
+        )
+
+    def delete_walk_archives(self, walk_ids: List[int]) -> int:
+        """경로 압축 보관본 (file 보관은 객체도 함께 삭제)"""
+        archives = (
+            self.db.query(WalkRouteArchive.storage, WalkRouteArchive.object_key)
+            .filter(WalkRouteArchive.walk_id.in_(walk_ids))
+            .all()
+        )
+        if not archives:
+            return 0
+        deleted = self.delete_ids(WalkRouteArchive, WalkRouteArchive.walk_id, walk_ids)
+        for storage, object_key in archives:
+            route_archive.store.delete(storage, object_key)
+        return deleted
+
+    def delete_walks(self, walk_ids: List[int]) -> int:
+        return self.delete_ids(Walk, Walk.walk_id, walk_ids)
+
+    # =====================================================
+    # 알림 (읽음 기록 → 알림)
+    # =====================================================
+    def delete_notifications(self, notification_ids: List[int]) -> int:
+        if not notification_ids:
+            return 0
+        reads = (
+            self.db.query(NotificationRead)
+            .filter(NotificationRead.notification_id.in_(notification_ids))
+            .delete(synchronize_session=False)
+        )
+        return reads + self.delete_ids(Notification, Notification.notification_id, notification_ids)
+
+    def get_notification_ids_for_requests(self, request_ids: List[int]) -> List[int]:
+        if not request_ids:
+            return []
+        rows = (
+            self._query(Notification.notification_id)
+            .filter(Notification.related_request_id.in_(request_ids))
+            .all()
+        )
+        return [r[0] for r in rows]
+
+    # =====================================================
+    # 작업 상태
+    # =====================================================
+    def mark_done(self, job: PurgeJob) -> None:
+        job.status = "DONE"
+        job.step = None
+        job.step_cursor = 0
+        job.finished_at = datetime.utcnow()
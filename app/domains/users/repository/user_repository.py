@@ -1,12 +1,37 @@
-from sqlalchemy import inspect, func
+from sqlalchemy import inspect, func, select
 from sqlalchemy.orm import Session
 from typing import Iterable, List, Optional, Set
 
+from app.core import change_log, push_targets
+from app.core.upsert import upsert
 from app.models.family_member import FamilyMember
 from app.models.user import User
 from app.models.user_fcm_token import UserFcmToken
 
 
+# user_fcm_tokens 테이블 확인 결과 (프로세스당 1회만 inspector 조회)
+_fcm_table_ready: Optional[bool] = None
+
+
+def ensure_fcm_token_table(bind) -> bool:
+    """
+    Ensure user_fcm_tokens table exists. Checked once per process (startup).
+    """
+    global _fcm_table_ready
+    if _fcm_table_ready:
+        return True
+    try:
+        inspector = inspect(bind)
+        if not inspector.has_table(UserFcmToken.__tablename__):
+            # create table if missing (checkfirst avoids errors)
+            UserFcmToken.__table__.create(bind=bind, checkfirst=True)
+        _fcm_table_ready = True
+    except Exception as e:
+        print(f"[FCM] Failed to ensure user_fcm_tokens table: {e}")
+        _fcm_table_ready = False
+    return _fcm_table_ready
+
+
 class UserRepository:
 
     def __init__(self, db: Session):
@@ -16,19 +41,9 @@ class UserRepository:
     # Internal helpers
     # -------------------------------------------------
     def _ensure_fcm_token_table(self) -> bool:
-        """
-        Ensure user_fcm_tokens table exists.
-        """
-        try:
-            bind = self.db.get_bind()
-            inspector = inspect(bind)
-            if not inspector.has_table(UserFcmToken.__tablename__):
-                # create table if missing (checkfirst avoids errors)
-                UserFcmToken.__table__.create(bind=bind, checkfirst=True)
+        if _fcm_table_ready:
             return True
-        except Exception as e:
-            print(f"[FCM] Failed to ensure user_fcm_tokens table: {e}")
-            return False
+        return ensure_fcm_token_table(self.db.get_bind())
 
     # -------------------------------------------------
     # Basic user lookups
@@ -57,13 +72,39 @@ class UserRepository:
         )
 
     # 해당 가족의 모든 멤버 조회
-    def get_family_members(self, family_id: int) -> List[FamilyMember]:
+    def get_family_members(self, family_id: int):
+        """구성원 + 사용자 프로필 (삭제된 사용자는 제외) — 한 번의 JOIN"""
         return (
-            self.db.query(FamilyMember)
+            self.db.query(
+                FamilyMember.user_id,
+                FamilyMember.role,
+                User.nickname,
+                User.profile_img_url,
+            )
+            .join(User, User.user_id == FamilyMember.user_id)
             .filter(FamilyMember.family_id == family_id)
+            .order_by(FamilyMember.member_id.asc())
             .all()
         )
 
+    # 가족 구성원 목록의 버전 (ETag)
+    def get_family_members_version(self, family_id: int):
+        """Row(head_change_id, head_created_at, profile_updated_at) — 가족 최근 변경 기록 + 구성원 프로필 최근 수정 시각"""
+        head_change_id, head_created_at = change_log.family_head(family_id)
+        profile_updated_at = (
+            select(func.max(User.updated_at))
+            .join(FamilyMember, FamilyMember.user_id == User.user_id)
+            .where(FamilyMember.family_id == family_id)
+            .scalar_subquery()
+        )
+        return self.db.execute(
+            select(
+                head_change_id.label("head_change_id"),
+                head_created_at.label("head_created_at"),
+                profile_updated_at.label("profile_updated_at"),
+            )
+        ).one()
+
     def update_user(self, user: User, nickname=None, phone=None):
         if nickname is not None:
             user.nickname = nickname
@@ -82,7 +123,7 @@ class UserRepository:
         user: User,
         fcm_token: str,
         device_id: Optional[str] = None,
-        platform: Optional[str] = "android",
+        platform: Optional[str] = None,
     ):
         """
         Store/update FCM token for a user.
@@ -97,48 +138,47 @@ class UserRepository:
         if not table_ready:
             return
 
-        # 1) If token already exists anywhere, move it to this user/device
-        existing_by_token = (
-            self.db.query(UserFcmToken)
-            .filter(UserFcmToken.fcm_token == fcm_token)
-            .first()
+        # 1) 같은 기기에 예전 토큰 행이 있으면 제거 (새 토큰이 (user_id, device_id) 키와 충돌하지 않도록)
+        if device_id:
+            self.db.query(UserFcmToken).filter(
+                UserFcmToken.user_id == user.user_id,
+                UserFcmToken.device_id == device_id,
+                UserFcmToken.fcm_token != fcm_token,
+            ).delete(synchronize_session=False)
+
+        # 2) 토큰 기준 단일 upsert: 이미 있으면(다른 사용자/기기 포함) 이 사용자/기기로 이동
+        #    device_id / platform 을 보내지 않은 요청은 기존 값을 유지 (NULL 로 넣고 coalesce)
+        upsert(
+            self.db,
+            UserFcmToken,
+            {
+                "user_id": user.user_id,
+                "fcm_token": fcm_token,
+                "device_id": device_id,
+                "platform": platform or None,
+                "is_active": True,
+            },
+            conflict_columns=("fcm_token",),
+            update=lambda inserted: [
+                ("user_id", inserted("user_id")),
+                ("device_id", func.coalesce(inserted("device_id"), UserFcmToken.__table__.c.device_id)),
+                ("platform", func.coalesce(inserted("platform"), UserFcmToken.__table__.c.platform)),
+                ("is_active", True),
+                ("updated_at", func.now()),
+            ],
         )
 
-        if existing_by_token:
-            existing_by_token.user_id = user.user_id
-            existing_by_token.device_id = device_id or existing_by_token.device_id
-            existing_by_token.platform = platform or existing_by_token.platform
-            existing_by_token.is_active = True
-            existing_by_token.updated_at = func.now()
-            return
-
-        # 2) If we know device_id, update that row; else create a new one
-        device_row = None
-        if device_id:
-            device_row = (
-                self.db.query(UserFcmToken)
-                .filter(
-                    UserFcmToken.user_id == user.user_id,
-                    UserFcmToken.device_id == device_id,
-                )
-                .first()
-            )
+        # Core 문장은 flush 이벤트를 거치지 않으므로 푸시 대상 캐시를 직접 무효화
+        # (토큰이 다른 사용자에게서 옮겨온 경우 그 가족 캐시도 함께)
+        push_targets.mark_user_changed(self.db, user.user_id)
+        push_targets.mark_token_changed(self.db, fcm_token)
 
-        if device_row:
-            device_row.fcm_token = fcm_token
-            device_row.platform = platform or device_row.platform
-            device_row.is_active = True
-            device_row.updated_at = func.now()
-        else:
-            self.db.add(
-                UserFcmToken(
-                    user_id=user.user_id,
-                    fcm_token=fcm_token,
-                    device_id=device_id,
-                    platform=platform or "android",
-                    is_active=True,
-                )
-            )
+    def get_family_push_tokens(self, family_id: int, exclude_user_ids: Iterable[int] = ()) -> List[str]:
+        """
+        Cached family → active device tokens (see app.core.push_targets).
+        Invalidated automatically by upsert_fcm_token / remove_fcm_tokens / membership changes.
+        """
+        return push_targets.get_family_push_tokens(self.db, family_id, exclude_user_ids)
 
     def get_active_fcm_tokens_for_users(self, user_ids: Iterable[int]) -> List[str]:
         """
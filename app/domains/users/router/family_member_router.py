@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+from app.core.etag import ConditionalGet, conditional_get
 from app.db import get_db
 from app.domains.users.service.family_member_service import FamilyMemberService
 from app.domains.users.repository.user_repository import UserRepository
@@ -25,10 +26,11 @@ async def get_family_members(
     request: Request,
     family_id: int = Query(..., description="조회할 가족 ID"),
     authorization: str | None = Header(None, description="Firebase ID Token (Bearer <token>)"),
+    conditional: ConditionalGet = Depends(conditional_get),
     db: Session = Depends(get_db),
 ):
     service = FamilyMemberService(db)
-    return service.get_family_members(request, family_id, authorization)
+    return service.get_family_members(request, family_id, authorization, conditional)
 
 
 @router.get(
@@ -16,7 +16,7 @@ from app.schemas.error_schema import ErrorResponse
 class FcmTokenUpdateRequest(BaseModel):
     fcm_token: str
     device_id: Optional[str] = None
-    platform: Optional[str] = "android"
+    platform: Optional[str] = None
 
 
 # FCM 토큰 업데이트 응답 스키마
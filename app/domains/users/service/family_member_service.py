@@ -4,7 +4,10 @@ from datetime import datetime
 
 from app.domains.users.repository.user_repository import UserRepository
 from app.schemas.users.family_member_schema import FamilyMembersResponse, FamilyMember
+from app.core import change_log
+from app.core.etag import ConditionalGet
 from app.core.firebase import verify_firebase_token
+from app.core.responses import model_response
 
 
 class FamilyMemberService:
@@ -12,7 +15,13 @@ class FamilyMemberService:
         self.db = db
         self.user_repo = UserRepository(db)
 
-    def get_family_members(self, request: Request, family_id: int, authorization: str | None):
+    def get_family_members(
+        self,
+        request: Request,
+        family_id: int,
+        authorization: str | None,
+        conditional: ConditionalGet,
+    ):
 
         path = "/api/v1/users/family-members"
 
@@ -138,7 +147,19 @@ class FamilyMemberService:
             )
 
         # ------------------------------
-        # 5) family_id의 전체 멤버 조회
+        # 5) 조건부 GET: 구성원 변경은 가족 변경 기록으로, 닉네임 / 프로필은 users.updated_at 으로
+        # ------------------------------
+        head = self.user_repo.get_family_members_version(family_id)
+        version = None
+        family_version = change_log.settled_version(head.head_change_id, head.head_created_at)
+        if family_version is not None:
+            version = (family_version, head.profile_updated_at)
+        not_modified = conditional.evaluate("users.family_members", current_user_id, version)
+        if not_modified is not None:
+            return not_modified
+
+        # ------------------------------
+        # 6) family_id의 전체 멤버 + 프로필 조회
         # ------------------------------
         family_members = self.user_repo.get_family_members(family_id)
 
@@ -156,34 +177,33 @@ class FamilyMemberService:
             )
 
         # ------------------------------
-        # 6) 응답 변환
+        # 7) 응답 변환
         # ------------------------------
         member_schemas = []
 
         for fm in family_members:
-            fm_user = self.user_repo.get_user_by_id(fm.user_id)
-            if not fm_user:
-                continue
-
             member_schemas.append(
                 FamilyMember(
-                    user_id=fm_user.user_id,
-                    nickname=fm_user.nickname,
-                    profile_img_url=fm_user.profile_img_url,
+                    user_id=fm.user_id,
+                    nickname=fm.nickname,
+                    profile_img_url=fm.profile_img_url,
                     role=fm.role.value if hasattr(fm.role, "value") else fm.role,
                     is_myself=(fm.user_id == current_user_id),
                 )
             )
 
         # ------------------------------
-        # 7) 최종 응답 반환
+        # 8) 최종 응답 반환
         # ------------------------------
-        return FamilyMembersResponse(
-            success=True,
-            status=200,
-            family_id=family_id,
-            members=member_schemas,
-            total_count=len(member_schemas),
-            timeStamp=datetime.now(),
-            path=path,
+        return model_response(
+            FamilyMembersResponse(
+                success=True,
+                status=200,
+                family_id=family_id,
+                members=member_schemas,
+                total_count=len(member_schemas),
+                timeStamp=datetime.now(),
+                path=path,
+            ),
+            headers=conditional.headers(),
         )
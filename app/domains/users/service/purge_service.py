@@ -0,0 +1,223 @@
+# app/domains/users/service/purge_service.py
+
+import time
+from typing import Callable, List, Optional, Tuple
+
+from firebase_admin import auth as firebase_auth
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.domains.users.repository.purge_repository import PurgeRepository
+from app.models.activity_stat import ActivityStat
+from app.models.family import Family
+from app.models.family_member import FamilyMember
+from app.models.notification import Notification
+from app.models.notification_reads import NotificationRead
+from app.models.pet import Pet
+from app.models.pet_share_request import PetShareRequest
+from app.models.pet_walk_goal import PetWalkGoal
+from app.models.pet_walk_recommendation import PetWalkRecommendation
+from app.models.purge_job import PurgeJob
+from app.models.user import User
+from app.models.walk import Walk
+
+
+PURGE_ROWS_DELETED = metrics.counter("purge_rows_deleted_total", "purge 작업으로 삭제된 행 수", ["step"])
+PURGE_JOBS = metrics.counter("purge_jobs_total", "purge 작업 실행 결과", ["result"])
+
+# (deleted_rows, 다음 cursor). 다음 cursor 가 None 이면 단계 완료
+StepFn = Callable[[int], Tuple[int, Optional[int]]]
+
+
+class PurgeService:
+    """
+    삭제 요청(tombstone) 이후 연관 데이터 정리 (주기 배치용)
+
+    - 작업 종류(user / family / pet)별 단계를 FK 순서대로, 단계 안에서는 PK keyset 묶음 단위로 삭제
+    - 묶음마다 삭제 + 진행 상태(step / step_cursor / deleted_rows)를 한 트랜잭션으로 commit → 중단돼도 이어서 진행
+    - 시간 예산을 넘으면 현재 위치까지 저장하고 다음 실행에서 계속
+    - 실패하면 attempts 증가, PURGE_MAX_ATTEMPTS 에 도달하면 FAILED
+    """
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None, walk_chunk: Optional[int] = None):
+        self.db = db
+        self.repo = PurgeRepository(db)
+        self.batch_size = batch_size or settings.PURGE_BATCH_SIZE
+        self.walk_chunk = walk_chunk or settings.PURGE_WALK_CHUNK
+
+    def run(self, time_budget_sec: Optional[float] = None) -> dict:
+        budget = time_budget_sec if time_budget_sec is not None else settings.PURGE_TIME_BUDGET_SEC
+        deadline = time.monotonic() + budget
+
+        counts = {"done": 0, "paused": 0, "retry": 0, "failed": 0}
+        for job in self.repo.list_pending_jobs(limit=100):
+            if time.monotonic() >= deadline:
+                break
+            result = self._run_job(job, deadline)
+            counts[result] += 1
+            PURGE_JOBS.labels(result).inc()
+            if result == "paused":
+                break
+
+        print(f"[PURGE] {counts}")
+        return counts
+
+    # =====================================================
+    # 작업 1건 실행
+    # =====================================================
+    def _run_job(self, job: PurgeJob, deadline: float) -> str:
+        job_id = job.job_id
+        try:
+            steps = self._steps(job)
+            names = [name for name, _ in steps]
+            start = names.index(job.step) if job.step in names else 0
+
+            for name, step in steps[start:]:
+                if job.step != name:
+                    job.step = name
+                    job.step_cursor = 0
+
+                while True:
+                    if time.monotonic() >= deadline:
+                        self.db.commit()
+                        return "paused"
+
+                    deleted, next_cursor = step(job.step_cursor)
+                    if next_cursor is None:
+                        break
+                    job.step_cursor = next_cursor
+                    job.deleted_rows += deleted
+                    self.db.commit()
+                    PURGE_ROWS_DELETED.labels(name).inc(deleted)
+
+            self.repo.mark_done(job)
+            self.db.commit()
+            print(f"[PURGE] job {job_id} ({job.kind} {job.target_id}) done: {job.deleted_rows} rows")
+            return "done"
+
+        except Exception as e:
+            print(f"PURGE_JOB_ERROR: job {job_id}:", e)
+            self.db.rollback()
+            job.attempts += 1
+            job.last_error = str(e)[:255]
+            if job.attempts >= settings.PURGE_MAX_ATTEMPTS:
+                job.status = "FAILED"
+            self.db.commit()
+            return "failed" if job.status == "FAILED" else "retry"
+
+    # =====================================================
+    # 작업 종류별 단계 (FK 참조 순서)
+    # =====================================================
+    def _steps(self, job: PurgeJob) -> List[Tuple[str, StepFn]]:
+        if job.kind == "user":
+            user_id = job.target_id
+            return [
+                ("share_requests", self._share_request_step(PetShareRequest.requester_id == user_id)),
+                ("notification_reads", self._keyset_step(
+                    NotificationRead, NotificationRead.id, NotificationRead.user_id == user_id
+                )),
+                ("family_members", self._keyset_step(
+                    FamilyMember, FamilyMember.member_id, FamilyMember.user_id == user_id
+                )),
+                ("firebase", self._firebase_step(job.firebase_uid)),
+                ("user", self._keyset_step(User, User.user_id, User.user_id == user_id)),
+            ]
+
+        if job.kind == "pet":
+            pet_ids = [job.target_id]
+            notification_condition = Notification.related_pet_id.in_(pet_ids)
+        elif job.kind == "family":
+            pet_ids = self.repo.get_family_pet_ids(job.target_id)
+            notification_condition = or_(
+                Notification.family_id == job.target_id,
+                Notification.related_pet_id.in_(pet_ids),
+            )
+        else:
+            raise ValueError(f"unknown purge kind: {job.kind}")
+
+        steps = [
+            ("walks", self._walk_step(pet_ids)),
+            ("activity_stats", self._keyset_step(
+                ActivityStat, ActivityStat.stats_id, ActivityStat.pet_id.in_(pet_ids)
+            )),
+            ("walk_goals", self._keyset_step(
+                PetWalkGoal, PetWalkGoal.goal_id, PetWalkGoal.pet_id.in_(pet_ids)
+            )),
+            ("walk_recommendations", self._keyset_step(
+                PetWalkRecommendation, PetWalkRecommendation.rec_id, PetWalkRecommendation.pet_id.in_(pet_ids)
+            )),
+            ("share_requests", self._share_request_step(PetShareRequest.pet_id.in_(pet_ids))),
+            ("notifications", self._notification_step(notification_condition)),
+            ("pets", self._keyset_step(Pet, Pet.pet_id, Pet.pet_id.in_(pet_ids))),
+        ]
+        if job.kind == "family":
+            steps += [
+                ("family_members", self._keyset_step(
+                    FamilyMember, FamilyMember.member_id, FamilyMember.family_id == job.target_id
+                )),
+                ("family", self._keyset_step(Family, Family.family_id, Family.family_id == job.target_id)),
+            ]
+        return steps
+
+    def _keyset_step(self, model, pk, condition) -> StepFn:
+        def step(cursor: int):
+            ids = self.repo.next_ids(pk, condition, cursor, self.batch_size)
+            if not ids:
+                return 0, None
+            return self.repo.delete_ids(model, pk, ids), ids[-1]
+
+        return step
+
+    def _walk_step(self, pet_ids: List[int]) -> StepFn:
+        def step(cursor: int):
+            walk_ids = self.repo.next_ids(Walk.walk_id, Walk.pet_id.in_(pet_ids), cursor, self.walk_chunk)
+            if not walk_ids:
+                return 0, None
+            # 경로 포인트가 남아 있으면 같은 산책 묶음을 다시 (cursor 유지)
+            deleted = self.repo.delete_walk_points(walk_ids, self.batch_size)
+            if deleted:
+                return deleted, cursor
+            deleted = (
+                self.repo.delete_walk_archives(walk_ids)
+                + self.repo.delete_walk_photos(walk_ids)
+                + self.repo.delete_walks(walk_ids)
+            )
+            return deleted, walk_ids[-1]
+
+        return step
+
+    def _share_request_step(self, condition) -> StepFn:
+        def step(cursor: int):
+            request_ids = self.repo.next_ids(PetShareRequest.request_id, condition, cursor, self.batch_size)
+            if not request_ids:
+                return 0, None
+            # 요청을 참조하는 알림(+읽음 기록)을 먼저
+            deleted = self.repo.delete_notifications(self.repo.get_notification_ids_for_requests(request_ids))
+            deleted += self.repo.delete_ids(PetShareRequest, PetShareRequest.request_id, request_ids)
+            return deleted, request_ids[-1]
+
+        return step
+
+    def _notification_step(self, condition) -> StepFn:
+        def step(cursor: int):
+            ids = self.repo.next_ids(Notification.notification_id, condition, cursor, self.batch_size)
+            if not ids:
+                return 0, None
+            return self.repo.delete_notifications(ids), ids[-1]
+
+        return step
+
+    @staticmethod
+    def _firebase_step(firebase_uid: Optional[str]) -> StepFn:
+        def step(cursor: int):
+            # 요청 처리 중 commit 후 이미 삭제했을 수 있음 (없으면 무시)
+            if firebase_uid:
+                try:
+                    firebase_auth.delete_user(firebase_uid)
+                except firebase_auth.UserNotFoundError:
+                    pass
+            return 0, None
+
+        return step
@@ -200,7 +200,7 @@ class UserService:
         fcm_token: str,
         db: Session,
         device_id: Optional[str] = None,
-        platform: Optional[str] = "android",
+        platform: Optional[str] = None,
     ):
         """FCM 푸시 알림 토큰을 업데이트합니다."""
         path = request.url.path
@@ -263,7 +263,7 @@ class UserService:
                 user=user,
                 fcm_token=fcm_token,
                 device_id=device_id,
-                platform=platform or "android",
+                platform=platform,
             )
             db.commit()
             db.refresh(user)
@@ -105,6 +105,13 @@ SAVE_ERRORS: Dict[str, WalkError] = {
     "WALK_SAVE_500_1": WalkError(500, "WALK_SAVE_500_1", "산책 기록 저장 중 오류가 발생했습니다."),
 }
 
+BULK_SAVE_ERRORS: Dict[str, WalkError] = {
+    "WALK_BULK_401_1": WalkError(401, "WALK_BULK_401_1", "Authorization 헤더가 필요합니다."),
+    "WALK_BULK_401_2": WalkError(401, "WALK_BULK_401_2", "Authorization 헤더는 'Bearer <token>' 형식이어야 합니다."),
+    "WALK_BULK_404_1": WalkError(404, "WALK_BULK_404_1", "해당 사용자를 찾을 수 없습니다."),
+    "WALK_BULK_500_1": WalkError(500, "WALK_BULK_500_1", "산책 기록 일괄 저장 중 오류가 발생했습니다."),
+}
+
 NOTIFY_ERRORS: Dict[str, WalkError] = {
     "WALK_NOTIFY_401_1": WalkError(401, "WALK_NOTIFY_401_1", "Authorization 헤더가 필요합니다."),
     "WALK_NOTIFY_401_2": WalkError(401, "WALK_NOTIFY_401_2", "Authorization 헤더는 'Bearer <token>' 형식이어야 합니다."),
@@ -136,6 +143,7 @@ WALK_ERRORS: Dict[str, WalkError] = {
     **RECOMMEND_ERRORS,
     **SESSION_ERRORS,
     **SAVE_ERRORS,
+    **BULK_SAVE_ERRORS,
     **NOTIFY_ERRORS,
     **WEATHER_ERRORS,
     **TODAY_ERRORS,
@@ -379,6 +387,19 @@ SAVE_RESPONSES = {
     })}}},
 }
 
+BULK_SAVE_RESPONSES = {
+    401: {"model": ErrorResponse, "content": {"application/json": {"examples": _examples("/api/v1/walks/bulk", {
+        "WALK_BULK_401_1": BULK_SAVE_ERRORS["WALK_BULK_401_1"],
+        "WALK_BULK_401_2": BULK_SAVE_ERRORS["WALK_BULK_401_2"],
+    })}}},
+    404: {"model": ErrorResponse, "content": {"application/json": {"examples": _examples("/api/v1/walks/bulk", {
+        "WALK_BULK_404_1": BULK_SAVE_ERRORS["WALK_BULK_404_1"],
+    })}}},
+    500: {"model": ErrorResponse, "content": {"application/json": {"examples": _examples("/api/v1/walks/bulk", {
+        "WALK_BULK_500_1": BULK_SAVE_ERRORS["WALK_BULK_500_1"],
+    })}}},
+}
+
 NOTIFY_RESPONSES = {
     401: {"model": ErrorResponse, "content": {"application/json": {"examples": _examples("/api/v1/walk/notify", {
         "WALK_NOTIFY_401_1": NOTIFY_ERRORS["WALK_NOTIFY_401_1"],
@@ -1,11 +1,33 @@
 # app/domains/walk/repository/ranking_repository.py
 
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc   \
+from sqlalchemy import func, desc
 
 from app.models.walk import Walk
 from app.models.family_member import FamilyMember
 from app.models.pet import Pet
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class RankingRow:
+    """랭킹 집계 1행 (유저 프로필 포함)"""
+    user_id: int
+    nickname: str
+    profile_img_url: Optional[str]
+    total_distance_km: float
+    total_duration_min: int
+    walk_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class RankingPet:
+    pet_id: int
+    name: str
+    image_url: Optional[str]
 
 
 class RankingRepository:
@@ -19,16 +41,24 @@ class RankingRepository:
             .all()
         )
 
-    def check_family_exists(self, family_id: int):
+    def check_family_exists(self, family_id: int) -> bool:
         return (
-            self.db.query(FamilyMember)
+            self.db.query(FamilyMember.member_id)
             .filter(FamilyMember.family_id == family_id)
             .first()
-        )
+        ) is not None
+
+    def is_family_member(self, family_id: int, user_id: int) -> bool:
+        return (
+            self.db.query(FamilyMember.member_id)
+            .filter(FamilyMember.family_id == family_id)
+            .filter(FamilyMember.user_id == user_id)
+            .first()
+        ) is not None
 
-    def get_walk_stats(self, user_ids, start_dt, end_dt, pet_id=None):
+    def get_walk_stats(self, user_ids, start_dt, end_dt, pet_id=None) -> List[RankingRow]:
         """
-        각 user_id 별로 이번 기간 동안의
+        각 user_id 별로 (닉네임 / 프로필 이미지와 함께) 이번 기간 동안의
         - 총 거리(km)
         - 총 시간(min)
         - 산책 횟수
@@ -44,20 +74,23 @@ class RankingRepository:
         query = (
             self.db.query(
                 Walk.user_id,
+                User.nickname,
+                User.profile_img_url,
                 func.coalesce(func.sum(Walk.distance_km), 0).label("total_distance_km"),
                 func.coalesce(func.sum(Walk.duration_min), 0).label("total_duration_min"),  # ✅ 컬럼명 수정
                 func.count(Walk.walk_id).label("walk_count"),
             )
+            .join(User, User.user_id == Walk.user_id)
             .filter(Walk.user_id.in_(user_ids))
             .filter(Walk.start_time >= start_dt)
-            .filter(Walk.start_time < end_dt)  
+            .filter(Walk.start_time < end_dt)
         )
 
         if pet_id is not None:
             query = query.filter(Walk.pet_id == pet_id)
 
         query = (
-            query.group_by(Walk.user_id)
+            query.group_by(Walk.user_id, User.nickname, User.profile_img_url)
             .order_by(
                 desc("total_distance_km"),  
                 desc("total_duration_min"),
@@ -65,20 +98,30 @@ class RankingRepository:
             )
         )
 
-        return query.all()
+        return [RankingRow(*r) for r in query.all()]
 
-    def get_user_pets(self, user_id, start_dt, end_dt):
-        """유저가 이번 기간 동안 산책한 pet 목록"""
-        return (
+    def get_users_pets(self, user_ids, start_dt, end_dt) -> Dict[int, List[RankingPet]]:
+        """유저별로 이번 기간 동안 산책한 pet 목록 (유저 수와 상관없이 쿼리 1번)"""
+        if not user_ids:
+            return {}
+
+        rows = (
             self.db.query(
+                Walk.user_id,
                 Pet.pet_id,
                 Pet.name,
                 Pet.image_url,
             )
             .join(Walk, Walk.pet_id == Pet.pet_id)
-            .filter(Walk.user_id == user_id)
+            .filter(Walk.user_id.in_(user_ids))
             .filter(Walk.start_time >= start_dt)
-            .filter(Walk.start_time < end_dt) 
-            .group_by(Pet.pet_id, Pet.name, Pet.image_url) 
+            .filter(Walk.start_time < end_dt)
+            .group_by(Walk.user_id, Pet.pet_id, Pet.name, Pet.image_url)
+            .order_by(Walk.user_id, Pet.pet_id)
             .all()
         )
+
+        pets: Dict[int, List[RankingPet]] = {}
+        for user_id, pet_id, name, image_url in rows:
+            pets.setdefault(user_id, []).append(RankingPet(pet_id, name, image_url))
+        return pets
@@ -1,17 +1,22 @@
 from sqlalchemy.orm import Session
-from app.models.pet_walk_recommendation import PetWalkRecommendation
+from typing import Optional
+
+from app.core.pet_profiles import PetProfile, get_pet_profile
+from app.models.family_member import FamilyMember
 
 
 class RecommendationRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_recommendation_by_pet_id(self, pet_id: int) -> PetWalkRecommendation | None:
-        """pet_id로 추천 산책 정보 조회"""
+    def get_pet_profile(self, pet_id: int) -> Optional[PetProfile]:
+        """펫 + 추천 산책 정보 (프로필 캐시, 미스일 때만 조회)"""
+        return get_pet_profile(self.db, pet_id)
+
+    def is_family_member(self, family_id: int, user_id: int) -> bool:
         return (
-            self.db.query(PetWalkRecommendation)
-            .filter(PetWalkRecommendation.pet_id == pet_id)
+            self.db.query(FamilyMember.member_id)
+            .filter(FamilyMember.family_id == family_id)
+            .filter(FamilyMember.user_id == user_id)
             .first()
-        )
-
-
+        ) is not None
@@ -0,0 +1,106 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert, text
+from datetime import datetime
+from typing import Dict, List, Set
+
+from app.models.walk import Walk
+from app.models.walk_route_archive import WalkRouteArchive
+from app.models.walk_tracking_point import WalkTrackingPoint
+
+
+class RouteArchiveRepository:
+    """오래된 산책 경로를 walk_route_archives 로 옮기는 배치용"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # =====================================================
+    # 대상: 종료된 지 오래됐는데 hot 행이 남아 있는 산책 (walk_id keyset)
+    # =====================================================
+    def list_candidate_walk_ids(self, cutoff: datetime, after_walk_id: int, limit: int) -> List[int]:
+        has_points = exists().where(WalkTrackingPoint.walk_id == Walk.walk_id)
+        rows = (
+            self.db.query(Walk.walk_id)
+            .filter(
+                Walk.walk_id > after_walk_id,
+                Walk.end_time.isnot(None),
+                Walk.end_time < cutoff,
+                has_points,
+            )
+            .order_by(Walk.walk_id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [r[0] for r in rows]
+
+    def get_archived_walk_ids(self, walk_ids: List[int]) -> Set[int]:
+        if not walk_ids:
+            return set()
+        rows = (
+            self.db.query(WalkRouteArchive.walk_id)
+            .filter(WalkRouteArchive.walk_id.in_(walk_ids))
+            .all()
+        )
+        return {r[0] for r in rows}
+
+    def list_points(self, walk_ids: List[int]) -> Dict[int, list]:
+        """walk_id → [(point_id, latitude, longitude, timestamp), ...] (시간순)"""
+        points: Dict[int, list] = {walk_id: [] for walk_id in walk_ids}
+        if not walk_ids:
+            return points
+        rows = (
+            self.db.query(
+                WalkTrackingPoint.walk_id,
+                WalkTrackingPoint.point_id,
+                WalkTrackingPoint.latitude,
+                WalkTrackingPoint.longitude,
+                WalkTrackingPoint.timestamp,
+            )
+            .filter(WalkTrackingPoint.walk_id.in_(walk_ids))
+            .order_by(
+                WalkTrackingPoint.walk_id,
+                WalkTrackingPoint.timestamp,
+                WalkTrackingPoint.point_id,
+            )
+            .all()
+        )
+        for walk_id, point_id, lat, lng, ts in rows:
+            points[walk_id].append((point_id, lat, lng, ts))
+        return points
+
+    def insert_archives(self, rows: List[dict]) -> None:
+        if rows:
+            self.db.execute(insert(WalkRouteArchive), rows)
+
+    # =====================================================
+    # hot 행 삭제 (PK 묶음 단위, 0 이 될 때까지 반복 호출)
+    # =====================================================
+    def delete_points(self, walk_ids: List[int], limit: int) -> int:
+        point_ids = [
+            r[0] for r in (
+                self.db.query(WalkTrackingPoint.point_id)
+                .filter(WalkTrackingPoint.walk_id.in_(walk_ids))
+                .limit(limit)
+                .all()
+            )
+        ]
+        if not point_ids:
+            return 0
+        return (
+            self.db.query(WalkTrackingPoint)
+            .filter(WalkTrackingPoint.point_id.in_(point_ids))
+            .delete(synchronize_session=False)
+        )
+
+    # =====================================================
+    # 파티션 삭제 전 확인: 보관본 없는 산책의 행이 남아 있는지 (MySQL 파티션 지정 조회)
+    # =====================================================
+    def has_unarchived_points(self, partition: str) -> bool:
+        row = self.db.execute(
+            text(
+                f"SELECT 1 FROM walk_tracking_points PARTITION ({partition}) p "
+                "LEFT JOIN walk_route_archives a ON a.walk_id = p.walk_id "
+                "WHERE a.walk_id IS NULL LIMIT 1"
+            )
+        ).first()
+        return row is not None
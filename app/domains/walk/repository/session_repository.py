@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import DateTime, Float, bindparam, case, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, List, Optional, Set
 import json
 
+from app.models.pet import Pet
+from app.models.family_member import FamilyMember
 from app.models.walk import Walk
 from app.models.walk_tracking_point import WalkTrackingPoint
 from app.models.activity_stat import ActivityStat
+from app.core import change_log
+from app.core.upsert import upsert
 
 
 class SessionRepository:
@@ -17,17 +22,19 @@ class SessionRepository:
     # 진행 중인 산책 가져오기
     # =====================================================
     def get_ongoing_walk_by_pet_id(self, pet_id: int) -> Walk | None:
+        # active_pet_id 는 진행 중일 때만 pet_id (unique index 조회)
         return (
             self.db.query(Walk)
-            .filter(
-                and_(
-                    Walk.pet_id == pet_id,
-                    Walk.end_time.is_(None)
-                )
-            )
+            .filter(Walk.active_pet_id == pet_id)
             .first()
         )
 
+    @staticmethod
+    def is_active_walk_conflict(error: IntegrityError) -> bool:
+        """create_walk 의 IntegrityError 가 '이미 진행 중인 산책' unique 위반인지"""
+        message = str(getattr(error, "orig", error))
+        return "uq_walks_active_pet" in message or "active_pet_id" in message
+
     # =====================================================
     # Walk 세션 생성
     # =====================================================
@@ -65,6 +72,56 @@ class SessionRepository:
         self.db.add(point)
         return point
 
+    # =====================================================
+    # 진행 중인 산책에만 위치 저장 (INSERT ... SELECT 단일 문)
+    # =====================================================
+    def create_tracking_point_if_active(
+        self,
+        walk_id: int,
+        family_id: int,
+        user_id: int,
+        latitude: float,
+        longitude: float,
+        timestamp: datetime,
+    ) -> Optional[int]:
+        """
+        walks 행이 진행 중이고 user_id 가 family_id 구성원일 때만 INSERT 하고 point_id 반환.
+        종료/삭제된 산책이거나 구성원이 아니면 None (별도 SELECT 없이 DB 가 판단)
+        """
+        is_member = (
+            select(FamilyMember.member_id)
+            .where(FamilyMember.family_id == family_id, FamilyMember.user_id == user_id)
+            .exists()
+        )
+        source = (
+            select(
+                Walk.walk_id,
+                literal(latitude, Float),
+                literal(longitude, Float),
+                literal(timestamp, DateTime),
+            )
+            .where(Walk.walk_id == walk_id, Walk.end_time.is_(None), is_member)
+        )
+        result = self.db.execute(
+            insert(WalkTrackingPoint).from_select(
+                ["walk_id", "latitude", "longitude", "timestamp"], source
+            )
+        )
+        if not result.rowcount:
+            return None
+        return result.lastrowid
+
+    # =====================================================
+    # 가족 구성원 여부 (권한 확인은 캐시가 아닌 DB 기준)
+    # =====================================================
+    def is_family_member(self, family_id: int, user_id: int) -> bool:
+        return (
+            self.db.query(FamilyMember.member_id)
+            .filter(FamilyMember.family_id == family_id, FamilyMember.user_id == user_id)
+            .first()
+            is not None
+        )
+
     # =====================================================
     # walk_id 기준 Walk 조회
     # =====================================================
@@ -110,54 +167,142 @@ class SessionRepository:
         return walk
 
     # =====================================================
-    # 특정 날짜 ActivityStat 조회 or 생성
+    # 특정 날짜 ActivityStat 누적 (단일 upsert 문)
     # =====================================================
-    def get_or_create_activity_stat(
+    def increment_activity_stat(
         self,
         pet_id: int,
         stat_date: date,
+        distance_km: float,
+        duration_min: int,
+        walks: int = 1,
     ) -> ActivityStat:
-        stat = (
+        """
+        (pet_id, date) unique 키 기준 INSERT ... ON DUPLICATE KEY UPDATE 로
+        산책 walks 회분을 DB 안에서 더함 (동시 종료에도 누락/중복 행 없음)
+        """
+        table = ActivityStat.__table__
+        c = table.c
+        first_speed = distance_km / (duration_min / 60.0) if duration_min else None
+
+        def assignments(inserted):
+            new_distance = func.coalesce(c.total_distance_km, 0) + inserted("total_distance_km")
+            new_duration = func.coalesce(c.total_duration_min, 0) + inserted("total_duration_min")
+            return [
+                # 평균 속도는 갱신 전 값 기준으로 먼저 계산 (MySQL 은 SET 을 왼쪽부터 적용)
+                ("avg_speed_kmh", case(
+                    (new_duration > 0, new_distance / (new_duration / 60.0)),
+                    else_=c.avg_speed_kmh,
+                )),
+                ("total_walks", func.coalesce(c.total_walks, 0) + inserted("total_walks")),
+                ("total_distance_km", new_distance),
+                ("total_duration_min", new_duration),
+                ("updated_at", func.now()),
+            ]
+
+        upsert(
+            self.db,
+            ActivityStat,
+            {
+                "pet_id": pet_id,
+                "date": stat_date,
+                "total_walks": walks,
+                "total_distance_km": distance_km,
+                "total_duration_min": duration_min,
+                "avg_speed_kmh": first_speed,
+            },
+            conflict_columns=("pet_id", "date"),
+            update=assignments,
+        )
+
+        return (
             self.db.query(ActivityStat)
             .filter(
-                and_(
-                    ActivityStat.pet_id == pet_id,
-                    ActivityStat.date == stat_date
-                )
+                ActivityStat.pet_id == pet_id,
+                ActivityStat.date == stat_date,
             )
-            .first()
+            .populate_existing()
+            .one()
         )
-        
-        if not stat:
-            stat = ActivityStat(
-                pet_id=pet_id,
-                date=stat_date,
-                total_walks=0,
-                total_distance_km=0,
-                total_duration_min=0,
-            )
-            self.db.add(stat)
-            self.db.flush()
-        
-        return stat
 
     # =====================================================
-    # ActivityStat 업데이트
+    # 방치된 산책 자동 종료 (배치용)
     # =====================================================
-    def update_activity_stat(
-        self,
-        stat: ActivityStat,
-        distance_km: float,
-        duration_min: int,
-    ) -> ActivityStat:
+    def list_stale_walks(self, cutoff: datetime, after_walk_id: int, limit: int):
+        """
+        진행 중인 산책 중 마지막 위치(없으면 시작 시각)가 cutoff 보다 오래된 것을 walk_id keyset 페이지로 조회
+        (walk_id, pet_id, start_time, weight, last_point_at)
+        """
+        last_point_at = func.max(WalkTrackingPoint.timestamp)
+        return (
+            self.db.query(
+                Walk.walk_id,
+                Walk.pet_id,
+                Walk.start_time,
+                Pet.weight,
+                last_point_at.label("last_point_at"),
+            )
+            .join(Pet, Pet.pet_id == Walk.pet_id)
+            .outerjoin(WalkTrackingPoint, WalkTrackingPoint.walk_id == Walk.walk_id)
+            .filter(
+                Walk.active_pet_id.isnot(None),
+                Walk.walk_id > after_walk_id,
+            )
+            .group_by(Walk.walk_id, Walk.pet_id, Walk.start_time, Pet.weight)
+            .having(func.coalesce(last_point_at, Walk.start_time) < cutoff)
+            .order_by(Walk.walk_id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def lock_open_walks(self, walk_ids: List[int]) -> Set[int]:
+        """배치 트랜잭션 안에서 아직 진행 중인 산책만 잠그고 ID 반환 (사용자 종료와 경합 방지)"""
+        if not walk_ids:
+            return set()
+        rows = (
+            self.db.query(Walk.walk_id)
+            .filter(Walk.walk_id.in_(walk_ids), Walk.end_time.is_(None))
+            .with_for_update()
+            .all()
+        )
+        return {r.walk_id for r in rows}
+
+    def list_points_for_walks(self, walk_ids: List[int]) -> Dict[int, list]:
+        """walk_id → [(latitude, longitude, timestamp), ...] (시간순)"""
+        points: Dict[int, list] = {walk_id: [] for walk_id in walk_ids}
+        if not walk_ids:
+            return points
+        rows = (
+            self.db.query(
+                WalkTrackingPoint.walk_id,
+                WalkTrackingPoint.latitude,
+                WalkTrackingPoint.longitude,
+                WalkTrackingPoint.timestamp,
+            )
+            .filter(WalkTrackingPoint.walk_id.in_(walk_ids))
+            .order_by(
+                WalkTrackingPoint.walk_id,
+                WalkTrackingPoint.timestamp,
+                WalkTrackingPoint.point_id,
+            )
+            .all()
+        )
+        for walk_id, lat, lng, ts in rows:
+            points[walk_id].append((float(lat), float(lng), ts))
+        return points
 
-        stat.total_walks += 1
-        stat.total_distance_km += distance_km
-        stat.total_duration_min += duration_min
-        
-        # 평균 속도 (km/h)
-        if stat.total_duration_min > 0:
-            total_hours = stat.total_duration_min / 60.0
-            stat.avg_speed_kmh = float(stat.total_distance_km) / total_hours
-        
-        return stat
+    def bulk_close_walks(self, rows: List[dict]) -> int:
+        """rows: walk_id + end_time/duration_min/distance_km/calories/last_lat/last_lng (executemany 한 번)"""
+        if not rows:
+            return 0
+        table = Walk.__table__
+        fields = [k for k in rows[0].keys() if k != "walk_id"]
+        stmt = (
+            update(table)
+            .where(table.c.walk_id == bindparam("b_walk_id"), table.c.end_time.is_(None))
+            .values({f: bindparam(f) for f in fields})
+        )
+        params = [{**{f: r[f] for f in fields}, "b_walk_id": r["walk_id"]} for r in rows]
+        self.db.execute(stmt, params)
+        change_log.record_ids(self.db, Walk, [r["walk_id"] for r in rows])
+        return len(rows)
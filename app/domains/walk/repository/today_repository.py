@@ -1,21 +1,191 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from dataclasses import dataclass
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, case, func
 from datetime import datetime
-from typing import Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
 
+import pytz
+
+from app.core import metrics
+from app.core.config import settings
+from app.models.family_member import FamilyMember
+from app.models.pet import Pet
 from app.models.walk import Walk
 
 
+# (total_walks, total_duration_min, total_distance_km, current_walk_order, has_ongoing_walk)
+TodayStats = Tuple[int, int, float, int, bool]
+EMPTY_TODAY_STATS: TodayStats = (0, 0, 0.0, 1, False)
+
+KST = pytz.timezone("Asia/Seoul")
+
+TODAY_COUNTER_LOOKUPS = metrics.counter(
+    "today_counter_lookups_total", "오늘 산책 카운터 캐시 조회 (hit/miss)", ("result",)
+)
+
+
+def kst_date_str(dt: datetime) -> str:
+    """naive 는 UTC 로 보고 KST 날짜 문자열로 변환"""
+    if dt.tzinfo is None:
+        dt = pytz.UTC.localize(dt)
+    return dt.astimezone(KST).date().isoformat()
+
+
+class TodayCounterCache:
+    """
+    반려동물별 "오늘(KST)" 산책 카운터 캐시
+
+    - 키는 (pet_id), 값에 날짜를 함께 저장해 KST 자정이 지나면 자동으로 미스
+    - 산책 시작/종료/저장 시 commit 후 증분 반영 (같은 날 시작된 산책만)
+    - 다른 워커의 변경은 ttl_sec 안에 반영 (미스 시 집계 쿼리로 다시 적재)
+    - 적재 중 증분/무효화가 끼어들면 그 적재 결과는 버림
+    """
+
+    def __init__(self, ttl_sec: float = 60.0, max_pets: int = 50000, clock: Callable[[], float] = time.monotonic):
+        self.ttl_sec = ttl_sec
+        self.max_pets = max_pets
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Tuple[str, float, TodayStats]] = {}
+        self._version = 0
+
+    def get_many(self, pet_ids: Iterable[int], date_str: str) -> Tuple[Dict[int, TodayStats], List[int], int]:
+        """(캐시 적중분, 미스 pet_id 목록, 적재용 version)"""
+        now = self.clock()
+        hits: Dict[int, TodayStats] = {}
+        misses: List[int] = []
+        with self._lock:
+            for pet_id in pet_ids:
+                entry = self._entries.get(pet_id)
+                if entry is not None and entry[0] == date_str and entry[1] > now:
+                    hits[pet_id] = entry[2]
+                else:
+                    misses.append(pet_id)
+            version = self._version
+        if hits:
+            TODAY_COUNTER_LOOKUPS.labels("hit").inc(len(hits))
+        if misses:
+            TODAY_COUNTER_LOOKUPS.labels("miss").inc(len(misses))
+        return hits, misses, version
+
+    def store_many(self, stats: Dict[int, TodayStats], date_str: str, version: int) -> None:
+        expires_at = self.clock() + self.ttl_sec
+        with self._lock:
+            if version != self._version:
+                return
+            if len(self._entries) + len(stats) > self.max_pets:
+                # 날짜가 지난 항목부터 정리, 그래도 많으면 전체 비움
+                self._entries = {k: v for k, v in self._entries.items() if v[0] == date_str}
+                if len(self._entries) + len(stats) > self.max_pets:
+                    self._entries.clear()
+            for pet_id, value in stats.items():
+                self._entries[pet_id] = (date_str, expires_at, value)
+
+    def _update(self, pet_id: int, start_time: datetime, apply: Callable[[TodayStats], Optional[TodayStats]]) -> None:
+        with self._lock:
+            self._version += 1
+            entry = self._entries.get(pet_id)
+            if entry is None:
+                return
+            date_str, expires_at, value = entry
+            if kst_date_str(start_time) != date_str:
+                # 오늘 시작된 산책이 아니면 오늘 카운터는 그대로
+                return
+            updated = apply(value)
+            if updated is None:
+                del self._entries[pet_id]
+            else:
+                self._entries[pet_id] = (date_str, expires_at, updated)
+
+    def on_walk_started(self, pet_id: int, start_time: datetime) -> None:
+        def apply(value: TodayStats) -> TodayStats:
+            total_walks, duration, distance, _, _ = value
+            return total_walks, duration, distance, total_walks + 1, True
+
+        self._update(pet_id, start_time, apply)
+
+    def on_walk_ended(self, pet_id: int, start_time: datetime, duration_min: Optional[int], distance_km: Optional[float]) -> None:
+        def apply(value: TodayStats) -> TodayStats:
+            total_walks, duration, distance, _, _ = value
+            total_walks += 1
+            return (
+                total_walks,
+                duration + (duration_min or 0),
+                distance + float(distance_km or 0),
+                total_walks + 1,
+                False,
+            )
+
+        self._update(pet_id, start_time, apply)
+
+    def on_walk_saved(self, pet_id: int, start_time: datetime, duration_min: Optional[int], distance_km: Optional[float]) -> None:
+        """완료된 산책을 한 번에 저장한 경우. 진행 중 산책이 있으면 순서가 바뀔 수 있어 무효화"""
+        def apply(value: TodayStats) -> Optional[TodayStats]:
+            total_walks, duration, distance, _, has_ongoing = value
+            if has_ongoing:
+                return None
+            total_walks += 1
+            return (
+                total_walks,
+                duration + (duration_min or 0),
+                distance + float(distance_km or 0),
+                total_walks + 1,
+                False,
+            )
+
+        self._update(pet_id, start_time, apply)
+
+    def invalidate(self, pet_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._version += 1
+            for pet_id in pet_ids:
+                self._entries.pop(pet_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+
+today_counters = TodayCounterCache(ttl_sec=settings.TODAY_COUNTER_TTL_SEC)
+
+
+@dataclass(frozen=True, slots=True)
+class PetAccess:
+    """반려동물 존재 + 요청자 가족 구성원 여부 (member_id 가 None 이면 구성원 아님)"""
+    pet_id: int
+    family_id: int
+    member_id: Optional[int]
+
+
 class TodayRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def get_pet_access(self, pet_id: int, user_id: int) -> Optional[PetAccess]:
+        """반려동물 조회 + 권한 체크를 컬럼만 골라 쿼리 1번으로 (반려동물이 없으면 None)"""
+        row = (
+            self.db.query(Pet.pet_id, Pet.family_id, FamilyMember.member_id)
+            .outerjoin(
+                FamilyMember,
+                and_(
+                    FamilyMember.family_id == Pet.family_id,
+                    FamilyMember.user_id == user_id,
+                ),
+            )
+            .filter(Pet.pet_id == pet_id)
+            .first()
+        )
+        return PetAccess(*row) if row else None
+
     def get_today_walks_stats(
         self, pet_id: int, today_start: datetime, today_end: datetime
-    ) -> Tuple[int, int, float, int, bool]:
+    ) -> TodayStats:
         """
         오늘 날짜 기준으로 산책 통계를 조회합니다.
-        
+
         Returns:
             Tuple[int, int, float, int, bool]:
             - total_walks: 완료된 산책 횟수
@@ -24,40 +194,71 @@ class TodayRepository:
             - current_walk_order: 현재 산책 순서
             - has_ongoing_walk: 진행 중인 산책이 있는지
         """
-        # 오늘 시작된 모든 산책 조회 (완료 여부와 관계없이, start_time으로 정렬)
-        all_today_walks = (
-            self.db.query(Walk)
+        return self.get_today_walks_stats_for_pets([pet_id], today_start, today_end)[pet_id]
+
+    def get_today_walks_stats_for_pets(
+        self, pet_ids: List[int], today_start: datetime, today_end: datetime
+    ) -> Dict[int, TodayStats]:
+        """
+        여러 반려동물의 오늘 산책 통계를 집계 쿼리 1번으로 조회합니다.
+        반환 값의 튜플 형식은 get_today_walks_stats 와 같습니다.
+
+        진행 중인 산책은 펫당 1개(uq_walks_active_pet)이므로 그 산책을 붙여
+        "진행 중 산책보다 먼저 시작된 오늘 산책 수 + 1" 로 현재 순서를 계산합니다.
+        """
+        stats = {pet_id: EMPTY_TODAY_STATS for pet_id in pet_ids}
+        if not pet_ids:
+            return stats
+
+        ongoing = aliased(Walk)
+        completed = Walk.end_time.isnot(None)
+        rows = (
+            self.db.query(
+                Walk.pet_id,
+                func.sum(case((completed, 1), else_=0)).label("total_walks"),
+                func.sum(case((completed, func.coalesce(Walk.duration_min, 0)), else_=0)).label("total_duration_min"),
+                func.sum(case((completed, func.coalesce(Walk.distance_km, 0)), else_=0)).label("total_distance_km"),
+                func.sum(case((Walk.start_time < ongoing.start_time, 1), else_=0)).label("walks_before_ongoing"),
+                func.max(ongoing.walk_id).label("ongoing_walk_id"),
+            )
+            .outerjoin(
+                ongoing,
+                and_(
+                    ongoing.active_pet_id == Walk.pet_id,
+                    ongoing.start_time >= today_start,
+                    ongoing.start_time < today_end,
+                ),
+            )
             .filter(
                 and_(
-                    Walk.pet_id == pet_id,
+                    Walk.pet_id.in_(pet_ids),
                     Walk.start_time >= today_start,
                     Walk.start_time < today_end
                 )
             )
-            .order_by(Walk.start_time.asc())
+            .group_by(Walk.pet_id)
             .all()
         )
 
-        # 완료된 산책만 필터링 (end_time이 있는 것)
-        completed_walks = [w for w in all_today_walks if w.end_time is not None]
-        
-        # 진행 중인 산책 확인 (end_time이 null이고 오늘 시작된 것)
-        ongoing_walks = [w for w in all_today_walks if w.end_time is None]
-        has_ongoing_walk = len(ongoing_walks) > 0
-
-        # 완료된 산책 통계 계산
-        total_walks = len(completed_walks)
-        total_duration_min = sum(w.duration_min or 0 for w in completed_walks)
-        total_distance_km = sum(float(w.distance_km or 0) for w in completed_walks)
-
-        # 현재 산책 순서 계산
-        if has_ongoing_walk:
-            # 진행 중인 산책이 있으면, 그 산책의 순서를 반환
-            ongoing_walk = ongoing_walks[0]  # 가장 먼저 시작된 진행 중인 산책
-            current_walk_order = all_today_walks.index(ongoing_walk) + 1
-        else:
-            # 진행 중인 산책이 없으면 다음 산책 순서 (완료된 산책 수 + 1)
-            current_walk_order = total_walks + 1
-
-        return total_walks, total_duration_min, total_distance_km, current_walk_order, has_ongoing_walk
+        for row in rows:
+            total_walks = int(row.total_walks or 0)
+            has_ongoing_walk = row.ongoing_walk_id is not None
+            stats[row.pet_id] = (
+                total_walks,
+                int(row.total_duration_min or 0),
+                float(row.total_distance_km or 0),
+                int(row.walks_before_ongoing or 0) + 1 if has_ongoing_walk else total_walks + 1,
+                has_ongoing_walk,
+            )
+        return stats
 
+    def get_today_walks_stats_cached(
+        self, pet_ids: List[int], date_str: str, today_start: datetime, today_end: datetime
+    ) -> Dict[int, TodayStats]:
+        """카운터 캐시 우선, 미스난 반려동물만 모아서 집계 쿼리 1번"""
+        hits, misses, version = today_counters.get_many(pet_ids, date_str)
+        if misses:
+            loaded = self.get_today_walks_stats_for_pets(misses, today_start, today_end)
+            today_counters.store_many(loaded, date_str, version)
+            hits.update(loaded)
+        return hits
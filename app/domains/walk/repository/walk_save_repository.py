@@ -0,0 +1,92 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, insert
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core import change_log
+from app.models.family_member import FamilyMember
+from app.models.pet import Pet
+from app.models.photo import Photo
+from app.models.walk import Walk
+from app.models.walk_tracking_point import WalkTrackingPoint
+
+
+# 경로 포인트 executemany 한 번에 넣는 행 수
+POINT_INSERT_CHUNK_SIZE = 2000
+
+
+class WalkSaveRepository:
+    """완료된 산책 저장용 (단건/오프라인 일괄 업로드 공용)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # =====================================================
+    # 반려동물 + 저장 권한 (요청한 pet 전체를 1쿼리로)
+    # =====================================================
+    def get_pets_with_membership(self, user_id: int, pet_ids: Iterable[int]) -> Dict[int, Tuple[Pet, bool]]:
+        """pet_id → (Pet, 사용자가 그 가족 구성원인지)"""
+        pet_ids = set(pet_ids)
+        if not pet_ids:
+            return {}
+        rows = (
+            self.db.query(Pet, FamilyMember.member_id)
+            .outerjoin(
+                FamilyMember,
+                and_(
+                    FamilyMember.family_id == Pet.family_id,
+                    FamilyMember.user_id == user_id,
+                ),
+            )
+            .filter(Pet.pet_id.in_(pet_ids))
+            .all()
+        )
+        return {pet.pet_id: (pet, member_id is not None) for pet, member_id in rows}
+
+    # =====================================================
+    # idempotency key → 이미 저장된 walk_id
+    # =====================================================
+    def get_walk_ids_by_client_keys(self, user_id: int, client_keys: Iterable[str]) -> Dict[str, int]:
+        client_keys = set(client_keys)
+        if not client_keys:
+            return {}
+        rows = (
+            self.db.query(Walk.client_key, Walk.walk_id)
+            .filter(Walk.user_id == user_id, Walk.client_key.in_(client_keys))
+            .all()
+        )
+        return {key: walk_id for key, walk_id in rows}
+
+    def get_walk_by_client_key(self, user_id: int, client_key: str) -> Optional[Walk]:
+        return (
+            self.db.query(Walk)
+            .filter(Walk.user_id == user_id, Walk.client_key == client_key)
+            .first()
+        )
+
+    # =====================================================
+    # executemany INSERT
+    # =====================================================
+    def bulk_insert_walks(self, user_id: int, rows: List[dict]) -> Dict[str, int]:
+        """
+        rows: Walk 컬럼 + client_key. bulk INSERT 는 생성 ID 를 돌려주지 않으므로
+        (user_id, client_key) unique 키로 다시 조회해 client_key → walk_id 반환
+        """
+        if not rows:
+            return {}
+        self.db.execute(insert(Walk), rows)
+        walk_ids = self.get_walk_ids_by_client_keys(user_id, [r["client_key"] for r in rows])
+        change_log.record_ids(self.db, Walk, walk_ids.values())
+        return walk_ids
+
+    def bulk_insert_photos(self, rows: List[dict]) -> None:
+        if not rows:
+            return
+        self.db.execute(insert(Photo), rows)
+        change_log.record_where(self.db, Photo, Photo.walk_id.in_({r["walk_id"] for r in rows}))
+
+    def bulk_insert_points(self, rows: List[dict]) -> int:
+        """rows: walk_id/latitude/longitude/timestamp"""
+        for i in range(0, len(rows), POINT_INSERT_CHUNK_SIZE):
+            self.db.execute(insert(WalkTrackingPoint), rows[i:i + POINT_INSERT_CHUNK_SIZE])
+        return len(rows)
+
@@ -2,11 +2,21 @@ from typing import Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import threading
 
+from app.core import metrics
+
 # 간단한 메모리 기반 캐시 (실제 운영에서는 Redis 등을 사용 권장)
 _weather_cache: Dict[Tuple[float, float], Dict] = {}
 _cache_lock = threading.Lock()
 CACHE_TTL_SECONDS = 600  # 10분
 
+WEATHER_CACHE_LOOKUPS = metrics.counter(
+    "weather_cache_lookups_total", "날씨 캐시 조회 결과 (hit/stale/miss)", ("result",)
+)
+WEATHER_CACHE_SIZE = metrics.gauge(
+    "weather_cache_entries", "날씨 캐시 항목 수"
+)
+metrics.register_collector(lambda: WEATHER_CACHE_SIZE.set(len(_weather_cache)))
+
 
 class WeatherRepository:
     def __init__(self):
@@ -26,13 +36,16 @@ class WeatherRepository:
                 if fetched_at:
                     age_seconds = (datetime.utcnow() - fetched_at).total_seconds()
                     if age_seconds < CACHE_TTL_SECONDS:
+                        WEATHER_CACHE_LOOKUPS.labels("hit").inc()
                         return cached_data
                     else:
                         # 캐시가 오래되었지만 반환 (is_stale=True로 표시)
+                        WEATHER_CACHE_LOOKUPS.labels("stale").inc()
                         cached_data["cache_age_seconds"] = int(age_seconds)
                         cached_data["is_stale"] = True
                         return cached_data
         
+        WEATHER_CACHE_LOOKUPS.labels("miss").inc()
         return None
 
     def set_cached_weather(
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Header, Request, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.etag import ConditionalGet, conditional_get
 from app.db import get_db
 from app.domains.walk.service.recommendation_service import RecommendationService
 from app.domains.walk.service.walk_recommendation_service import WalkRecommendationService
@@ -28,6 +29,7 @@ def get_recommendation(
     request: Request,
     pet_id: int = Query(..., description="반려동물 ID"),
     authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    conditional: ConditionalGet = Depends(conditional_get),
     db: Session = Depends(get_db),
 ):
     """
@@ -35,12 +37,14 @@ def get_recommendation(
     
     - pet_id: 반려동물 ID (query parameter)
     - 권한 체크: 해당 반려동물의 family_members에 속한 사용자만 조회 가능
+    - ETag / If-None-Match 지원 (변경 없으면 304)
     """
     service = RecommendationService(db)
     return service.get_recommendation(
         request=request,
         authorization=authorization,
         pet_id=pet_id,
+        conditional=conditional,
     )
 
 
@@ -5,8 +5,13 @@ from pydantic import BaseModel, Field
 
 from app.db import get_db
 from app.domains.walk.service.walk_save_service import WalkSaveService
-from app.schemas.walk.walk_save_schema import WalkSaveRequest, WalkSaveResponse
-from app.domains.walk.exception import SAVE_RESPONSES, NOTIFY_RESPONSES
+from app.schemas.walk.walk_save_schema import (
+    WalkSaveRequest,
+    WalkSaveResponse,
+    WalkBulkSaveRequest,
+    WalkBulkSaveResponse,
+)
+from app.domains.walk.exception import SAVE_RESPONSES, BULK_SAVE_RESPONSES, NOTIFY_RESPONSES
 
 
 # 산책 시작 알림 요청 스키마
@@ -40,6 +45,7 @@ def save_walk(
     - body: 산책 기록 정보 (pet_id, start_time, end_time, duration_min, distance_km 등)
     - 권한 체크: 해당 반려동물의 family_members에 속한 사용자만 저장 가능
     - route_points가 있으면 경로 포인트도 함께 저장
+    - client_key를 보내면 같은 키로 재전송해도 기존 기록을 반환 (중복 저장 없음)
     - 저장된 기록은 Record/Activity 페이지에서 조회 가능
     """
     service = WalkSaveService(db)
@@ -50,6 +56,36 @@ def save_walk(
     )
 
 
+@router.post(
+    "/walks/bulk",
+    summary="산책 기록 일괄 저장 (오프라인 업로드)",
+    description="오프라인 동안 저장된 산책 기록을 한 번에 저장합니다. 항목별 결과를 반환합니다.",
+    status_code=200,
+    response_model=WalkBulkSaveResponse,
+    responses=BULK_SAVE_RESPONSES,
+)
+def save_walks_bulk(
+    request: Request,
+    body: WalkBulkSaveRequest = ...,
+    authorization: Optional[str] = Header(None, description="Firebase ID 토큰"),
+    db: Session = Depends(get_db),
+):
+    """
+    산책 기록 여러 개를 한 번에 저장합니다.
+
+    - body.walks: 산책 기록 목록 (최대 100개, 항목마다 client_key 필수)
+    - 같은 client_key로 이미 저장된 항목은 duplicate로 기존 walk_id를 반환하므로 실패 시 그대로 재전송하면 됩니다.
+    - 권한/시간 형식 오류는 해당 항목만 failed로 표시되고 나머지는 저장됩니다.
+    - 가족 알림은 반려동물별로 1건만 전송됩니다.
+    """
+    service = WalkSaveService(db)
+    return service.save_walks_bulk(
+        request=request,
+        authorization=authorization,
+        body=body,
+    )
+
+
 @router.post(
     "/walks/notify-start",
     summary="산책 시작 알림 전송",
@@ -0,0 +1,58 @@
+# app/domains/walk/service/partition_service.py
+
+from datetime import date
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.partitions import MonthlyPartitions, add_months, month_start
+from app.domains.walk.repository.route_archive_repository import RouteArchiveRepository
+
+
+PARTITIONS_CHANGED = metrics.counter("partitions_changed_total", "파티션 관리 작업 결과", ["table", "action"])
+
+TRACKING_POINTS_TABLE = "walk_tracking_points"
+
+
+class PartitionMaintenanceService:
+    """
+    walk_tracking_points 월 단위 파티션 관리 (주기 배치용, MySQL 전용)
+
+    - 앞으로 PARTITION_MONTHS_AHEAD 개월 파티션을 미리 생성
+    - PARTITION_RETENTION_MONTHS 개월보다 오래된 파티션은 그 안의 모든 산책이 압축 보관된 경우에만 DROP
+      (보관되지 않은 산책이 있으면 route_archiver 가 처리할 때까지 유지)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.archive_repo = RouteArchiveRepository(db)
+
+    def maintain(self, today: Optional[date] = None) -> dict:
+        today = today or date.today()
+        partitions = MonthlyPartitions(self.db.connection(), TRACKING_POINTS_TABLE)
+
+        if not partitions.is_supported():
+            print(f"[PARTITIONS] {TRACKING_POINTS_TABLE} 파티션 없음 (MySQL 마이그레이션 적용 전이거나 다른 DB)")
+            return {"supported": False, "created": [], "dropped": []}
+
+        try:
+            created = partitions.ensure_future(today, settings.PARTITION_MONTHS_AHEAD)
+            cutoff = add_months(month_start(today), -settings.PARTITION_RETENTION_MONTHS)
+            dropped = partitions.drop_before(
+                cutoff,
+                can_drop=lambda name: not self.archive_repo.has_unarchived_points(name),
+            )
+            self.db.commit()
+        except Exception as e:
+            print("PARTITION_MAINTENANCE_ERROR:", e)
+            self.db.rollback()
+            raise
+
+        PARTITIONS_CHANGED.labels(TRACKING_POINTS_TABLE, "create").inc(len(created))
+        PARTITIONS_CHANGED.labels(TRACKING_POINTS_TABLE, "drop").inc(len(dropped))
+
+        result = {"supported": True, "created": created, "dropped": dropped}
+        print(f"[PARTITIONS] {result}")
+        return result
@@ -1,12 +1,11 @@
 from fastapi import Request, UploadFile, File, Form
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 import os
 
 from app.core.firebase import verify_firebase_token, upload_file_to_storage
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 from app.models.user import User
 from app.models.pet import Pet
@@ -215,6 +214,5 @@ class PhotoService:
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=201, content=encoded)
+        return json_response(response_content, status_code=201)
 
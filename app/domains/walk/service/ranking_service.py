@@ -1,14 +1,12 @@
 # app/domains/walk/service/ranking_service.py
 
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from datetime import datetime, timedelta
 
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 
 from app.models.user import User
-from app.models.family_member import FamilyMember
 
 from app.domains.walk.repository.ranking_repository import RankingRepository
 
@@ -54,13 +52,7 @@ class RankingService:
         # -------------------------
         # 4) 요청자가 family 구성원인지 확인
         # -------------------------
-        member = (
-            self.db.query(FamilyMember)
-            .filter(FamilyMember.family_id == family_id)
-            .filter(FamilyMember.user_id == user.user_id)
-            .first()
-        )
-        if not member:
+        if not self.repo.is_family_member(family_id, user.user_id):
             return walk_error("WALK_RANKING_403_1", path)
 
         # -------------------------
@@ -106,19 +98,18 @@ class RankingService:
         # -------------------------
         # 8) 랭킹 결과 생성
         # -------------------------
+        pets_by_user = self.repo.get_users_pets([row.user_id for row in stats], start_dt, end_dt)
         ranking_items = []
 
         for idx, row in enumerate(stats, start=1):
-            uid = row[0]
-            usr = self.db.query(User).get(uid)
-
-            pets = self.repo.get_user_pets(uid, start_dt, end_dt)
+            uid = row.user_id
+            pets = pets_by_user.get(uid, [])
 
             ranking_items.append({
                 "rank": idx,
                 "user_id": uid,
-                "nickname": usr.nickname,
-                "profile_img_url": usr.profile_img_url,
+                "nickname": row.nickname,
+                "profile_img_url": row.profile_img_url,
                 "total_distance_km": float(row.total_distance_km),
                 "total_duration_min": int(row.total_duration_min),
                 "walk_count": int(row.walk_count),
@@ -147,4 +138,4 @@ class RankingService:
             "path": path,
         }
 
-        return JSONResponse(status_code=200, content=jsonable_encoder(response))
+        return json_response(response, status_code=200)
@@ -1,18 +1,48 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
 
+from app.core.etag import ConditionalGet
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 from app.models.user import User
-from app.models.pet import Pet
-from app.models.family_member import FamilyMember
 from app.domains.walk.repository.recommendation_repository import RecommendationRepository
 
 
+def recommendation_to_dict(recommendation) -> dict:
+    """추천 산책 정보 (홈 화면 집계 응답에서도 사용)"""
+    # per_walk 계산 (추천 산책 횟수로 나눔)
+    recommended_minutes_per_walk = (
+        recommendation.recommended_minutes // recommendation.recommended_walks
+        if recommendation.recommended_walks > 0 else 0
+    )
+    recommended_distance_km_per_walk = (
+        float(recommendation.recommended_distance_km) / recommendation.recommended_walks
+        if recommendation.recommended_walks > 0 else 0.0
+    )
+
+    return {
+        "pet_id": recommendation.pet_id,
+        "min_walks": recommendation.min_walks,
+        "min_minutes": recommendation.min_minutes,
+        "min_distance_km": float(recommendation.min_distance_km),
+        "recommended_walks": recommendation.recommended_walks,
+        "recommended_minutes": recommendation.recommended_minutes,
+        "recommended_distance_km": float(recommendation.recommended_distance_km),
+        "max_walks": recommendation.max_walks,
+        "max_minutes": recommendation.max_minutes,
+        "max_distance_km": float(recommendation.max_distance_km),
+        "generated_by": recommendation.generated_by,
+        "updated_at": recommendation.updated_at.isoformat() if recommendation.updated_at else None,
+        "per_walk": {
+            "recommended_minutes_per_walk": recommended_minutes_per_walk,
+            "recommended_distance_km_per_walk": round(recommended_distance_km_per_walk, 2)
+        }
+    }
+
+
 class RecommendationService:
     def __init__(self, db: Session):
         self.db = db
@@ -23,6 +53,7 @@ class RecommendationService:
         request: Request,
         authorization: Optional[str],
         pet_id: int,
+        conditional: ConditionalGet,
     ):
         path = request.url.path
 
@@ -60,84 +91,45 @@ class RecommendationService:
             return walk_error("WALK_REC_404_1", path)
 
         # ============================================
-        # 3) 반려동물 조회
+        # 3) 반려동물 + 추천 산책 정보 (프로필 캐시)
         # ============================================
-        pet: Pet = (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == pet_id)
-            .first()
-        )
+        try:
+            profile = self.recommendation_repo.get_pet_profile(pet_id)
+        except Exception as e:
+            print("RECOMMENDATION_QUERY_ERROR:", e)
+            return walk_error("WALK_REC_500_1", path)
 
-        if not pet:
+        if not profile:
             return walk_error("WALK_REC_404_2", path)
 
         # ============================================
         # 4) 권한 체크 (family_members 확인)
         # ============================================
-        family_member: FamilyMember = (
-            self.db.query(FamilyMember)
-            .filter(
-                FamilyMember.family_id == pet.family_id,
-                FamilyMember.user_id == user.user_id
-            )
-            .first()
-        )
-
-        if not family_member:
+        if not self.recommendation_repo.is_family_member(profile.pet.family_id, user.user_id):
             return walk_error("WALK_REC_403_1", path)
 
+        recommendation = profile.recommendation
+        if not recommendation:
+            return walk_error("WALK_REC_404_3", path)
+
         # ============================================
-        # 5) 추천 산책 정보 조회
+        # 5) 조건부 GET: 작은 행이라 추천 값 자체를 버전으로
         # ============================================
-        try:
-            recommendation = self.recommendation_repo.get_recommendation_by_pet_id(pet_id)
-
-            if not recommendation:
-                return walk_error("WALK_REC_404_3", path)
-
-        except Exception as e:
-            print("RECOMMENDATION_QUERY_ERROR:", e)
-            return walk_error("WALK_REC_500_1", path)
+        not_modified = conditional.evaluate("walk.recommendation", user.user_id, recommendation)
+        if not_modified is not None:
+            return not_modified
 
         # ============================================
         # 6) 응답 생성
         # ============================================
-        # per_walk 계산 (추천 산책 횟수로 나눔)
-        recommended_minutes_per_walk = (
-            recommendation.recommended_minutes // recommendation.recommended_walks
-            if recommendation.recommended_walks > 0 else 0
-        )
-        recommended_distance_km_per_walk = (
-            float(recommendation.recommended_distance_km) / recommendation.recommended_walks
-            if recommendation.recommended_walks > 0 else 0.0
-        )
-
         response_content = {
             "success": True,
             "status": 200,
-            "recommendation": {
-                "pet_id": recommendation.pet_id,
-                "min_walks": recommendation.min_walks,
-                "min_minutes": recommendation.min_minutes,
-                "min_distance_km": float(recommendation.min_distance_km),
-                "recommended_walks": recommendation.recommended_walks,
-                "recommended_minutes": recommendation.recommended_minutes,
-                "recommended_distance_km": float(recommendation.recommended_distance_km),
-                "max_walks": recommendation.max_walks,
-                "max_minutes": recommendation.max_minutes,
-                "max_distance_km": float(recommendation.max_distance_km),
-                "generated_by": recommendation.generated_by,
-                "updated_at": recommendation.updated_at.isoformat() if recommendation.updated_at else None,
-                "per_walk": {
-                    "recommended_minutes_per_walk": recommended_minutes_per_walk,
-                    "recommended_distance_km_per_walk": round(recommended_distance_km_per_walk, 2)
-                }
-            },
+            "recommendation": recommendation_to_dict(recommendation),
             "timeStamp": datetime.utcnow().isoformat(),
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
+        return json_response(response_content, status_code=200, headers=conditional.headers())
 
 
@@ -0,0 +1,110 @@
+# app/domains/walk/service/route_archive_service.py
+
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import metrics, route_archive
+from app.core.config import settings
+from app.domains.walk.repository.route_archive_repository import RouteArchiveRepository
+
+
+ROUTE_ARCHIVED_WALKS = metrics.counter("route_archived_walks_total", "압축 보관된 산책 수")
+ROUTE_ARCHIVED_POINTS = metrics.counter("route_archived_points_total", "보관 후 삭제된 hot 경로 포인트 수")
+ROUTE_ARCHIVED_BYTES = metrics.counter("route_archived_bytes_total", "압축 보관본 크기 합계(bytes)")
+
+
+class RouteArchiveService:
+    """
+    오래된 산책 경로를 압축 보관본으로 옮기고 hot 행 삭제 (주기 배치용)
+
+    - 종료된 지 ROUTE_ARCHIVE_AFTER_DAYS 일 지난 산책을 walk_id keyset 묶음으로 조회
+    - 묶음마다: 포인트 1쿼리 → 산책별 blob 인코딩 → 보관본 executemany INSERT → commit
+      → hot 행을 ROUTE_ARCHIVE_DELETE_CHUNK 개씩 삭제 (묶음마다 commit)
+    - 보관본이 먼저 commit 되므로 중간에 멈춰도 경로가 사라지지 않고, 다음 실행에서 남은 hot 행만 삭제
+    - 경로 조회는 보관본이 있으면 보관본만 읽으므로, 삭제 도중 일부만 남은 hot 행이 노출되지 않음
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = RouteArchiveRepository(db)
+
+    def archive_old_routes(
+        self,
+        after_days: Optional[int] = None,
+        batch_walks: Optional[int] = None,
+        time_budget_sec: Optional[float] = None,
+        now: Optional[datetime] = None,
+    ) -> dict:
+        after_days = after_days if after_days is not None else settings.ROUTE_ARCHIVE_AFTER_DAYS
+        batch_walks = batch_walks or settings.ROUTE_ARCHIVE_BATCH_WALKS
+        budget = time_budget_sec if time_budget_sec is not None else settings.ROUTE_ARCHIVE_TIME_BUDGET_SEC
+        cutoff = (now or datetime.utcnow()) - timedelta(days=after_days)
+        deadline = time.monotonic() + budget
+
+        result = {"walks": 0, "points": 0, "bytes": 0, "failed": 0}
+        if not settings.ROUTE_ARCHIVE_ENABLED:
+            return result
+
+        last_walk_id = 0
+        while time.monotonic() < deadline:
+            walk_ids = self.repo.list_candidate_walk_ids(cutoff, last_walk_id, batch_walks)
+            if not walk_ids:
+                break
+            last_walk_id = walk_ids[-1]
+
+            try:
+                archived, size = self._archive_batch(walk_ids)
+                self.db.commit()
+                points = self._delete_hot_points(walk_ids, deadline)
+            except Exception as e:
+                print("ROUTE_ARCHIVE_ERROR:", e)
+                self.db.rollback()
+                result["failed"] += len(walk_ids)
+                continue
+
+            result["walks"] += archived
+            result["points"] += points
+            result["bytes"] += size
+            ROUTE_ARCHIVED_WALKS.inc(archived)
+            ROUTE_ARCHIVED_BYTES.inc(size)
+
+        print(f"[ROUTE_ARCHIVE] {result}")
+        return result
+
+    def _archive_batch(self, walk_ids) -> tuple:
+        # 지난 실행에서 보관만 되고 삭제가 끝나지 않은 산책은 다시 인코딩하지 않음
+        archived = self.repo.get_archived_walk_ids(walk_ids)
+        pending = [w for w in walk_ids if w not in archived]
+        points_by_walk = self.repo.list_points(pending)
+
+        rows = []
+        size = 0
+        for walk_id in pending:
+            blob, count = route_archive.encode_points(points_by_walk[walk_id])
+            rows.append({
+                "walk_id": walk_id,
+                "point_count": count,
+                "codec": route_archive.CODEC,
+                "compressed_bytes": len(blob),
+                **route_archive.store.put(walk_id, blob),
+            })
+            size += len(blob)
+
+        self.repo.insert_archives(rows)
+        return len(rows), size
+
+    def _delete_hot_points(self, walk_ids, deadline: float) -> int:
+        chunk = settings.ROUTE_ARCHIVE_DELETE_CHUNK
+        deleted = 0
+        # 시간 예산을 넘기면 남은 행은 다음 실행에서 (보관본은 이미 있음)
+        while time.monotonic() < deadline:
+            count = self.repo.delete_points(walk_ids, chunk)
+            self.db.commit()
+            deleted += count
+            ROUTE_ARCHIVED_POINTS.inc(count)
+            if count < chunk:
+                break
+        return deleted
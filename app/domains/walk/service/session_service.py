@@ -1,18 +1,23 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime, date
 import pytz
 
-from app.core.firebase import verify_firebase_token, send_push_notification_to_multiple
+from app.core import active_walks
+from app.core.active_walks import ActiveWalk
+from app.core.error_handler import error_response
+from app.core.firebase import verify_firebase_token
+from app.core.push_coalescer import submit_family_push
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.family_member import FamilyMember
 from app.models.notification import NotificationType
 from app.domains.walk.repository.session_repository import SessionRepository
+from app.domains.walk.repository.today_repository import today_counters
 from app.domains.notifications.repository.notification_repository import NotificationRepository
 from app.domains.users.repository.user_repository import UserRepository
 from app.schemas.walk.session_schema import WalkStartRequest, WalkTrackRequest, WalkEndRequest
@@ -38,38 +43,21 @@ class SessionService:
         산책을 시작/종료한 본인은 제외합니다.
         """
         try:
-            print(f"[FCM DEBUG] _send_walk_fcm_push called: family_id={family_id}, exclude_user_id={exclude_user_id}")
-            
-            # 가족 멤버 조회
-            family_members = (
-                self.db.query(FamilyMember)
-                .filter(FamilyMember.family_id == family_id)
-                .all()
+            data = data or {}
+            push_type = data.get("type", "WALK")
+            # 같은 펫의 START/END 는 collapse key 로 묶여 debounce 시간 안이면 1건으로 병합
+            result = submit_family_push(
+                family_id=family_id,
+                pet_id=data.get("pet_id"),
+                kind="WALK",
+                push_type=push_type,
+                title=title,
+                body=body,
+                data=data,
+                exclude_user_ids=[exclude_user_id],
+                dedup_actor_id=exclude_user_id if push_type == "WALK_START" else None,
             )
-            
-            print(f"[FCM DEBUG] Family members count: {len(family_members)}")
-
-            target_user_ids = [
-                m.user_id for m in family_members if m.user_id != exclude_user_id
-            ]
-            fcm_tokens = self.user_repo.get_active_fcm_tokens_for_users(target_user_ids)
-            print(f"[FCM DEBUG] Target user IDs: {target_user_ids}")
-            token_previews = [t[:15] + "..." if t and len(t) > 15 else t for t in fcm_tokens]
-            print(f"[FCM DEBUG] Collected FCM tokens: {len(fcm_tokens)} ({token_previews})")
-
-            # FCM 푸시 발송
-            if fcm_tokens:
-                result = send_push_notification_to_multiple(
-                    fcm_tokens=fcm_tokens,
-                    title=title,
-                    body=body,
-                    data=data,
-                )
-                print(f"[FCM] Walk push sent: success={result['success_count']}, failure={result['failure_count']}")
-                if result.get("invalid_tokens"):
-                    self.user_repo.remove_fcm_tokens(result["invalid_tokens"])
-            else:
-                print("[FCM] No FCM tokens to send walk notification")
+            print(f"[FCM] Walk push {result}: family_id={family_id}, type={push_type}")
 
         except Exception as e:
             print(f"[FCM] Walk push error: {e}")
@@ -159,19 +147,9 @@ class SessionService:
             return walk_error("WALK_START_403_1", path)
 
         # ============================================
-        # 6) 진행 중인 산책 체크
-        # ============================================
-        try:
-            ongoing_walk = self.session_repo.get_ongoing_walk_by_pet_id(body.pet_id)
-            
-            if ongoing_walk:
-                return walk_error("WALK_START_409_1", path)
-        except Exception as e:
-            print("ONGOING_WALK_CHECK_ERROR:", e)
-            return walk_error("WALK_START_500_1", path)
-
-        # ============================================
-        # 7) 산책 세션 생성
+        # 6) 산책 세션 생성
+        #    (진행 중인 산책 중복은 walks.uq_walks_active_pet unique index 가 막음
+        #     → 사전 SELECT 없이 INSERT 후 충돌이면 409)
         # ============================================
         try:
             start_time = datetime.utcnow()
@@ -196,11 +174,30 @@ class SessionService:
             self.db.commit()
             self.db.refresh(walk)
 
+        except IntegrityError as e:
+            self.db.rollback()
+            if self.session_repo.is_active_walk_conflict(e):
+                return walk_error("WALK_START_409_1", path)
+            print("WALK_CREATE_ERROR:", e)
+            return walk_error("WALK_START_500_1", path)
         except Exception as e:
             print("WALK_CREATE_ERROR:", e)
             self.db.rollback()
             return walk_error("WALK_START_500_1", path)
 
+        # 진행 중 산책 레지스트리 등록 (이후 track 은 Walk/Pet/FamilyMember 조회 생략)
+        active_walks.registry.put(ActiveWalk(
+            walk_id=walk.walk_id,
+            pet_id=walk.pet_id,
+            family_id=pet.family_id,
+            user_id=user.user_id,
+            start_time=walk.start_time,
+            last_lat=body.start_lat if has_lat else None,
+            last_lng=body.start_lng if has_lng else None,
+            last_at=start_time if has_lat else None,
+        ))
+        today_counters.on_walk_started(walk.pet_id, walk.start_time)
+
         # ============================================
         # 7-1) 산책 시작 알림 생성 (FAMILY 기준 1개) + FCM 푸시
         # ============================================
@@ -273,8 +270,7 @@ class SessionService:
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=201, content=encoded)
+        return json_response(response_content, status_code=201)
 
     def track_walk(
         self,
@@ -375,17 +371,12 @@ class SessionService:
             timestamp = datetime.utcnow()
 
         # ============================================
-        # 4) 산책 세션 조회
+        # 4) 진행 중인 산책 조회 (레지스트리 → 미스면 1쿼리)
         # ============================================
         try:
-            walk = self.session_repo.get_walk_by_walk_id(walk_id)
-            
-            if not walk:
-                return error_response(
-                    404, "WALK_POINT_404_2",
-                    "요청하신 산책 세션을 찾을 수 없습니다.",
-                    path
-                )
+            active = active_walks.registry.get(self.db, walk_id)
+            if active is None:
+                return self._inactive_walk_point_error(walk_id, path)
         except Exception as e:
             print("WALK_QUERY_ERROR:", e)
             return error_response(
@@ -395,60 +386,32 @@ class SessionService:
             )
 
         # ============================================
-        # 5) 산책 종료 여부 체크
-        # ============================================
-        if walk.end_time is not None:
-            return error_response(
-                409, "WALK_POINT_409_1",
-                "종료된 산책 세션에는 위치 정보를 기록할 수 없습니다.",
-                path
-            )
-
-        # ============================================
-        # 6) 권한 체크 (family_members 확인)
-        # ============================================
-        pet: Pet = (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == walk.pet_id)
-            .first()
-        )
-
-        if not pet:
-            return error_response(
-                404, "WALK_POINT_404_2",
-                "요청하신 산책 세션을 찾을 수 없습니다.",
-                path
-            )
-
-        family_member: FamilyMember = (
-            self.db.query(FamilyMember)
-            .filter(
-                FamilyMember.family_id == pet.family_id,
-                FamilyMember.user_id == user.user_id
-            )
-            .first()
-        )
-
-        if not family_member:
-            return error_response(
-                403, "WALK_POINT_403_1",
-                "해당 산책의 위치 정보를 기록할 권한이 없습니다.",
-                path
-            )
-
-        # ============================================
-        # 7) 위치 정보 저장
+        # 5) 권한 체크 + 위치 정보 저장
+        #    (진행 중 + 가족 구성원일 때만 INSERT, 구성원 확인은 DB 기준)
         # ============================================
         try:
-            point = self.session_repo.create_tracking_point(
+            point_id = self.session_repo.create_tracking_point_if_active(
                 walk_id=walk_id,
+                family_id=active.family_id,
+                user_id=user.user_id,
                 latitude=latitude,
                 longitude=longitude,
                 timestamp=timestamp,
             )
-            
+
+            if point_id is None:
+                self.db.rollback()
+                if not self.session_repo.is_family_member(active.family_id, user.user_id):
+                    return error_response(
+                        403, "WALK_POINT_403_1",
+                        "해당 산책의 위치 정보를 기록할 권한이 없습니다.",
+                        path
+                    )
+                # 다른 서버에서 종료/삭제된 산책 → 레지스트리에서도 제거
+                active_walks.registry.remove(walk_id)
+                return self._inactive_walk_point_error(walk_id, path)
+
             self.db.commit()
-            self.db.refresh(point)
 
         except Exception as e:
             print("TRACKING_POINT_CREATE_ERROR:", e)
@@ -459,25 +422,42 @@ class SessionService:
                 path
             )
 
+        active_walks.registry.record_point(walk_id, latitude, longitude, timestamp)
+
         # ============================================
-        # 8) 응답 생성
+        # 6) 응답 생성
         # ============================================
         response_content = {
             "success": True,
             "status": 201,
             "point": {
-                "point_id": point.point_id,
-                "walk_id": point.walk_id,
-                "latitude": float(point.latitude),
-                "longitude": float(point.longitude),
-                "timestamp": point.timestamp.isoformat() if point.timestamp else None,
+                "point_id": point_id,
+                "walk_id": walk_id,
+                # DB 컬럼(DECIMAL(10, 7))과 같은 자릿수
+                "latitude": round(latitude, 7),
+                "longitude": round(longitude, 7),
+                "timestamp": timestamp.isoformat() if timestamp else None,
             },
             "timeStamp": datetime.utcnow().isoformat(),
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=201, content=encoded)
+        return json_response(response_content, status_code=201)
+
+    def _inactive_walk_point_error(self, walk_id: int, path: str):
+        """진행 중이 아닌 산책에 위치 저장 시: 종료된 산책이면 409, 없으면 404"""
+        walk = self.session_repo.get_walk_by_walk_id(walk_id)
+        if walk is not None and walk.end_time is not None:
+            return error_response(
+                409, "WALK_POINT_409_1",
+                "종료된 산책 세션에는 위치 정보를 기록할 수 없습니다.",
+                path
+            )
+        return error_response(
+            404, "WALK_POINT_404_2",
+            "요청하신 산책 세션을 찾을 수 없습니다.",
+            path
+        )
 
     def end_walk(
         self,
@@ -622,13 +602,19 @@ class SessionService:
                 MET = 3.0
                 calories = pet_weight * 1.036 * duration_min * MET / 60
 
+            # 마지막 위치를 안 보냈으면 track 으로 받은 마지막 좌표 사용
+            last_lat, last_lng = body.last_lat, body.last_lng
+            active = active_walks.registry.get_by_pet(walk.pet_id)
+            if last_lat is None and last_lng is None and active is not None and active.walk_id == walk.walk_id:
+                last_lat, last_lng = active.last_lat, active.last_lng
+
             updated_walk = self.session_repo.end_walk(
                 walk=walk,
                 end_time=end_time,
                 duration_min=duration_min,
                 distance_km=distance_km,
-                last_lat=body.last_lat,
-                last_lng=body.last_lng,
+                last_lat=last_lat,
+                last_lng=last_lng,
                 route_data=route_data_dict,
             )
 
@@ -642,13 +628,9 @@ class SessionService:
                 kst = pytz.timezone("Asia/Seoul")
                 stat_date = datetime.now(kst).date()
 
-                activity_stat = self.session_repo.get_or_create_activity_stat(
+                activity_stat = self.session_repo.increment_activity_stat(
                     pet_id=walk.pet_id,
                     stat_date=stat_date,
-                )
-
-                self.session_repo.update_activity_stat(
-                    stat=activity_stat,
                     distance_km=distance_km,
                     duration_min=duration_min,
                 )
@@ -659,6 +641,9 @@ class SessionService:
             if activity_stat:
                 self.db.refresh(activity_stat)
 
+            active_walks.registry.remove(walk.walk_id)
+            today_counters.on_walk_ended(walk.pet_id, walk.start_time, duration_min, distance_km)
+
         except Exception as e:
             print("WALK_END_ERROR:", e)
             self.db.rollback()
@@ -737,8 +722,8 @@ class SessionService:
                 "duration_min": updated_walk.duration_min,
                 "distance_km": float(updated_walk.distance_km) if updated_walk.distance_km else None,
                 "calories": float(updated_walk.calories) if updated_walk.calories else None,
-                "last_lat": body.last_lat,
-                "last_lng": body.last_lng,
+                "last_lat": last_lat,
+                "last_lng": last_lng,
                 "route_data": route_data_response,
             },
             "timeStamp": datetime.utcnow().isoformat(),
@@ -756,5 +741,4 @@ class SessionService:
                 if activity_stat.avg_speed_kmh else None,
             }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
+        return json_response(response_content, status_code=200)
@@ -0,0 +1,159 @@
+# app/domains/walk/service/stale_walk_service.py
+
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.core import active_walks, metrics
+from app.core.config import settings
+from app.domains.walk.repository.session_repository import SessionRepository
+from app.domains.walk.repository.today_repository import today_counters
+
+
+STALE_WALKS_CLOSED = metrics.counter("stale_walks_closed_total", "자동 종료된 방치 산책 수")
+STALE_WALK_BATCHES = metrics.counter("stale_walk_batches_total", "방치 산책 종료 배치 결과", ["result"])
+STALE_WALK_BATCH_SECONDS = metrics.histogram(
+    "stale_walk_batch_duration_seconds", "방치 산책 종료 배치 1회 처리 시간(초)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+KST = pytz.timezone("Asia/Seoul")
+EARTH_RADIUS_KM = 6371.0088
+# GPS 튐(순간이동) 구간은 거리에서 제외
+MAX_SEGMENT_SPEED_KMH = 40.0
+# end_walk 와 같은 칼로리 계산 (MET=3 고정, weight 없으면 5kg)
+MET = 3.0
+DEFAULT_WEIGHT_KG = 5
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def route_distance_km(points: List[Tuple[float, float, datetime]]) -> float:
+    total = 0.0
+    for (lat1, lng1, t1), (lat2, lng2, t2) in zip(points, points[1:]):
+        segment = haversine_km(lat1, lng1, lat2, lng2)
+        hours = (t2 - t1).total_seconds() / 3600
+        if hours > 0 and segment / hours > MAX_SEGMENT_SPEED_KMH:
+            continue
+        total += segment
+    return total
+
+
+class StaleWalkService:
+    """
+    앱 종료/크래시로 end_time 이 비어 있는 산책을 자동 종료 (주기 배치용)
+
+    - 마지막 위치(없으면 시작 시각)가 idle_min 분 넘게 지난 진행 중 산책을 walk_id keyset 페이지로 조회
+    - 기록된 위치로 거리/시간/칼로리 계산, 종료 시각은 마지막 위치 시각
+    - 배치마다 한 트랜잭션: 행 잠금 → executemany UPDATE → (pet, 날짜)별 activity_stats upsert
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.session_repo = SessionRepository(db)
+
+    def close_stale_walks(
+        self,
+        idle_min: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> dict:
+        idle_min = idle_min if idle_min is not None else settings.STALE_WALK_IDLE_MIN
+        batch_size = batch_size or settings.STALE_WALK_BATCH_SIZE
+        cutoff = (now or datetime.utcnow()) - timedelta(minutes=idle_min)
+
+        last_walk_id = 0
+        closed = 0
+        skipped = 0
+        failed = 0
+        batches = 0
+
+        while True:
+            candidates = self.session_repo.list_stale_walks(cutoff, last_walk_id, batch_size)
+            if not candidates:
+                break
+            last_walk_id = candidates[-1].walk_id
+            batches += 1
+
+            started = time.perf_counter()
+            try:
+                closed_ids = self._close_batch(candidates)
+                self.db.commit()
+            except Exception as e:
+                print("STALE_WALK_CLOSE_ERROR:", e)
+                self.db.rollback()
+                failed += len(candidates)
+                STALE_WALK_BATCHES.labels("failed").inc()
+                continue
+            finally:
+                STALE_WALK_BATCH_SECONDS.observe(time.perf_counter() - started)
+
+            for walk_id in closed_ids:
+                active_walks.registry.remove(walk_id)
+            today_counters.invalidate({c.pet_id for c in candidates if c.walk_id in closed_ids})
+            closed += len(closed_ids)
+            skipped += len(candidates) - len(closed_ids)
+            STALE_WALKS_CLOSED.inc(len(closed_ids))
+            STALE_WALK_BATCHES.labels("ok").inc()
+
+        result = {"closed": closed, "skipped": skipped, "failed": failed, "batches": batches}
+        print(f"[STALE_WALKS] {result}")
+        return result
+
+    def _close_batch(self, candidates) -> List[int]:
+        # 조회 후 사용자가 직접 종료한 산책은 제외
+        open_ids = self.session_repo.lock_open_walks([c.walk_id for c in candidates])
+        targets = [c for c in candidates if c.walk_id in open_ids]
+        points_by_walk = self.session_repo.list_points_for_walks([c.walk_id for c in targets])
+
+        rows = []
+        stats: Dict[Tuple[int, object], List[float]] = {}
+        for c in targets:
+            points = points_by_walk.get(c.walk_id, [])
+            end_time = max(c.start_time, points[-1][2]) if points else c.start_time
+            duration_min = int(round((end_time - c.start_time).total_seconds() / 60))
+            distance_km = round(route_distance_km(points), 3)
+
+            calories = None
+            if duration_min and distance_km:
+                weight = c.weight if c.weight else DEFAULT_WEIGHT_KG
+                calories = weight * 1.036 * duration_min * MET / 60
+
+            rows.append({
+                "walk_id": c.walk_id,
+                "end_time": end_time,
+                "duration_min": duration_min,
+                "distance_km": distance_km,
+                "calories": calories,
+                "last_lat": points[-1][0] if points else None,
+                "last_lng": points[-1][1] if points else None,
+            })
+
+            # end_walk 와 같이 거리/시간이 있는 산책만 통계에 반영 (날짜는 KST 종료일)
+            if distance_km and duration_min:
+                stat_date = pytz.utc.localize(end_time).astimezone(KST).date()
+                acc = stats.setdefault((c.pet_id, stat_date), [0, 0.0, 0])
+                acc[0] += 1
+                acc[1] += distance_km
+                acc[2] += duration_min
+
+        self.session_repo.bulk_close_walks(rows)
+        for (pet_id, stat_date), (walks, distance_km, duration_min) in stats.items():
+            self.session_repo.increment_activity_stat(
+                pet_id=pet_id,
+                stat_date=stat_date,
+                distance_km=distance_km,
+                duration_min=duration_min,
+                walks=walks,
+            )
+        return [r["walk_id"] for r in rows]
@@ -1,19 +1,29 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 import pytz
 
 from app.core.firebase import verify_firebase_token
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 from app.models.user import User
-from app.models.pet import Pet
-from app.models.family_member import FamilyMember
 from app.domains.walk.repository.today_repository import TodayRepository
 
 
+def kst_today_range() -> Tuple[str, datetime, datetime]:
+    """오늘(KST) 날짜 문자열과 UTC 기준 시작/끝 시각"""
+    kst = pytz.timezone('Asia/Seoul')
+    now_kst = datetime.now(kst)
+    today_start_kst = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end_kst = now_kst.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return (
+        now_kst.date().isoformat(),
+        today_start_kst.astimezone(pytz.UTC),
+        today_end_kst.astimezone(pytz.UTC),
+    )
+
+
 class TodayService:
     def __init__(self, db: Session):
         self.db = db
@@ -61,65 +71,33 @@ class TodayService:
             return walk_error("WALK_TODAY_404_1", path)
 
         # ============================================
-        # 3) 반려동물 조회
+        # 3) 반려동물 조회 + 4) 권한 체크 (family_members 확인) — 쿼리 1번
         # ============================================
-        pet: Pet = (
-            self.db.query(Pet)
-            .filter(Pet.pet_id == pet_id)
-            .first()
-        )
+        access = self.today_repo.get_pet_access(pet_id, user.user_id)
 
-        if not pet:
+        if access is None:
             return walk_error("WALK_TODAY_404_2", path)
 
-        # ============================================
-        # 4) 권한 체크 (family_members 확인)
-        # ============================================
-        family_member: FamilyMember = (
-            self.db.query(FamilyMember)
-            .filter(
-                FamilyMember.family_id == pet.family_id,
-                FamilyMember.user_id == user.user_id
-            )
-            .first()
-        )
-
-        if not family_member:
+        if access.member_id is None:
             return walk_error("WALK_TODAY_403_1", path)
 
         # ============================================
         # 5) 오늘 날짜 계산 (서버 타임존 기준, KST UTC+9)
         # ============================================
         try:
-            # 한국 시간대 설정
-            kst = pytz.timezone('Asia/Seoul')
-            now_kst = datetime.now(kst)
-            
-            # 오늘 날짜의 시작과 끝 시간 계산 (KST 기준)
-            today_start_kst = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
-            today_end_kst = now_kst.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            # UTC로 변환 (DB에 저장된 시간이 UTC일 수 있으므로)
-            today_start_utc = today_start_kst.astimezone(pytz.UTC)
-            today_end_utc = today_end_kst.astimezone(pytz.UTC)
-            
-            # 날짜 문자열 (YYYY-MM-DD)
-            today_date_str = now_kst.date().isoformat()
-
+            today_date_str, today_start_utc, today_end_utc = kst_today_range()
         except Exception as e:
             print("DATE_CALCULATION_ERROR:", e)
             return walk_error("WALK_TODAY_500_1", path)
 
         # ============================================
-        # 6) 오늘 산책 현황 조회
+        # 6) 오늘 산책 현황 조회 (카운터 캐시 → 미스면 집계 쿼리 1번)
         # ============================================
         try:
             total_walks, total_duration_min, total_distance_km, current_walk_order, has_ongoing_walk = (
-                self.today_repo.get_today_walks_stats(
-                    pet_id=pet_id,
-                    today_start=today_start_utc,
-                    today_end=today_end_utc
-                )
+                self.today_repo.get_today_walks_stats_cached(
+                    [pet_id], today_date_str, today_start_utc, today_end_utc
+                )[pet_id]
             )
 
         except Exception as e:
@@ -145,6 +123,5 @@ class TodayService:
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
+        return json_response(response_content, status_code=200)
 
@@ -1,30 +1,68 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
-import pytz
-
-from app.core.firebase import verify_firebase_token, send_push_notification_to_multiple
-from app.domains.walk.exception import walk_error
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core.firebase import verify_firebase_token
+from app.core.push_coalescer import submit_family_push
+from app.core.responses import json_response
+from app.domains.walk.exception import SAVE_ERRORS, walk_error
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.family_member import FamilyMember
 from app.models.walk import Walk
 from app.models.photo import Photo
-from app.models.walk_tracking_point import WalkTrackingPoint
 from app.models.notification import NotificationType
-from app.schemas.walk.walk_save_schema import WalkSaveRequest
+from app.schemas.walk.walk_save_schema import WalkSaveRequest, WalkBulkSaveRequest
 from app.domains.walk.repository.session_repository import SessionRepository
+from app.domains.walk.repository.today_repository import today_counters
+from app.domains.walk.repository.walk_save_repository import WalkSaveRepository
 from app.domains.notifications.repository.notification_repository import NotificationRepository
 from app.domains.users.repository.user_repository import UserRepository
 
 
+def parse_utc(value: str) -> datetime:
+    """ISO 8601 문자열 → naive UTC datetime (타임존 없으면 UTC 로 간주). 형식 오류는 ValueError"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    offset = parsed.utcoffset()
+    if offset is not None:
+        parsed = (parsed - offset).replace(tzinfo=None)
+    return parsed
+
+
+def _point_rows(walk_id: int, route_points) -> List[dict]:
+    """경로 포인트 → INSERT 행 (타임스탬프 파싱 실패한 포인트는 스킵)"""
+    rows = []
+    for point in route_points:
+        try:
+            timestamp = parse_utc(point.timestamp)
+        except ValueError:
+            continue
+        rows.append({
+            "walk_id": walk_id,
+            "latitude": point.latitude,
+            "longitude": point.longitude,
+            "timestamp": timestamp,
+        })
+    return rows
+
+
+def _bulk_result(client_key: str, status: str, walk_id: Optional[int]) -> dict:
+    return {"client_key": client_key, "status": status, "walk_id": walk_id, "code": None, "reason": None}
+
+
+def _bulk_failure(client_key: str, code: str) -> dict:
+    err = SAVE_ERRORS[code]
+    return {"client_key": client_key, "status": "failed", "walk_id": None, "code": err.code, "reason": err.reason}
+
+
 class WalkSaveService:
     def __init__(self, db: Session):
         self.db = db
         self.session_repo = SessionRepository(db)
+        self.save_repo = WalkSaveRepository(db)
         self.notification_repo = NotificationRepository(db)
         self.user_repo = UserRepository(db)
 
@@ -41,38 +79,21 @@ class WalkSaveService:
         산책한 본인은 제외합니다.
         """
         try:
-            print(f"[FCM DEBUG] _send_walk_complete_fcm_push called: family_id={family_id}, exclude_user_id={exclude_user_id}")
-            
-            # 가족 멤버 조회
-            family_members = (
-                self.db.query(FamilyMember)
-                .filter(FamilyMember.family_id == family_id)
-                .all()
+            data = data or {}
+            push_type = data.get("type", "WALK")
+            # 같은 펫의 START/END 는 collapse key 로 묶여 debounce 시간 안이면 1건으로 병합
+            result = submit_family_push(
+                family_id=family_id,
+                pet_id=data.get("pet_id"),
+                kind="WALK",
+                push_type=push_type,
+                title=title,
+                body=body,
+                data=data,
+                exclude_user_ids=[exclude_user_id],
+                dedup_actor_id=exclude_user_id if push_type == "WALK_START" else None,
             )
-            
-            print(f"[FCM DEBUG] Family members count: {len(family_members)}")
-
-            target_user_ids = [
-                m.user_id for m in family_members if m.user_id != exclude_user_id
-            ]
-            fcm_tokens = self.user_repo.get_active_fcm_tokens_for_users(target_user_ids)
-            print(f"[FCM DEBUG] Target user IDs: {target_user_ids}")
-            token_previews = [t[:15] + "..." if t and len(t) > 15 else t for t in fcm_tokens]
-            print(f"[FCM DEBUG] Collected FCM tokens: {len(fcm_tokens)} ({token_previews})")
-
-            # FCM 푸시 발송
-            if fcm_tokens:
-                result = send_push_notification_to_multiple(
-                    fcm_tokens=fcm_tokens,
-                    title=title,
-                    body=body,
-                    data=data,
-                )
-                print(f"[FCM] Walk complete push sent: success={result['success_count']}, failure={result['failure_count']}")
-                if result.get("invalid_tokens"):
-                    self.user_repo.remove_fcm_tokens(result["invalid_tokens"])
-            else:
-                print("[FCM] No FCM tokens to send walk complete notification")
+            print(f"[FCM] Walk complete push {result}: family_id={family_id}, type={push_type}")
 
         except Exception as e:
             print(f"[FCM] Walk complete push error: {e}")
@@ -149,28 +170,30 @@ class WalkSaveService:
         # 4) 날짜/시간 파싱
         # ============================================
         try:
-            # ISO 8601 형식 파싱 (YYYY-MM-DDTHH:mm:ss)
-            start_time = datetime.fromisoformat(body.start_time.replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(body.end_time.replace('Z', '+00:00'))
-            
-            # UTC로 변환 (로컬 시간이면 UTC로 변환)
-            if start_time.tzinfo is None:
-                # 타임존 정보가 없으면 UTC로 가정
-                start_time = pytz.UTC.localize(start_time)
-            else:
-                start_time = start_time.astimezone(pytz.UTC)
-            
-            if end_time.tzinfo is None:
-                end_time = pytz.UTC.localize(end_time)
-            else:
-                end_time = end_time.astimezone(pytz.UTC)
-            
+            # ISO 8601 형식 파싱 (YYYY-MM-DDTHH:mm:ss), 타임존 없으면 UTC 로 가정
+            start_time = parse_utc(body.start_time)
+            end_time = parse_utc(body.end_time)
+
             # end_time이 start_time보다 이후인지 확인
             if end_time <= start_time:
                 return walk_error("WALK_SAVE_400_1", path)
         except ValueError as e:
             return walk_error("WALK_SAVE_400_2", path)
 
+        # ============================================
+        # 4-1) 같은 client_key 로 이미 저장된 산책이면 그대로 반환 (재전송)
+        # ============================================
+        if body.client_key:
+            existing = self.save_repo.get_walk_by_client_key(user.user_id, body.client_key)
+            if existing:
+                thumbnail = (
+                    self.db.query(Photo.image_url)
+                    .filter(Photo.walk_id == existing.walk_id)
+                    .order_by(Photo.photo_id.asc())
+                    .first()
+                )
+                return self._save_response(path, existing, thumbnail[0] if thumbnail else None)
+
         # ============================================
         # 5) Walk 저장
         # ============================================
@@ -186,6 +209,7 @@ class WalkSaveService:
                 calories=body.calories,
                 weather_status=body.weather_status,
                 weather_temp_c=body.weather_temp_c,
+                client_key=body.client_key,
             )
 
             self.db.add(walk)
@@ -200,33 +224,28 @@ class WalkSaveService:
                 )
                 self.db.add(photo)
                 thumbnail_url = body.thumbnail_image_url
-            
-            # 경로 포인트 저장
+
+            # 경로 포인트 저장 (executemany 한 번)
             if body.route_points:
-                for point_dto in body.route_points:
-                    try:
-                        point_timestamp = datetime.fromisoformat(
-                            point_dto.timestamp.replace('Z', '+00:00')
-                        )
-                        if point_timestamp.tzinfo is None:
-                            point_timestamp = pytz.UTC.localize(point_timestamp)
-                        else:
-                            point_timestamp = point_timestamp.astimezone(pytz.UTC)
-                    except ValueError:
-                        # 타임스탬프 파싱 실패 시 스킵
-                        continue
-                    
-                    tracking_point = WalkTrackingPoint(
-                        walk_id=walk.walk_id,
-                        latitude=point_dto.latitude,
-                        longitude=point_dto.longitude,
-                        timestamp=point_timestamp,
-                    )
-                    self.db.add(tracking_point)
-            
+                self.save_repo.bulk_insert_points(_point_rows(walk.walk_id, body.route_points))
+
             self.db.commit()
             self.db.refresh(walk)
-            
+
+            # 오늘 산책 카운터 캐시 증분 반영
+            today_counters.on_walk_saved(pet.pet_id, start_time, body.duration_min, body.distance_km)
+
+        except IntegrityError as e:
+            # 같은 client_key 동시 재전송: 먼저 저장된 쪽을 반환
+            self.db.rollback()
+            existing = (
+                self.save_repo.get_walk_by_client_key(user.user_id, body.client_key)
+                if body.client_key else None
+            )
+            if existing:
+                return self._save_response(path, existing, None)
+            print("WALK_SAVE_ERROR:", e)
+            return walk_error("WALK_SAVE_500_1", path)
         except Exception as e:
             print("WALK_SAVE_ERROR:", e)
             self.db.rollback()
@@ -285,6 +304,10 @@ class WalkSaveService:
         # ============================================
         # 6) 응답 생성
         # ============================================
+        return self._save_response(path, walk, thumbnail_url)
+
+    @staticmethod
+    def _save_response(path: str, walk: Walk, thumbnail_url: Optional[str]):
         response_content = {
             "success": True,
             "status": 200,
@@ -305,8 +328,248 @@ class WalkSaveService:
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
+        return json_response(response_content, status_code=200)
+
+    def save_walks_bulk(
+        self,
+        request: Request,
+        authorization: Optional[str],
+        body: WalkBulkSaveRequest,
+    ):
+        """
+        오프라인 동안 쌓인 완료 산책을 한 번에 저장
+
+        - 항목 검증(시간/권한/중복 키)을 DB 조회 2번으로 한 번에 처리하고 항목별 결과를 반환
+        - 산책 / 대표 사진 / 경로 포인트는 executemany INSERT, 전체를 한 트랜잭션으로
+        - (user_id, client_key) 가 이미 있으면 duplicate 로 기존 walk_id 반환 (재전송 안전)
+        - 알림/푸시는 반려동물별 요약 1건
+        """
+        path = request.url.path
+
+        # ============================================
+        # 1) Authorization 검증
+        # ============================================
+        if authorization is None:
+            return walk_error("WALK_BULK_401_1", path)
+
+        if not authorization.startswith("Bearer "):
+            return walk_error("WALK_BULK_401_2", path)
+
+        parts = authorization.split(" ")
+        if len(parts) != 2:
+            return walk_error("WALK_BULK_401_2", path)
+
+        decoded = verify_firebase_token(parts[1])
+        if decoded is None:
+            return walk_error("WALK_BULK_401_2", path)
+
+        firebase_uid = decoded.get("uid")
+
+        # ============================================
+        # 2) 사용자 조회
+        # ============================================
+        user: User = (
+            self.db.query(User)
+            .filter(User.firebase_uid == firebase_uid)
+            .first()
+        )
+
+        if not user:
+            return walk_error("WALK_BULK_404_1", path)
+
+        # ============================================
+        # 3) 항목 검증 (반려동물/권한 1쿼리 + 기존 키 1쿼리)
+        # ============================================
+        items = body.walks
+        results: List[Optional[dict]] = [None] * len(items)
+        times: Dict[int, tuple] = {}
+
+        try:
+            pets = self.save_repo.get_pets_with_membership(user.user_id, {item.pet_id for item in items})
+            existing_keys = self.save_repo.get_walk_ids_by_client_keys(
+                user.user_id, {item.client_key for item in items}
+            )
+        except Exception as e:
+            print("WALK_BULK_QUERY_ERROR:", e)
+            return walk_error("WALK_BULK_500_1", path)
+
+        first_index_by_key: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            if item.client_key in existing_keys:
+                results[i] = _bulk_result(item.client_key, "duplicate", existing_keys[item.client_key])
+                continue
+            if item.client_key in first_index_by_key:
+                # 같은 요청 안의 중복 키는 첫 항목 결과를 따름 (아래에서 채움)
+                continue
+
+            pet_entry = pets.get(item.pet_id)
+            if pet_entry is None:
+                results[i] = _bulk_failure(item.client_key, "WALK_SAVE_404_2")
+                continue
+            if not pet_entry[1]:
+                results[i] = _bulk_failure(item.client_key, "WALK_SAVE_403_1")
+                continue
+
+            try:
+                start_time = parse_utc(item.start_time)
+                end_time = parse_utc(item.end_time)
+            except ValueError:
+                results[i] = _bulk_failure(item.client_key, "WALK_SAVE_400_2")
+                continue
+            if end_time <= start_time:
+                results[i] = _bulk_failure(item.client_key, "WALK_SAVE_400_1")
+                continue
+
+            times[i] = (start_time, end_time)
+            first_index_by_key[item.client_key] = i
+
+        # ============================================
+        # 4) 저장 (동시 재전송과 unique 키가 겹치면 1회 재시도)
+        # ============================================
+        created_ids: Dict[str, int] = {}
+        for attempt in range(2):
+            pending = [i for i in first_index_by_key.values() if results[i] is None]
+            try:
+                created_ids = self._insert_bulk(user.user_id, items, pending, times)
+                self.db.commit()
+                break
+            except IntegrityError as e:
+                self.db.rollback()
+                if attempt == 1:
+                    print("WALK_BULK_SAVE_ERROR:", e)
+                    return walk_error("WALK_BULK_500_1", path)
+                raced = self.save_repo.get_walk_ids_by_client_keys(
+                    user.user_id, [items[i].client_key for i in pending]
+                )
+                for i in pending:
+                    if items[i].client_key in raced:
+                        results[i] = _bulk_result(items[i].client_key, "duplicate", raced[items[i].client_key])
+            except Exception as e:
+                print("WALK_BULK_SAVE_ERROR:", e)
+                self.db.rollback()
+                return walk_error("WALK_BULK_500_1", path)
+
+        for i in first_index_by_key.values():
+            if results[i] is None:
+                results[i] = _bulk_result(items[i].client_key, "created", created_ids.get(items[i].client_key))
+        for i, item in enumerate(items):
+            if results[i] is None:
+                first = results[first_index_by_key[item.client_key]]
+                results[i] = {**first, "status": "duplicate"} if first["status"] == "created" else first
+
+        # 오늘 산책 카운터 캐시 증분 반영
+        created_indexes = [
+            i for i in first_index_by_key.values() if results[i]["status"] == "created"
+        ]
+        for i in created_indexes:
+            today_counters.on_walk_saved(
+                items[i].pet_id, times[i][0], items[i].duration_min, items[i].distance_km
+            )
+
+        # ============================================
+        # 5) 반려동물별 요약 알림 + FCM 푸시
+        # ============================================
+        self._notify_bulk_saved(user, pets, [items[i] for i in created_indexes])
+
+        # ============================================
+        # 6) 응답 생성
+        # ============================================
+        counts = {"created": 0, "duplicate": 0, "failed": 0}
+        for r in results:
+            counts[r["status"]] += 1
+
+        response_content = {
+            "success": True,
+            "status": 200,
+            **counts,
+            "results": results,
+            "timeStamp": datetime.utcnow().isoformat(),
+            "path": path
+        }
+
+        return json_response(response_content, status_code=200)
+
+    def _insert_bulk(self, user_id: int, items, indexes: List[int], times: Dict[int, tuple]) -> Dict[str, int]:
+        if not indexes:
+            return {}
+
+        walk_ids = self.save_repo.bulk_insert_walks(user_id, [
+            {
+                "pet_id": items[i].pet_id,
+                "user_id": user_id,
+                "start_time": times[i][0],
+                "end_time": times[i][1],
+                "duration_min": items[i].duration_min,
+                "distance_km": items[i].distance_km,
+                "calories": items[i].calories,
+                "weather_status": items[i].weather_status,
+                "weather_temp_c": items[i].weather_temp_c,
+                "client_key": items[i].client_key,
+            }
+            for i in indexes
+        ])
+
+        photo_rows = []
+        point_rows = []
+        for i in indexes:
+            walk_id = walk_ids[items[i].client_key]
+            if items[i].thumbnail_image_url:
+                photo_rows.append({
+                    "walk_id": walk_id,
+                    "image_url": items[i].thumbnail_image_url,
+                    "uploaded_by": user_id,
+                    "caption": None,
+                })
+            if items[i].route_points:
+                point_rows.extend(_point_rows(walk_id, items[i].route_points))
+
+        self.save_repo.bulk_insert_photos(photo_rows)
+        self.save_repo.bulk_insert_points(point_rows)
+        return walk_ids
+
+    def _notify_bulk_saved(self, user: User, pets: dict, created_items: list) -> None:
+        by_pet: Dict[int, list] = {}
+        for item in created_items:
+            by_pet.setdefault(item.pet_id, []).append(item)
+
+        for pet_id, pet_items in by_pet.items():
+            pet = pets[pet_id][0]
+            try:
+                total_min = sum(item.duration_min or 0 for item in pet_items)
+                total_km = sum(item.distance_km or 0 for item in pet_items)
+                notification_message = (
+                    f"{user.nickname}님이 {pet.name}와 산책한 기록 {len(pet_items)}건을 저장했습니다."
+                    f" ({total_min}분 {total_km:.1f}km)"
+                )
+
+                self.notification_repo.create_notification(
+                    family_id=pet.family_id,
+                    target_user_id=None,  # 가족 전체에게 보여주는 공용 알림
+                    related_pet_id=pet.pet_id,
+                    related_user_id=user.user_id,
+                    notif_type=NotificationType.ACTIVITY_END,
+                    title="산책 기록 저장",
+                    message=notification_message,
+                )
+                self.db.commit()
+
+                self._send_walk_complete_fcm_push(
+                    family_id=pet.family_id,
+                    exclude_user_id=user.user_id,
+                    title="✅ 산책 기록 저장",
+                    body=notification_message,
+                    data={
+                        "type": "WALK_END",
+                        "pet_id": pet.pet_id,
+                        "pet_name": pet.name or "",
+                        "user_nickname": user.nickname or "",
+                        "walk_count": str(len(pet_items)),
+                    },
+                )
+            except Exception as e:
+                print("WALK_BULK_NOTIFICATION_ERROR:", e)
+                self.db.rollback()
+                # 알림 실패해도 산책 저장은 성공으로 처리
 
     def notify_walk_start(
         self,
@@ -382,20 +645,29 @@ class WalkSaveService:
         # ============================================
         try:
             notification_message = f"{user.nickname}님이 {pet.name}와 산책을 시작했습니다."
-            
-            # 알림 생성 (family 전체)
-            self.notification_repo.create_notification(
+
+            # start_walk 에서 이미 만든 ACTIVITY_START 알림이 있으면 중복 생성하지 않음
+            existing = self.notification_repo.check_existing_activity_notification(
                 family_id=pet.family_id,
-                target_user_id=None,  # 가족 전체에게 보여주는 공용 알림
                 related_pet_id=pet.pet_id,
                 related_user_id=user.user_id,
                 notif_type=NotificationType.ACTIVITY_START,
-                title="산책 시작",
-                message=notification_message,
+                since_time=datetime.utcnow() - timedelta(seconds=settings.PUSH_DEDUP_SEC),
             )
-            self.db.commit()
-            
-            # 🔔 FCM 푸시 알림 발송 (산책 시작한 본인 제외)
+            if not existing:
+                # 알림 생성 (family 전체)
+                self.notification_repo.create_notification(
+                    family_id=pet.family_id,
+                    target_user_id=None,  # 가족 전체에게 보여주는 공용 알림
+                    related_pet_id=pet.pet_id,
+                    related_user_id=user.user_id,
+                    notif_type=NotificationType.ACTIVITY_START,
+                    title="산책 시작",
+                    message=notification_message,
+                )
+                self.db.commit()
+
+            # 🔔 FCM 푸시 알림 발송 (산책 시작한 본인 제외, 같은 산책 시작 푸시는 병합기에서 1회만)
             self._send_walk_complete_fcm_push(
                 family_id=pet.family_id,
                 exclude_user_id=user.user_id,
@@ -430,6 +702,5 @@ class WalkSaveService:
             "path": path
         }
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
+        return json_response(response_content, status_code=200)
 
@@ -1,16 +1,19 @@
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from typing import Optional
 from datetime import datetime
 import httpx
 import os
 
 from app.core.firebase import verify_firebase_token
+from app.core.http_client import get_http_client
+from app.core.responses import json_response
 from app.domains.walk.exception import walk_error
 from app.domains.walk.repository.weather_repository import WeatherRepository
 
 
+WEATHER_FAILURE_CODES = ("WEATHER_502_1", "WEATHER_503_1")
+
+
 class WeatherService:
     def __init__(self):
         self.weather_repo = WeatherRepository()
@@ -37,10 +40,9 @@ class WeatherService:
                 "lang": "kr",  # 한국어
             }
 
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = get_http_client().get(self.base_url, params=params)
+            response.raise_for_status()
+            data = response.json()
 
             # OpenWeatherMap 응답 파싱
             weather_main = data.get("weather", [{}])[0]
@@ -148,28 +150,38 @@ class WeatherService:
             return walk_error("WEATHER_400_2", path)
 
         # ============================================
-        # 3) 캐시 확인
+        # 3) 캐시 → 외부 API → 오래된 캐시 순으로 조회
+        # ============================================
+        try:
+            weather = self.get_weather_data(latitude, longitude)
+        except Exception as e:
+            code = str(e)
+            return walk_error(code if code in WEATHER_FAILURE_CODES else "WEATHER_503_1", path)
+
+        # ============================================
+        # 4) 응답 생성
         # ============================================
+        response_content = {
+            "success": True,
+            "status": 200,
+            "weather": weather,
+            "timeStamp": datetime.utcnow().isoformat(),
+            "path": path
+        }
+
+        return json_response(response_content, status_code=200)
+
+    def get_weather_data(self, latitude: float, longitude: float) -> dict:
+        """
+        날씨 dict 반환 (홈 화면 집계 응답에서도 사용)
+        캐시도 없고 외부 API 도 실패하면 WEATHER_502_1 / WEATHER_503_1 코드를 담은 Exception
+        """
         cached_weather = self.weather_repo.get_cached_weather(latitude, longitude)
-        
+
         if cached_weather and not cached_weather.get("is_stale", False):
             # 최신 캐시가 있으면 반환
-            response_content = {
-                "success": True,
-                "status": 200,
-                "weather": {
-                    **cached_weather,
-                    "fetched_at": cached_weather["fetched_at"].isoformat() if isinstance(cached_weather.get("fetched_at"), datetime) else cached_weather.get("fetched_at"),
-                },
-                "timeStamp": datetime.utcnow().isoformat(),
-                "path": path
-            }
-            encoded = jsonable_encoder(response_content)
-            return JSONResponse(status_code=200, content=encoded)
+            return _serialize_weather(cached_weather)
 
-        # ============================================
-        # 4) 외부 API 호출
-        # ============================================
         try:
             weather_data = self._fetch_weather_from_api(latitude, longitude)
             weather_data["fetched_at"] = datetime.utcnow()
@@ -180,46 +192,21 @@ class WeatherService:
             self.weather_repo.set_cached_weather(latitude, longitude, weather_data)
 
         except Exception as e:
-            error_msg = str(e)
-            
             # 오래된 캐시가 있으면 반환
             if cached_weather:
                 cached_weather["is_stale"] = True
-                response_content = {
-                    "success": True,
-                    "status": 200,
-                    "weather": {
-                        **cached_weather,
-                        "fetched_at": cached_weather["fetched_at"].isoformat() if isinstance(cached_weather.get("fetched_at"), datetime) else cached_weather.get("fetched_at"),
-                    },
-                    "timeStamp": datetime.utcnow().isoformat(),
-                    "path": path
-                }
-                encoded = jsonable_encoder(response_content)
-                return JSONResponse(status_code=200, content=encoded)
+                return _serialize_weather(cached_weather)
 
             # 캐시도 없고 API 호출도 실패한 경우
-            if "EXTERNAL_API_5XX" in error_msg:
-                return walk_error("WEATHER_502_1", path)
-            elif "EXTERNAL_API_TIMEOUT" in error_msg:
-                return walk_error("WEATHER_503_1", path)
-            else:
-                return walk_error("WEATHER_503_1", path)
+            if "EXTERNAL_API_5XX" in str(e):
+                raise Exception("WEATHER_502_1")
+            raise Exception("WEATHER_503_1")
 
-        # ============================================
-        # 5) 응답 생성
-        # ============================================
-        response_content = {
-            "success": True,
-            "status": 200,
-            "weather": {
-                **weather_data,
-                "fetched_at": weather_data["fetched_at"].isoformat() if isinstance(weather_data.get("fetched_at"), datetime) else weather_data.get("fetched_at"),
-            },
-            "timeStamp": datetime.utcnow().isoformat(),
-            "path": path
-        }
+        return _serialize_weather(weather_data)
 
-        encoded = jsonable_encoder(response_content)
-        return JSONResponse(status_code=200, content=encoded)
 
+def _serialize_weather(weather: dict) -> dict:
+    return {
+        **weather,
+        "fetched_at": weather["fetched_at"].isoformat() if isinstance(weather.get("fetched_at"), datetime) else weather.get("fetched_at"),
+    }
@@ -4,6 +4,7 @@ import httpx
 import os
 
 from app.core.config import settings
+from app.core.http_client import get_async_http_client
 
 router = APIRouter(
     prefix="/api/v1/weather",
@@ -52,10 +53,9 @@ async def get_current_weather(
     }
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await get_async_http_client().get(url, params=params, timeout=10.0)
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if 500 <= e.response.status_code < 600:
             raise HTTPException(
@@ -1,5 +1,10 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from typing import Optional
+
+from fastapi import FastAPI, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.domains.auth.router.auth_router import router as auth_router
 from app.domains.pets.router.register_router import router as pet_register_router
 from app.domains.pets.router.share_request_router import router as pet_share_router
@@ -17,13 +22,71 @@ from app.domains.users.router.users_router import router as user_router
 from app.domains.notifications.router.notification_router import router as notifications_router
 from app.domains.notifications.router.health_router import router as health_router
 from app.domains.notifications.router.weather_router import router as weather_router
+from app.domains.notifications.router.broadcast_router import router as broadcast_router
 from app.domains.weather.router.weather_router import router as current_weather_router
+from app.domains.home.router.home_router import router as home_router
+from app.domains.sync.router.sync_router import router as sync_router
 
 
 from fastapi.openapi.utils import get_openapi
+from app.core.config import settings
+from app.core import metrics
+from app.core.ops_auth import ops_auth_error
+from app.core.responses import FastJSONResponse
+from app.core.http_client import aclose_http_clients
+from app.core.fcm_fanout import shutdown_fanout
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 🟢 user_fcm_tokens 스키마 확인은 기동 시 1회만 (요청마다 inspector 조회 제거)
+    from app.db import engine
+    from app.domains.users.repository.user_repository import ensure_fcm_token_table
+
+    ensure_fcm_token_table(engine)
+
+    # 🟢 진행 중 산책 레지스트리 예열 (이후 track 요청은 Walk/Pet/FamilyMember 조회 생략)
+    from app.core.active_walks import registry as active_walk_registry
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"[ACTIVE_WALKS] warmed {active_walk_registry.warm(db)} ongoing walks")
+    except Exception as e:
+        print("[ACTIVE_WALKS] warm failed:", e)
+    finally:
+        db.close()
+
+    # 🟢 주기 작업 스케줄러 (replica 간 lease로 작업별 1곳에서만 실행)
+    scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        from app.core.jobs import create_scheduler
+
+        scheduler = create_scheduler()
+        scheduler.start()
+    app.state.scheduler = scheduler
+
+    # 🟢 멀티 워커 /metrics 집계용 스냅샷 기록
+    metrics.start_snapshot_flusher()
+
+    yield
+
+    if scheduler is not None:
+        scheduler.stop()
+    # 대기 중인 병합 푸시는 종료 전에 모두 전송
+    from app.core.push_coalescer import coalescer
+
+    coalescer.stop(flush=True)
+    shutdown_fanout()
+    metrics.stop_snapshot_flusher()
+    await aclose_http_clients()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
+        lifespan=lifespan,
+        # dict 를 반환하는 라우트 / response_model 직렬화 결과도 orjson 으로 렌더링
+        default_response_class=FastJSONResponse,
         title="Take a Paw API 🐾",
         version="1.0.0",
         description="Backend API for Take a Paw mobile app",
@@ -36,6 +99,8 @@ def create_app() -> FastAPI:
             {"name": "Pet", "description": "반려동물 등록/조회/수정/삭제 API"},
             {"name": "Walk", "description": "산책 기록 API"},
             {"name": "Family", "description": "가족 그룹 관리 API"},
+            {"name": "Home", "description": "홈 화면 집계 API"},
+            {"name": "Sync", "description": "변경분 동기화 API"},
         ]
     )
 
@@ -46,8 +111,18 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],      # 웹 클라이언트가 If-None-Match 로 재검증할 수 있도록
     )
 
+    # 요청 지표 (라우트 템플릿 단위 latency/status/size/in-flight)
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    # 디버그 모드: 요청별 SQL 수/시간 헤더 + N+1 의심 로그
+    if settings.DB_QUERY_DEBUG:
+        from app.core.query_counter import QueryCounterMiddleware
+
+        app.add_middleware(QueryCounterMiddleware)
+
     # 🟢 라우터 등록
     app.include_router(auth_router)
 
@@ -75,14 +150,36 @@ def create_app() -> FastAPI:
     app.include_router(notifications_router)
     app.include_router(health_router)
     app.include_router(weather_router)
+    app.include_router(broadcast_router)
     # Weather API
     app.include_router(current_weather_router)
+    # Home (앱 첫 화면 집계)
+    app.include_router(home_router)
+    # Sync (cursor 이후 변경분)
+    app.include_router(sync_router)
 
 
     @app.get("/")
     def root():
         return {"message": "🐾 Take a Paw API is running successfully"}
 
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint(request: Request, authorization: Optional[str] = Header(None)):
+        # Prometheus scrape 설정의 bearer token 으로 OPS_API_TOKEN 을 전달
+        denied = ops_auth_error(request, authorization)
+        if denied is not None:
+            return denied
+        return PlainTextResponse(metrics.generate_latest(), media_type=metrics.CONTENT_TYPE_LATEST)
+
+    @app.get("/scheduler/jobs", include_in_schema=False)
+    def scheduler_jobs(request: Request, authorization: Optional[str] = Header(None)):
+        # 작업별 last_error 에 내부 정보가 담길 수 있어 운영 토큰으로만 조회
+        denied = ops_auth_error(request, authorization)
+        if denied is not None:
+            return denied
+        scheduler = getattr(app.state, "scheduler", None)
+        return {"enabled": scheduler is not None, "jobs": scheduler.stats() if scheduler else []}
+
     return app
 
 
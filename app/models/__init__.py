@@ -14,3 +14,8 @@ from .notification_reads import NotificationRead
 from .pet_walk_recommendation import PetWalkRecommendation
 from .pet_walk_goal import PetWalkGoal
 from .user_fcm_token import UserFcmToken
+from .job_lease import JobLease
+from .change_log import ChangeLog
+from .purge_job import PurgeJob
+from .walk_route_archive import WalkRouteArchive
+from .broadcast_job import BroadcastJob
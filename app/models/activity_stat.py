@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DECIMAL, Float, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DECIMAL, Float, Date, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from app.models.base import Base
 
@@ -16,3 +16,8 @@ class ActivityStat(Base):
     calories_burned = Column(Float)
 
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    # 펫별 하루 1행 (산책 종료 시 upsert 로 누적)
+    __table_args__ = (
+        UniqueConstraint("pet_id", "date", name="uq_activity_stats_pet_date"),
+    )
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class BroadcastJob(Base):
+    """
+    전체 기기 푸시 발송 작업 (운영자 요청 → 백그라운드 워커가 발송)
+    - dedup_key unique: 같은 요청을 재시도해도 작업은 1건, 발송도 1번
+    - device_cursor / legacy_cursor: 토큰 출처별 마지막 발송 id. 페이지 발송마다 집계와 함께 commit → 중단돼도 이어서 진행
+    - lease_owner / lease_until: 한 작업은 한 워커만 실행, 워커가 죽으면 lease 만료 후 다른 워커가 이어받음
+    """
+
+    __tablename__ = "broadcast_jobs"
+    __table_args__ = (
+        Index("ix_broadcast_jobs_status_job", "status", "job_id"),
+    )
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    dedup_key = Column(String(64), nullable=False, unique=True)
+    title = Column(String(100), nullable=False)
+    body = Column(String(500), nullable=False)
+    data = Column(Text, nullable=True)  # JSON 문자열
+
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING / DONE / FAILED
+    device_cursor = Column(Integer, nullable=False, default=0)
+    legacy_cursor = Column(Integer, nullable=False, default=0)
+    pages = Column(Integer, nullable=False, default=0)
+    tokens = Column(Integer, nullable=False, default=0)
+    success = Column(Integer, nullable=False, default=0)
+    failure = Column(Integer, nullable=False, default=0)
+    invalid = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String(255), nullable=True)
+
+    lease_owner = Column(String(128), nullable=True)
+    lease_until = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, nullable=True)
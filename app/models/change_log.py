@@ -0,0 +1,29 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+
+from app.models.base import Base
+
+
+class ChangeLog(Base):
+    """
+    동기화 API(/api/v1/sync/changes)용 변경 기록
+    - change_id 가 클라이언트 cursor (단조 증가)
+    - 한 행 = (entity, entity_id) 의 변경 1건. op: U(생성/수정) / D(삭제)
+    - 보이는 범위: family_id 가 내 가족이거나 user_id 가 나 (기록 시점 기준, 삭제 후에도 남도록 FK 없음)
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_family_change", "family_id", "change_id"),
+        Index("ix_change_log_user_change", "user_id", "change_id"),
+        Index("ix_change_log_created_at", "created_at"),
+    )
+
+    change_id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    entity = Column(String(20), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String(1), nullable=False)
+
+    family_id = Column(Integer, nullable=True)
+    user_id = Column(Integer, nullable=True)
+
+    created_at = Column(DateTime, nullable=False)
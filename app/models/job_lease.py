@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class JobLease(Base):
+    """
+    스케줄러 작업 리더 선출용 lease
+    - 한 작업(name)의 한 실행 슬롯(last_slot)은 전체 replica 중 한 곳에서만 실행
+    """
+
+    __tablename__ = "job_leases"
+
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(128), nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+    last_slot = Column(DateTime, nullable=True)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -29,3 +29,6 @@ class Pet(Base):
 
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    # 삭제 요청 시각 (tombstone). 채워지면 조회에서 제외되고 purge 작업이 연관 데이터를 정리
+    deleted_at = Column(DateTime, nullable=True)
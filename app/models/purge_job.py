@@ -0,0 +1,34 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class PurgeJob(Base):
+    """
+    계정 / 가족 / 반려동물 삭제 후 연관 데이터 정리 작업
+    - 요청 시에는 tombstone(deleted_at)만 남기고, 연관 행은 워커가 작은 묶음으로 삭제
+    - step / step_cursor / deleted_rows 는 삭제와 같은 트랜잭션에서 갱신 → 중단돼도 이어서 진행
+    """
+
+    __tablename__ = "purge_jobs"
+    __table_args__ = (
+        Index("ix_purge_jobs_status_job", "status", "job_id"),
+    )
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)  # user / family / pet
+    target_id = Column(Integer, nullable=False)
+    # user 작업: Firebase 계정 삭제 재시도용 원래 UID
+    firebase_uid = Column(String(128), nullable=True)
+
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING / DONE / FAILED
+    step = Column(String(40), nullable=True)
+    step_cursor = Column(Integer, nullable=False, default=0)
+    deleted_rows = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String(255), nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, nullable=True)
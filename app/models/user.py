@@ -29,5 +29,8 @@ class User(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
+    # 삭제 요청 시각 (tombstone). 채워지면 조회에서 제외되고 purge 작업이 연관 데이터를 정리
+    deleted_at = Column(DateTime, nullable=True)
+
     def __repr__(self):
         return f"<User id={self.user_id}, uid={self.firebase_uid}, sns={self.sns}>"
@@ -1,9 +1,19 @@
-from sqlalchemy import Column, Integer, DECIMAL, Float, DateTime, String, ForeignKey
+from sqlalchemy import Column, Computed, Index, Integer, DECIMAL, Float, DateTime, String, ForeignKey
 from sqlalchemy.sql import func
 from app.models.base import Base
 
 class Walk(Base):
     __tablename__ = "walks"
+    __table_args__ = (
+        # 펫당 진행 중인 산책은 1개만 (종료된 산책은 NULL 이라 unique 대상 아님)
+        Index("uq_walks_active_pet", "active_pet_id", unique=True),
+        # 오프라인 업로드 재시도 중복 방지 (사용자별 클라이언트 생성 키)
+        Index("uq_walks_user_client_key", "user_id", "client_key", unique=True),
+        # 기간 조회 (통계/랭킹/사진/오늘): 앞 컬럼 동등 + start_time 범위
+        Index("ix_walks_pet_start", "pet_id", "start_time"),
+        Index("ix_walks_user_start", "user_id", "start_time"),
+        Index("ix_walks_start", "start_time"),
+    )
 
     walk_id = Column(Integer, primary_key=True, autoincrement=True)
     pet_id = Column(Integer, ForeignKey("pets.pet_id"), nullable=False)
@@ -28,3 +38,12 @@ class Walk(Base):
 
 
     created_at = Column(DateTime, default=func.now())
+
+    # 클라이언트가 만든 idempotency key (오프라인 저장분 재전송 시 같은 값)
+    client_key = Column(String(64), nullable=True)
+
+    # 진행 중(end_time IS NULL)일 때만 pet_id, 종료되면 NULL 이 되는 생성 컬럼
+    active_pet_id = Column(
+        Integer,
+        Computed("CASE WHEN end_time IS NULL THEN pet_id END", persisted=True),
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.dialects import mysql
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class WalkRouteArchive(Base):
+    """
+    오래된 산책 경로(walk_tracking_points)의 압축 보관본 (산책 1건당 1행)
+    - codec: (point_id, 위도, 경도, 시각) 을 delta + varint 로 직렬화한 뒤 zlib 압축
+    - storage: db 면 data 컬럼에, file 이면 object_key 위치(로컬 객체 저장소 대용)에 보관
+    - 보관이 끝난 산책의 hot 행은 삭제되므로, 경로 조회는 hot 행이 없을 때 이 테이블을 읽음
+    """
+
+    __tablename__ = "walk_route_archives"
+
+    walk_id = Column(Integer, ForeignKey("walks.walk_id"), primary_key=True)
+    point_count = Column(Integer, nullable=False)
+    codec = Column(String(20), nullable=False)
+    storage = Column(String(10), nullable=False)
+    data = Column(LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql"), nullable=True)
+    object_key = Column(String(255), nullable=True)
+    compressed_bytes = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime, server_default=func.now())
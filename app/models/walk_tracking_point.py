@@ -1,11 +1,17 @@
-from sqlalchemy import Column, Integer, DECIMAL, DateTime, ForeignKey
+from sqlalchemy import Column, Index, Integer, DECIMAL, DateTime
 from app.models.base import Base
 
 class WalkTrackingPoint(Base):
     __tablename__ = "walk_tracking_points"
+    # MySQL 에서는 timestamp 기준 월 단위 RANGE 파티션 (마이그레이션 a9d2e6f1c874)
+    # - 파티션 키가 모든 unique 키에 들어가야 해서 물리 PK 는 (point_id, timestamp)
+    # - 파티션 테이블은 FK 를 가질 수 없어 walks 참조는 애플리케이션에서 보장 (삭제는 purge 작업)
+    __table_args__ = (
+        Index("ix_walk_tracking_points_walk_ts", "walk_id", "timestamp"),
+    )
 
     point_id = Column(Integer, primary_key=True, autoincrement=True)
-    walk_id = Column(Integer, ForeignKey("walks.walk_id"), nullable=False)
+    walk_id = Column(Integer, nullable=False)
 
     latitude = Column(DECIMAL(10, 7), nullable=False)
     longitude = Column(DECIMAL(10, 7), nullable=False)
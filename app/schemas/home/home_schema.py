@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.schemas.pets.my_pets_schema import MyPetItem
+from app.schemas.record.recent_schema import RecentActivityItem
+from app.schemas.walk.recommendation_schema import RecommendationDetail
+from app.schemas.walk.today_schema import TodayWalkDetail
+from app.schemas.walk.weather_schema import WeatherDetail
+
+
+class HomeUser(BaseModel):
+    """홈 화면 사용자 정보"""
+    user_id: int = Field(..., description="사용자 ID")
+    nickname: Optional[str] = Field(None, description="닉네임")
+    profile_img_url: Optional[str] = Field(None, description="프로필 이미지 URL")
+
+
+class HomePetItem(MyPetItem):
+    """홈 화면 반려동물 항목 (내 반려동물 + 오늘/최근/추천)"""
+    today: Optional[TodayWalkDetail] = Field(None, description="오늘 산책 현황 (조회 실패 시 null)")
+    recent_activities: List[RecentActivityItem] = Field(default_factory=list, description="최근 활동 목록")
+    recommendation: Optional[RecommendationDetail] = Field(None, description="추천 산책 정보 (없으면 null)")
+
+
+class HomeNotificationSummary(BaseModel):
+    """홈 화면 알림 요약"""
+    unread_count: int = Field(..., description="안 읽은 알림 수")
+
+
+class HomeSectionError(BaseModel):
+    """섹션별 부분 실패 정보"""
+    section: str = Field(..., description="실패한 섹션 (today, recent_activities, recommendation, notifications, weather)")
+    status: int = Field(..., description="섹션 상태 코드")
+    code: str = Field(..., description="에러 코드")
+    reason: str = Field(..., description="에러 메시지")
+
+
+class HomeResponse(BaseModel):
+    """홈 화면 집계 응답"""
+    success: bool = Field(True, description="성공 여부")
+    status: int = Field(200, description="HTTP 상태 코드")
+    user: HomeUser = Field(..., description="사용자 정보")
+    pets: List[HomePetItem] = Field(default_factory=list, description="반려동물 목록")
+    weather: Optional[WeatherDetail] = Field(None, description="날씨 (lat/lng 미전달 또는 조회 실패 시 null)")
+    notifications: Optional[HomeNotificationSummary] = Field(None, description="알림 요약 (조회 실패 시 null)")
+    errors: List[HomeSectionError] = Field(default_factory=list, description="부분 실패 목록 (비어 있으면 전체 성공)")
+    timeStamp: str = Field(..., description="응답 시간 (ISO 형식)")
+    path: str = Field(..., description="요청 경로")
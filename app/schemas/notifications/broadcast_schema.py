@@ -0,0 +1,26 @@
+# app/schemas/notifications/broadcast_schema.py
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BroadcastRequest(BaseModel):
+    title: str = Field(..., min_length=1, max_length=100)
+    body: str = Field(..., min_length=1, max_length=500)
+    data: Optional[Dict[str, str]] = None
+    # 같은 키로 다시 요청하면 새로 발송하지 않고 기존 작업을 돌려줌 (없으면 제목/본문/data 로 생성)
+    dedup_key: Optional[str] = Field(None, min_length=1, max_length=64)
+
+
+class BroadcastJobResponse(BaseModel):
+    job_id: int
+    status: str
+    created: bool = False
+    pages: int
+    tokens: int
+    success: int
+    failure: int
+    invalid: int
+    attempts: int
+    last_error: Optional[str] = None
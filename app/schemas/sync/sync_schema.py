@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class SyncChangeItem(BaseModel):
+    """변경 항목 (같은 엔티티는 페이지 안에서 마지막 상태 1건으로 합쳐짐)"""
+    entity: str = Field(..., description="pet, walk, photo, notification, family_member, share_request")
+    id: int = Field(..., description="엔티티 ID")
+    op: str = Field(..., description="upsert(생성/수정) 또는 delete")
+    data: Optional[Dict[str, Any]] = Field(None, description="upsert 일 때 현재 값 (delete 면 null)")
+
+
+class SyncChangesResponse(BaseModel):
+    """변경분 조회 응답"""
+    success: bool = Field(True, description="성공 여부")
+    status: int = Field(200, description="HTTP 상태 코드")
+    changes: List[SyncChangeItem] = Field(default_factory=list, description="cursor 이후 변경 목록 (오래된 순)")
+    next_cursor: str = Field(..., description="다음 요청에 전달할 cursor")
+    has_more: bool = Field(False, description="이어서 받을 변경이 더 있는지")
+    full_resync: bool = Field(
+        False,
+        description="true 면 목록 전체를 다시 받아야 함 (첫 동기화, 오래된 cursor, 내 가족 구성 변경)",
+    )
+    timeStamp: str = Field(..., description="응답 시간 (ISO 형식)")
+    path: str = Field(..., description="요청 경로")
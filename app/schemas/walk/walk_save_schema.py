@@ -22,6 +22,10 @@ class WalkSaveRequest(BaseModel):
     weather_temp_c: Optional[float] = Field(None, description="날씨 온도 (섭씨)")
     thumbnail_image_url: Optional[str] = Field(None, description="대표 이미지 URL")
     route_points: Optional[List[RoutePointDto]] = Field(None, description="경로 포인트 목록")
+    client_key: Optional[str] = Field(
+        None, min_length=1, max_length=64,
+        description="클라이언트가 만든 중복 방지 키 (재전송 시 같은 값이면 기존 기록을 반환)",
+    )
 
 
 class WalkSaveDetail(BaseModel):
@@ -48,3 +52,34 @@ class WalkSaveResponse(BaseModel):
     path: str = Field(..., description="요청 경로")
 
 
+
+
+class WalkBulkSaveItem(WalkSaveRequest):
+    """일괄 저장 항목 (client_key 필수)"""
+    client_key: str = Field(..., min_length=1, max_length=64, description="클라이언트가 만든 중복 방지 키")
+
+
+class WalkBulkSaveRequest(BaseModel):
+    """오프라인 산책 일괄 저장 요청"""
+    walks: List[WalkBulkSaveItem] = Field(..., min_length=1, max_length=100, description="저장할 산책 목록 (최대 100개)")
+
+
+class WalkBulkSaveResult(BaseModel):
+    """항목별 저장 결과"""
+    client_key: str = Field(..., description="요청한 중복 방지 키")
+    status: str = Field(..., description="created(새로 저장) / duplicate(이미 저장됨) / failed")
+    walk_id: Optional[int] = Field(None, description="산책 ID (failed 면 null)")
+    code: Optional[str] = Field(None, description="실패 코드")
+    reason: Optional[str] = Field(None, description="실패 사유")
+
+
+class WalkBulkSaveResponse(BaseModel):
+    """오프라인 산책 일괄 저장 응답"""
+    success: bool = Field(True, description="성공 여부")
+    status: int = Field(200, description="HTTP 상태 코드")
+    created: int = Field(..., description="새로 저장된 수")
+    duplicate: int = Field(..., description="이미 저장되어 있던 수")
+    failed: int = Field(..., description="실패한 수")
+    results: List[WalkBulkSaveResult] = Field(..., description="요청 순서대로의 항목별 결과")
+    timeStamp: str = Field(..., description="응답 시간 (ISO 형식)")
+    path: str = Field(..., description="요청 경로")
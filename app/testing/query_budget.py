@@ -0,0 +1,80 @@
+"""
+SQL 쿼리 예산 pytest 플러그인 (N+1 회귀 방지)
+
+사용: tests/conftest.py 에서 pytest_plugins 로 로드 (다른 곳에서는 pytest -p app.testing.query_budget)
+
+    @pytest.mark.query_budget(max_queries=6, max_repeats=2)
+    def test_ranking(client):
+        client.get("/api/v1/walk/ranking?family_id=1&period=WEEK")
+
+    def test_notifications(client, query_budget):
+        with query_budget(max_queries=5, max_repeats=2):
+            client.get("/api/v1/notifications")
+
+- max_queries: 구간 전체에서 허용하는 SQL 문장 수
+- max_repeats: 같은 모양(바인드 값/IN 목록 길이 무시)의 문장이 반복될 수 있는 최대 횟수
+"""
+from contextlib import contextmanager
+from typing import Optional
+
+import pytest
+
+from app.core.query_counter import QueryStats, track_all_queries
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def check_budget(
+    stats: QueryStats,
+    max_queries: Optional[int] = None,
+    max_repeats: Optional[int] = None,
+    label: str = "",
+) -> None:
+    problems = []
+    if max_queries is not None and stats.count > max_queries:
+        problems.append(f"{stats.count} queries > budget {max_queries}")
+    if max_repeats is not None:
+        for shape, n in stats.repeated(max_repeats + 1):
+            problems.append(f"statement repeated {n}x (max {max_repeats}): {shape[:200]}")
+
+    if problems:
+        head = f"Query budget exceeded{' for ' + label if label else ''}:"
+        raise QueryBudgetExceeded("\n  ".join([head, *problems]))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries=None, max_repeats=None): "
+        "테스트 전체 SQL 수 / 같은 문장 반복 수 상한",
+    )
+
+
+@pytest.fixture
+def query_budget():
+    """구간별 예산: with query_budget(max_queries=..., max_repeats=...): ..."""
+
+    @contextmanager
+    def _budget(max_queries: Optional[int] = None, max_repeats: Optional[int] = None, label: str = ""):
+        with track_all_queries() as stats:
+            yield stats
+        check_budget(stats, max_queries, max_repeats, label)
+
+    return _budget
+
+
+@pytest.fixture(autouse=True)
+def _query_budget_marker(request):
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+
+    max_queries = marker.kwargs.get("max_queries", marker.args[0] if marker.args else None)
+    max_repeats = marker.kwargs.get("max_repeats")
+
+    with track_all_queries() as stats:
+        yield
+    check_budget(stats, max_queries, max_repeats, request.node.nodeid)
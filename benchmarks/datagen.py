@@ -0,0 +1,379 @@
+"""
+대규모 합성 데이터 생성기 (app.models 스키마와 일치)
+
+scale=1.0 이 사용자 약 10만 명 규모. 분포는 실제 서비스 모양을 흉내낸다.
+- 가족 구성원 수 / 가족당 반려동물 수: 1이 가장 많고 꼬리가 짧은 이산 분포
+- 반려동물별 활동량, 가족 내 산책 담당 비중: 파레토(멱법칙) — 소수가 대부분의 산책을 기록
+- 산책 시각: 아침/저녁 두 봉우리 (KST), 산책 시간: 로그정규
+- GPS 경로: 방향 지속성이 있는 상관 랜덤워크 (10초 간격), 거리는 속도×시간(경로 길이 기대값)과 일치
+- 경로 포인트는 최근 trace_days 일 산책에만 생성 (오래된 경로는 보관 계층으로 간다는 가정)
+
+모든 PK를 명시적으로 부여하고, 테이블별 버퍼를 부모→자식 순서로 Core executemany 청크 INSERT 한다.
+
+    python -m benchmarks.datagen --db sqlite:///bench.db --scale 0.01 --years 1
+    python -m benchmarks.datagen --db "mysql+pymysql://root:pw@127.0.0.1:3306/takeapaw_bench" --scale 1 --no-create-schema
+"""
+import argparse
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from benchmarks.env import prepare_environment
+
+USERS_PER_SCALE = 100_000
+
+MEMBER_COUNT_WEIGHTS = {1: 0.35, 2: 0.30, 3: 0.18, 4: 0.10, 5: 0.05, 6: 0.02}
+PET_COUNT_WEIGHTS = {1: 0.60, 2: 0.28, 3: 0.09, 4: 0.03}
+
+# 가족 거주지 후보 (위도, 경도, 가중치)
+CITY_CENTERS = [
+    (37.5665, 126.9780, 0.45),  # 서울
+    (37.4563, 126.7052, 0.10),  # 인천
+    (37.2636, 127.0286, 0.12),  # 수원
+    (35.1796, 129.0756, 0.12),  # 부산
+    (35.8714, 128.6014, 0.08),  # 대구
+    (36.3504, 127.3845, 0.07),  # 대전
+    (35.1595, 126.8526, 0.06),  # 광주
+]
+
+BREEDS = [
+    "말티즈", "푸들", "포메라니안", "시츄", "비숑", "치와와", "요크셔테리어",
+    "시바견", "웰시코기", "진돗개", "비글", "프렌치불독", "골든리트리버", "래브라도리트리버", "믹스",
+]
+DISEASES = [None] * 8 + ["관절염", "비만", "심장병", "슬개골 탈구"]
+
+POINT_INTERVAL_SEC = 10
+METERS_PER_DEG_LAT = 111_320.0
+KST_OFFSET = timedelta(hours=9)
+
+
+@dataclass
+class GenConfig:
+    scale: float = 0.01
+    years: float = 1.0
+    mean_walks_per_week: float = 6.0
+    inactive_pet_ratio: float = 0.1
+    activity_alpha: float = 1.6          # 파레토 형상 (작을수록 쏠림이 큼)
+    trace_days: int = 14
+    photo_ratio: float = 0.15
+    notification_days: int = 90
+    read_ratio: float = 0.7
+    chunk_size: int = 5000
+    rng_seed: int = 42
+
+
+# ============================================================
+# 적재기
+# ============================================================
+class BulkLoader:
+    """테이블별 버퍼를 모아 부모→자식 순서로 청크 INSERT"""
+
+    def __init__(self, conn, tables: List, chunk_size: int):
+        self.conn = conn
+        self.tables = tables
+        self.chunk_size = chunk_size
+        self.buffers: Dict[str, List[dict]] = {t.name: [] for t in tables}
+        self.counts: Dict[str, int] = {t.name: 0 for t in tables}
+        self._pending = 0
+
+    def add(self, table, row: dict) -> None:
+        self.buffers[table.name].append(row)
+        self._pending += 1
+        if self._pending >= self.chunk_size * 4 or len(self.buffers[table.name]) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        from sqlalchemy import insert
+
+        for table in self.tables:
+            rows = self.buffers[table.name]
+            for i in range(0, len(rows), self.chunk_size):
+                self.conn.execute(insert(table), rows[i:i + self.chunk_size])
+            self.counts[table.name] += len(rows)
+            self.buffers[table.name] = []
+        self._pending = 0
+
+
+# ============================================================
+# 분포 헬퍼
+# ============================================================
+def _weighted(rng: random.Random, weights: Dict[int, float]) -> int:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _pareto_weight(rng: random.Random, alpha: float) -> float:
+    return rng.paretovariate(alpha)
+
+
+def _home_location(rng: random.Random):
+    lat, lng, _ = rng.choices(CITY_CENTERS, weights=[c[2] for c in CITY_CENTERS])[0]
+    # 도시 중심에서 수 km 이내로 퍼뜨림
+    return lat + rng.gauss(0, 0.05), lng + rng.gauss(0, 0.06)
+
+
+def _walk_start_kst_hour(rng: random.Random) -> float:
+    if rng.random() < 0.55:
+        return min(max(rng.gauss(7.5, 1.0), 5.0), 11.0)
+    return min(max(rng.gauss(19.5, 1.5), 15.0), 23.5)
+
+
+def _gps_trace(rng: random.Random, lat: float, lng: float, duration_min: int, speed_kmh: float):
+    """상관 랜덤워크 경로 (10초 간격 좌표 목록). 후반부에는 출발점 방향으로 조금씩 꺾인다"""
+    steps = max(2, duration_min * 60 // POINT_INTERVAL_SEC)
+    step_m = speed_kmh * 1000 / 3600 * POINT_INTERVAL_SEC
+    home_lat, home_lng = lat, lng
+    heading = rng.uniform(0, 2 * math.pi)
+    points = [(lat, lng)]
+    for i in range(steps - 1):
+        heading += rng.gauss(0, 0.35)
+        if i > steps // 2:
+            # 산책은 대체로 원점 회귀: 집 방향과의 각도 차이를 조금씩 줄임
+            to_home = math.atan2(
+                (home_lng - lng) * math.cos(math.radians(lat)),
+                home_lat - lat,
+            )
+            diff = (to_home - heading + math.pi) % (2 * math.pi) - math.pi
+            heading += 0.15 * diff
+        d = step_m * rng.uniform(0.7, 1.3)
+        lat += d * math.cos(heading) / METERS_PER_DEG_LAT
+        lng += d * math.sin(heading) / (METERS_PER_DEG_LAT * math.cos(math.radians(lat)))
+        points.append((lat, lng))
+    return points
+
+
+# ============================================================
+# 생성
+# ============================================================
+def generate(engine, config: Optional[GenConfig] = None) -> Dict[str, int]:
+    from app.models import (
+        ActivityStat, Family, FamilyMember, Notification, NotificationRead, Pet,
+        PetWalkRecommendation, Photo, User, UserFcmToken, Walk, WalkTrackingPoint,
+    )
+    from app.models.family_member import MemberRole
+    from app.models.notification import NotificationType
+    from app.domains.pets.service.recommendation_engine import GENERATED_BY_RULE, PetProfile, recommend
+    from sqlalchemy import text
+
+    cfg = config or GenConfig()
+    rng = random.Random(cfg.rng_seed)
+
+    target_users = max(1, int(USERS_PER_SCALE * cfg.scale))
+    now = datetime.utcnow().replace(microsecond=0)
+    history_days = int(cfg.years * 365)
+    trace_since = now - timedelta(days=cfg.trace_days)
+    notif_since = now - timedelta(days=cfg.notification_days)
+
+    tables = [
+        User.__table__, Family.__table__, FamilyMember.__table__, UserFcmToken.__table__,
+        Pet.__table__, PetWalkRecommendation.__table__, Walk.__table__, WalkTrackingPoint.__table__,
+        Photo.__table__, ActivityStat.__table__, Notification.__table__, NotificationRead.__table__,
+    ]
+    T = {t.name: t for t in tables}
+
+    ids = {name: 0 for name in ("user", "family", "member", "token", "pet", "walk", "point", "photo", "stat", "notif", "read")}
+
+    def next_id(kind: str) -> int:
+        ids[kind] += 1
+        return ids[kind]
+
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+        if engine.dialect.name == "mysql":
+            conn.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+            conn.execute(text("SET UNIQUE_CHECKS=0"))
+
+        loader = BulkLoader(conn, tables, cfg.chunk_size)
+
+        while ids["user"] < target_users:
+            family_id = next_id("family")
+            loader.add(T["families"], {
+                "family_id": family_id, "family_name": f"가족{family_id}",
+                "created_at": now - timedelta(days=history_days), "updated_at": now,
+            })
+
+            # 구성원
+            member_ids, member_weights = [], []
+            for m in range(_weighted(rng, MEMBER_COUNT_WEIGHTS)):
+                user_id = next_id("user")
+                uid = f"gen-{user_id}"
+                loader.add(T["users"], {
+                    "user_id": user_id, "firebase_uid": uid, "sns": rng.choice(["google", "kakao", "apple", "email"]),
+                    "nickname": f"user{user_id}", "email": f"{uid}@gen.local",
+                    "created_at": now - timedelta(days=history_days), "updated_at": now,
+                })
+                loader.add(T["family_members"], {
+                    "member_id": next_id("member"), "family_id": family_id, "user_id": user_id,
+                    "role": MemberRole.OWNER if m == 0 else MemberRole.MEMBER,
+                    "joined_at": now - timedelta(days=history_days),
+                })
+                for d in range(1 if rng.random() < 0.8 else 2):
+                    token_id = next_id("token")
+                    loader.add(T["user_fcm_tokens"], {
+                        "token_id": token_id, "user_id": user_id, "fcm_token": f"fcm-{uid}-{d}",
+                        "device_id": f"dev-{token_id}", "platform": "android" if rng.random() < 0.7 else "ios",
+                        "is_active": True, "created_at": now, "updated_at": now,
+                    })
+                member_ids.append(user_id)
+                member_weights.append(_pareto_weight(rng, cfg.activity_alpha))
+
+            home_lat, home_lng = _home_location(rng)
+
+            # 반려동물
+            for _ in range(_weighted(rng, PET_COUNT_WEIGHTS)):
+                pet_id = next_id("pet")
+                breed = rng.choice(BREEDS)
+                age = rng.randint(0, 16)
+                weight = round(max(1.5, rng.lognormvariate(2.0, 0.6)), 1)
+                disease = rng.choice(DISEASES)
+                pet_name = f"멍멍{pet_id}"
+                loader.add(T["pets"], {
+                    "pet_id": pet_id, "family_id": family_id, "owner_id": member_ids[0],
+                    "pet_search_id": f"{pet_id:08d}", "name": pet_name, "breed": breed,
+                    "age": age, "weight": weight, "disease": disease,
+                    "created_at": now - timedelta(days=history_days), "updated_at": now,
+                })
+                rec = recommend(PetProfile(pet_id=pet_id, breed=breed, age=age, weight=weight, disease=disease))
+                loader.add(T["pet_walk_recommendations"], {
+                    **rec, "rec_id": pet_id, "pet_id": pet_id, "generated_by": GENERATED_BY_RULE, "updated_at": now,
+                })
+
+                # 활동량: 비활성 pet + 파레토 분포
+                if rng.random() < cfg.inactive_pet_ratio:
+                    continue
+                walks_per_day = min(
+                    3.0,
+                    cfg.mean_walks_per_week / 7.0
+                    * _pareto_weight(rng, cfg.activity_alpha) * (cfg.activity_alpha - 1) / cfg.activity_alpha,
+                )
+
+                daily: Dict = {}
+                for day in range(history_days, -1, -1):
+                    n = int(walks_per_day) + (1 if rng.random() < walks_per_day % 1 else 0)
+                    for _ in range(n):
+                        walk_id = next_id("walk")
+                        day_kst = (now + KST_OFFSET).date() - timedelta(days=day)
+                        start_kst = datetime.combine(day_kst, datetime.min.time()) + timedelta(
+                            hours=_walk_start_kst_hour(rng)
+                        )
+                        start = (start_kst - KST_OFFSET).replace(microsecond=0)
+                        if start > now:
+                            continue
+                        duration = int(min(180, max(5, rng.lognormvariate(3.45, 0.45))))
+                        speed = max(2.0, rng.gauss(4.0, 0.7))
+                        distance = round(speed * duration / 60, 2)
+                        walker = rng.choices(member_ids, weights=member_weights)[0]
+
+                        last_lat, last_lng = home_lat, home_lng
+                        if start >= trace_since:
+                            trace = _gps_trace(rng, home_lat, home_lng, duration, speed)
+                            for p, (plat, plng) in enumerate(trace):
+                                loader.add(T["walk_tracking_points"], {
+                                    "point_id": next_id("point"), "walk_id": walk_id,
+                                    "latitude": round(plat, 7), "longitude": round(plng, 7),
+                                    "timestamp": start + timedelta(seconds=p * POINT_INTERVAL_SEC),
+                                })
+                            last_lat, last_lng = trace[-1]
+
+                        loader.add(T["walks"], {
+                            "walk_id": walk_id, "pet_id": pet_id, "user_id": walker,
+                            "start_time": start, "end_time": start + timedelta(minutes=duration),
+                            "duration_min": duration, "distance_km": distance,
+                            "calories": round(distance * weight * 0.8, 1),
+                            "weather_status": rng.choice(["Clear", "Clouds", "Rain"]),
+                            "weather_temp_c": round(rng.gauss(14, 9), 1),
+                            "last_lat": round(last_lat, 7), "last_lng": round(last_lng, 7),
+                            "created_at": start,
+                        })
+
+                        if rng.random() < cfg.photo_ratio:
+                            for _ in range(rng.randint(1, 3)):
+                                photo_id = next_id("photo")
+                                loader.add(T["photos"], {
+                                    "photo_id": photo_id, "walk_id": walk_id,
+                                    "image_url": f"https://gen.local/photos/{photo_id}.jpg",
+                                    "uploaded_by": walker, "created_at": start,
+                                })
+
+                        agg = daily.setdefault(day_kst, [0, 0.0, 0, 0.0])
+                        agg[0] += 1
+                        agg[1] += distance
+                        agg[2] += duration
+                        agg[3] += distance * weight * 0.8
+
+                        # 최근 산책 종료 알림 (가족 broadcast) + 읽음 기록
+                        if start >= notif_since:
+                            notif_id = next_id("notif")
+                            loader.add(T["notifications"], {
+                                "notification_id": notif_id, "family_id": family_id, "target_user_id": None,
+                                "type": NotificationType.ACTIVITY_END, "title": "산책 완료",
+                                "message": f"{pet_name} 산책을 마쳤어요", "related_pet_id": pet_id,
+                                "related_user_id": walker, "created_at": start + timedelta(minutes=duration),
+                            })
+                            for member in member_ids:
+                                if member == walker or rng.random() < cfg.read_ratio:
+                                    loader.add(T["notification_reads"], {
+                                        "id": next_id("read"), "notification_id": notif_id, "user_id": member,
+                                        "read_at": start + timedelta(minutes=duration + rng.randint(0, 600)),
+                                    })
+
+                for day_kst, (walks, dist, dur, cal) in daily.items():
+                    loader.add(T["activity_stats"], {
+                        "stats_id": next_id("stat"), "pet_id": pet_id, "date": day_kst,
+                        "total_walks": walks, "total_distance_km": round(dist, 2),
+                        "total_duration_min": dur,
+                        "avg_speed_kmh": round(dist / (dur / 60), 2) if dur else 0.0,
+                        "calories_burned": round(cal, 1), "updated_at": now,
+                    })
+
+        loader.flush()
+
+        if engine.dialect.name == "mysql":
+            conn.execute(text("SET UNIQUE_CHECKS=1"))
+            conn.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+
+    elapsed = time.perf_counter() - started
+    total = sum(loader.counts.values())
+    print(f"[DATAGEN] {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    for name, count in loader.counts.items():
+        print(f"  {name:28} {count:>12,}")
+    return dict(loader.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Take a Paw synthetic data generator")
+    parser.add_argument("--db", default="sqlite:///bench.db")
+    parser.add_argument("--no-create-schema", action="store_true")
+    parser.add_argument("--scale", type=float, default=0.01, help="1.0 = 사용자 약 10만 명")
+    parser.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--mean-walks-per-week", type=float, default=6.0)
+    parser.add_argument("--trace-days", type=int, default=14)
+    parser.add_argument("--notification-days", type=int, default=90)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--rng-seed", type=int, default=42)
+    args = parser.parse_args()
+
+    prepare_environment(args.db)
+
+    from app.db import engine
+    from app.models import Base
+
+    if not args.no_create_schema:
+        Base.metadata.create_all(engine)
+
+    generate(engine, GenConfig(
+        scale=args.scale,
+        years=args.years,
+        mean_walks_per_week=args.mean_walks_per_week,
+        trace_days=args.trace_days,
+        notification_days=args.notification_days,
+        chunk_size=args.chunk_size,
+        rng_seed=args.rng_seed,
+    ))
+
+
+if __name__ == "__main__":
+    main()
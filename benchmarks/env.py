@@ -0,0 +1,52 @@
+"""
+벤치마크 실행 환경 준비
+
+app 모듈을 import 하기 전에 호출해야 한다.
+- settings 필수값을 더미로 채우고 DATABASE_URL_OVERRIDE 로 대상 DB 지정
+- firebase_admin 초기화가 통과하도록 임시 RSA 키로 만든 가짜 서비스 계정 사용 (네트워크 호출 없음)
+- 스케줄러는 끔
+"""
+import json
+import os
+
+
+def _fake_service_account() -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return json.dumps({
+        "type": "service_account",
+        "project_id": "takeapaw-bench",
+        "private_key_id": "bench",
+        "private_key": pem,
+        "client_email": "bench@takeapaw-bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    })
+
+
+def prepare_environment(db_url: str) -> None:
+    defaults = {
+        "DB_HOST": "localhost",
+        "DB_PORT": "3306",
+        "DB_USER": "bench",
+        "DB_PASSWORD": "bench",
+        "DB_NAME": "bench",
+        "OPENAI_API_KEY": "bench",
+        "OPENWEATHER_API_KEY": "bench",
+        "OPENWEATHERMAP_API_KEY": "bench",
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+
+    os.environ["DATABASE_URL_OVERRIDE"] = db_url
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "takeapaw-bench.appspot.com")
+    if not os.environ.get("FIREBASE_CREDENTIALS"):
+        os.environ["FIREBASE_CREDENTIALS"] = _fake_service_account()
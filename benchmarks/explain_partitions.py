@@ -0,0 +1,140 @@
+"""
+기간 조회 / 경로 조회 쿼리의 실행 계획 확인 (파티션 pruning + 인덱스)
+
+실제 repository 메서드를 호출하면서 실행된 SELECT 를 가로채 같은 파라미터로 EXPLAIN 한다.
+MySQL 은 EXPLAIN 의 partitions / key 컬럼, SQLite 는 EXPLAIN QUERY PLAN 을 출력.
+
+    # 로컬 MySQL (alembic upgrade head 까지 완료 + 시드된 DB)
+    python -m benchmarks.explain_partitions --db "mysql+pymysql://root:pw@127.0.0.1:3306/takeapaw_bench" --check
+
+--check: 파티션 1개만 읽어야 하는 쿼리가 여러 파티션을 읽거나, 인덱스를 타야 하는 쿼리가 풀스캔이면 exit 1
+"""
+import argparse
+import sys
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from benchmarks.env import prepare_environment
+
+
+# (이름, 파티션 1개만 읽어야 하는지)
+Case = Tuple[str, bool, Callable]
+
+
+def capture_selects(engine, fn: Callable) -> List[tuple]:
+    from sqlalchemy import event
+
+    captured = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return captured
+
+
+def explain(conn, statement: str, parameters) -> List[dict]:
+    prefix = "EXPLAIN " if conn.dialect.name == "mysql" else "EXPLAIN QUERY PLAN "
+    result = conn.exec_driver_sql(prefix + statement, parameters)
+    return [dict(r._mapping) for r in result]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Take a Paw partition / index EXPLAIN check")
+    parser.add_argument("--db", default="sqlite:///bench.db")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    prepare_environment(args.db)
+
+    from sqlalchemy import text
+
+    from app.core.partitions import MonthlyPartitions, add_months, month_start
+    from app.db import SessionLocal, engine
+    from app.domains.record.repository.photo_repository import RecordPhotoRepository
+    from app.domains.record.repository.stats_repository import StatsRepository
+    from app.domains.record.repository.walk_repository import RecordWalkRepository
+    from app.domains.walk.repository.ranking_repository import RankingRepository
+    from app.domains.walk.repository.route_archive_repository import RouteArchiveRepository
+    from app.domains.walk.repository.today_repository import TodayRepository
+    from app.models.walk import Walk
+    from app.models.walk_tracking_point import WalkTrackingPoint
+
+    db = SessionLocal()
+    sample = (
+        db.query(Walk.walk_id, Walk.pet_id, Walk.user_id, WalkTrackingPoint.timestamp)
+        .join(WalkTrackingPoint, WalkTrackingPoint.walk_id == Walk.walk_id)
+        .order_by(Walk.walk_id.desc())
+        .first()
+    )
+    if sample is None:
+        raise SystemExit("경로 포인트가 있는 산책이 없습니다. 먼저 시드하세요.")
+    walk_id, pet_id, user_id, point_ts = sample
+
+    end = datetime.utcnow()
+    start = end - timedelta(days=30)
+    month = month_start(point_ts.date())
+
+    partitions = MonthlyPartitions(db.connection(), "walk_tracking_points").list()
+    point_partition = next(
+        (p.name for p in partitions if p.upper is not None and p.upper > point_ts.date()),
+        None,
+    )
+
+    cases: List[Case] = [
+        ("record.walk_detail.photos_points", False, lambda: RecordWalkRepository(db).get_photos_and_points(walk_id, True)),
+        ("record.stats.aggregate_daily", False, lambda: StatsRepository(db).aggregate_daily(pet_id, start, end)),
+        ("record.photos.list", False, lambda: RecordPhotoRepository(db).list_photos(pet_id, start, end, 1, 20)),
+        ("walk.ranking.walk_stats", False, lambda: RankingRepository(db).get_walk_stats([user_id], start, end)),
+        ("walk.today.stats", False, lambda: TodayRepository(db).get_today_walks_stats_for_pets([pet_id], start, end)),
+        ("points.month_range", True, lambda: db.execute(
+            text("SELECT COUNT(*) FROM walk_tracking_points WHERE timestamp >= :s AND timestamp < :e"),
+            {"s": datetime.combine(month, datetime.min.time()), "e": datetime.combine(add_months(month, 1), datetime.min.time())},
+        ).all()),
+    ]
+    if point_partition:
+        cases.append((
+            "archive.partition_drop_check", True,
+            lambda: RouteArchiveRepository(db).has_unarchived_points(point_partition),
+        ))
+
+    failures = []
+    conn = db.connection()
+    for name, single_partition, fn in cases:
+        statements = capture_selects(engine, fn)
+        print(f"\n=== {name} ({len(statements)} SELECT)")
+        for statement, parameters in statements:
+            for row in explain(conn, statement, parameters):
+                if conn.dialect.name != "mysql":
+                    print(f"  {row.get('detail')}")
+                    continue
+                parts = row.get("partitions") or ""
+                print(
+                    f"  table={row.get('table')} partitions={parts or '-'} type={row.get('type')} "
+                    f"key={row.get('key')} rows={row.get('rows')}"
+                )
+                if row.get("table") == "walk_tracking_points" or row.get("table") == "p":
+                    if single_partition and parts and len(parts.split(",")) > 1:
+                        failures.append(f"{name}: {parts}")
+                    if row.get("type") == "ALL" and not single_partition:
+                        failures.append(f"{name}: full scan")
+
+    db.close()
+
+    if failures:
+        print("\nFAIL:")
+        for failure in failures:
+            print(f"  {failure}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
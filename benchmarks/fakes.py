@@ -0,0 +1,242 @@
+"""
+외부 의존성 로컬 대체물 (지연 시간 설정 가능)
+
+- LocalTokenIssuer: HS256 로컬 서명 JWT 발급/검증 → firebase.set_token_verifier 로 주입
+- FakeMessaging: firebase_admin.messaging.send / send_each_for_multicast 교체
+- FakeOpenAI: chat.completions.create 만 흉내내는 클라이언트 → llm.set_openai_client 로 주입
+- FakeWeather: OpenWeather 응답을 돌려주는 httpx MockTransport (동기/비동기), 받은 호출 수 기록
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import httpx
+
+
+# ============================================================
+# 토큰
+# ============================================================
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class LocalTokenIssuer:
+    def __init__(self, secret: str = "takeapaw-bench-secret", ttl_sec: int = 3600):
+        self.secret = secret.encode()
+        self.ttl_sec = ttl_sec
+
+    def issue(self, uid: str, email: Optional[str] = None) -> str:
+        now = int(time.time())
+        header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload = _b64(json.dumps({
+            "uid": uid,
+            "user_id": uid,
+            "sub": uid,
+            "email": email or f"{uid}@bench.local",
+            "iat": now,
+            "exp": now + self.ttl_sec,
+            "firebase": {"sign_in_provider": "password"},
+        }).encode())
+        signing_input = f"{header}.{payload}".encode()
+        signature = _b64(hmac.new(self.secret, signing_input, hashlib.sha256).digest())
+        return f"{header}.{payload}.{signature}"
+
+    def verify(self, token: str):
+        try:
+            header, payload, signature = token.split(".")
+            expected = _b64(hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+            if not hmac.compare_digest(expected, signature):
+                return None
+            decoded = json.loads(_unb64(payload))
+            if decoded.get("exp", 0) < time.time():
+                return None
+            return decoded
+        except Exception:
+            return None
+
+
+# ============================================================
+# FCM
+# ============================================================
+@dataclass
+class _SendResponse:
+    success: bool = True
+    message_id: Optional[str] = "bench"
+    exception: Optional[Exception] = None
+
+
+@dataclass
+class _BatchResponse:
+    responses: List[_SendResponse] = field(default_factory=list)
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for r in self.responses if r.success)
+
+    @property
+    def failure_count(self) -> int:
+        return len(self.responses) - self.success_count
+
+
+class FakeMessaging:
+    def __init__(self, latency_sec: float = 0.05):
+        self.latency_sec = latency_sec
+        self.sent_messages = 0
+        self.calls = 0
+
+    def send(self, message, *args, **kwargs):
+        time.sleep(self.latency_sec)
+        self.calls += 1
+        self.sent_messages += 1
+        return "projects/bench/messages/1"
+
+    def send_each_for_multicast(self, message, *args, **kwargs):
+        time.sleep(self.latency_sec)
+        self.calls += 1
+        n = len(message.tokens)
+        self.sent_messages += n
+        return _BatchResponse([_SendResponse() for _ in range(n)])
+
+    def install(self) -> None:
+        from firebase_admin import messaging
+
+        messaging.send = self.send
+        messaging.send_each_for_multicast = self.send_each_for_multicast
+
+
+# ============================================================
+# OpenAI
+# ============================================================
+_PET_ID = re.compile(r'"pet_id":\s*(\d+)')
+
+
+class _Obj:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeOpenAI:
+    """
+    프롬프트를 보고 형식만 맞는 JSON을 돌려줌
+    - 배치 프롬프트(items)면 pet_id마다 항목 생성
+    - 그 외에는 산책 추천 필드 + title/message 를 모두 담은 객체
+    """
+
+    RECOMMENDATION = {
+        "min_walks": 1, "min_minutes": 20, "min_distance_km": 1.0,
+        "recommended_walks": 2, "recommended_minutes": 40, "recommended_distance_km": 2.5,
+        "max_walks": 3, "max_minutes": 70, "max_distance_km": 4.5,
+    }
+
+    def __init__(self, latency_sec: float = 0.8):
+        self.latency_sec = latency_sec
+        self.calls = 0
+        self.chat = _Obj(completions=_Obj(create=self._create))
+
+    def _create(self, model=None, messages=None, **kwargs):
+        time.sleep(self.latency_sec)
+        self.calls += 1
+        prompt = (messages or [{}])[-1].get("content", "")
+
+        advice = {
+            "title": "오늘의 산책 추천",
+            "message": "선선한 시간대에 가볍게 산책해 주세요.",
+            "suggested_time_slots": [{"label": "아침", "start_time": "07:00", "end_time": "08:00"}],
+            "suggested_duration_min": 30,
+            "notes": ["물을 챙겨주세요"],
+            "tags": ["활동량"],
+        }
+        if '"items"' in prompt:
+            body = {"items": [{"pet_id": int(pid), **advice} for pid in _PET_ID.findall(prompt)]}
+        else:
+            body = {**self.RECOMMENDATION, **advice}
+
+        return _Obj(choices=[_Obj(message=_Obj(content=json.dumps(body, ensure_ascii=False)))])
+
+
+# ============================================================
+# OpenWeather
+# ============================================================
+def _weather_payload(request: httpx.Request) -> dict:
+    params = request.url.params
+    return {
+        "coord": {"lat": float(params.get("lat", 37.5)), "lon": float(params.get("lon", 127.0))},
+        "weather": [{"main": "Clear", "description": "맑음", "icon": "01d"}],
+        "main": {"temp": 18.5, "feels_like": 18.0, "humidity": 55},
+        "wind": {"speed": 2.1},
+        "name": "Bench",
+    }
+
+
+class FakeWeather:
+    def __init__(self, latency_sec: float = 0.15):
+        self.latency_sec = latency_sec
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _count(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def transports(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self._count()
+            time.sleep(self.latency_sec)
+            return httpx.Response(200, json=_weather_payload(request))
+
+        async def async_handler(request: httpx.Request) -> httpx.Response:
+            self._count()
+            await asyncio.sleep(self.latency_sec)
+            return httpx.Response(200, json=_weather_payload(request))
+
+        return httpx.MockTransport(handler), httpx.MockTransport(async_handler)
+
+    def install(self) -> None:
+        from app.core.http_client import set_http_transport
+
+        set_http_transport(*self.transports())
+
+
+# ============================================================
+# 일괄 설치
+# ============================================================
+@dataclass
+class Fakes:
+    tokens: LocalTokenIssuer
+    messaging: FakeMessaging
+    openai: FakeOpenAI
+    weather: FakeWeather
+
+
+def install_fakes(
+    fcm_latency: float = 0.05,
+    llm_latency: float = 0.8,
+    weather_latency: float = 0.15,
+) -> Fakes:
+    from app.core import firebase
+    from app.core.llm import set_openai_client
+
+    tokens = LocalTokenIssuer()
+    firebase.set_token_verifier(tokens.verify)
+
+    fake_messaging = FakeMessaging(fcm_latency)
+    fake_messaging.install()
+
+    fake_openai = FakeOpenAI(llm_latency)
+    set_openai_client(fake_openai)
+
+    fake_weather = FakeWeather(weather_latency)
+    fake_weather.install()
+
+    return Fakes(tokens=tokens, messaging=fake_messaging, openai=fake_openai, weather=fake_weather)
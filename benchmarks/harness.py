@@ -0,0 +1,182 @@
+"""
+부하/지연 벤치마크 하네스
+
+create_app()을 SQLite 또는 로컬 MySQL 컨테이너에 붙여 띄우고,
+Firebase/FCM/OpenAI/OpenWeather 를 지연 시간이 있는 로컬 대체물로 바꾼 뒤
+시나리오를 반복 실행해 엔드포인트별 p50/p95/p99 와 처리량을 보고한다.
+
+    # SQLite (기본)
+    python -m benchmarks.harness --iterations 50 --concurrency 4
+
+    # 로컬 MySQL (docker-compose up db 후, alembic upgrade head 까지 완료된 DB)
+    python -m benchmarks.harness --db "mysql+pymysql://root:pw@127.0.0.1:3306/takeapaw_bench" --no-create-schema
+
+    # 결과 저장 (변경 전/후 비교용)
+    python -m benchmarks.harness --scenarios home,stats --out results/before.json
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from typing import Dict, List
+
+from benchmarks.env import prepare_environment
+
+WEATHER_HOST = "api.openweathermap.org"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+def summarize(recorder, wall_sec: float) -> Dict[str, dict]:
+    report = {}
+    total = 0
+    for name in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[name])
+        total += len(values)
+        report[name] = {
+            "count": len(values),
+            "errors": recorder.errors.get(name, 0),
+            "statuses": dict(recorder.statuses[name]),
+            "mean_ms": sum(values) / len(values) * 1000,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "rps": len(values) / wall_sec if wall_sec else 0.0,
+        }
+    report["__total__"] = {"count": total, "wall_sec": wall_sec, "rps": total / wall_sec if wall_sec else 0.0}
+    return report
+
+
+def outbound_weather_requests() -> int:
+    """MetricsTransport 가 기록한 OpenWeather 호출 수 (가짜 transport 를 거쳤는지와 무관)"""
+    from app.core.http_client import HTTP_CLIENT_REQUESTS
+
+    return int(sum(child.value for (host, _), child in HTTP_CLIENT_REQUESTS.items() if host == WEATHER_HOST))
+
+
+def print_report(report: Dict[str, dict]) -> None:
+    header = f"{'endpoint':48} {'count':>7} {'err':>5} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in report.items():
+        if name == "__total__":
+            continue
+        print(
+            f"{name[:48]:48} {r['count']:>7} {r['errors']:>5} "
+            f"{r['mean_ms']:>8.1f}ms {r['p50_ms']:>7.1f}ms {r['p95_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms "
+            f"{r['rps']:>8.1f}"
+        )
+    t = report["__total__"]
+    print("-" * len(header))
+    print(f"total requests={t['count']} wall={t['wall_sec']:.1f}s throughput={t['rps']:.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Take a Paw API benchmark harness")
+    parser.add_argument("--db", default="sqlite:///bench.db")
+    parser.add_argument("--no-create-schema", action="store_true", help="스키마는 alembic으로 이미 준비됨")
+    parser.add_argument("--reseed", action="store_true", help="데이터가 있어도 다시 시드 (빈 DB 필요)")
+    parser.add_argument("--scale", type=float, default=0.002, help="datagen 규모 (1.0 = 사용자 약 10만 명)")
+    parser.add_argument("--years", type=float, default=1.0, help="산책 이력 기간(년)")
+    parser.add_argument("--scenarios", default="walk_session,home,home_aggregate,stats,ranking,notifications")
+    parser.add_argument("--iterations", type=int, default=30, help="시나리오별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--track-points", type=int, default=20)
+    parser.add_argument("--fcm-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.8)
+    parser.add_argument("--weather-latency", type=float, default=0.15)
+    parser.add_argument("--rng-seed", type=int, default=7)
+    parser.add_argument("--out", help="JSON 결과 파일 경로")
+    args = parser.parse_args()
+
+    prepare_environment(args.db)
+
+    # 환경 준비 후 app import
+    from fastapi.testclient import TestClient
+
+    from app.db import engine
+    from app.main import create_app
+    from app.models import Base
+    from benchmarks import scenarios as sc
+    from benchmarks import seed as seed_mod
+    from benchmarks.fakes import install_fakes
+
+    fakes = install_fakes(args.fcm_latency, args.llm_latency, args.weather_latency)
+
+    if not args.no_create_schema:
+        Base.metadata.create_all(engine)
+
+    if args.reseed or not seed_mod.is_seeded(engine):
+        t0 = time.perf_counter()
+        seed_mod.seed(engine, scale=args.scale, years=args.years)
+        print(f"[SEED] done in {time.perf_counter() - t0:.1f}s")
+    seed_info = seed_mod.load_seed_info(engine)
+
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = [n for n in names if n not in sc.SCENARIOS]
+    if unknown:
+        raise SystemExit(f"unknown scenarios: {unknown} (available: {list(sc.SCENARIOS)})")
+
+    app = create_app()
+    recorder = sc.Recorder()
+
+    # (시나리오, 반복) 작업 큐를 워커 스레드가 나눠 처리
+    jobs = [name for name in names for _ in range(args.iterations)]
+    random.Random(args.rng_seed).shuffle(jobs)
+    job_lock = threading.Lock()
+
+    def worker(client, index: int):
+        rng = random.Random(args.rng_seed * 1000 + index)
+        while True:
+            with job_lock:
+                if not jobs:
+                    return
+                name = jobs.pop()
+            user = rng.choice(seed_info.users)
+            session = sc.Session(client, user, fakes.tokens.issue(user.firebase_uid), rng, recorder, seed_info)
+            if name == "walk_session":
+                sc.walk_session(session, track_points=args.track_points)
+            else:
+                sc.SCENARIOS[name](session)
+
+    weather_before = outbound_weather_requests()
+
+    # lifespan(startup/shutdown)은 한 번만: 워커마다 TestClient 를 열면 먼저 끝난 워커의 shutdown 이
+    # 공유 HTTP 클라이언트(가짜 transport)를 닫아 나머지 워커의 날씨 호출이 실제 네트워크로 나감
+    with TestClient(app, raise_server_exceptions=False) as client:
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(client, i)) for i in range(args.concurrency)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - started
+
+    report = summarize(recorder, wall)
+    print_report(report)
+    weather_calls = outbound_weather_requests() - weather_before
+    print(
+        f"[FAKES] fcm_calls={fakes.messaging.calls} fcm_messages={fakes.messaging.sent_messages} "
+        f"llm_calls={fakes.openai.calls} weather_calls={fakes.weather.calls}/{weather_calls}"
+    )
+
+    if fakes.weather.calls != weather_calls:
+        raise SystemExit(
+            f"[FAKES] {weather_calls - fakes.weather.calls} weather calls bypassed the fake transport; "
+            "latencies are not comparable"
+        )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"args": vars(args), "report": report}, f, indent=2, ensure_ascii=False)
+        print(f"[OUT] {args.out}")
+
+
+if __name__ == "__main__":
+    main()
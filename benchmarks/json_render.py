@@ -0,0 +1,105 @@
+"""
+응답 직렬화 비용: jsonable_encoder + JSONResponse(stdlib json) vs json_response(orjson)
+
+DB 없이 산책 상세(경로 포인트 多) / 알림 목록 모양의 dict 를 만들어 응답 1건 렌더링 시간(µs)을 비교한다.
+
+    python -m benchmarks.json_render --points 2000 --rounds 200
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# settings 로딩용 더미 값 (실제 DB/외부 서비스에는 접속하지 않음)
+for key, value in {
+    "DB_HOST": "localhost", "DB_PORT": "3306", "DB_USER": "bench", "DB_PASSWORD": "bench",
+    "DB_NAME": "bench", "FIREBASE_CREDENTIALS": "{}", "OPENAI_API_KEY": "bench",
+    "OPENWEATHER_API_KEY": "bench",
+}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core.responses import json_response  # noqa: E402
+
+
+def walk_detail_payload(points: int) -> dict:
+    start = datetime(2026, 10, 1, 7, 30)
+    return {
+        "success": True,
+        "status": 200,
+        "walk": {
+            "walk_id": 1, "pet_id": 1, "start_time": start.isoformat(), "end_time": start + timedelta(minutes=40),
+            "duration_min": 40, "distance_km": Decimal("2.31"), "calories": 123.4,
+        },
+        "photos": [{"photo_id": i, "image_url": f"https://cdn.local/{i}.jpg", "created_at": start} for i in range(5)],
+        "points": [
+            {
+                "point_id": i,
+                "latitude": 37.5665 + i * 1e-5,
+                "longitude": 126.978 + i * 1e-5,
+                "timestamp": (start + timedelta(seconds=5 * i)).isoformat(),
+            }
+            for i in range(points)
+        ],
+        "timeStamp": datetime.utcnow().isoformat(),
+        "path": "/api/v1/record/walks/1",
+    }
+
+
+def notifications_payload(size: int) -> dict:
+    now = datetime(2026, 10, 1, 9, 0)
+    return {
+        "success": True,
+        "status": 200,
+        "notifications": [
+            {
+                "notification_id": i, "type": "ACTIVITY_START", "title": "산책 시작", "message": "멍멍이 산책을 시작했어요",
+                "family_id": 1, "target_user_id": None,
+                "related_pet": {"pet_id": 1, "name": "멍멍", "image_url": None},
+                "related_user": {"user_id": 2, "nickname": "가족", "profile_img_url": None},
+                "is_read_by_me": True, "is_me": False, "read_count": 2, "unread_count": 1,
+                "display_time": "오전 09:00", "display_type_label": "[ACTIVITY_START]", "display_read_text": "2명 읽음",
+                "created_at": now + timedelta(minutes=i),
+            }
+            for i in range(size)
+        ],
+        "timeStamp": datetime.utcnow().isoformat(),
+        "path": "/api/v1/notifications",
+    }
+
+
+def bench(fn, payload, rounds: int) -> float:
+    fn(payload)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(payload)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--notifications", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    def before(payload):
+        return JSONResponse(status_code=200, content=jsonable_encoder(payload)).body
+
+    def after(payload):
+        return json_response(payload, status_code=200).body
+
+    for name, payload in (
+        (f"walk_detail ({args.points} points)", walk_detail_payload(args.points)),
+        (f"notifications ({args.notifications} items)", notifications_payload(args.notifications)),
+    ):
+        old_us = bench(before, payload, args.rounds)
+        new_us = bench(after, payload, args.rounds)
+        print(f"{name:32} jsonable_encoder+json {old_us:>10.1f} us   orjson {new_us:>9.1f} us   x{old_us / new_us:.1f}")
+
+
+if __name__ == "__main__":
+    main()
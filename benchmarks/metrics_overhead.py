@@ -0,0 +1,98 @@
+"""
+MetricsMiddleware hot-path 오버헤드 측정
+
+네트워크/서버 없이 ASGI 앱을 직접 호출해 미들웨어 유무에 따른 요청당 추가 시간(µs)을 비교한다.
+
+    python -m benchmarks.metrics_overhead --requests 200000
+"""
+import argparse
+import asyncio
+import os
+import time
+
+# settings 로딩용 더미 값 (실제 DB/외부 서비스에는 접속하지 않음)
+for key, value in {
+    "DB_HOST": "localhost", "DB_PORT": "3306", "DB_USER": "bench", "DB_PASSWORD": "bench",
+    "DB_NAME": "bench", "FIREBASE_CREDENTIALS": "{}", "OPENAI_API_KEY": "bench",
+    "OPENWEATHER_API_KEY": "bench",
+}.items():
+    os.environ.setdefault(key, value)
+
+from app.core.metrics import MetricsMiddleware  # noqa: E402
+
+
+def _endpoint():
+    return None
+
+
+class _Route:
+    path = path_format = "/api/v1/record/walks/{walk_id}"
+    endpoint = staticmethod(_endpoint)
+
+
+class _Router:
+    routes = [_Route()]
+
+
+class _App:
+    router = _Router()
+
+
+BODY = b'{"success": true}'
+
+
+async def inner_app(scope, receive, send):
+    # 라우팅 결과를 흉내냄 (Starlette Router와 같은 방식으로 scope 갱신)
+    scope["endpoint"] = _endpoint
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, n: int) -> float:
+    fake_app = _App()
+    start = time.perf_counter()
+    for i in range(n):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/record/walks/{i}",
+            "app": fake_app,
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    wrapped = MetricsMiddleware(inner_app)
+    loop = asyncio.new_event_loop()
+
+    # 워밍업 (라벨 child 생성, 템플릿 맵 구성)
+    loop.run_until_complete(run(wrapped, 1000))
+    loop.run_until_complete(run(inner_app, 1000))
+
+    base_best = min(loop.run_until_complete(run(inner_app, args.requests)) for _ in range(args.rounds))
+    wrapped_best = min(loop.run_until_complete(run(wrapped, args.requests)) for _ in range(args.rounds))
+
+    base_us = base_best / args.requests * 1e6
+    wrapped_us = wrapped_best / args.requests * 1e6
+    print(f"requests/round : {args.requests}")
+    print(f"baseline       : {base_us:.2f} µs/req")
+    print(f"with metrics   : {wrapped_us:.2f} µs/req")
+    print(f"overhead       : {wrapped_us - base_us:.2f} µs/req")
+
+
+if __name__ == "__main__":
+    main()
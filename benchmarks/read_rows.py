@@ -0,0 +1,181 @@
+"""
+읽기 경로 row 적재 비용: ORM 엔티티 vs 컬럼 projection + __slots__ DTO
+
+같은 화면의 조회를 변경 전 방식(엔티티 로드 + 행마다 추가 조회)과 현재 repository(projection 1번)로
+각각 실행해 행당 시간(µs)과 tracemalloc 최대 할당량(KiB)을 비교한다. 시드된 DB 에서 실행.
+
+    python -m benchmarks.read_rows --db "sqlite:///bench.db" --rounds 5
+    python -m benchmarks.read_rows --db "mysql+pymysql://root:pw@127.0.0.1:3306/takeapaw_bench"
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from benchmarks.env import prepare_environment
+
+
+# (이름, 세션을 받아 행 목록을 돌려주는 함수)
+Case = Tuple[str, Callable]
+
+
+def measure(session_factory, fn: Callable, rounds: int) -> Tuple[int, float, float]:
+    """
+    (행 수, 행당 µs 중앙값, 최대 할당 KiB 중앙값) — 라운드마다 새 세션 (identity map 재사용 없음)
+    tracemalloc 는 할당마다 비용이 붙어 시간을 왜곡하므로 시간 / 메모리는 따로 실행
+    """
+    times: List[float] = []
+    peaks: List[float] = []
+    count = 0
+    for _ in range(rounds):
+        for traced in (False, True):
+            db = session_factory()
+            try:
+                gc.collect()
+                if traced:
+                    tracemalloc.start()
+                start = time.perf_counter()
+                rows = fn(db)
+                elapsed = time.perf_counter() - start
+                if traced:
+                    peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+                    tracemalloc.stop()
+                else:
+                    times.append(elapsed)
+            finally:
+                db.close()
+            count = len(rows)
+    times.sort()
+    peaks.sort()
+    per_row = times[len(times) // 2] / count * 1e6 if count else 0.0
+    return count, per_row, peaks[len(peaks) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Take a Paw read-path row materialization benchmark")
+    parser.add_argument("--db", default="sqlite:///bench.db")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    prepare_environment(args.db)
+
+    from sqlalchemy import func
+    from sqlalchemy.orm import joinedload
+
+    from app.db import SessionLocal
+    from app.domains.notifications.repository.notification_repository import NotificationRepository
+    from app.domains.pets.repository.pet_repository import PetRepository
+    from app.domains.record.repository.walk_repository import RecordWalkRepository
+    from app.models.family import Family
+    from app.models.family_member import FamilyMember
+    from app.models.notification import Notification
+    from app.models.notification_reads import NotificationRead
+    from app.models.pet import Pet
+    from app.models.photo import Photo
+    from app.models.user import User
+    from app.models.walk import Walk
+
+    db = SessionLocal()
+    pet_ids = [r[0] for r in db.query(Pet.pet_id).order_by(Pet.pet_id).all()]
+    user_ids = [r[0] for r in db.query(User.user_id).order_by(User.user_id).all()]
+    db.close()
+    if not pet_ids or not user_ids:
+        raise SystemExit("데이터가 없습니다. 먼저 시드하세요.")
+
+    def walks_entity(s):
+        rows = []
+        for pet_id in pet_ids:
+            for walk in s.query(Walk).filter(Walk.pet_id == pet_id).order_by(Walk.start_time.desc()).all():
+                # 산책마다 첫 사진
+                photo = s.query(Photo).filter(Photo.walk_id == walk.walk_id).order_by(Photo.created_at.asc()).first()
+                rows.append((walk, photo.image_url if photo else None))
+        return rows
+
+    def walks_rows(s):
+        repo = RecordWalkRepository(s)
+        rows = []
+        for pet_id in pet_ids:
+            rows += repo.list_walks(pet_id=pet_id)
+        return rows
+
+    def my_pets_entity(s):
+        rows = []
+        for user_id in user_ids:
+            rows += (
+                s.query(Pet, Family)
+                .join(Family, Family.family_id == Pet.family_id)
+                .join(FamilyMember, FamilyMember.family_id == Pet.family_id)
+                .filter(FamilyMember.user_id == user_id)
+                .order_by((Pet.owner_id == user_id).desc(), Pet.created_at.desc())
+                .all()
+            )
+        return rows
+
+    def my_pets_rows(s):
+        repo = PetRepository(s)
+        rows = []
+        for user_id in user_ids:
+            rows += repo.get_pets_for_user(user_id)
+        return rows
+
+    def notifications_entity(s):
+        rows = []
+        for user_id in user_ids:
+            family_ids = s.query(FamilyMember.family_id).filter(FamilyMember.user_id == user_id)
+            items = (
+                s.query(Notification)
+                .options(joinedload(Notification.related_user), joinedload(Notification.related_pet))
+                .filter(
+                    (Notification.target_user_id == user_id)
+                    | (Notification.target_user_id.is_(None) & Notification.family_id.in_(family_ids))
+                )
+                .order_by(Notification.created_at.asc())
+                .limit(100)
+                .all()
+            )
+            for notif in items:
+                # 알림마다 내 읽음 여부 / 읽은 사람 수 / 가족 인원수
+                s.query(NotificationRead).filter(
+                    NotificationRead.notification_id == notif.notification_id,
+                    NotificationRead.user_id == user_id,
+                ).first()
+                s.query(NotificationRead.user_id).filter(
+                    NotificationRead.notification_id == notif.notification_id
+                ).distinct().count()
+                if notif.target_user_id is None:
+                    s.query(func.count(FamilyMember.user_id)).filter(
+                        FamilyMember.family_id == notif.family_id
+                    ).scalar()
+            rows += items
+        return rows
+
+    def notifications_rows(s):
+        repo = NotificationRepository(s)
+        rows = []
+        for user_id in user_ids:
+            items = repo.get_notifications(user_id=user_id, pet_id=None, page=0, size=100)[0]
+            repo.get_read_counts(row.notification_id for row in items)
+            repo.get_family_member_counts({row.family_id for row in items if row.target_user_id is None})
+            rows += items
+        return rows
+
+    cases: List[Case] = [
+        ("record.walks.entity", walks_entity),
+        ("record.walks.rows", walks_rows),
+        ("pets.my.entity", my_pets_entity),
+        ("pets.my.rows", my_pets_rows),
+        ("notifications.entity", notifications_entity),
+        ("notifications.rows", notifications_rows),
+    ]
+
+    header = f"{'case':28} {'rows':>8} {'us/row':>9} {'peak KiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, fn in cases:
+        count, per_row, peak = measure(SessionLocal, fn, args.rounds)
+        print(f"{name:28} {count:>8} {per_row:>9.2f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+벤치마크 시나리오 (모바일 앱의 실제 호출 순서를 흉내냄)
+"""
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, elapsed: float, status: int) -> None:
+        with self._lock:
+            self.latencies[name].append(elapsed)
+            self.statuses[name][status] += 1
+            if status >= 500:
+                self.errors[name] += 1
+
+
+class Session:
+    def __init__(self, client, user, token: str, rng: random.Random, recorder: Recorder, seed_info):
+        self.client = client
+        self.user = user
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rng = rng
+        self.recorder = recorder
+        self.seed_info = seed_info
+
+    def call(self, name: str, method: str, url: str, headers: Dict[str, str] = None, **kwargs):
+        start = time.perf_counter()
+        response = self.client.request(method, url, headers={**self.headers, **(headers or {})}, **kwargs)
+        self.recorder.record(name, time.perf_counter() - start, response.status_code)
+        return response
+
+    def pick_pet(self) -> int:
+        return self.rng.choice(self.user.pet_ids)
+
+
+# ============================================================
+# 시나리오
+# ============================================================
+def walk_session(s: Session, track_points: int = 20) -> None:
+    pet_id = s.pick_pet()
+    lat, lng = 37.5665 + s.rng.uniform(-0.1, 0.1), 126.9780 + s.rng.uniform(-0.1, 0.1)
+
+    res = s.call("POST /walk/sessions/start", "POST", "/api/v1/walk/sessions/start",
+                 json={"pet_id": pet_id, "start_lat": lat, "start_lng": lng})
+    if res.status_code != 201:
+        return
+    walk_id = res.json()["walk"]["walk_id"]
+
+    now = datetime.utcnow()
+    for i in range(track_points):
+        lat += s.rng.uniform(-0.0004, 0.0004)
+        lng += s.rng.uniform(-0.0004, 0.0004)
+        s.call("POST /walk/sessions/{walk_id}/track", "POST", f"/api/v1/walk/sessions/{walk_id}/track",
+               json={"latitude": lat, "longitude": lng,
+                     "timestamp": (now + timedelta(seconds=5 * i)).isoformat()})
+
+    s.call("POST /walk/sessions/{walk_id}/end", "POST", f"/api/v1/walk/sessions/{walk_id}/end",
+           json={"total_distance_km": 1.2, "total_duration_min": 25, "last_lat": lat, "last_lng": lng})
+
+
+def home(s: Session) -> None:
+    pet_id = s.pick_pet()
+    s.call("GET /pets/my", "GET", "/api/v1/pets/my")
+    s.call("GET /walk/today", "GET", "/api/v1/walk/today", params={"pet_id": pet_id})
+    s.call("GET /walk/recommendations", "GET", "/api/v1/walk/recommendations", params={"pet_id": pet_id})
+    s.call("GET /walk/weather", "GET", "/api/v1/walk/weather",
+           params={"lat": round(37.5 + s.rng.uniform(0, 0.2), 4), "lng": round(126.9 + s.rng.uniform(0, 0.2), 4)})
+    s.call("GET /notifications", "GET", "/api/v1/notifications", params={"page": 0, "size": 20})
+
+
+def home_aggregate(s: Session) -> None:
+    """home 시나리오와 같은 화면을 집계 API 1회로 조회"""
+    s.call("GET /home", "GET", "/api/v1/home",
+           params={"lat": round(37.5 + s.rng.uniform(0, 0.2), 4), "lng": round(126.9 + s.rng.uniform(0, 0.2), 4)})
+
+
+def stats(s: Session) -> None:
+    pet_id = s.pick_pet()
+    s.call("GET /record/stats?period=week", "GET", "/api/v1/record/stats", params={"pet_id": pet_id, "period": "week"})
+    s.call("GET /record/stats?period=month", "GET", "/api/v1/record/stats", params={"pet_id": pet_id, "period": "month"})
+    s.call("GET /record/recent", "GET", "/api/v1/record/recent", params={"pet_id": pet_id, "limit": 20})
+
+    walk_ids = s.seed_info.walk_ids_by_pet.get(pet_id)
+    if walk_ids:
+        walk_id = s.rng.choice(walk_ids)
+        s.call("GET /record/walks/{walk_id}", "GET", f"/api/v1/record/walks/{walk_id}",
+               params={"include_points": "true"})
+
+
+def ranking(s: Session) -> None:
+    for period in ("weekly", "monthly"):
+        s.call(f"GET /walk/ranking?period={period}", "GET", "/api/v1/walk/ranking",
+               params={"family_id": s.user.family_id, "period": period})
+
+
+def notifications(s: Session) -> None:
+    res = s.call("GET /notifications", "GET", "/api/v1/notifications", params={"page": 0, "size": 20})
+    if res.status_code != 200:
+        return
+    items = res.json().get("notifications") or []
+    if items:
+        notif_id = s.rng.choice(items).get("notification_id")
+        if notif_id:
+            s.call("PATCH /notifications/{id}/read", "PATCH", f"/api/v1/notifications/{notif_id}/read")
+
+
+def revalidate(s: Session) -> None:
+    """읽기 화면 재진입: 같은 GET 을 직전 응답의 ETag 로 다시 요청 (바뀌지 않았으면 304)"""
+    pet_id = s.pick_pet()
+    gets = [
+        ("GET /pets/my", "/api/v1/pets/my", {}),
+        ("GET /walk/recommendations", "/api/v1/walk/recommendations", {"pet_id": pet_id}),
+        ("GET /record/stats?period=month", "/api/v1/record/stats", {"pet_id": pet_id, "period": "month"}),
+        ("GET /users/family-members", "/api/v1/users/family-members", {"family_id": s.user.family_id}),
+    ]
+    walk_ids = s.seed_info.walk_ids_by_pet.get(pet_id)
+    if walk_ids:
+        gets.append((
+            "GET /record/walks/{walk_id}", f"/api/v1/record/walks/{s.rng.choice(walk_ids)}", {"include_points": "true"},
+        ))
+
+    for name, url, params in gets:
+        res = s.call(name, "GET", url, params=params)
+        etag = res.headers.get("etag")
+        if etag:
+            s.call(f"{name} (If-None-Match)", "GET", url, params=params, headers={"If-None-Match": etag})
+
+
+SCENARIOS: Dict[str, Callable[[Session], None]] = {
+    "walk_session": walk_session,
+    "home": home,
+    "home_aggregate": home_aggregate,
+    "stats": stats,
+    "ranking": ranking,
+    "notifications": notifications,
+    "revalidate": revalidate,
+}
@@ -0,0 +1,66 @@
+"""
+벤치마크 시드 준비/조회
+
+- 데이터 생성은 benchmarks.datagen 에 위임
+- 시나리오가 사용할 사용자/반려동물/산책 ID를 DB에서 다시 읽음
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from sqlalchemy import func, select
+
+from app.models import FamilyMember, Pet, User, Walk
+
+
+@dataclass
+class SeedUser:
+    user_id: int
+    firebase_uid: str
+    family_id: int
+    pet_ids: List[int]
+
+
+@dataclass
+class SeedInfo:
+    users: List[SeedUser] = field(default_factory=list)
+    walk_ids_by_pet: Dict[int, List[int]] = field(default_factory=dict)
+
+
+def is_seeded(engine) -> bool:
+    with engine.connect() as conn:
+        return (conn.execute(select(func.count()).select_from(User.__table__)).scalar() or 0) > 0
+
+
+def load_seed_info(engine) -> SeedInfo:
+    """이미 시드된 DB에서 시나리오에 필요한 사용자/반려동물/산책 ID를 다시 읽음"""
+    info = SeedInfo()
+    with engine.connect() as conn:
+        pets_by_family: Dict[int, List[int]] = {}
+        for pet_id, family_id in conn.execute(select(Pet.pet_id, Pet.family_id)):
+            pets_by_family.setdefault(family_id, []).append(pet_id)
+
+        rows = conn.execute(
+            select(User.user_id, User.firebase_uid, FamilyMember.family_id)
+            .join(FamilyMember, FamilyMember.user_id == User.user_id)
+            .order_by(User.user_id)
+        )
+        seen = set()
+        for user_id, uid, family_id in rows:
+            if user_id in seen:
+                continue
+            seen.add(user_id)
+            info.users.append(SeedUser(user_id, uid, family_id, pets_by_family.get(family_id, [])))
+
+        for walk_id, pet_id in conn.execute(
+            select(Walk.walk_id, Walk.pet_id).where(Walk.end_time.isnot(None)).order_by(Walk.walk_id.desc()).limit(20000)
+        ):
+            info.walk_ids_by_pet.setdefault(pet_id, []).append(walk_id)
+    return info
+
+
+def seed(engine, scale: float = 0.002, years: float = 1.0, rng_seed: int = 42) -> SeedInfo:
+    """datagen 으로 데이터를 만들고 시나리오용 ID 정보를 돌려줌"""
+    from benchmarks.datagen import GenConfig, generate
+
+    generate(engine, GenConfig(scale=scale, years=years, rng_seed=rng_seed))
+    return load_seed_info(engine)
@@ -0,0 +1,45 @@
+"""
+테스트 공통 설정
+
+app 모듈은 import 시점에 settings 필수값과 Firebase 초기화가 필요하므로,
+벤치마크와 같은 방식으로 임시 SQLite DB + 더미 설정을 먼저 준비한 뒤 import 한다.
+"""
+import os
+import tempfile
+
+import pytest
+
+from benchmarks.env import prepare_environment
+
+_DB_DIR = tempfile.mkdtemp(prefix="takeapaw-test-")
+prepare_environment(f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}")
+
+# SQL 쿼리 예산 (query_budget 마커 / 픽스처)
+pytest_plugins = ["app.testing.query_budget"]
+
+
+@pytest.fixture(scope="session")
+def fakes():
+    """Firebase 토큰 검증 / FCM / OpenAI / 날씨를 지연 없는 로컬 대체물로 교체"""
+    from benchmarks.fakes import install_fakes
+
+    return install_fakes(fcm_latency=0.0, llm_latency=0.0, weather_latency=0.0)
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    from app.db import engine
+    from app.models import Base
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="session")
+def api_client(db_engine, fakes):
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    with TestClient(create_app()) as client:
+        yield client
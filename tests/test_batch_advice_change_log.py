@@ -0,0 +1,49 @@
+from app.db import SessionLocal
+from app.domains.notifications.repository.batch_advice_repository import BatchAdviceRepository
+from app.models import Family, Notification, Pet, User
+from app.models.change_log import ChangeLog
+from app.models.notification import NotificationType
+
+
+def test_bulk_notifications_log_exactly_the_inserted_rows(db_engine):
+    db = SessionLocal()
+    try:
+        family = Family(family_name="advice")
+        users = [User(firebase_uid=f"advice-{i}", sns="email", nickname=f"advice{i}") for i in range(3)]
+        db.add(family)
+        db.add_all(users)
+        db.flush()
+        pet = Pet(family_id=family.family_id, owner_id=users[0].user_id, pet_search_id="ADVICE01", name="advice")
+        db.add(pet)
+        db.commit()
+
+        rows = [
+            {
+                "family_id": family.family_id,
+                "target_user_id": user.user_id,
+                "related_pet_id": pet.pet_id,
+                "related_user_id": user.user_id,
+                "type": NotificationType.SYSTEM_WEATHER,
+                "title": "산책 추천",
+                "message": "오늘은 산책하기 좋은 날이에요",
+            }
+            for user in users
+        ]
+        repo = BatchAdviceRepository(db)
+        assert repo.bulk_insert_notifications(rows) == 3
+        db.commit()
+
+        ids = {
+            r[0] for r in db.query(Notification.notification_id).filter(Notification.related_pet_id == pet.pet_id)
+        }
+        logged = (
+            db.query(ChangeLog.entity_id, ChangeLog.user_id, ChangeLog.family_id)
+            .filter(ChangeLog.entity == "notification", ChangeLog.entity_id.in_(ids))
+            .all()
+        )
+        assert sorted(r.entity_id for r in logged) == sorted(ids)
+        # 개인 알림은 대상자 범위로만 기록
+        assert {r.user_id for r in logged} == {u.user_id for u in users}
+        assert {r.family_id for r in logged} == {None}
+    finally:
+        db.close()
@@ -0,0 +1,100 @@
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db import SessionLocal
+from app.domains.notifications.service import broadcast_service
+from app.domains.notifications.service.broadcast_service import BroadcastService
+from app.models import User
+from app.models.broadcast_job import BroadcastJob
+from app.models.user_fcm_token import UserFcmToken
+
+
+@pytest.fixture
+def db(db_engine):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """발송된 토큰 기록. fail_on 번째 호출에서 예외 (워커 중단 흉내)"""
+    calls = Counter()
+    state = {"fail_on": None, "n": 0}
+
+    def fake_send(fcm_tokens, title, body, data=None, collapse_key=None):
+        state["n"] += 1
+        if state["n"] == state["fail_on"]:
+            raise RuntimeError("worker crashed")
+        calls.update(fcm_tokens)
+        return {"success_count": len(fcm_tokens), "failure_count": 0, "invalid_tokens": []}
+
+    monkeypatch.setattr(broadcast_service, "send_push_notification_to_multiple", fake_send)
+    calls.state = state
+    return calls
+
+
+def _seed(db, prefix: str, count: int):
+    user = User(firebase_uid=f"{prefix}-user", sns="email", nickname=prefix)
+    db.add(user)
+    db.flush()
+    db.add_all([
+        UserFcmToken(user_id=user.user_id, fcm_token=f"{prefix}-{i}", device_id=f"{prefix}-d{i}")
+        for i in range(count)
+    ])
+    db.commit()
+    return {f"{prefix}-{i}" for i in range(count)}
+
+
+def test_crashed_job_resumes_without_resending(db, sent):
+    tokens = _seed(db, "resume", 5)
+    job, created = BroadcastService(db).enqueue("공지", "재개 테스트", dedup_key="resume-1")
+    assert created
+
+    # 두 번째 페이지 발송 중 실패 → 첫 페이지 cursor 는 저장돼 있음
+    sent.state["fail_on"] = 2
+    assert BroadcastService(db, page_size=2, owner="w1").run_pending()["retry"] >= 1
+    db.refresh(job)
+    assert job.status == "PENDING"
+    assert job.attempts == 1
+    assert job.device_cursor > 0
+
+    # 다른 워커가 저장된 cursor 부터 이어서 발송
+    BroadcastService(db, page_size=2, owner="w2").run_pending()
+    db.refresh(job)
+    assert job.status == "DONE"
+    assert tokens <= set(sent)
+    assert max(sent.values()) == 1
+    assert job.tokens == sum(sent.values())
+
+
+def test_job_held_by_live_worker_is_skipped(db, sent):
+    _seed(db, "leased", 1)
+    job, _ = BroadcastService(db).enqueue("공지", "lease 테스트", dedup_key="leased-1")
+    job.lease_owner = "other-worker"
+    job.lease_until = datetime.utcnow() + timedelta(minutes=5)
+    db.commit()
+
+    counts = BroadcastService(db, owner="w1").run_pending()
+    assert counts["busy"] >= 1
+    db.refresh(job)
+    assert job.status == "PENDING"
+
+    # lease 가 만료되면 이어받음
+    job.lease_until = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    BroadcastService(db, owner="w1").run_pending()
+    db.refresh(job)
+    assert job.status == "DONE"
+
+
+def test_same_content_without_key_is_enqueued_once(db):
+    service = BroadcastService(db)
+    first, created = service.enqueue("같은 공지", "본문", {"url": "/notice/1"})
+    again, created_again = service.enqueue("같은 공지", "본문", {"url": "/notice/1"})
+
+    assert created and not created_again
+    assert first.job_id == again.job_id
+    assert db.query(BroadcastJob).filter(BroadcastJob.title == "같은 공지").count() == 1
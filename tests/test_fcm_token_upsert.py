@@ -0,0 +1,56 @@
+from app.db import SessionLocal
+from app.domains.users.repository.user_repository import UserRepository
+from app.models import User
+from app.models.user_fcm_token import UserFcmToken
+
+
+def _row(db, token):
+    db.expire_all()
+    return db.query(UserFcmToken).filter(UserFcmToken.fcm_token == token).one()
+
+
+def test_upsert_keeps_platform_and_device_when_omitted(db_engine):
+    db = SessionLocal()
+    try:
+        user = User(firebase_uid="fcm-upsert-0", sns="email", nickname="fcm")
+        db.add(user)
+        db.commit()
+        repo = UserRepository(db)
+
+        repo.upsert_fcm_token(user, "fcm-upsert-token", device_id="ios-1", platform="ios")
+        db.commit()
+
+        # 같은 토큰 재등록에서 platform / device_id 를 생략해도 기존 값 유지
+        repo.upsert_fcm_token(user, "fcm-upsert-token")
+        db.commit()
+        row = _row(db, "fcm-upsert-token")
+        assert (row.platform, row.device_id) == ("ios", "ios-1")
+
+        repo.upsert_fcm_token(user, "fcm-upsert-token", platform="android")
+        db.commit()
+        assert _row(db, "fcm-upsert-token").platform == "android"
+
+        # 처음 보는 토큰에 platform 이 없으면 NULL
+        repo.upsert_fcm_token(user, "fcm-upsert-token-2")
+        db.commit()
+        assert _row(db, "fcm-upsert-token-2").platform is None
+    finally:
+        db.close()
+
+
+def test_fcm_token_endpoint_keeps_platform_when_omitted(api_client, fakes):
+    headers = {"Authorization": f"Bearer {fakes.tokens.issue('fcm-endpoint-0')}"}
+    url = "/api/v1/users/me/fcm-token"
+
+    res = api_client.put(url, json={"fcm_token": "fcm-endpoint-token", "device_id": "ios-2", "platform": "ios"}, headers=headers)
+    assert res.status_code == 200
+
+    res = api_client.put(url, json={"fcm_token": "fcm-endpoint-token"}, headers=headers)
+    assert res.status_code == 200
+
+    db = SessionLocal()
+    try:
+        row = _row(db, "fcm-endpoint-token")
+        assert (row.platform, row.device_id) == ("ios", "ios-2")
+    finally:
+        db.close()
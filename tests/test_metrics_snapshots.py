@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from app.core import metrics
+from app.core.config import settings
+
+
+@pytest.fixture
+def multiproc_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _write_worker(directory, pid: int, value: float, age_sec: float = 0.0) -> str:
+    registry = metrics.Registry()
+    registry.counter("test_worker_total", "test").inc(value)
+    snap = registry.snapshot()
+    snap["pid"] = pid
+    path = os.path.join(directory, f"{pid}.json")
+    with open(path, "w") as f:
+        json.dump(snap, f)
+    if age_sec:
+        past = time.time() - age_sec
+        os.utime(path, (past, past))
+    return path
+
+
+def _worker_total(registry) -> float:
+    for line in metrics.generate_latest(registry).splitlines():
+        if line.startswith("test_worker_total "):
+            return float(line.split()[1])
+    return 0.0
+
+
+def test_cleanup_removes_dead_worker_files(multiproc_dir):
+    dead = _write_worker(multiproc_dir, _dead_pid(), 5)
+    live = _write_worker(multiproc_dir, os.getppid(), 7)
+    leftover = os.path.join(multiproc_dir, f"{_dead_pid()}.json.tmp")
+    open(leftover, "w").close()
+
+    metrics.cleanup_snapshots()
+
+    assert not os.path.exists(dead)
+    assert not os.path.exists(leftover)
+    assert os.path.exists(live)
+
+
+def test_stale_snapshot_is_dropped_from_sum(multiproc_dir):
+    fresh = _write_worker(multiproc_dir, os.getppid(), 7)
+    stale = _write_worker(
+        multiproc_dir, _dead_pid(), 5, age_sec=settings.METRICS_SNAPSHOT_STALE_SEC + 10
+    )
+
+    assert _worker_total(metrics.Registry()) == 7
+    assert not os.path.exists(stale)
+    assert os.path.exists(fresh)
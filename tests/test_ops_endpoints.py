@@ -0,0 +1,109 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import create_app
+
+
+@pytest.fixture
+def client():
+    with TestClient(create_app()) as c:
+        yield c
+
+
+def test_scheduler_jobs_hidden_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "")
+
+    assert client.get("/scheduler/jobs").status_code == 404
+
+
+def test_scheduler_jobs_requires_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "ops-secret")
+
+    assert client.get("/scheduler/jobs").status_code == 401
+    res = client.get("/scheduler/jobs", headers={"Authorization": "Bearer wrong"})
+    assert res.status_code == 401
+    assert res.json()["code"] == "OPS_401_2"
+
+    res = client.get("/scheduler/jobs", headers={"Authorization": "Bearer ops-secret"})
+    assert res.status_code == 200
+    assert res.json() == {"enabled": False, "jobs": []}
+
+
+def test_metrics_requires_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "ops-secret")
+
+    assert client.get("/metrics").status_code == 401
+
+    res = client.get("/metrics", headers={"Authorization": "Bearer ops-secret"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+
+
+def test_broadcast_requires_token(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "ops-secret")
+    body = {"title": "점검 안내", "body": "오늘 밤 점검이 있습니다."}
+
+    res = api_client.post("/api/v1/notifications/broadcast", json=body)
+    assert res.status_code == 401
+
+    res = api_client.post(
+        "/api/v1/notifications/broadcast",
+        json=body,
+        headers={"Authorization": "Bearer wrong"},
+    )
+    assert res.status_code == 401
+
+
+
+def _seed_device_tokens(prefix: str, count: int) -> None:
+    from app.db import SessionLocal
+    from app.models import User
+    from app.models.user_fcm_token import UserFcmToken
+
+    db = SessionLocal()
+    try:
+        user = User(firebase_uid=f"{prefix}-user", sns="email", nickname=prefix)
+        db.add(user)
+        db.flush()
+        db.add_all([
+            UserFcmToken(user_id=user.user_id, fcm_token=f"{prefix}-token-{i}", device_id=f"{prefix}-d{i}")
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_broadcast_runs_in_background_and_dedups_retries(api_client, fakes, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_API_TOKEN", "ops-secret")
+    _seed_device_tokens("broadcast", 3)
+    headers = {"Authorization": "Bearer ops-secret"}
+    body = {"title": "점검 안내", "body": "오늘 밤 점검이 있습니다.", "dedup_key": "maintenance-1"}
+
+    sent_before = fakes.messaging.sent_messages
+    res = api_client.post("/api/v1/notifications/broadcast", json=body, headers=headers)
+    assert res.status_code == 202
+    job = res.json()
+    assert job["created"] is True
+    assert job["status"] == "PENDING"
+
+    # 응답 후 백그라운드 작업이 끝난 상태
+    res = api_client.get(f"/api/v1/notifications/broadcast/{job['job_id']}", headers=headers)
+    done = res.json()
+    assert done["status"] == "DONE"
+    assert done["tokens"] >= 3
+    assert done["success"] == done["tokens"]
+    sent = fakes.messaging.sent_messages - sent_before
+    assert sent >= done["tokens"]
+
+    # 재시도는 같은 작업을 돌려주고 다시 보내지 않음
+    sent_before = fakes.messaging.sent_messages
+    res = api_client.post("/api/v1/notifications/broadcast", json=body, headers=headers)
+    assert res.status_code == 202
+    assert res.json()["job_id"] == job["job_id"]
+    assert res.json()["created"] is False
+    assert fakes.messaging.sent_messages == sent_before
+
+    res = api_client.get("/api/v1/notifications/broadcast/999999", headers=headers)
+    assert res.status_code == 404
@@ -0,0 +1,181 @@
+"""
+목록/집계 엔드포인트의 SQL 쿼리 예산 (N+1 회귀 방지)
+
+가족 구성원/반려동물/산책/알림/공유 요청을 여러 건 만들어 두고,
+건수에 비례해 같은 문장이 반복되면(max_repeats 초과) 또는 전체 쿼리 수가 예산을 넘으면 실패한다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db import SessionLocal
+from app.models import (
+    Family,
+    FamilyMember,
+    Notification,
+    NotificationRead,
+    Pet,
+    PetShareRequest,
+    Photo,
+    User,
+    Walk,
+)
+from app.models.family_member import MemberRole
+from app.models.notification import NotificationType
+from app.models.pet_share_request import RequestStatus
+
+MEMBERS = 6
+PETS = 3
+REQUESTERS = 5
+
+
+@pytest.fixture(scope="module")
+def family(db_engine):
+    """owner + 구성원 5명, 반려동물 3마리, 구성원별 산책(사진 포함), 가족 알림, 요청자 5명의 공유 요청"""
+    db = SessionLocal()
+    now = datetime.utcnow()
+    try:
+        family = Family(family_name="budget")
+        db.add(family)
+        db.flush()
+
+        users = [
+            User(firebase_uid=f"budget-{i}", sns="email", nickname=f"member{i}", email=f"m{i}@test.local")
+            for i in range(MEMBERS)
+        ]
+        db.add_all(users)
+        db.flush()
+        db.add_all([
+            FamilyMember(
+                family_id=family.family_id,
+                user_id=u.user_id,
+                role=MemberRole.OWNER if i == 0 else MemberRole.MEMBER,
+            )
+            for i, u in enumerate(users)
+        ])
+
+        pets = [
+            Pet(
+                family_id=family.family_id,
+                owner_id=users[0].user_id,
+                pet_search_id=f"BUDGET0{i}",
+                name=f"pet{i}",
+                breed="푸들",
+                age=3,
+                weight=5.0,
+            )
+            for i in range(PETS)
+        ]
+        db.add_all(pets)
+        db.flush()
+
+        for day in range(5):
+            for pet in pets:
+                for u in users:
+                    start = now - timedelta(days=day, hours=1)
+                    walk = Walk(
+                        pet_id=pet.pet_id,
+                        user_id=u.user_id,
+                        start_time=start,
+                        end_time=start + timedelta(minutes=30),
+                        duration_min=30,
+                        distance_km=1.5,
+                        calories=50,
+                    )
+                    db.add(walk)
+                    db.flush()
+                    db.add(Photo(walk_id=walk.walk_id, image_url=f"https://img.test/{walk.walk_id}.jpg", uploaded_by=u.user_id))
+
+        for i in range(30):
+            u = users[i % MEMBERS]
+            n = Notification(
+                family_id=family.family_id,
+                type=NotificationType.ACTIVITY_END,
+                title="산책 종료",
+                message=f"{u.nickname} 산책 종료",
+                related_pet_id=pets[i % PETS].pet_id,
+                related_user_id=u.user_id,
+            )
+            db.add(n)
+            db.flush()
+            if i % 2:
+                db.add(NotificationRead(notification_id=n.notification_id, user_id=users[0].user_id))
+
+        # 다른 가족 사용자들이 이 가족의 반려동물 공유를 요청
+        requesters = [
+            User(firebase_uid=f"budget-req-{i}", sns="email", nickname=f"req{i}", email=f"r{i}@test.local")
+            for i in range(REQUESTERS)
+        ]
+        db.add_all(requesters)
+        db.flush()
+        for i, r in enumerate(requesters):
+            other = Family(family_name=f"req{i}")
+            db.add(other)
+            db.flush()
+            db.add(FamilyMember(family_id=other.family_id, user_id=r.user_id, role=MemberRole.OWNER))
+            for pet in pets:
+                db.add(PetShareRequest(pet_id=pet.pet_id, requester_id=r.user_id, status=RequestStatus.PENDING))
+
+        db.commit()
+        return {
+            "family_id": family.family_id,
+            "owner_uid": users[0].firebase_uid,
+            "requester_uid": requesters[0].firebase_uid,
+            "pet_id": pets[0].pet_id,
+        }
+    finally:
+        db.close()
+
+
+def _get(api_client, fakes, uid, url, **params):
+    token = fakes.tokens.issue(uid)
+    res = api_client.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+@pytest.mark.parametrize("period", ["weekly", "monthly", "total"])
+def test_ranking_budget(api_client, fakes, family, query_budget, period):
+    with query_budget(max_queries=6, max_repeats=1, label=f"ranking {period}"):
+        body = _get(
+            api_client, fakes, family["owner_uid"], "/api/v1/walk/ranking",
+            family_id=family["family_id"], period=period,
+        )
+    assert len(body["ranking"]) == MEMBERS
+
+
+def test_notifications_budget(api_client, fakes, family, query_budget):
+    with query_budget(max_queries=7, max_repeats=1, label="notifications"):
+        body = _get(api_client, fakes, family["owner_uid"], "/api/v1/notifications", page=0, size=20)
+    assert len(body["notifications"]) == 20
+
+
+def test_family_members_budget(api_client, fakes, family, query_budget):
+    with query_budget(max_queries=4, max_repeats=1, label="family members"):
+        body = _get(
+            api_client, fakes, family["owner_uid"], "/api/v1/users/family-members",
+            family_id=family["family_id"],
+        )
+    assert len(body["members"]) == MEMBERS
+
+
+def test_received_share_requests_budget(api_client, fakes, family, query_budget):
+    with query_budget(max_queries=3, max_repeats=1, label="received share requests"):
+        body = _get(api_client, fakes, family["owner_uid"], "/api/v1/pets/share/requests/received")
+    assert len(body["requests"]) == REQUESTERS * PETS
+
+
+def test_my_share_requests_budget(api_client, fakes, family, query_budget):
+    with query_budget(max_queries=3, max_repeats=1, label="my share requests"):
+        body = _get(api_client, fakes, family["requester_uid"], "/api/v1/pets/share/requests/me")
+    assert len(body["requests"]) == PETS
+
+
+@pytest.mark.query_budget(max_queries=5, max_repeats=1)
+def test_recent_activity_budget(api_client, fakes, family):
+    body = _get(
+        api_client, fakes, family["owner_uid"], "/api/v1/record/recent",
+        pet_id=family["pet_id"], limit=20,
+    )
+    assert len(body["recent_activities"]) == 20
+    assert all(a["thumbnail_image_url"] for a in body["recent_activities"])
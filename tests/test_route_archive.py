@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from app.db import SessionLocal
+from app.domains.record.repository.walk_repository import RecordWalkRepository
+from app.domains.walk.repository.route_archive_repository import RouteArchiveRepository
+from app.domains.walk.service.route_archive_service import RouteArchiveService
+from app.models import Family, Pet, User
+from app.models.walk import Walk
+from app.models.walk_tracking_point import WalkTrackingPoint
+
+
+def test_partially_deleted_walk_reads_full_route_from_archive(db_engine):
+    db = SessionLocal()
+    try:
+        family = Family(family_name="archive")
+        user = User(firebase_uid="archive-0", sns="email", nickname="archiver")
+        db.add_all([family, user])
+        db.flush()
+        pet = Pet(family_id=family.family_id, owner_id=user.user_id, pet_search_id="ARCH0001", name="old")
+        db.add(pet)
+        db.flush()
+        start = datetime(2024, 1, 1, 9, 0)
+        walk = Walk(pet_id=pet.pet_id, user_id=user.user_id, start_time=start, end_time=start + timedelta(minutes=10))
+        db.add(walk)
+        db.flush()
+        db.add_all([
+            WalkTrackingPoint(
+                walk_id=walk.walk_id,
+                latitude=37.5 + i * 0.001,
+                longitude=127.0,
+                timestamp=start + timedelta(seconds=30 * i),
+            )
+            for i in range(10)
+        ])
+        db.commit()
+
+        # 보관본 commit 후 hot 행 삭제가 중간에 멈춘 상태
+        RouteArchiveService(db)._archive_batch([walk.walk_id])
+        db.commit()
+        assert RouteArchiveRepository(db).delete_points([walk.walk_id], 4) == 4
+        db.commit()
+
+        _, points = RecordWalkRepository(db).get_photos_and_points(walk.walk_id, include_points=True)
+
+        assert len(points) == 10
+        assert [p.timestamp for p in points] == sorted(p.timestamp for p in points)
+    finally:
+        db.close()
@@ -0,0 +1,210 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.scheduler import (
+    CronSchedule,
+    FakeClock,
+    IntervalSchedule,
+    Scheduler,
+    TableLease,
+)
+from app.models.job_lease import JobLease
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    JobLease.__table__.create(engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
+
+
+# ============================================================
+# Schedule
+# ============================================================
+def test_interval_slots_are_epoch_aligned():
+    schedule = IntervalSchedule(600)
+
+    assert schedule.next_after(utc(2025, 1, 1, 0, 3, 10)) == utc(2025, 1, 1, 0, 10)
+    # 슬롯 시각 그대로면 다음 슬롯
+    assert schedule.next_after(utc(2025, 1, 1, 0, 10)) == utc(2025, 1, 1, 0, 20)
+
+
+def test_cron_daily_uses_kst():
+    schedule = CronSchedule("0 6 * * *")
+
+    # 2025-01-01 09:00 KST → 다음 06:00 KST 는 다음날 (UTC 전날 21:00)
+    assert schedule.next_after(utc(2025, 1, 1, 0, 0)) == utc(2025, 1, 1, 21, 0)
+    # 05:59 KST → 같은 날 06:00 KST
+    assert schedule.next_after(utc(2025, 1, 1, 20, 59)) == utc(2025, 1, 1, 21, 0)
+
+
+def test_cron_weekday():
+    schedule = CronSchedule("0 9 * * 1")
+
+    # 2025-01-01 은 수요일 → 다음 월요일 2025-01-06 09:00 KST
+    assert schedule.next_after(utc(2025, 1, 1, 0, 0)) == utc(2025, 1, 6, 0, 0)
+
+
+def test_cron_day_and_weekday_are_ored():
+    schedule = CronSchedule("30 3 15 * 0")
+
+    # 2025-01-05(일) 이 15일보다 먼저
+    assert schedule.next_after(utc(2025, 1, 1, 0, 0)) == utc(2025, 1, 4, 18, 30)
+    # 일요일 다음은 15일(수)
+    assert schedule.next_after(utc(2025, 1, 12, 0, 0)) == utc(2025, 1, 14, 18, 30)
+
+
+def test_cron_steps_and_ranges():
+    schedule = CronSchedule("*/20 8-9 * * *", tz=pytz.utc)
+
+    assert schedule.next_after(utc(2025, 1, 1, 8, 0)) == utc(2025, 1, 1, 8, 20)
+    assert schedule.next_after(utc(2025, 1, 1, 9, 40)) == utc(2025, 1, 2, 8, 0)
+
+
+def test_cron_rejects_invalid_expression():
+    with pytest.raises(ValueError):
+        CronSchedule("0 6 * *")
+    with pytest.raises(ValueError):
+        CronSchedule("61 * * * *")
+
+
+# ============================================================
+# TableLease
+# ============================================================
+def test_lease_slot_runs_on_one_owner(session_factory):
+    clock = FakeClock(utc(2025, 1, 1))
+    a = TableLease(session_factory, owner="a", clock=clock)
+    b = TableLease(session_factory, owner="b", clock=clock)
+    slot = utc(2025, 1, 1)
+
+    assert a.acquire("job", slot, ttl_sec=60) is True
+    assert b.acquire("job", slot, ttl_sec=60) is False
+
+    # 끝난 뒤에도 같은 슬롯은 다시 실행하지 않음
+    a.release("job")
+    assert b.acquire("job", slot, ttl_sec=60) is False
+    assert a.acquire("job", slot, ttl_sec=60) is False
+
+
+def test_lease_next_slot_after_release(session_factory):
+    clock = FakeClock(utc(2025, 1, 1))
+    a = TableLease(session_factory, owner="a", clock=clock)
+    b = TableLease(session_factory, owner="b", clock=clock)
+
+    assert a.acquire("job", utc(2025, 1, 1, 0, 0), ttl_sec=60)
+    a.release("job")
+
+    clock.advance(1)
+    assert b.acquire("job", utc(2025, 1, 1, 0, 1), ttl_sec=60)
+
+
+def test_lease_takeover_after_expiry(session_factory):
+    clock = FakeClock(utc(2025, 1, 1))
+    a = TableLease(session_factory, owner="a", clock=clock)
+    b = TableLease(session_factory, owner="b", clock=clock)
+
+    # a 가 실행 도중 죽어 release 하지 못함
+    assert a.acquire("job", utc(2025, 1, 1, 0, 0), ttl_sec=60)
+
+    clock.advance(30)
+    assert b.acquire("job", utc(2025, 1, 1, 0, 1), ttl_sec=60) is False
+
+    clock.advance(31)
+    assert b.acquire("job", utc(2025, 1, 1, 0, 2), ttl_sec=60) is True
+
+    with session_factory() as db:
+        row = db.execute(select(JobLease.owner, JobLease.last_slot)).one()
+    assert row.owner == "b"
+    assert row.last_slot == datetime(2025, 1, 1, 0, 2)
+
+
+# ============================================================
+# Scheduler
+# ============================================================
+def test_replicas_run_each_slot_once(session_factory):
+    clock = FakeClock(utc(2025, 1, 1, 0, 0, 30))
+    runs = []
+
+    replicas = []
+    for owner in ("a", "b"):
+        scheduler = Scheduler(
+            clock=clock,
+            lease=TableLease(session_factory, owner=owner, clock=clock),
+            synchronous=True,
+        )
+        scheduler.add_interval_job("tick", lambda owner=owner: runs.append(owner), 60)
+        replicas.append(scheduler)
+
+    for _ in range(3):
+        clock.advance(60)
+        for scheduler in replicas:
+            scheduler.run_pending()
+
+    assert len(runs) == 3
+    stats = [s.get_job("tick").stats for s in replicas]
+    assert sum(s.runs for s in stats) == 3
+    assert sum(s.skipped_lease for s in stats) == 3
+
+
+def test_missed_slots_are_coalesced():
+    clock = FakeClock(utc(2025, 1, 1, 0, 0, 30))
+    runs = []
+    scheduler = Scheduler(clock=clock, synchronous=True)
+    job = scheduler.add_interval_job("tick", lambda: runs.append(clock.now()), 60)
+
+    clock.advance(60 * 5)
+    assert scheduler.run_pending() == 1
+    assert scheduler.run_pending() == 0
+    assert job.next_slot == utc(2025, 1, 1, 0, 6)
+    # 지연은 밀린 첫 슬롯(00:01) 기준
+    assert job.stats.last_lag_sec == 270.0
+
+
+def test_failed_job_records_error():
+    clock = FakeClock(utc(2025, 1, 1))
+    scheduler = Scheduler(clock=clock, synchronous=True)
+
+    def boom():
+        raise RuntimeError("boom")
+
+    job = scheduler.add_interval_job("boom", boom, 60)
+    clock.advance(60)
+    scheduler.run_pending()
+
+    assert job.stats.runs == 1
+    assert job.stats.failures == 1
+    assert job.stats.last_error == "boom"
+    assert job.running == 0
+
+
+def test_jitter_delays_run_but_keeps_slot():
+    clock = FakeClock(utc(2025, 1, 1))
+    runs = []
+    scheduler = Scheduler(clock=clock, synchronous=True)
+
+    class FixedRng:
+        def uniform(self, a, b):
+            return b
+
+    scheduler.rng = FixedRng()
+    job = scheduler.add_interval_job("tick", lambda: runs.append(1), 60, jitter_sec=10)
+    assert job.next_run_at == job.next_slot + timedelta(seconds=10)
+
+    clock.advance(65)
+    assert scheduler.run_pending() == 0
+    clock.advance(5)
+    assert scheduler.run_pending() == 1
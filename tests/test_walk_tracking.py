@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete
+
+from app.core import push_targets
+from app.db import SessionLocal
+from app.models import Family, FamilyMember, Pet, User
+from app.models.family_member import MemberRole
+
+
+@pytest.fixture
+def family(db_engine):
+    db = SessionLocal()
+    try:
+        family = Family(family_name="tracking")
+        db.add(family)
+        db.flush()
+        users = [
+            User(firebase_uid=f"tracking-{i}", sns="email", nickname=f"tracker{i}")
+            for i in range(2)
+        ]
+        db.add_all(users)
+        db.flush()
+        db.add_all([
+            FamilyMember(family_id=family.family_id, user_id=users[0].user_id, role=MemberRole.OWNER),
+            FamilyMember(family_id=family.family_id, user_id=users[1].user_id, role=MemberRole.MEMBER),
+        ])
+        pet = Pet(family_id=family.family_id, owner_id=users[0].user_id, pet_search_id="TRACK001", name="walker")
+        db.add(pet)
+        db.commit()
+        return {
+            "family_id": family.family_id,
+            "pet_id": pet.pet_id,
+            "owner": users[0].firebase_uid,
+            "member": users[1].firebase_uid,
+            "member_id": users[1].user_id,
+        }
+    finally:
+        db.close()
+
+
+def _post(api_client, fakes, uid, url, body):
+    token = fakes.tokens.issue(uid)
+    return api_client.post(url, json=body, headers={"Authorization": f"Bearer {token}"})
+
+
+def _track(api_client, fakes, uid, walk_id):
+    return _post(
+        api_client, fakes, uid, f"/api/v1/walk/sessions/{walk_id}/track",
+        {"latitude": 37.5, "longitude": 127.0, "timestamp": datetime.utcnow().isoformat()},
+    )
+
+
+def test_removed_member_cannot_track_even_with_warm_push_cache(api_client, fakes, family):
+    res = _post(
+        api_client, fakes, family["owner"], "/api/v1/walk/sessions/start",
+        {"pet_id": family["pet_id"], "start_lat": 37.5, "start_lng": 127.0},
+    )
+    assert res.status_code == 201, res.text
+    walk_id = res.json()["walk"]["walk_id"]
+
+    assert _track(api_client, fakes, family["member"], walk_id).status_code == 201
+
+    # 다른 워커에서 구성원이 빠진 상황: 이 프로세스의 푸시 대상 캐시는 무효화되지 않음
+    db = SessionLocal()
+    try:
+        push_targets.registry.get_family_tokens(db, family["family_id"])
+        db.execute(delete(FamilyMember).where(FamilyMember.user_id == family["member_id"]))
+        db.commit()
+    finally:
+        db.close()
+
+    res = _track(api_client, fakes, family["member"], walk_id)
+    assert res.status_code == 403
+    assert res.json()["code"] == "WALK_POINT_403_1"
+
+    assert _track(api_client, fakes, family["owner"], walk_id).status_code == 201